@@ -0,0 +1,62 @@
+"""
+Benchmarks of aerodynamics models.
+
+These benchmarks are not run with the test suite. They need pytest-benchmark
+(``pip install pytest-benchmark``)::
+
+    pytest benchmarks --benchmark-autosave
+
+See :mod:`test_propulsion` for comparing results between runs.
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from importlib.resources import open_text
+
+import numpy as np
+import pytest
+from scipy import interpolate
+
+from fastoad_cs25.models.aerodynamics.components import resources
+from fastoad_cs25.models.aerodynamics.components.high_lift_aero import (
+    LIFT_EFFECTIVENESS_CHORD_RATIOS,
+    LIFT_EFFECTIVENESS_FILENAME,
+    get_lift_effectiveness_interpolant,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _legacy_lift_effectiveness(flap_angle, ratio_cf_flap):
+    """Former implementation, that reads the data file and builds splines on each call."""
+    with open_text(resources, LIFT_EFFECTIVENESS_FILENAME) as data_file:
+        data = np.array([[float(x) for x in line.split(",")] for line in data_file])
+
+    y_final = [
+        interpolate.splev(flap_angle, interpolate.splrep(data[:, i], data[:, i + 1], s=0))
+        for i in range(0, 10, 2)
+    ]
+    tck = interpolate.splrep(LIFT_EFFECTIVENESS_CHORD_RATIOS, y_final, s=0)
+    return interpolate.splev(ratio_cf_flap, tck)
+
+
+@pytest.mark.benchmark(group="lift_effectiveness-scalar")
+def test_lift_effectiveness_legacy(benchmark):
+    benchmark(_legacy_lift_effectiveness, 20.0, 0.25)
+
+
+@pytest.mark.benchmark(group="lift_effectiveness-scalar")
+def test_lift_effectiveness_interpolant(benchmark):
+    interpolant = get_lift_effectiveness_interpolant()
+    result = benchmark(interpolant, 20.0, 0.25)
+    assert result == pytest.approx(_legacy_lift_effectiveness(20.0, 0.25), rel=1e-10)
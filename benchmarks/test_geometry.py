@@ -0,0 +1,63 @@
+"""
+Benchmarks of geometry models.
+
+These benchmarks are not run with the test suite. They need pytest-benchmark
+(``pip install pytest-benchmark``)::
+
+    pytest benchmarks --benchmark-autosave
+
+See :mod:`test_propulsion` for comparing results between runs.
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import tracemalloc
+
+import pytest
+
+from fastoad_cs25.models.geometry.profiles.array_profile import ArrayProfile
+from fastoad_cs25.models.geometry.profiles.profile import Profile
+from fastoad_cs25.models.geometry.profiles.profile_getter import get_profile
+
+pytest.importorskip("pytest_benchmark")
+
+PROFILE_CLASSES = [Profile, ArrayProfile]
+
+KEPT_PROFILE_COUNT = 20
+
+
+@pytest.fixture(scope="module")
+def profile_points():
+    points = get_profile(chord_length=2.5).get_sides()
+    return points.x.to_numpy(), points.z.to_numpy()
+
+
+def _build_and_get_thickness(profile_class, x, z):
+    profile = profile_class()
+    profile.set_points(x, z)
+    return profile.get_relative_thickness()
+
+
+@pytest.mark.benchmark(group="profile-set_points")
+@pytest.mark.parametrize("profile_class", PROFILE_CLASSES, ids=lambda cls: cls.__name__)
+def test_profile_set_points(benchmark, profile_points, profile_class):
+    # Memory footprint of profiles kept alive, stored along with timing results.
+    tracemalloc.start()
+    profiles = [profile_class() for _ in range(KEPT_PROFILE_COUNT)]
+    for profile in profiles:
+        profile.set_points(*profile_points)
+    benchmark.extra_info["allocated_memory"] = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    thickness = benchmark(_build_and_get_thickness, profile_class, *profile_points)
+    assert len(thickness) > 0
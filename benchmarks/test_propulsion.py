@@ -0,0 +1,172 @@
+"""
+Benchmarks of the rubber engine model.
+
+These benchmarks are not run with the test suite. They need pytest-benchmark
+(``pip install pytest-benchmark``)::
+
+    pytest benchmarks --benchmark-autosave
+
+Results are stored as JSON files in .benchmarks/, named after the current commit. They can
+be compared with results from a previous run with::
+
+    pytest benchmarks --benchmark-compare=<run id> --benchmark-compare-fail=mean:10%
+
+or written to a given JSON file with ``--benchmark-json=<path>``.
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Dict
+
+import numpy as np
+import openmdao.api as om
+import pandas as pd
+import pytest
+from fastoad.constants import EngineSetting
+from fastoad.model_base import FlightPoint
+
+from fastoad_cs25.models.propulsion.fuel_propulsion.rubber_engine import (
+    OMRubberEngineComponent,
+    RubberEngine,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+POINT_COUNTS = [1, 100, 10_000, 1_000_000]
+OM_POINT_COUNTS = [1, 100, 10_000]
+
+THRUST_MODES = ["thrust_rate", "regulated"]
+
+ENGINE_PARAMETERS = dict(
+    bypass_ratio=5.0,
+    overall_pressure_ratio=30.0,
+    turbine_inlet_temperature=1500.0,
+    mto_thrust=120000.0,
+    maximum_mach=0.95,
+    design_altitude=10000.0,
+)
+
+
+def _get_flight_point_columns(point_count: int, thrust_mode: str) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(42)
+    thrust_rate = rng.uniform(0.2, 1.0, point_count)
+    return dict(
+        mach=rng.uniform(0.0, 0.85, point_count),
+        altitude=rng.uniform(0.0, 12000.0, point_count),
+        engine_setting=rng.integers(EngineSetting.TAKEOFF, EngineSetting.IDLE + 1, point_count),
+        isa_offset=np.zeros(point_count),
+        thrust_is_regulated=np.full(point_count, thrust_mode == "regulated"),
+        thrust_rate=thrust_rate,
+        thrust=thrust_rate * 0.5 * ENGINE_PARAMETERS["mto_thrust"],
+    )
+
+
+@pytest.fixture(scope="module")
+def engine() -> RubberEngine:
+    return RubberEngine(**ENGINE_PARAMETERS)
+
+
+@pytest.mark.benchmark(group="compute_flight_points-scalar")
+@pytest.mark.parametrize("thrust_mode", THRUST_MODES)
+def test_compute_flight_points_scalar(benchmark, engine, thrust_mode):
+    flight_point = FlightPoint(
+        mach=0.78,
+        altitude=10000.0,
+        engine_setting=EngineSetting.CRUISE,
+        isa_offset=0.0,
+        thrust_is_regulated=thrust_mode == "regulated",
+        thrust_rate=0.7,
+        thrust=30000.0,
+    )
+    benchmark(engine.compute_flight_points, flight_point)
+    assert flight_point.sfc > 0.0
+
+
+@pytest.mark.benchmark(group="compute_flight_points-arrays")
+@pytest.mark.parametrize("thrust_mode", THRUST_MODES)
+@pytest.mark.parametrize("point_count", POINT_COUNTS)
+def test_compute_flight_points_arrays(benchmark, engine, point_count, thrust_mode):
+    flight_point = FlightPoint(**_get_flight_point_columns(point_count, thrust_mode))
+    benchmark.extra_info["point_count"] = point_count
+    benchmark(engine.compute_flight_points, flight_point)
+    assert np.all(flight_point.sfc > 0.0)
+
+
+@pytest.mark.benchmark(group="compute_flight_points-dataframe")
+@pytest.mark.parametrize("thrust_mode", THRUST_MODES)
+@pytest.mark.parametrize("point_count", POINT_COUNTS)
+def test_compute_flight_points_dataframe(benchmark, engine, point_count, thrust_mode):
+    flight_points = pd.DataFrame(_get_flight_point_columns(point_count, thrust_mode))
+    benchmark.extra_info["point_count"] = point_count
+    benchmark(engine.compute_flight_points, flight_points)
+    assert np.all(flight_points.sfc > 0.0)
+
+
+@pytest.mark.benchmark(group="compute_flight_point_columns")
+@pytest.mark.parametrize("thrust_mode", THRUST_MODES)
+@pytest.mark.parametrize("point_count", POINT_COUNTS)
+def test_compute_flight_point_columns(benchmark, engine, point_count, thrust_mode):
+    columns = _get_flight_point_columns(point_count, thrust_mode)
+    columns.update(sfc=np.empty(point_count))
+    benchmark.extra_info["point_count"] = point_count
+    benchmark(engine.compute_flight_point_columns, columns)
+    assert np.all(columns["sfc"] > 0.0)
+
+
+def _get_om_problem(point_count: int, thrust_mode: str) -> om.Problem:
+    columns = _get_flight_point_columns(point_count, thrust_mode)
+
+    ivc = om.IndepVarComp()
+    ivc.add_output("data:propulsion:rubber_engine:bypass_ratio", 5.0)
+    ivc.add_output("data:propulsion:rubber_engine:overall_pressure_ratio", 30.0)
+    ivc.add_output("data:propulsion:rubber_engine:turbine_inlet_temperature", 1500.0, units="K")
+    ivc.add_output("data:propulsion:MTO_thrust", 120000.0, units="N")
+    ivc.add_output("data:propulsion:rubber_engine:maximum_mach", 0.95)
+    ivc.add_output("data:propulsion:rubber_engine:design_altitude", 10000.0, units="m")
+    ivc.add_output("data:geometry:propulsion:engine:count", 2.0)
+
+    ivc.add_output("data:propulsion:mach", columns["mach"])
+    ivc.add_output("data:propulsion:altitude", columns["altitude"], units="m")
+    ivc.add_output("data:propulsion:engine_setting", columns["engine_setting"])
+    ivc.add_output(
+        "data:propulsion:use_thrust_rate", np.logical_not(columns["thrust_is_regulated"])
+    )
+    ivc.add_output("data:propulsion:required_thrust_rate", columns["thrust_rate"])
+    ivc.add_output("data:propulsion:required_thrust", columns["thrust"], units="N")
+
+    problem = om.Problem(reports=False)
+    problem.model.add_subsystem("inputs", ivc, promotes=["*"])
+    problem.model.add_subsystem("engine", OMRubberEngineComponent(), promotes=["*"])
+    problem.setup()
+    problem.final_setup()
+    return problem
+
+
+@pytest.mark.benchmark(group="OMRubberEngineComponent-compute")
+@pytest.mark.parametrize("thrust_mode", THRUST_MODES)
+@pytest.mark.parametrize("point_count", OM_POINT_COUNTS)
+def test_om_rubber_engine_compute(benchmark, point_count, thrust_mode):
+    problem = _get_om_problem(point_count, thrust_mode)
+    benchmark.extra_info["point_count"] = point_count
+    benchmark(problem.run_model)
+    assert np.all(problem["data:propulsion:SFC"] > 0.0)
+
+
+@pytest.mark.benchmark(group="OMRubberEngineComponent-partials")
+@pytest.mark.parametrize("thrust_mode", THRUST_MODES)
+@pytest.mark.parametrize("point_count", OM_POINT_COUNTS)
+def test_om_rubber_engine_partials(benchmark, point_count, thrust_mode):
+    problem = _get_om_problem(point_count, thrust_mode)
+    problem.run_model()
+    benchmark.extra_info["point_count"] = point_count
+    benchmark(problem.model.run_linearize)
@@ -16,6 +16,8 @@ import fastoad.api as oad
 import openmdao.api as om
 from fastoad.module_management.constants import ModelDomain
 
+from .components.polar_engine import PolarEngine
+from .components.utils.cl_sampling import get_cl_sampling_option
 from .constants import (
     SERVICE_ALPHA,
     SERVICE_CD0,
@@ -26,6 +28,7 @@ from .constants import (
     SERVICE_INITIALIZE_CL,
     SERVICE_OSWALD_COEFFICIENT,
     SERVICE_POLAR,
+    SERVICE_POLAR_TABLE,
     SERVICE_REYNOLDS_COEFFICIENT,
 )
 
@@ -39,9 +42,21 @@ class AerodynamicsHighSpeed(om.Group):
 
     Drag contributions of each part of the aircraft are computed though analytical
     models.
+
+    If option "polar_table" is True, the polar is also computed on a grid of Mach numbers
+    and altitudes, for use in mission computation.
+
+    Option "cl_sampling" defines the CL values of the polar (see
+    :class:`~fastoad_cs25.models.aerodynamics.components.utils.cl_sampling.ClSampling`).
     """
 
+    def initialize(self):
+        self.options.declare("polar_table", default=False, types=bool)
+        self.options.declare("cl_sampling", default=None, types=dict, allow_none=True)
+
     def setup(self):
+        cl_sampling_option = get_cl_sampling_option(self.options["cl_sampling"])
+
         self.add_subsystem(
             "compute_oswald_coeff",
             oad.RegisterSubmodel.get_submodel(SERVICE_OSWALD_COEFFICIENT),
@@ -59,7 +74,7 @@ class AerodynamicsHighSpeed(om.Group):
         )
         self.add_subsystem(
             "initialize_cl",
-            oad.RegisterSubmodel.get_submodel(SERVICE_INITIALIZE_CL),
+            oad.RegisterSubmodel.get_submodel(SERVICE_INITIALIZE_CL, cl_sampling_option),
             promotes=["*"],
         )
         self.add_subsystem(
@@ -82,3 +97,35 @@ class AerodynamicsHighSpeed(om.Group):
             oad.RegisterSubmodel.get_submodel(SERVICE_ALPHA),
             promotes=["*"],
         )
+        if self.options["polar_table"]:
+            self.add_subsystem(
+                "polar_table",
+                oad.RegisterSubmodel.get_submodel(SERVICE_POLAR_TABLE, cl_sampling_option),
+                promotes=["*"],
+            )
+
+
+@oad.RegisterOpenMDAOSystem("fastoad.aerodynamics.highspeed.fused", domain=ModelDomain.AERODYNAMICS)
+class AerodynamicsHighSpeedFused(om.Group):
+    """
+    Computes aerodynamic polar of the aircraft in cruise conditions, in one component.
+
+    Models, inputs and outputs are the same as in :class:`AerodynamicsHighSpeed` with its
+    default submodels, but computation is faster. Submodels cannot be changed, except the
+    one for polar table.
+    """
+
+    def initialize(self):
+        self.options.declare("polar_table", default=False, types=bool)
+        self.options.declare("cl_sampling", default=None, types=dict, allow_none=True)
+
+    def setup(self):
+        cl_sampling_option = get_cl_sampling_option(self.options["cl_sampling"])
+
+        self.add_subsystem("polar_engine", PolarEngine(**cl_sampling_option), promotes=["*"])
+        if self.options["polar_table"]:
+            self.add_subsystem(
+                "polar_table",
+                oad.RegisterSubmodel.get_submodel(SERVICE_POLAR_TABLE, cl_sampling_option),
+                promotes=["*"],
+            )
@@ -18,7 +18,6 @@ import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
 from fastoad.module_management.constants import ModelDomain
-from stdatm import Atmosphere
 
 from .constants import (
     SERVICE_HIGH_LIFT,
@@ -27,14 +26,21 @@ from .constants import (
     SERVICE_LANDING_MAX_CL_CLEAN,
     SERVICE_POLAR,
     SERVICE_XFOIL,
+    SERVICE_XFOIL_TABLE,
     PolarType,
 )
+from .external.xfoil.cl_max_table import OPTION_TABLE_FILE_PATH
 from .external.xfoil.xfoil_polar import (
+    OPTION_ADAPTIVE_SWEEP,
     OPTION_ALPHA_END,
     OPTION_ALPHA_START,
     OPTION_ITER_LIMIT,
+    OPTION_PERSISTENT_SESSION,
+    OPTION_USE_POLAR_CACHE,
+    OPTION_USE_RAM_DISK,
     OPTION_XFOIL_EXE_PATH,
 )
+from ..atmosphere import get_atmosphere
 
 
 @oad.RegisterOpenMDAOSystem("fastoad.aerodynamics.landing.legacy", domain=ModelDomain.AERODYNAMICS)
@@ -44,13 +50,21 @@ class AerodynamicsLanding(om.Group):
 
     - Computes CL and CD increments due to high-lift devices at landing.
     - Computes maximum CL of the aircraft in landing conditions.
-    - Computes the polar in landing configuration.
+    - Computes the polar in landing configuration, if option "compute_polar" is True.
 
     Maximum 2D CL without high-lift is computed using XFoil (or provided as input if option
     use_xfoil is set to False). 3D CL is deduced using sweep angle.
 
+    If option xfoil_table_file_path is provided, maximum 2D CL is interpolated in this table of
+    precomputed XFOIL results instead, whatever the value of use_xfoil (see
+    :class:`~fastoad_cs25.models.aerodynamics.external.xfoil.cl_max_table.CLMax2DTable`).
+
     Contribution of high-lift devices is modelled according to their geometry (span and chord ratio)
     and their deflection angles.
+
+    Option "compute_polar" should be set to False when the landing polar is computed along
+    with the low speed polar (see option "high_lift_polars" of
+    :class:`~fastoad_cs25.models.aerodynamics.aerodynamics_low_speed.AerodynamicsLowSpeed`).
     """
 
     def initialize(self):
@@ -90,6 +104,49 @@ class AerodynamicsLanding(om.Group):
             allow_none=True,
             desc="The path to the XFOIL executable. Needed for non-Windows OS.",
         )
+        self.options.declare(
+            "xfoil_use_polar_cache",
+            default=False,
+            types=bool,
+            desc="Used if use_xfoil is True. If True, XFOIL results are stored on disk and "
+            "reused when XFOIL inputs are unchanged.",
+        )
+        self.options.declare(
+            "xfoil_persistent_session",
+            default=False,
+            types=bool,
+            desc="Used if use_xfoil is True. If True, one XFOIL process is kept alive and "
+            "driven interactively, instead of being started for each computation.",
+        )
+        self.options.declare(
+            "xfoil_adaptive_sweep",
+            default=False,
+            types=bool,
+            desc="Used if use_xfoil is True. If True, XFOIL does a coarse alpha sweep, then "
+            "refines around the CL peak, instead of a fine sweep over the whole alpha range.",
+        )
+        self.options.declare(
+            "xfoil_use_ram_disk",
+            default=False,
+            types=bool,
+            desc="Used if use_xfoil is True. If True, XFOIL files are written on a RAM disk "
+            "(/dev/shm), if available.",
+        )
+        self.options.declare(
+            "xfoil_table_file_path",
+            default=None,
+            types=str,
+            allow_none=True,
+            desc="If provided, maximum 2D CL is interpolated in this CSV file, as generated by "
+            "generate_cl_max_table(), instead of being computed by XFOIL or provided as input. "
+            "In this case, use_xfoil has no effect.",
+        )
+        self.options.declare(
+            "compute_polar",
+            default=True,
+            types=bool,
+            desc="If False, the landing polar is not computed by this group.",
+        )
 
     def setup(self):
         self.add_subsystem(
@@ -98,7 +155,15 @@ class AerodynamicsLanding(om.Group):
             promotes=["*"],
         )
 
-        if self.options["use_xfoil"]:
+        use_table = bool(self.options["xfoil_table_file_path"])
+        if use_table:
+            table_options = {OPTION_TABLE_FILE_PATH: self.options["xfoil_table_file_path"]}
+            self.add_subsystem(
+                "xfoil_run",
+                oad.RegisterSubmodel.get_submodel(SERVICE_XFOIL_TABLE, table_options),
+                promotes=["data:geometry:wing:thickness_ratio"],
+            )
+        elif self.options["use_xfoil"]:
             start = self.options["xfoil_alpha_min"]
             end = self.options["xfoil_alpha_max"]
             iter_limit = self.options["xfoil_iter_limit"]
@@ -107,6 +172,10 @@ class AerodynamicsLanding(om.Group):
                 OPTION_ALPHA_END: end,
                 OPTION_ITER_LIMIT: iter_limit,
                 OPTION_XFOIL_EXE_PATH: self.options[OPTION_XFOIL_EXE_PATH],
+                OPTION_USE_POLAR_CACHE: self.options["xfoil_use_polar_cache"],
+                OPTION_PERSISTENT_SESSION: self.options["xfoil_persistent_session"],
+                OPTION_ADAPTIVE_SWEEP: self.options["xfoil_adaptive_sweep"],
+                OPTION_USE_RAM_DISK: self.options["xfoil_use_ram_disk"],
             }
             self.add_subsystem(
                 "xfoil_run",
@@ -133,19 +202,20 @@ class AerodynamicsLanding(om.Group):
             promotes=["*"],
         )
 
-        if self.options["use_xfoil"]:
+        if use_table or self.options["use_xfoil"]:
             self.connect("data:aerodynamics:aircraft:landing:mach", "xfoil_run.xfoil:mach")
             self.connect("data:aerodynamics:wing:landing:reynolds", "xfoil_run.xfoil:reynolds")
             self.connect(
                 "xfoil_run.xfoil:CL_max_2D", "data:aerodynamics:aircraft:landing:CL_max_clean_2D"
             )
 
-        polar_type_option = {"polar_type": PolarType.LANDING}
-        self.add_subsystem(
-            "compute_landing_polar",
-            oad.RegisterSubmodel.get_submodel(SERVICE_POLAR, polar_type_option),
-            promotes=["*"],
-        )
+        if self.options["compute_polar"]:
+            polar_type_option = {"polar_type": PolarType.LANDING}
+            self.add_subsystem(
+                "compute_landing_polar",
+                oad.RegisterSubmodel.get_submodel(SERVICE_POLAR, polar_type_option),
+                promotes=["*"],
+            )
 
 
 @oad.RegisterSubmodel(
@@ -169,7 +239,7 @@ class ComputeMachReynolds(om.ExplicitComponent):
         l0_wing = inputs["data:geometry:wing:MAC:length"]
         speed = inputs["data:TLAR:approach_speed"]
 
-        atm = Atmosphere(0.0, 15.0)
+        atm = get_atmosphere(0.0, 15.0)
         atm.true_airspeed = speed
         reynolds = atm.unitary_reynolds * l0_wing
 
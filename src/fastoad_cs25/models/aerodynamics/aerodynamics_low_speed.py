@@ -16,6 +16,8 @@ import fastoad.api as oad
 import openmdao.api as om
 from fastoad.module_management.constants import ModelDomain
 
+from .components.polar_engine import PolarEngine
+from .components.utils.cl_sampling import get_cl_sampling_option
 from .constants import (
     SERVICE_ALPHA,
     SERVICE_CD0,
@@ -23,6 +25,7 @@ from .constants import (
     SERVICE_CL_ALPHA,
     SERVICE_INDUCED_DRAG_COEFFICIENT,
     SERVICE_INITIALIZE_CL,
+    SERVICE_MULTI_POLAR,
     SERVICE_OSWALD_COEFFICIENT,
     SERVICE_POLAR,
     SERVICE_REYNOLDS_COEFFICIENT,
@@ -34,10 +37,30 @@ from .constants import (
 class AerodynamicsLowSpeed(om.Group):
     """
     Models for low speed aerodynamics
+
+    Option "cl_sampling" defines the CL values of the polar (see
+    :class:`~fastoad_cs25.models.aerodynamics.components.utils.cl_sampling.ClSampling`).
+
+    If option "high_lift_polars" is True, takeoff and landing polars are computed along with
+    the low speed polar, in one component. Then groups
+    :class:`~fastoad_cs25.models.aerodynamics.aerodynamics_takeoff.AerodynamicsTakeoff` and
+    :class:`~fastoad_cs25.models.aerodynamics.aerodynamics_landing.AerodynamicsLanding` must
+    be used with option "compute_polar" set to False. As they provide the high-lift increments,
+    they should preferably be placed before this group in the configuration file.
     """
 
+    def initialize(self):
+        self.options.declare("cl_sampling", default=None, types=dict, allow_none=True)
+        self.options.declare(
+            "high_lift_polars",
+            default=False,
+            types=bool,
+            desc="If True, takeoff and landing polars are also computed.",
+        )
+
     def setup(self):
         low_speed_option = {"low_speed_aero": True}
+        cl_sampling_option = get_cl_sampling_option(self.options["cl_sampling"])
 
         ivc = om.IndepVarComp("data:aerodynamics:aircraft:takeoff:mach", val=0.2)
         self.add_subsystem("mach_low_speed", ivc, promotes=["*"])
@@ -59,7 +82,9 @@ class AerodynamicsLowSpeed(om.Group):
         )
         self.add_subsystem(
             "initialize_cl",
-            oad.RegisterSubmodel.get_submodel(SERVICE_INITIALIZE_CL, low_speed_option),
+            oad.RegisterSubmodel.get_submodel(
+                SERVICE_INITIALIZE_CL, {**low_speed_option, **cl_sampling_option}
+            ),
             promotes=["*"],
         )
         self.add_subsystem(
@@ -72,12 +97,19 @@ class AerodynamicsLowSpeed(om.Group):
             oad.RegisterSubmodel.get_submodel(SERVICE_CD_TRIM, low_speed_option),
             promotes=["*"],
         )
-        polar_type_option = {"polar_type": PolarType.LOW_SPEED}
-        self.add_subsystem(
-            "get_polar",
-            oad.RegisterSubmodel.get_submodel(SERVICE_POLAR, polar_type_option),
-            promotes=["*"],
-        )
+        if self.options["high_lift_polars"]:
+            self.add_subsystem(
+                "get_polar",
+                oad.RegisterSubmodel.get_submodel(SERVICE_MULTI_POLAR),
+                promotes=["*"],
+            )
+        else:
+            polar_type_option = {"polar_type": PolarType.LOW_SPEED}
+            self.add_subsystem(
+                "get_polar",
+                oad.RegisterSubmodel.get_submodel(SERVICE_POLAR, polar_type_option),
+                promotes=["*"],
+            )
         self.add_subsystem(
             "compute_CLalpha",
             oad.RegisterSubmodel.get_submodel(SERVICE_CL_ALPHA, low_speed_option),
@@ -88,3 +120,40 @@ class AerodynamicsLowSpeed(om.Group):
             oad.RegisterSubmodel.get_submodel(SERVICE_ALPHA, low_speed_option),
             promotes=["*"],
         )
+
+
+@oad.RegisterOpenMDAOSystem("fastoad.aerodynamics.lowspeed.fused", domain=ModelDomain.AERODYNAMICS)
+class AerodynamicsLowSpeedFused(om.Group):
+    """
+    Models for low speed aerodynamics, in one component.
+
+    Models, inputs and outputs are the same as in :class:`AerodynamicsLowSpeed` with its
+    default submodels, but computation is faster. Submodels cannot be changed, except the
+    one that computes takeoff and landing polars if option "high_lift_polars" is True.
+    """
+
+    def initialize(self):
+        self.options.declare("cl_sampling", default=None, types=dict, allow_none=True)
+        self.options.declare(
+            "high_lift_polars",
+            default=False,
+            types=bool,
+            desc="If True, takeoff and landing polars are also computed.",
+        )
+
+    def setup(self):
+        cl_sampling_option = get_cl_sampling_option(self.options["cl_sampling"])
+
+        ivc = om.IndepVarComp("data:aerodynamics:aircraft:takeoff:mach", val=0.2)
+        self.add_subsystem("mach_low_speed", ivc, promotes=["*"])
+        self.add_subsystem(
+            "polar_engine", PolarEngine(low_speed_aero=True, **cl_sampling_option), promotes=["*"]
+        )
+        if self.options["high_lift_polars"]:
+            self.add_subsystem(
+                "high_lift_polars",
+                oad.RegisterSubmodel.get_submodel(
+                    SERVICE_MULTI_POLAR, {"polar_types": [PolarType.TAKEOFF, PolarType.LANDING]}
+                ),
+                promotes=["*"],
+            )
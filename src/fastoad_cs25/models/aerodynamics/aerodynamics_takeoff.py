@@ -25,8 +25,21 @@ class AerodynamicsTakeoff(om.Group):
     Computes aerodynamic characteristics at takeoff.
 
     - Computes CL and CD increments due to high-lift devices at takeoff.
+    - Computes the polar in takeoff configuration, if option "compute_polar" is True.
+
+    Option "compute_polar" should be set to False when the takeoff polar is computed along
+    with the low speed polar (see option "high_lift_polars" of
+    :class:`~fastoad_cs25.models.aerodynamics.aerodynamics_low_speed.AerodynamicsLowSpeed`).
     """
 
+    def initialize(self):
+        self.options.declare(
+            "compute_polar",
+            default=True,
+            types=bool,
+            desc="If False, the takeoff polar is not computed by this group.",
+        )
+
     def setup(self):
         landing_flag_option = {"landing_flag": False}
         self.add_subsystem(
@@ -35,9 +48,10 @@ class AerodynamicsTakeoff(om.Group):
             promotes=["*"],
         )
 
-        polar_type_option = {"polar_type": PolarType.TAKEOFF}
-        self.add_subsystem(
-            "polar",
-            oad.RegisterSubmodel.get_submodel(SERVICE_POLAR, polar_type_option),
-            promotes=["*"],
-        )
+        if self.options["compute_polar"]:
+            polar_type_option = {"polar_type": PolarType.TAKEOFF}
+            self.add_subsystem(
+                "polar",
+                oad.RegisterSubmodel.get_submodel(SERVICE_POLAR, polar_type_option),
+                promotes=["*"],
+            )
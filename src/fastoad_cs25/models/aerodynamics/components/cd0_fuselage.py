@@ -16,7 +16,11 @@ import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
 
-from .utils.friction_drag import get_flat_plate_friction_drag_coefficient
+from .utils.cd0_bodies import compute_cd0_fuselage
+from .utils.friction_drag import (
+    get_flat_plate_friction_drag_coefficient,
+    get_flat_plate_friction_drag_coefficient_partials,
+)
 from ..constants import SERVICE_CD0_FUSELAGE
 
 
@@ -68,39 +72,108 @@ class Cd0Fuselage(om.ExplicitComponent):
         self.add_input("data:geometry:fuselage:wetted_area", val=np.nan, units="m**2")
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        cl_name, mach_name, reynolds_name, cd0_name = self._get_variable_names()
+        cl_metadata = self.get_io_metadata(metadata_keys=["size"], includes=[cl_name])
+        diagonal = np.arange(cl_metadata[cl_name]["size"])
+        self.declare_partials(cd0_name, cl_name, rows=diagonal, cols=diagonal)
+        self.declare_partials(
+            cd0_name,
+            [
+                mach_name,
+                reynolds_name,
+                "data:geometry:wing:area",
+                "data:geometry:fuselage:length",
+                "data:geometry:fuselage:maximum_width",
+                "data:geometry:fuselage:maximum_height",
+                "data:geometry:fuselage:wetted_area",
+            ],
+            rows=diagonal,
+            cols=np.zeros_like(diagonal),
+        )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        cl_name, mach_name, reynolds_name, _ = self._get_variable_names()
+
+        cd0_fus = compute_cd0_fuselage(
+            inputs["data:geometry:fuselage:length"],
+            inputs["data:geometry:fuselage:maximum_height"],
+            inputs["data:geometry:fuselage:maximum_width"],
+            inputs["data:geometry:fuselage:wetted_area"],
+            inputs[mach_name],
+            inputs[reynolds_name],
+            inputs["data:geometry:wing:area"],
+            inputs[cl_name],
+        )
+
+        if self.options["low_speed_aero"]:
+            outputs["data:aerodynamics:fuselage:low_speed:CD:CD0"] = cd0_fus
+        else:
+            outputs["data:aerodynamics:fuselage:high_speed:CD:CD0"] = cd0_fus
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
         height_max = inputs["data:geometry:fuselage:maximum_height"]
         width_max = inputs["data:geometry:fuselage:maximum_width"]
         wet_area_fus = inputs["data:geometry:fuselage:wetted_area"]
         wing_area = inputs["data:geometry:wing:area"]
         fus_length = inputs["data:geometry:fuselage:length"]
-        if self.options["low_speed_aero"]:
-            cl = inputs["data:aerodynamics:aircraft:low_speed:CL"]
-            mach = inputs["data:aerodynamics:aircraft:takeoff:mach"]
-            reynolds = inputs["data:aerodynamics:aircraft:low_speed:unit_reynolds"]
-        else:
-            cl = inputs["data:aerodynamics:aircraft:high_speed:CL"]
-            mach = inputs["data:TLAR:cruise_mach"]
-            reynolds = inputs["data:aerodynamics:aircraft:high_speed:unit_reynolds"]
+        cl_name, mach_name, reynolds_name, cd0_name = self._get_variable_names()
+        cl = inputs[cl_name]
+        mach = inputs[mach_name]
+        reynolds = inputs[reynolds_name]
 
         cf_fus = get_flat_plate_friction_drag_coefficient(fus_length, mach, reynolds)
+        d_cf_fus = get_flat_plate_friction_drag_coefficient_partials(fus_length, mach, reynolds)
+
+        # See compute_cd0_fuselage() for the equations
+        section_root = np.sqrt(height_max * width_max)
+        form_factor = 0.98 + 0.745 * section_root / fus_length
+        cd0_friction_fus = form_factor * cf_fus * wet_area_fus / wing_area
+        upsweep_factor = 0.0029 * cl**2 - 0.0066 * cl + 0.0043
+        cd0_upsweep_fus = upsweep_factor * (0.67 * 3.6 * height_max * width_max) / wing_area
+
+        def broadcast(value):
+            return np.broadcast_to(value, cl.shape)
 
-        cd0_friction_fus = (
-            (0.98 + 0.745 * np.sqrt(height_max * width_max) / fus_length)
-            * cf_fus
+        partials[cd0_name, cl_name] = (
+            (0.0058 * cl - 0.0066) * (0.67 * 3.6 * height_max * width_max) / wing_area
+        )
+        partials[cd0_name, mach_name] = broadcast(
+            form_factor * d_cf_fus["mach"] * wet_area_fus / wing_area
+        )
+        partials[cd0_name, reynolds_name] = broadcast(
+            form_factor * d_cf_fus["reynolds"] * wet_area_fus / wing_area
+        )
+        partials[cd0_name, "data:geometry:wing:area"] = (
+            -(cd0_friction_fus + cd0_upsweep_fus) / wing_area
+        )
+        partials[cd0_name, "data:geometry:fuselage:length"] = broadcast(
+            (-0.745 * section_root / fus_length**2 * cf_fus + form_factor * d_cf_fus["length"])
             * wet_area_fus
             / wing_area
         )
-        cd0_upsweep_fus = (
-            (0.0029 * cl**2 - 0.0066 * cl + 0.0043)
-            * (0.67 * 3.6 * height_max * width_max)
-            / wing_area
+        partials[cd0_name, "data:geometry:fuselage:maximum_width"] = (
+            0.745 * 0.5 * height_max / section_root / fus_length * cf_fus * wet_area_fus
+            + upsweep_factor * 0.67 * 3.6 * height_max
+        ) / wing_area
+        partials[cd0_name, "data:geometry:fuselage:maximum_height"] = (
+            0.745 * 0.5 * width_max / section_root / fus_length * cf_fus * wet_area_fus
+            + upsweep_factor * 0.67 * 3.6 * width_max
+        ) / wing_area
+        partials[cd0_name, "data:geometry:fuselage:wetted_area"] = broadcast(
+            form_factor * cf_fus / wing_area
         )
-        cd0_fus = cd0_friction_fus + cd0_upsweep_fus
 
+    def _get_variable_names(self):
         if self.options["low_speed_aero"]:
-            outputs["data:aerodynamics:fuselage:low_speed:CD:CD0"] = cd0_fus
-        else:
-            outputs["data:aerodynamics:fuselage:high_speed:CD:CD0"] = cd0_fus
+            return (
+                "data:aerodynamics:aircraft:low_speed:CL",
+                "data:aerodynamics:aircraft:takeoff:mach",
+                "data:aerodynamics:aircraft:low_speed:unit_reynolds",
+                "data:aerodynamics:fuselage:low_speed:CD:CD0",
+            )
+        return (
+            "data:aerodynamics:aircraft:high_speed:CL",
+            "data:TLAR:cruise_mach",
+            "data:aerodynamics:aircraft:high_speed:unit_reynolds",
+            "data:aerodynamics:fuselage:high_speed:CD:CD0",
+        )
@@ -16,7 +16,7 @@ import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
 
-from .utils.friction_drag import get_flat_plate_friction_drag_coefficient
+from .utils.cd0_bodies import compute_cd0_nacelles, compute_cd0_pylons
 from ..constants import SERVICE_CD0_NACELLES_PYLONS
 
 
@@ -67,8 +67,23 @@ class Cd0NacellesAndPylons(om.ExplicitComponent):
             mach = inputs["data:TLAR:cruise_mach"]
             reynolds = inputs["data:aerodynamics:aircraft:high_speed:unit_reynolds"]
 
-        cd0_pylon = self._compute_cd0_for_pylons(inputs, n_engines, wing_area, mach, reynolds)
-        cd0_nac = self._compute_cd0_for_nacelles(inputs, n_engines, wing_area, mach, reynolds)
+        cd0_pylon = compute_cd0_pylons(
+            inputs["data:geometry:propulsion:pylon:length"],
+            inputs["data:geometry:propulsion:pylon:wetted_area"],
+            n_engines,
+            mach,
+            reynolds,
+            wing_area,
+        )
+        cd0_nac = compute_cd0_nacelles(
+            inputs["data:geometry:propulsion:nacelle:length"],
+            inputs["data:geometry:propulsion:nacelle:wetted_area"],
+            inputs["data:geometry:propulsion:fan:length"],
+            n_engines,
+            mach,
+            reynolds,
+            wing_area,
+        )
 
         if self.options["low_speed_aero"]:
             outputs["data:aerodynamics:pylons:low_speed:CD:CD0"] = cd0_pylon
@@ -76,27 +91,3 @@ class Cd0NacellesAndPylons(om.ExplicitComponent):
         else:
             outputs["data:aerodynamics:pylons:high_speed:CD:CD0"] = cd0_pylon
             outputs["data:aerodynamics:nacelles:high_speed:CD:CD0"] = cd0_nac
-
-    @staticmethod
-    def _compute_cd0_for_pylons(inputs, n_engines, wing_area, mach, reynolds):
-        pylon_length = inputs["data:geometry:propulsion:pylon:length"]
-        wet_area_pylon = inputs["data:geometry:propulsion:pylon:wetted_area"]
-
-        cf_pylon = get_flat_plate_friction_drag_coefficient(pylon_length, mach, reynolds)
-        el_pylon = 0.06
-        ke_cd0_pylon = 4.688 * el_pylon**2 + 3.146 * el_pylon
-        cd0_pylon = n_engines * (1 + ke_cd0_pylon) * cf_pylon * wet_area_pylon / wing_area
-        return cd0_pylon
-
-    @staticmethod
-    def _compute_cd0_for_nacelles(inputs, n_engines, wing_area, mach, reynolds):
-        nac_length = inputs["data:geometry:propulsion:nacelle:length"]
-        wet_area_nac = inputs["data:geometry:propulsion:nacelle:wetted_area"]
-        fan_length = inputs["data:geometry:propulsion:fan:length"]
-
-        cf_nac = get_flat_plate_friction_drag_coefficient(nac_length, mach, reynolds)
-        e_fan = 0.22
-        kn_cd0_nac = 1 + 0.05 + 5.8 * e_fan / fan_length
-        cd0_int_nac = 0.0002
-        cd0_nac = n_engines * (kn_cd0_nac * cf_nac * wet_area_nac / wing_area + cd0_int_nac)
-        return cd0_nac
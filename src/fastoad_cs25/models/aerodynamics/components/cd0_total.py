@@ -16,6 +16,10 @@ import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
 
+from .utils.parasitic_drag import (
+    get_parasitic_drag_factor,
+    get_parasitic_drag_factor_derivative,
+)
 from ..constants import SERVICE_CD0_SUM
 
 
@@ -111,7 +115,33 @@ class Cd0Total(om.ExplicitComponent):
             )
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        ls_tag = "low_speed" if self.options["low_speed_aero"] else "high_speed"
+        wing_cd0_name = f"data:aerodynamics:wing:{ls_tag}:CD:CD0"
+        wing_cd0_metadata = self.get_io_metadata(metadata_keys=["size"], includes=[wing_cd0_name])
+        diagonal = np.arange(wing_cd0_metadata[wing_cd0_name]["size"])
+        column = np.zeros_like(diagonal)
+        vector_inputs = [
+            f"data:aerodynamics:{component}:{ls_tag}:CD:CD0" for component in ["wing", "fuselage"]
+        ]
+        scalar_inputs = [
+            f"data:aerodynamics:{component}:{ls_tag}:CD:CD0"
+            for component in ["horizontal_tail", "vertical_tail", "nacelles", "pylons"]
+        ]
+        clean_name = f"data:aerodynamics:aircraft:{ls_tag}:CD:CD0:clean"
+
+        self.declare_partials(clean_name, vector_inputs, rows=diagonal, cols=diagonal, val=1.0)
+        self.declare_partials(clean_name, scalar_inputs, rows=diagonal, cols=column, val=1.0)
+        for output_name in [
+            f"data:aerodynamics:aircraft:{ls_tag}:CD:CD0",
+            f"data:aerodynamics:aircraft:{ls_tag}:CD:CD0:parasitic",
+        ]:
+            self.declare_partials(output_name, vector_inputs, rows=diagonal, cols=diagonal)
+            self.declare_partials(
+                output_name,
+                scalar_inputs + ["data:geometry:aircraft:wetted_area"],
+                rows=diagonal,
+                cols=column,
+            )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         wet_area_total = inputs["data:geometry:aircraft:wetted_area"]
@@ -130,12 +160,7 @@ class Cd0Total(om.ExplicitComponent):
             cd0_nac = inputs["data:aerodynamics:nacelles:high_speed:CD:CD0"]
             cd0_pylon = inputs["data:aerodynamics:pylons:high_speed:CD:CD0"]
 
-        k_parasite = (
-            -2.39 * pow(10, -12) * wet_area_total**3
-            + 2.58 * pow(10, -8) * wet_area_total**2
-            - 0.89 * pow(10, -4) * wet_area_total
-            + 0.163
-        )
+        k_parasite = get_parasitic_drag_factor(wet_area_total)
 
         cd0_total_clean = cd0_wing + cd0_fus + cd0_ht + cd0_vt + cd0_nac + cd0_pylon
         cd0_total = cd0_total_clean * (1.0 + k_parasite)
@@ -152,3 +177,33 @@ class Cd0Total(om.ExplicitComponent):
             outputs["data:aerodynamics:aircraft:high_speed:CD:CD0:parasitic"] = (
                 cd0_total - cd0_total_clean
             )
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        ls_tag = "low_speed" if self.options["low_speed_aero"] else "high_speed"
+        wet_area_total = inputs["data:geometry:aircraft:wetted_area"]
+        input_names = [
+            f"data:aerodynamics:{component}:{ls_tag}:CD:CD0"
+            for component in [
+                "wing",
+                "fuselage",
+                "horizontal_tail",
+                "vertical_tail",
+                "nacelles",
+                "pylons",
+            ]
+        ]
+        cd0_total_clean = sum(inputs[name] for name in input_names)
+        point_count = np.size(cd0_total_clean)
+
+        k_parasite = get_parasitic_drag_factor(wet_area_total)
+        d_k_parasite = get_parasitic_drag_factor_derivative(wet_area_total)
+
+        for output_name, factor in [
+            (f"data:aerodynamics:aircraft:{ls_tag}:CD:CD0", 1.0 + k_parasite),
+            (f"data:aerodynamics:aircraft:{ls_tag}:CD:CD0:parasitic", k_parasite),
+        ]:
+            for input_name in input_names:
+                partials[output_name, input_name] = np.full(point_count, factor)
+            partials[output_name, "data:geometry:aircraft:wetted_area"] = (
+                cd0_total_clean * d_k_parasite
+            )
@@ -19,6 +19,7 @@ import openmdao.api as om
 from .utils.cd0_lifting_surface import (
     LiftingSurfaceGeometry,
     compute_cd0_lifting_surface,
+    compute_cd0_lifting_surface_partials,
 )
 from ..constants import SERVICE_CD0_WING
 
@@ -76,10 +77,62 @@ class Cd0Wing(om.ExplicitComponent):
         self.add_input("data:geometry:wing:sweep_25", val=np.nan, units="deg")
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        cl_name, mach_name, reynolds_name, cd0_name = self._get_variable_names()
+        cl_metadata = self.get_io_metadata(metadata_keys=["size"], includes=[cl_name])
+        diagonal = np.arange(cl_metadata[cl_name]["size"])
+        self.declare_partials(cd0_name, cl_name, rows=diagonal, cols=diagonal)
+        self.declare_partials(
+            cd0_name,
+            [mach_name, reynolds_name, *_GEOMETRY_INPUTS.values()],
+            rows=diagonal,
+            cols=np.zeros_like(diagonal),
+        )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
-        wing_geometry = LiftingSurfaceGeometry(
+        cl_name, mach_name, reynolds_name, cd0_name = self._get_variable_names()
+        outputs[cd0_name] = compute_cd0_lifting_surface(
+            self._get_geometry(inputs),
+            inputs[mach_name],
+            inputs[reynolds_name],
+            inputs["data:geometry:wing:area"],
+            inputs[cl_name],
+        )
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        cl_name, mach_name, reynolds_name, cd0_name = self._get_variable_names()
+        cl = inputs[cl_name]
+        d_cd0 = compute_cd0_lifting_surface_partials(
+            self._get_geometry(inputs),
+            inputs[mach_name],
+            inputs[reynolds_name],
+            inputs["data:geometry:wing:area"],
+            cl,
+        )
+
+        partials[cd0_name, cl_name] = d_cd0["lift_coefficient"]
+        partials[cd0_name, mach_name] = np.broadcast_to(d_cd0["mach"], cl.shape)
+        partials[cd0_name, reynolds_name] = np.broadcast_to(d_cd0["reynolds"], cl.shape)
+        for key, input_name in _GEOMETRY_INPUTS.items():
+            partials[cd0_name, input_name] = np.broadcast_to(d_cd0[key], cl.shape)
+
+    def _get_variable_names(self):
+        if self.options["low_speed_aero"]:
+            return (
+                "data:aerodynamics:aircraft:low_speed:CL",
+                "data:aerodynamics:aircraft:takeoff:mach",
+                "data:aerodynamics:aircraft:low_speed:unit_reynolds",
+                "data:aerodynamics:wing:low_speed:CD:CD0",
+            )
+        return (
+            "data:aerodynamics:aircraft:high_speed:CL",
+            "data:TLAR:cruise_mach",
+            "data:aerodynamics:aircraft:high_speed:unit_reynolds",
+            "data:aerodynamics:wing:high_speed:CD:CD0",
+        )
+
+    @staticmethod
+    def _get_geometry(inputs) -> LiftingSurfaceGeometry:
+        return LiftingSurfaceGeometry(
             thickness_ratio=inputs["data:geometry:wing:thickness_ratio"],
             MAC_length=inputs["data:geometry:wing:MAC:length"],
             sweep_angle_25=inputs["data:geometry:wing:sweep_25"],
@@ -87,19 +140,13 @@ class Cd0Wing(om.ExplicitComponent):
             cambered=True,
             interaction_coeff=0.04,
         )
-        wing_area = inputs["data:geometry:wing:area"]
-        if self.options["low_speed_aero"]:
-            cl = inputs["data:aerodynamics:aircraft:low_speed:CL"]
-            mach = inputs["data:aerodynamics:aircraft:takeoff:mach"]
-            reynolds = inputs["data:aerodynamics:aircraft:low_speed:unit_reynolds"]
-        else:
-            cl = inputs["data:aerodynamics:aircraft:high_speed:CL"]
-            mach = inputs["data:TLAR:cruise_mach"]
-            reynolds = inputs["data:aerodynamics:aircraft:high_speed:unit_reynolds"]
 
-        cd0_wing = compute_cd0_lifting_surface(wing_geometry, mach, reynolds, wing_area, cl)
 
-        if self.options["low_speed_aero"]:
-            outputs["data:aerodynamics:wing:low_speed:CD:CD0"] = cd0_wing
-        else:
-            outputs["data:aerodynamics:wing:high_speed:CD:CD0"] = cd0_wing
+# Keys of partials of compute_cd0_lifting_surface() for scalar inputs
+_GEOMETRY_INPUTS = {
+    "thickness_ratio": "data:geometry:wing:thickness_ratio",
+    "MAC_length": "data:geometry:wing:MAC:length",
+    "sweep_angle_25": "data:geometry:wing:sweep_25",
+    "wet_area": "data:geometry:wing:wetted_area",
+    "wing_area": "data:geometry:wing:area",
+}
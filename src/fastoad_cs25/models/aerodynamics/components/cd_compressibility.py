@@ -16,6 +16,7 @@ import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
 
+from .utils.compressibility_drag import compute_compressibility_drag, get_characteristic_mach
 from ..constants import SERVICE_CD_COMPRESSIBILITY
 
 
@@ -64,31 +65,75 @@ class CdCompressibility(om.ExplicitComponent):
         )
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        cd_name = "data:aerodynamics:aircraft:high_speed:CD:wave"
+        cl_name = "data:aerodynamics:aircraft:high_speed:CL"
+        cl_metadata = self.get_io_metadata(metadata_keys=["size"], includes=[cl_name])
+        diagonal = np.arange(cl_metadata[cl_name]["size"])
+        self.declare_partials(cd_name, cl_name, rows=diagonal, cols=diagonal)
+        self.declare_partials(
+            cd_name,
+            [
+                "data:TLAR:cruise_mach",
+                "data:geometry:wing:sweep_25",
+                "data:geometry:wing:thickness_ratio",
+                "tuning:aerodynamics:aircraft:high_speed:CD:compressibility:max_value",
+                "tuning:aerodynamics:aircraft:high_speed:CD:compressibility:characteristic_mach_increment",
+            ],
+            rows=diagonal,
+            cols=np.zeros_like(diagonal),
+        )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        cd_comp = compute_compressibility_drag(
+            inputs["data:aerodynamics:aircraft:high_speed:CL"],
+            inputs["data:TLAR:cruise_mach"],
+            inputs["data:geometry:wing:sweep_25"],
+            inputs["data:geometry:wing:thickness_ratio"],
+            inputs["tuning:aerodynamics:aircraft:high_speed:CD:compressibility:max_value"],
+            inputs[
+                "tuning:aerodynamics:aircraft:high_speed:CD:compressibility:"
+                "characteristic_mach_increment"
+            ],
+        )
+
+        outputs["data:aerodynamics:aircraft:high_speed:CD:wave"] = cd_comp
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        cd_name = "data:aerodynamics:aircraft:high_speed:CD:wave"
         cl = inputs["data:aerodynamics:aircraft:high_speed:CL"]
         m = inputs["data:TLAR:cruise_mach"]
         max_cd_comp = inputs["tuning:aerodynamics:aircraft:high_speed:CD:compressibility:max_value"]
         delta_m_charac_0 = inputs[
             "tuning:aerodynamics:aircraft:high_speed:CD:compressibility:characteristic_mach_increment"
         ]
-        sweep_angle = inputs["data:geometry:wing:sweep_25"]
+        sweep_angle = np.radians(inputs["data:geometry:wing:sweep_25"])
         thickness_ratio = inputs["data:geometry:wing:thickness_ratio"]
 
-        # Computation of characteristic Mach for 28° sweep and 0.12 of relative thickness
-        m_charac_comp_0 = (
-            -0.5 * np.maximum(0.35, cl) ** 2
-            + 0.35 * np.maximum(0.35, cl)
-            + 0.765
-            + delta_m_charac_0
+        # See compute_compressibility_drag() for the equations
+        m_charac_comp = get_characteristic_mach(
+            cl, inputs["data:geometry:wing:sweep_25"], thickness_ratio, delta_m_charac_0
         )
+        cd_comp = 0.002 * np.exp(42.58 * (m - m_charac_comp))
+        is_capped = cd_comp > max_cd_comp
 
-        # Computation of characteristic Mach for actual sweep angle and relative thickness
-        m_charac_comp = (
-            m_charac_comp_0 * np.cos(np.radians(28)) + 0.12 - thickness_ratio
-        ) / np.cos(np.radians(sweep_angle))
-
-        cd_comp = np.minimum(max_cd_comp, 0.002 * np.exp(42.58 * (m - m_charac_comp)))
+        # Derivative of CD w.r.t. characteristic Mach, where CD is not capped
+        d_cd_d_m_charac = np.where(is_capped, 0.0, -42.58 * cd_comp)
+        d_m_charac_d_m_charac_0 = np.cos(np.radians(28)) / np.cos(sweep_angle)
 
-        outputs["data:aerodynamics:aircraft:high_speed:CD:wave"] = cd_comp
+        partials[cd_name, "data:aerodynamics:aircraft:high_speed:CL"] = (
+            d_cd_d_m_charac * d_m_charac_d_m_charac_0 * np.where(cl > 0.35, 0.35 - cl, 0.0)
+        )
+        partials[cd_name, "data:TLAR:cruise_mach"] = -d_cd_d_m_charac
+        partials[cd_name, "data:geometry:wing:sweep_25"] = (
+            d_cd_d_m_charac * m_charac_comp * np.tan(sweep_angle) * np.pi / 180.0
+        )
+        partials[cd_name, "data:geometry:wing:thickness_ratio"] = d_cd_d_m_charac / -np.cos(
+            sweep_angle
+        )
+        partials[
+            cd_name, "tuning:aerodynamics:aircraft:high_speed:CD:compressibility:max_value"
+        ] = np.where(is_capped, 1.0, 0.0)
+        partials[
+            cd_name,
+            "tuning:aerodynamics:aircraft:high_speed:CD:compressibility:characteristic_mach_increment",
+        ] = d_cd_d_m_charac * d_m_charac_d_m_charac_0
@@ -16,6 +16,7 @@ import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
 
+from .utils.trim_drag import TRIM_DRAG_FACTOR, compute_trim_drag
 from ..constants import SERVICE_CD_TRIM
 
 
@@ -53,7 +54,15 @@ class CdTrim(om.ExplicitComponent):
             )
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        if self.options["low_speed_aero"]:
+            cl_name = "data:aerodynamics:aircraft:low_speed:CL"
+            cd_name = "data:aerodynamics:aircraft:low_speed:CD:trim"
+        else:
+            cl_name = "data:aerodynamics:aircraft:high_speed:CL"
+            cd_name = "data:aerodynamics:aircraft:high_speed:CD:trim"
+        cl_metadata = self.get_io_metadata(metadata_keys=["size"], includes=[cl_name])
+        diagonal = np.arange(cl_metadata[cl_name]["size"])
+        self.declare_partials(cd_name, cl_name, rows=diagonal, cols=diagonal, val=TRIM_DRAG_FACTOR)
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         if self.options["low_speed_aero"]:
@@ -61,10 +70,7 @@ class CdTrim(om.ExplicitComponent):
         else:
             cl = inputs["data:aerodynamics:aircraft:high_speed:CL"]
 
-        cd_trim = []
-
-        for cl_val in cl:
-            cd_trim.append(5.89 * pow(10, -4) * cl_val)
+        cd_trim = compute_trim_drag(cl)
 
         if self.options["low_speed_aero"]:
             outputs["data:aerodynamics:aircraft:low_speed:CD:trim"] = cd_trim
@@ -55,7 +55,21 @@ class ComputeAlpha(om.ExplicitComponent):
 
     def setup_partials(self):
         polar_type = "low_speed" if self.options["low_speed_aero"] else "high_speed"
-        self.declare_partials(f"data:aerodynamics:aircraft:{polar_type}:AoA", "*", method="fd")
+        cl_name = f"data:aerodynamics:aircraft:{polar_type}:CL"
+        cl_metadata = self.get_io_metadata(metadata_keys=["size"], includes=[cl_name])
+        diagonal = np.arange(cl_metadata[cl_name]["size"])
+        self.declare_partials(
+            f"data:aerodynamics:aircraft:{polar_type}:AoA", cl_name, rows=diagonal, cols=diagonal
+        )
+        self.declare_partials(
+            f"data:aerodynamics:aircraft:{polar_type}:AoA",
+            [
+                f"data:aerodynamics:aircraft:{polar_type}:CL_alpha",
+                f"data:aerodynamics:aircraft:{polar_type}:CL0",
+            ],
+            rows=diagonal,
+            cols=np.zeros_like(diagonal),
+        )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         polar_type = "low_speed" if self.options["low_speed_aero"] else "high_speed"
@@ -66,3 +80,22 @@ class ComputeAlpha(om.ExplicitComponent):
         CL0 = inputs[f"data:aerodynamics:aircraft:{polar_type}:CL0"]  # pylint: disable=invalid-name
 
         outputs[f"data:aerodynamics:aircraft:{polar_type}:AoA"] = (CL - CL0) / CLalpha
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        polar_type = "low_speed" if self.options["low_speed_aero"] else "high_speed"
+        aoa_name = f"data:aerodynamics:aircraft:{polar_type}:AoA"
+        CL = inputs[f"data:aerodynamics:aircraft:{polar_type}:CL"]  # pylint: disable=invalid-name
+        CLalpha = inputs[  # pylint: disable=invalid-name
+            f"data:aerodynamics:aircraft:{polar_type}:CL_alpha"
+        ]
+        CL0 = inputs[f"data:aerodynamics:aircraft:{polar_type}:CL0"]  # pylint: disable=invalid-name
+
+        partials[aoa_name, f"data:aerodynamics:aircraft:{polar_type}:CL"] = np.broadcast_to(
+            1.0 / CLalpha, CL.shape
+        )
+        partials[aoa_name, f"data:aerodynamics:aircraft:{polar_type}:CL_alpha"] = (
+            -(CL - CL0) / CLalpha**2
+        )
+        partials[aoa_name, f"data:aerodynamics:aircraft:{polar_type}:CL0"] = np.broadcast_to(
+            -1.0 / CLalpha, CL.shape
+        )
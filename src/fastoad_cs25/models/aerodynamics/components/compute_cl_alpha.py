@@ -16,6 +16,7 @@ import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
 
+from .utils.cl_alpha import compute_cl_alpha
 from ..constants import SERVICE_CL_ALPHA
 
 
@@ -57,42 +58,22 @@ class ComputeCLAlpha(om.ExplicitComponent):
             )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
-        width_max = inputs["data:geometry:fuselage:maximum_width"]
-        height_max = inputs["data:geometry:fuselage:maximum_height"]
-        span = inputs["data:geometry:wing:span"]
-        lambda_wing = inputs["data:geometry:wing:aspect_ratio"]
-        root_chord = inputs["data:geometry:wing:root:chord"]
-        tip_chord = inputs["data:geometry:wing:tip:chord"]
-        tip_thickness_ratio = inputs["data:geometry:wing:tip:thickness_ratio"]
-        sweep_25 = inputs["data:geometry:wing:sweep_25"]
-        wing_area = inputs["data:geometry:wing:area"]
-
         if self.options["low_speed_aero"]:
             mach = 0.2
         else:
             mach = inputs["data:TLAR:cruise_mach"]
 
-        beta = np.sqrt(1.0 - mach**2)
-        d_f = np.sqrt(width_max * height_max)
-        fuselage_lift_factor = 1.07 * (1.0 + d_f / span) ** 2
-        lambda_wing_eff = lambda_wing * (1.0 + 1.9 * tip_chord * tip_thickness_ratio / span)
-        cl_alpha_wing = (
-            2.0
-            * np.pi
-            * lambda_wing_eff
-            / (
-                2.0
-                + np.sqrt(
-                    4.0
-                    + lambda_wing_eff**2
-                    * beta**2
-                    / 0.9025  # equals 0.95**2
-                    * (1.0 + (np.tan(sweep_25)) ** 2 / beta**2)
-                )
-            )
-            * (wing_area - root_chord * width_max)
-            / wing_area
-            * fuselage_lift_factor
+        cl_alpha_wing = compute_cl_alpha(
+            mach,
+            inputs["data:geometry:fuselage:maximum_height"],
+            inputs["data:geometry:fuselage:maximum_width"],
+            inputs["data:geometry:wing:span"],
+            inputs["data:geometry:wing:aspect_ratio"],
+            inputs["data:geometry:wing:root:chord"],
+            inputs["data:geometry:wing:tip:chord"],
+            inputs["data:geometry:wing:tip:thickness_ratio"],
+            inputs["data:geometry:wing:sweep_25"],
+            inputs["data:geometry:wing:area"],
         )
 
         if self.options["low_speed_aero"]:
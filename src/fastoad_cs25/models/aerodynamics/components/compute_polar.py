@@ -12,11 +12,14 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from typing import Dict, List, Tuple
+
 import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
 
-from ..constants import SERVICE_POLAR, PolarType
+from .utils.polar_optimum import get_optimum_cl_cd, get_optimum_cl_cd_partials
+from ..constants import SERVICE_MULTI_POLAR, SERVICE_POLAR, PolarType
 
 
 @oad.RegisterSubmodel(SERVICE_POLAR, "fastoad.submodel.aerodynamics.polar.legacy")
@@ -27,202 +30,23 @@ class ComputePolar(om.ExplicitComponent):
         self.options.declare("polar_type", default=PolarType.HIGH_SPEED, types=PolarType)
 
     def setup(self):
-        self.add_input("tuning:aerodynamics:aircraft:high_speed:CD:k", val=np.nan, units="unitless")
-        self.add_input(
-            "tuning:aerodynamics:aircraft:high_speed:CD:offset", val=np.nan, units="unitless"
-        )
-        self.add_input(
-            "tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:k",
-            val=np.nan,
-            units="unitless",
-        )
-        self.add_input(
-            "tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:offset",
-            val=np.nan,
-            units="unitless",
-        )
-
-        if self.options["polar_type"] != PolarType.HIGH_SPEED:
-            self.add_input(
-                "data:aerodynamics:aircraft:low_speed:CD:CD0",
-                shape_by_conn=True,
-                val=np.nan,
-                units="unitless",
-            )
-            self.add_input(
-                "data:aerodynamics:aircraft:low_speed:CL",
-                shape_by_conn=True,
-                val=np.nan,
-                units="unitless",
-            )
-            self.add_input(
-                "data:aerodynamics:aircraft:low_speed:CD:trim",
-                shape_by_conn=True,
-                val=np.nan,
-                units="unitless",
-            )
-            self.add_input(
-                "data:aerodynamics:aircraft:low_speed:CD:induced:coefficient",
-                val=np.nan,
-                units="unitless",
-            )
-
-            if self.options["polar_type"] == PolarType.TAKEOFF:
-                self.add_input(
-                    "data:aerodynamics:high_lift_devices:takeoff:CL", val=np.nan, units="unitless"
-                )
-                self.add_input(
-                    "data:aerodynamics:high_lift_devices:takeoff:CD", val=np.nan, units="unitless"
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:takeoff:CL",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:takeoff:CD",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:takeoff:CD:CD0",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:takeoff:CD:induced",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:takeoff:CD:wave",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:takeoff:CD:trim",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:takeoff:CD:offset",
-                    units="unitless",
-                )
-
-            elif self.options["polar_type"] == PolarType.LANDING:
-                self.add_input(
-                    "data:aerodynamics:high_lift_devices:landing:CL", val=np.nan, units="unitless"
-                )
-                self.add_input(
-                    "data:aerodynamics:high_lift_devices:landing:CD", val=np.nan, units="unitless"
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:landing:CL",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:landing:CD",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:landing:CD:CD0",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:landing:CD:induced",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:landing:CD:wave",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:landing:CD:trim",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:landing:CD:offset",
-                    units="unitless",
-                )
+        names = self._get_variable_names()
+        _add_polar_inputs(self, names)
+        _add_polar_outputs(self, self.options["polar_type"], names)
 
-            elif self.options["polar_type"] == PolarType.LOW_SPEED:
-                self.add_output(
-                    "data:aerodynamics:aircraft:low_speed:CD",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:low_speed:CD:induced",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output(
-                    "data:aerodynamics:aircraft:low_speed:CD:wave",
-                    copy_shape="data:aerodynamics:aircraft:low_speed:CL",
-                    units="unitless",
-                )
-                self.add_output("data:aerodynamics:aircraft:low_speed:CD:offset", units="unitless")
-
-            else:
-                raise AttributeError(f"Unknown polar type: {self.options['polar_type']}")
+        if self.options["polar_type"] == PolarType.HIGH_SPEED:
+            for key in ["L_D_max", "optimal_CL", "optimal_CD"]:
+                self.add_output(names[key], units="unitless")
 
-        elif self.options["polar_type"] == PolarType.HIGH_SPEED:
-            self.add_input(
-                "data:aerodynamics:aircraft:high_speed:CL",
-                shape_by_conn=True,
-                val=np.nan,
-                units="unitless",
-            )
-            self.add_input(
-                "data:aerodynamics:aircraft:high_speed:CD:CD0",
-                shape_by_conn=True,
-                val=np.nan,
-                units="unitless",
-            )
-            self.add_input(
-                "data:aerodynamics:aircraft:high_speed:CD:trim",
-                shape_by_conn=True,
-                val=np.nan,
-                units="unitless",
-            )
-            self.add_input(
-                "data:aerodynamics:aircraft:high_speed:CD:wave",
-                shape_by_conn=True,
-                val=np.nan,
-                units="unitless",
-            )
-            self.add_input(
-                "data:aerodynamics:aircraft:high_speed:CD:induced:coefficient",
-                val=np.nan,
-                units="unitless",
-            )
+    def setup_partials(self):
+        names = self._get_variable_names()
+        vector_inputs, scalar_inputs = _declare_polar_partials(self, names)
 
-            self.add_output(
-                "data:aerodynamics:aircraft:high_speed:CD",
-                copy_shape="data:aerodynamics:aircraft:high_speed:CL",
-                units="unitless",
+        if self.options["polar_type"] == PolarType.HIGH_SPEED:
+            self.declare_partials(
+                [names["L_D_max"], names["optimal_CL"], names["optimal_CD"]],
+                vector_inputs + scalar_inputs,
             )
-            self.add_output(
-                "data:aerodynamics:aircraft:high_speed:CD:induced",
-                copy_shape="data:aerodynamics:aircraft:high_speed:CL",
-                units="unitless",
-            )
-            self.add_output("data:aerodynamics:aircraft:high_speed:CD:offset", units="unitless")
-            self.add_output("data:aerodynamics:aircraft:high_speed:L_D_max", units="unitless")
-            self.add_output("data:aerodynamics:aircraft:high_speed:optimal_CL", units="unitless")
-            self.add_output("data:aerodynamics:aircraft:high_speed:optimal_CD", units="unitless")
-
-        else:
-            raise AttributeError(f"Unknown polar type: {self.options['polar_type']}")
-
-    def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         k_cd = inputs["tuning:aerodynamics:aircraft:high_speed:CD:k"]
@@ -294,17 +118,325 @@ class ComputePolar(om.ExplicitComponent):
             outputs["data:aerodynamics:aircraft:high_speed:CD:induced"] = cd_induced
             outputs["data:aerodynamics:aircraft:high_speed:CD:offset"] = cd_offset
 
-            Cl_opt, Cd_opt = get_optimum_ClCd(np.array([cd, cl]))[0:2]
+            Cl_opt, Cd_opt = get_optimum_cl_cd(cl, cd)
             outputs["data:aerodynamics:aircraft:high_speed:L_D_max"] = Cl_opt / Cd_opt
             outputs["data:aerodynamics:aircraft:high_speed:optimal_CL"] = Cl_opt
             outputs["data:aerodynamics:aircraft:high_speed:optimal_CD"] = Cd_opt
 
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        names = self._get_variable_names()
+        d_cd = _compute_polar_partials(inputs, partials, names)
+
+        if self.options["polar_type"] == PolarType.HIGH_SPEED:
+            cl = inputs[names["cl"]]
+            cd = (
+                inputs[names["cd0"]]
+                + inputs[names["cd_wave"]]
+                + inputs[names["cd_trim"]]
+                + inputs[names["coef_k"]] * cl**2 * inputs[names["k_winglet_cd"]]
+                + inputs[names["offset_winglet_cd"]]
+            ) * inputs[names["k_cd"]] + inputs[names["offset_cd"]]
+            cl_opt, cd_opt = get_optimum_cl_cd(cl, cd)
+            d_optimum = get_optimum_cl_cd_partials(cl, cd)
+
+            for key in ["cl", "cd0", "cd_trim", "cd_wave", *_SCALAR_INPUTS]:
+                if key not in names:
+                    continue
+                d_cd_key = np.broadcast_to(d_cd[key], cl.shape)
+                d_cl_key = 1.0 if key == "cl" else 0.0
+                d_cl_opt = d_optimum[("cl", "cd")] * d_cd_key + d_optimum[("cl", "cl")] * d_cl_key
+                d_cd_opt = d_optimum[("cd", "cd")] * d_cd_key + d_optimum[("cd", "cl")] * d_cl_key
+                if key in _SCALAR_INPUTS:
+                    d_cl_opt = np.sum(d_cl_opt)
+                    d_cd_opt = np.sum(d_cd_opt)
+                partials[names["optimal_CL"], names[key]] = d_cl_opt
+                partials[names["optimal_CD"], names[key]] = d_cd_opt
+                partials[names["L_D_max"], names[key]] = (
+                    d_cl_opt / cd_opt - cl_opt * d_cd_opt / cd_opt**2
+                )
+
+    def _get_variable_names(self):
+        """
+        :return: names of OpenMDAO variables for current polar type, indexed by short names
+        """
+        return _get_polar_variable_names(self.options["polar_type"])
+
+
+@oad.RegisterSubmodel(SERVICE_MULTI_POLAR, "fastoad.submodel.aerodynamics.multi_polar.legacy")
+class ComputeMultiPolar(om.ExplicitComponent):
+    """
+    Computation of CL and CD for whole aircraft, for several low speed configurations at once.
+
+    Polars of option "polar_types" (LOW_SPEED, TAKEOFF and/or LANDING) are computed from the
+    same low speed CL, CD0, trim drag and induced drag coefficient, that are read and scaled
+    once. Only high-lift increments differ between configurations.
+
+    Inputs, outputs and results are the ones of :class:`ComputePolar` for each of these polar
+    types.
+    """
+
+    def initialize(self):
+        self.options.declare(
+            "polar_types",
+            default=[PolarType.LOW_SPEED, PolarType.TAKEOFF, PolarType.LANDING],
+            types=list,
+            desc="Polar types to compute. HIGH_SPEED is not allowed.",
+        )
+
+    def setup(self):
+        polar_types = self.options["polar_types"]
+        if PolarType.HIGH_SPEED in polar_types or len(set(polar_types)) != len(polar_types):
+            raise AttributeError(f"Invalid polar types: {polar_types}")
+
+        # Inputs that are not related to high-lift devices are the same for all polar types.
+        _add_polar_inputs(self, _get_polar_variable_names(polar_types[0]))
+        for polar_type in polar_types:
+            _add_polar_outputs(self, polar_type, _get_polar_variable_names(polar_type))
+
+    def setup_partials(self):
+        for polar_type in self.options["polar_types"]:
+            _declare_polar_partials(self, _get_polar_variable_names(polar_type))
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        names = _get_polar_variable_names(PolarType.LOW_SPEED)
+        k_cd = inputs[names["k_cd"]]
+        offset_cd = inputs[names["offset_cd"]]
+        k_winglet_cd = inputs[names["k_winglet_cd"]]
+        offset_winglet_cd = inputs[names["offset_winglet_cd"]]
+        cl_clean = inputs[names["cl"]]
+
+        # Terms that are common to all configurations (see ComputePolar.compute())
+        cd_cd0 = inputs[names["cd0"]] * k_cd
+        cd_trim_component = inputs[names["cd_trim"]] * k_cd
+        induced_factor = inputs[names["coef_k"]] * k_winglet_cd * k_cd
+        induced_offset = offset_winglet_cd * k_cd
+        cd_parasite = cd_cd0 + cd_trim_component
+
+        for polar_type in self.options["polar_types"]:
+            names = _get_polar_variable_names(polar_type)
+            if "delta_cl_hl" in names:
+                cl = cl_clean + inputs[names["delta_cl_hl"]]
+                cd_offset = inputs[names["delta_cd_hl"]] * k_cd + offset_cd
+                outputs[names["CL"]] = cl
+                outputs[names["CD:CD0"]] = cd_cd0
+                outputs[names["CD:trim"]] = cd_trim_component
+            else:
+                cl = cl_clean
+                cd_offset = offset_cd
+
+            cd_induced = induced_factor * cl**2 + induced_offset
+            outputs[names["CD"]] = cd_parasite + cd_induced + cd_offset
+            outputs[names["CD:induced"]] = cd_induced
+            outputs[f"data:aerodynamics:aircraft:{polar_type.value}:CD:wave"] = 0.0
+            outputs[names["CD:offset"]] = cd_offset
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        for polar_type in self.options["polar_types"]:
+            _compute_polar_partials(inputs, partials, _get_polar_variable_names(polar_type))
+
+
+# Short names of scalar inputs in _get_polar_variable_names(). The first 4 ones are
+# involved in induced drag for all polar types.
+_SCALAR_INPUTS = [
+    "k_cd",
+    "k_winglet_cd",
+    "offset_winglet_cd",
+    "coef_k",
+    "delta_cl_hl",
+    "offset_cd",
+    "delta_cd_hl",
+]
+
 
 def get_optimum_ClCd(ClCd):
-    lift_drag_ratio = ClCd[1, :] / ClCd[0, :]
-    optimum_index = np.argmax(lift_drag_ratio)
+    """
+    Kept for compatibility. See
+    :func:`~fastoad_cs25.models.aerodynamics.components.utils.polar_optimum.get_optimum_cl_cd`.
+
+    :param ClCd: 2-rows array with CD values in first row and CL values in second row
+    :return: CL and CD at maximum lift/drag ratio
+    """
+    return get_optimum_cl_cd(ClCd[1, :], ClCd[0, :])
+
+
+def _get_polar_variable_names(polar_type: PolarType) -> Dict[str, str]:
+    """
+    :return: names of OpenMDAO variables for given polar type, indexed by short names
+    """
+    names = {
+        "k_cd": "tuning:aerodynamics:aircraft:high_speed:CD:k",
+        "offset_cd": "tuning:aerodynamics:aircraft:high_speed:CD:offset",
+        "k_winglet_cd": "tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:k",
+        "offset_winglet_cd": "tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:offset",
+    }
+    if polar_type == PolarType.HIGH_SPEED:
+        input_tag = output_tag = "high_speed"
+        names["cd_wave"] = "data:aerodynamics:aircraft:high_speed:CD:wave"
+        for output_key in ["L_D_max", "optimal_CL", "optimal_CD"]:
+            names[output_key] = f"data:aerodynamics:aircraft:high_speed:{output_key}"
+    else:
+        input_tag = "low_speed"
+        output_tag = polar_type.value
+        if polar_type != PolarType.LOW_SPEED:
+            names["delta_cl_hl"] = f"data:aerodynamics:high_lift_devices:{output_tag}:CL"
+            names["delta_cd_hl"] = f"data:aerodynamics:high_lift_devices:{output_tag}:CD"
+            for output_key in ["CL", "CD:CD0", "CD:trim"]:
+                names[output_key] = f"data:aerodynamics:aircraft:{output_tag}:{output_key}"
+
+    names["cl"] = f"data:aerodynamics:aircraft:{input_tag}:CL"
+    names["cd0"] = f"data:aerodynamics:aircraft:{input_tag}:CD:CD0"
+    names["cd_trim"] = f"data:aerodynamics:aircraft:{input_tag}:CD:trim"
+    names["coef_k"] = f"data:aerodynamics:aircraft:{input_tag}:CD:induced:coefficient"
+    for output_key in ["CD", "CD:induced", "CD:offset"]:
+        names[output_key] = f"data:aerodynamics:aircraft:{output_tag}:{output_key}"
+
+    return names
+
+
+def _add_polar_inputs(system: om.ExplicitComponent, names: Dict[str, str]):
+    """
+    Adds inputs of the polar that are not related to high-lift devices.
+
+    :param system: the component where inputs are added
+    :param names: variable names, as provided by :func:`_get_polar_variable_names`
+    """
+    for key in ["k_cd", "offset_cd", "k_winglet_cd", "offset_winglet_cd", "coef_k"]:
+        system.add_input(names[key], val=np.nan, units="unitless")
+    for key in ["cl", "cd0", "cd_trim", "cd_wave"]:
+        if key in names:
+            system.add_input(names[key], shape_by_conn=True, val=np.nan, units="unitless")
+
+
+def _add_polar_outputs(system: om.ExplicitComponent, polar_type: PolarType, names: Dict[str, str]):
+    """
+    Adds inputs of high-lift increments, if any, and outputs of the polar, except the ones
+    of the optimum point of high speed polar.
+
+    :param system: the component where variables are added
+    :param polar_type: the polar type
+    :param names: variable names, as provided by :func:`_get_polar_variable_names`
+    """
+    if "delta_cl_hl" in names:
+        system.add_input(names["delta_cl_hl"], val=np.nan, units="unitless")
+        system.add_input(names["delta_cd_hl"], val=np.nan, units="unitless")
+    for key in ["CL", "CD", "CD:CD0", "CD:induced", "CD:trim"]:
+        if key in names:
+            system.add_output(names[key], copy_shape=names["cl"], units="unitless")
+    if polar_type != PolarType.HIGH_SPEED:
+        # Wave drag is not computed at low speed, but the output is expected.
+        system.add_output(
+            f"data:aerodynamics:aircraft:{polar_type.value}:CD:wave",
+            copy_shape=names["cl"],
+            units="unitless",
+        )
+    system.add_output(names["CD:offset"], units="unitless")
+
+
+def _declare_polar_partials(
+    system: om.ExplicitComponent, names: Dict[str, str]
+) -> Tuple[List[str], List[str]]:
+    """
+    Declares partials of CD, induced CD and offset CD, and for high-lift polars, of CL, CD0 and
+    trim CD.
+
+    :param system: the component where partials are declared
+    :param names: variable names, as provided by :func:`_get_polar_variable_names`
+    :return: names of vector inputs and of scalar inputs of the polar
+    """
+    cl_metadata = system.get_io_metadata(metadata_keys=["size"], includes=[names["cl"]])
+    diagonal = np.arange(cl_metadata[names["cl"]]["size"])
+    column = np.zeros_like(diagonal)
+    vector_inputs = [names[key] for key in ["cl", "cd0", "cd_trim", "cd_wave"] if key in names]
+    scalar_inputs = [names[key] for key in _SCALAR_INPUTS if key in names]
+
+    system.declare_partials(names["CD"], vector_inputs, rows=diagonal, cols=diagonal)
+    system.declare_partials(names["CD"], scalar_inputs, rows=diagonal, cols=column)
+    system.declare_partials(names["CD:induced"], names["cl"], rows=diagonal, cols=diagonal)
+    system.declare_partials(
+        names["CD:induced"],
+        [names[key] for key in _SCALAR_INPUTS[:4]],
+        rows=diagonal,
+        cols=column,
+    )
+    system.declare_partials(names["CD:offset"], names["offset_cd"], val=1.0)
+
+    if "delta_cl_hl" in names:
+        system.declare_partials(names["CL"], names["cl"], rows=diagonal, cols=diagonal, val=1.0)
+        system.declare_partials(
+            names["CL"], names["delta_cl_hl"], rows=diagonal, cols=column, val=1.0
+        )
+        system.declare_partials(
+            names["CD:induced"], names["delta_cl_hl"], rows=diagonal, cols=column
+        )
+        system.declare_partials(names["CD:offset"], [names["k_cd"], names["delta_cd_hl"]])
+        for output_key, input_key in [("CD:CD0", "cd0"), ("CD:trim", "cd_trim")]:
+            system.declare_partials(
+                names[output_key], names[input_key], rows=diagonal, cols=diagonal
+            )
+            system.declare_partials(names[output_key], names["k_cd"], rows=diagonal, cols=column)
+
+    return vector_inputs, scalar_inputs
+
+
+def _compute_polar_partials(inputs, partials, names: Dict[str, str]) -> Dict[str, np.ndarray]:
+    """
+    Computes partials declared by :func:`_declare_polar_partials`.
+
+    :param inputs: inputs of the component
+    :param partials: partials of the component, that are filled
+    :param names: variable names, as provided by :func:`_get_polar_variable_names`
+    :return: partials of total CD, indexed by short names of inputs
+    """
+    k_cd = inputs[names["k_cd"]]
+    k_winglet_cd = inputs[names["k_winglet_cd"]]
+    offset_winglet_cd = inputs[names["offset_winglet_cd"]]
+    coef_k = inputs[names["coef_k"]]
+    cl = inputs[names["cl"]]
+    cd0 = inputs[names["cd0"]]
+    cd_trim = inputs[names["cd_trim"]]
+    cd_c = inputs[names["cd_wave"]] if "cd_wave" in names else 0.0
+    delta_cl_hl = inputs[names["delta_cl_hl"]] if "delta_cl_hl" in names else 0.0
+    delta_cd_hl = inputs[names["delta_cd_hl"]] if "delta_cd_hl" in names else 0.0
+
+    # See ComputePolar.compute() for the equations
+    cl = cl + delta_cl_hl
+    cd_induced_raw = coef_k * cl**2 * k_winglet_cd + offset_winglet_cd
+
+    # Partials of induced drag
+    d_cd_induced = {
+        "cl": 2.0 * coef_k * cl * k_winglet_cd * k_cd,
+        "delta_cl_hl": 2.0 * coef_k * cl * k_winglet_cd * k_cd,
+        "k_cd": cd_induced_raw,
+        "k_winglet_cd": coef_k * cl**2 * k_cd,
+        "offset_winglet_cd": k_cd,
+        "coef_k": cl**2 * k_winglet_cd * k_cd,
+    }
+    # Partials of total drag
+    d_cd = dict(d_cd_induced)
+    d_cd.update(
+        {
+            "cd0": k_cd,
+            "cd_trim": k_cd,
+            "cd_wave": k_cd,
+            "delta_cd_hl": k_cd,
+            "offset_cd": 1.0,
+            "k_cd": cd0 + cd_c + cd_trim + cd_induced_raw + delta_cd_hl,
+        }
+    )
+
+    for key, value in d_cd.items():
+        if key in names:
+            partials[names["CD"], names[key]] = np.broadcast_to(value, cl.shape)
+    for key, value in d_cd_induced.items():
+        if key in names:
+            partials[names["CD:induced"], names[key]] = np.broadcast_to(value, cl.shape)
 
-    optimum_Cl = ClCd[1][optimum_index]
-    optimum_Cd = ClCd[0][optimum_index]
+    if "delta_cl_hl" in names:
+        partials[names["CD:offset"], names["k_cd"]] = delta_cd_hl
+        partials[names["CD:offset"], names["delta_cd_hl"]] = k_cd
+        partials[names["CD:CD0"], names["cd0"]] = np.broadcast_to(k_cd, cl.shape)
+        partials[names["CD:CD0"], names["k_cd"]] = cd0
+        partials[names["CD:trim"], names["cd_trim"]] = np.broadcast_to(k_cd, cl.shape)
+        partials[names["CD:trim"], names["k_cd"]] = cd_trim
 
-    return optimum_Cl, optimum_Cd
+    return d_cd
@@ -15,9 +15,9 @@
 import fastoad.api as oad
 import numpy as np
 from openmdao.core.explicitcomponent import ExplicitComponent
-from stdatm import AtmosphereSI
 
 from ..constants import SERVICE_REYNOLDS_COEFFICIENT
+from ...atmosphere import get_atmosphere
 
 
 @oad.RegisterSubmodel(
@@ -57,7 +57,7 @@ class ComputeReynolds(ExplicitComponent):
             mach = inputs["data:TLAR:cruise_mach"]
             altitude = inputs[self.options["altitude_var_name_high_speed"]]
 
-        atm = AtmosphereSI(altitude)
+        atm = get_atmosphere(altitude, altitude_in_feet=False)
         atm.mach = mach
         reynolds = atm.unitary_reynolds
 
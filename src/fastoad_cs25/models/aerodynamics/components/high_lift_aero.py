@@ -14,11 +14,13 @@ Computation of lift and drag increment due to high-lift devices
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from functools import lru_cache
 from importlib.resources import open_text
 
 import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
+from numpy.polynomial import polynomial
 from scipy import interpolate
 
 from . import resources
@@ -26,6 +28,154 @@ from ..constants import SERVICE_HIGH_LIFT
 
 LIFT_EFFECTIVENESS_FILENAME = "interpolation of lift effectiveness.txt"
 
+#: Flap chord ratios of the curves provided in :data:`LIFT_EFFECTIVENESS_FILENAME`
+LIFT_EFFECTIVENESS_CHORD_RATIOS = (0.15, 0.20, 0.25, 0.30, 0.40)
+
+# Polynomial coefficients, by increasing degree.
+# Leading edge slat effectiveness w.r.t. slat chord ratio
+_SLAT_CL_DELTA_COEFFICIENTS = np.array(
+    [
+        5.05503e-7,
+        0.00666,
+        0.23758,
+        -4.3639,
+        51.16323,
+        -320.10803,
+        1142.23033,
+        -2340.75209,
+        2570.35947,
+        -1173.73465,
+    ]
+)
+# Slat drag increment in percent w.r.t. slat angle in degrees
+_SLAT_CD0_COEFFICIENTS = np.array(
+    [
+        -0.00266,
+        0.06065,
+        -0.03023,
+        0.01055,
+        -0.00176,
+        1.77986e-4,
+        -1.11754e-5,
+        4.19082e-7,
+        -8.53492e-9,
+        7.24194e-11,
+    ]
+)
+# Flap drag increment in percent w.r.t. flap angle in degrees
+_FLAP_CD0_COEFFICIENTS = np.array([-0.01523, 0.05145, -9.53201e-4, 7.5972e-5])
+
+
+class LiftEffectivenessInterpolant:
+    """
+    Bivariate interpolant of flap lift effectiveness w.r.t. flap angle and flap chord ratio.
+
+    Flap angle is interpolated with one cubic spline per tabulated flap chord ratio, then
+    the result is interpolated along flap chord ratio with a cubic spline.
+    Because an interpolating spline is linear w.r.t. its ordinates, the second
+    interpolation is done by weighting the first ones with the splines of the unit vectors,
+    which are computed once for all. This way, both interpolations are vectorized.
+
+    Instances are not meant to be modified after creation. The instance built from package
+    resources is obtained with :func:`get_lift_effectiveness_interpolant`.
+    """
+
+    def __init__(self, angle_curves, chord_ratios):
+        """
+        :param angle_curves: sequence of (flap angles in degrees, lift effectiveness) curves,
+                             one per item of chord_ratios
+        :param chord_ratios: flap chord ratios of the curves in angle_curves
+        """
+        self._angle_splines = tuple(
+            self._read_only_spline(interpolate.splrep(angles, values, s=0))
+            for angles, values in angle_curves
+        )
+
+        # Unit vector splines share the same knots, so they are gathered in one spline
+        unit_splines = [
+            interpolate.splrep(chord_ratios, unit_values, s=0)
+            for unit_values in np.eye(len(chord_ratios))
+        ]
+        knots, _, degree = unit_splines[0]
+        self._chord_ratio_weights = self._read_only_spline(
+            (knots, np.stack([tck[1] for tck in unit_splines], axis=-1), degree)
+        )
+
+        self._angle_derivative_splines = tuple(
+            spline.derivative() for spline in self._angle_splines
+        )
+        self._chord_ratio_weight_derivatives = self._chord_ratio_weights.derivative()
+
+    @classmethod
+    def from_resource(cls) -> "LiftEffectivenessInterpolant":
+        """
+        :return: the interpolant built from :data:`LIFT_EFFECTIVENESS_FILENAME`
+        """
+        with open_text(resources, LIFT_EFFECTIVENESS_FILENAME) as data_file:
+            data = np.loadtxt(data_file, delimiter=",")
+
+        angle_curves = [(data[:, 2 * i], data[:, 2 * i + 1]) for i in range(data.shape[1] // 2)]
+        return cls(angle_curves, LIFT_EFFECTIVENESS_CHORD_RATIOS)
+
+    def __call__(self, flap_angle, chord_ratio):
+        """
+        Inputs are broadcast against each other.
+
+        :param flap_angle: in degrees
+        :param chord_ratio: ratio of flap chord to clean chord
+        :return: lift effectiveness, with the broadcast shape of inputs
+        """
+        flap_angle, chord_ratio = self._broadcast(flap_angle, chord_ratio)
+        angle_values = self._evaluate(self._angle_splines, flap_angle)
+        chord_ratio_weights = self._chord_ratio_weights(chord_ratio)
+
+        return np.sum(angle_values * chord_ratio_weights, axis=-1)
+
+    def partial_derivatives(self, flap_angle, chord_ratio):
+        """
+        Inputs are broadcast against each other.
+
+        :param flap_angle: in degrees
+        :param chord_ratio: ratio of flap chord to clean chord
+        :return: derivatives of lift effectiveness w.r.t. flap angle (in 1/deg) and w.r.t. flap
+                 chord ratio, with the broadcast shape of inputs
+        """
+        flap_angle, chord_ratio = self._broadcast(flap_angle, chord_ratio)
+        angle_values = self._evaluate(self._angle_splines, flap_angle)
+        angle_derivatives = self._evaluate(self._angle_derivative_splines, flap_angle)
+        chord_ratio_weights = self._chord_ratio_weights(chord_ratio)
+        chord_ratio_weight_derivatives = self._chord_ratio_weight_derivatives(chord_ratio)
+
+        return (
+            np.sum(angle_derivatives * chord_ratio_weights, axis=-1),
+            np.sum(angle_values * chord_ratio_weight_derivatives, axis=-1),
+        )
+
+    @staticmethod
+    def _broadcast(flap_angle, chord_ratio):
+        return np.broadcast_arrays(
+            np.asarray(flap_angle, dtype=float), np.asarray(chord_ratio, dtype=float)
+        )
+
+    @staticmethod
+    def _evaluate(splines, x):
+        return np.stack([spline(x) for spline in splines], axis=-1)
+
+    @staticmethod
+    def _read_only_spline(tck) -> interpolate.BSpline:
+        spline = interpolate.BSpline(*tck)
+        spline.t.setflags(write=False)
+        spline.c.setflags(write=False)
+        return spline
+
+
+@lru_cache(maxsize=None)
+def get_lift_effectiveness_interpolant() -> LiftEffectivenessInterpolant:
+    """
+    :return: the interpolant of flap lift effectiveness, built on first call only
+    """
+    return LiftEffectivenessInterpolant.from_resource()
+
 
 @oad.RegisterSubmodel(SERVICE_HIGH_LIFT, "fastoad.submodel.aerodynamics.high_lift.legacy")
 class ComputeDeltaHighLift(om.ExplicitComponent):
@@ -35,20 +185,38 @@ class ComputeDeltaHighLift(om.ExplicitComponent):
 
     def initialize(self):
         self.options.declare("landing_flag", default=False, types=bool)
+        self.options.declare(
+            "setting_count",
+            default=1,
+            types=int,
+            lower=1,
+            desc="Number of flap/slat settings that are computed at once. Flap and slat angles "
+            "and increments of lift and drag coefficients are vectors of this size.",
+        )
 
     def setup(self):
-        if self.options["landing_flag"]:
-            self.add_input("data:mission:sizing:landing:flap_angle", val=np.nan, units="deg")
-            self.add_input("data:mission:sizing:landing:slat_angle", val=np.nan, units="deg")
-            self.add_input("data:aerodynamics:aircraft:landing:mach", val=np.nan, units="unitless")
-            self.add_output("data:aerodynamics:high_lift_devices:landing:CL", units="unitless")
-            self.add_output("data:aerodynamics:high_lift_devices:landing:CD", units="unitless")
-        else:
-            self.add_input("data:mission:sizing:takeoff:flap_angle", val=np.nan, units="deg")
-            self.add_input("data:mission:sizing:takeoff:slat_angle", val=np.nan, units="deg")
-            self.add_input("data:aerodynamics:aircraft:takeoff:mach", val=np.nan, units="unitless")
-            self.add_output("data:aerodynamics:high_lift_devices:takeoff:CL", units="unitless")
-            self.add_output("data:aerodynamics:high_lift_devices:takeoff:CD", units="unitless")
+        phase = self._get_phase()
+        setting_count = self.options["setting_count"]
+
+        self.add_input(
+            f"data:mission:sizing:{phase}:flap_angle",
+            val=np.nan,
+            shape=setting_count,
+            units="deg",
+        )
+        self.add_input(
+            f"data:mission:sizing:{phase}:slat_angle",
+            val=np.nan,
+            shape=setting_count,
+            units="deg",
+        )
+        self.add_input(f"data:aerodynamics:aircraft:{phase}:mach", val=np.nan, units="unitless")
+        self.add_output(
+            f"data:aerodynamics:high_lift_devices:{phase}:CL", shape=setting_count, units="unitless"
+        )
+        self.add_output(
+            f"data:aerodynamics:high_lift_devices:{phase}:CD", shape=setting_count, units="unitless"
+        )
 
         self.add_input("data:geometry:wing:sweep_0", val=np.nan, units="rad")
         self.add_input("data:geometry:wing:sweep_100_outer", val=np.nan, units="rad")
@@ -68,24 +236,97 @@ class ComputeDeltaHighLift(om.ExplicitComponent):
         )
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        phase = self._get_phase()
+        diagonal = np.arange(self.options["setting_count"])
+        column = np.zeros_like(diagonal)
+
+        self.declare_partials(
+            f"data:aerodynamics:high_lift_devices:{phase}:CL",
+            [
+                f"data:mission:sizing:{phase}:flap_angle",
+                f"data:mission:sizing:{phase}:slat_angle",
+            ],
+            rows=diagonal,
+            cols=diagonal,
+        )
+        self.declare_partials(
+            f"data:aerodynamics:high_lift_devices:{phase}:CL",
+            [
+                f"data:aerodynamics:aircraft:{phase}:mach",
+                "data:geometry:wing:sweep_0",
+                "data:geometry:wing:sweep_100_outer",
+                "data:geometry:flap:chord_ratio",
+                "data:geometry:flap:span_ratio",
+                "data:geometry:slat:chord_ratio",
+                "data:geometry:slat:span_ratio",
+                "tuning:aerodynamics:high_lift_devices:landing:CL:multi_slotted_flap_effect:k",
+            ],
+            rows=diagonal,
+            cols=column,
+        )
+        self.declare_partials(
+            f"data:aerodynamics:high_lift_devices:{phase}:CD",
+            [
+                f"data:mission:sizing:{phase}:flap_angle",
+                f"data:mission:sizing:{phase}:slat_angle",
+            ],
+            rows=diagonal,
+            cols=diagonal,
+        )
+        self.declare_partials(
+            f"data:aerodynamics:high_lift_devices:{phase}:CD",
+            [
+                "data:geometry:flap:span_ratio",
+                "data:geometry:slat:span_ratio",
+                "tuning:aerodynamics:high_lift_devices:landing:CD:multi_slotted_flap_effect:k",
+            ],
+            rows=diagonal,
+            cols=column,
+        )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
-        if self.options["landing_flag"]:
-            flap_angle = inputs["data:mission:sizing:landing:flap_angle"]
-            slat_angle = inputs["data:mission:sizing:landing:slat_angle"]
-            mach = inputs["data:aerodynamics:aircraft:landing:mach"]
-        else:
-            flap_angle = inputs["data:mission:sizing:takeoff:flap_angle"]
-            slat_angle = inputs["data:mission:sizing:takeoff:slat_angle"]
-            mach = inputs["data:aerodynamics:aircraft:takeoff:mach"]
-
-        k_cd_slot = inputs[
-            "tuning:aerodynamics:high_lift_devices:landing:CD:multi_slotted_flap_effect:k"
-        ]
-        k_cl_slot = inputs[
+        phase = self._get_phase()
+
+        outputs[f"data:aerodynamics:high_lift_devices:{phase}:CL"] = self._get_delta_cl(
+            inputs[f"data:mission:sizing:{phase}:slat_angle"],
+            inputs[f"data:mission:sizing:{phase}:flap_angle"],
+            inputs["data:geometry:slat:span_ratio"],
+            inputs["data:geometry:flap:span_ratio"],
+            inputs["data:geometry:slat:chord_ratio"],
+            inputs["data:geometry:flap:chord_ratio"],
+            inputs[f"data:aerodynamics:aircraft:{phase}:mach"],
+            inputs["data:geometry:wing:sweep_0"],
+            inputs["data:geometry:wing:sweep_100_outer"],
+            inputs["tuning:aerodynamics:high_lift_devices:landing:CL:multi_slotted_flap_effect:k"],
+        )
+        outputs[f"data:aerodynamics:high_lift_devices:{phase}:CD"] = self._get_delta_cd(
+            inputs[f"data:mission:sizing:{phase}:slat_angle"],
+            inputs[f"data:mission:sizing:{phase}:flap_angle"],
+            inputs["data:geometry:slat:span_ratio"],
+            inputs["data:geometry:flap:span_ratio"],
+            inputs["tuning:aerodynamics:high_lift_devices:landing:CD:multi_slotted_flap_effect:k"],
+        )
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        phase = self._get_phase()
+        cl_name = f"data:aerodynamics:high_lift_devices:{phase}:CL"
+        cd_name = f"data:aerodynamics:high_lift_devices:{phase}:CD"
+
+        flap_angle_name = f"data:mission:sizing:{phase}:flap_angle"
+        slat_angle_name = f"data:mission:sizing:{phase}:slat_angle"
+        mach_name = f"data:aerodynamics:aircraft:{phase}:mach"
+        k_cl_slot_name = (
             "tuning:aerodynamics:high_lift_devices:landing:CL:multi_slotted_flap_effect:k"
-        ]
+        )
+        k_cd_slot_name = (
+            "tuning:aerodynamics:high_lift_devices:landing:CD:multi_slotted_flap_effect:k"
+        )
+
+        flap_angle_deg = inputs[flap_angle_name]
+        slat_angle_deg = inputs[slat_angle_name]
+        mach = inputs[mach_name]
+        k_cl_slot = inputs[k_cl_slot_name]
+        k_cd_slot = inputs[k_cd_slot_name]
         le_sweep_angle = inputs["data:geometry:wing:sweep_0"]
         te_sweep_angle = inputs["data:geometry:wing:sweep_100_outer"]
         flap_chord_ratio = inputs["data:geometry:flap:chord_ratio"]
@@ -93,38 +334,98 @@ class ComputeDeltaHighLift(om.ExplicitComponent):
         slat_chord_ratio = inputs["data:geometry:slat:chord_ratio"]
         slat_span_ratio = inputs["data:geometry:slat:span_ratio"]
 
-        if self.options["landing_flag"]:
-            outputs["data:aerodynamics:high_lift_devices:landing:CL"] = self._get_delta_cl(
-                slat_angle,
-                flap_angle,
-                slat_span_ratio,
-                flap_span_ratio,
-                slat_chord_ratio,
-                flap_chord_ratio,
-                mach,
-                le_sweep_angle,
-                te_sweep_angle,
-                k_cl_slot,
-            )
-            outputs["data:aerodynamics:high_lift_devices:landing:CD"] = self._get_delta_cd(
-                slat_angle, flap_angle, slat_span_ratio, flap_span_ratio, k_cd_slot
-            )
-        else:
-            outputs["data:aerodynamics:high_lift_devices:takeoff:CL"] = self._get_delta_cl(
-                slat_angle,
-                flap_angle,
-                slat_span_ratio,
-                flap_span_ratio,
-                slat_chord_ratio,
-                flap_chord_ratio,
-                mach,
-                le_sweep_angle,
-                te_sweep_angle,
-                k_cl_slot,
+        # Lift: see _get_delta_cl() for the equations.
+        flap_angle = np.radians(flap_angle_deg)
+        slat_angle = np.radians(slat_angle_deg)
+
+        ratio_c_flap = 1.0 + flap_chord_ratio * np.cos(flap_angle)
+        alpha_flap = self._compute_alpha_flap(flap_angle * 57.3, flap_chord_ratio)
+        d_alpha_flap_d_angle, d_alpha_flap_d_chord_ratio = (
+            get_lift_effectiveness_interpolant().partial_derivatives(
+                flap_angle * 57.3, flap_chord_ratio
             )
-            outputs["data:aerodynamics:high_lift_devices:takeoff:CD"] = self._get_delta_cd(
-                slat_angle, flap_angle, slat_span_ratio, flap_span_ratio, k_cd_slot
+        )
+        compressibility_factor = 2.0 * np.pi / np.sqrt(1 - mach**2)
+        # Flap increment without multiple slotted flap correction, so that derivative w.r.t.
+        # k_cl_slot is defined even if k_cl_slot is zero.
+        base_delta_cl_flap = compressibility_factor * ratio_c_flap * alpha_flap * flap_angle
+        delta_cl_flap = base_delta_cl_flap * k_cl_slot
+        d_delta_cl_flap_d_angle = (
+            compressibility_factor
+            * k_cl_slot
+            * (
+                -flap_chord_ratio * np.sin(flap_angle) * alpha_flap * flap_angle
+                + ratio_c_flap * d_alpha_flap_d_angle * 57.3 * flap_angle
+                + ratio_c_flap * alpha_flap
             )
+        )
+        d_delta_cl_flap_d_chord_ratio = (
+            compressibility_factor
+            * k_cl_slot
+            * flap_angle
+            * (np.cos(flap_angle) * alpha_flap + ratio_c_flap * d_alpha_flap_d_chord_ratio)
+        )
+
+        ratio_c_slat = 1.0 + slat_chord_ratio * np.cos(slat_angle)
+        cl_delta = polynomial.polyval(slat_chord_ratio, _SLAT_CL_DELTA_COEFFICIENTS)
+        d_cl_delta = polynomial.polyval(
+            slat_chord_ratio, polynomial.polyder(_SLAT_CL_DELTA_COEFFICIENTS)
+        )
+        delta_cl_slat = cl_delta * slat_angle * 57.3 * ratio_c_slat
+        d_delta_cl_slat_d_angle = (
+            cl_delta * 57.3 * (ratio_c_slat - slat_chord_ratio * np.sin(slat_angle) * slat_angle)
+        )
+        d_delta_cl_slat_d_chord_ratio = (
+            57.3 * slat_angle * (d_cl_delta * ratio_c_slat + cl_delta * np.cos(slat_angle))
+        )
+
+        flap_3d_factor = flap_span_ratio * np.cos(te_sweep_angle)
+        slat_3d_factor = slat_span_ratio * np.cos(le_sweep_angle)
+
+        partials[cl_name, flap_angle_name] = (
+            d_delta_cl_flap_d_angle * flap_3d_factor * np.pi / 180.0
+        )
+        partials[cl_name, slat_angle_name] = (
+            d_delta_cl_slat_d_angle * slat_3d_factor * np.pi / 180.0
+        )
+        partials[cl_name, mach_name] = delta_cl_flap * mach / (1 - mach**2) * flap_3d_factor
+        partials[cl_name, "data:geometry:wing:sweep_0"] = (
+            -delta_cl_slat * slat_span_ratio * np.sin(le_sweep_angle)
+        )
+        partials[cl_name, "data:geometry:wing:sweep_100_outer"] = (
+            -delta_cl_flap * flap_span_ratio * np.sin(te_sweep_angle)
+        )
+        partials[cl_name, "data:geometry:flap:chord_ratio"] = (
+            d_delta_cl_flap_d_chord_ratio * flap_3d_factor
+        )
+        partials[cl_name, "data:geometry:flap:span_ratio"] = delta_cl_flap * np.cos(te_sweep_angle)
+        partials[cl_name, "data:geometry:slat:chord_ratio"] = (
+            d_delta_cl_slat_d_chord_ratio * slat_3d_factor
+        )
+        partials[cl_name, "data:geometry:slat:span_ratio"] = delta_cl_slat * np.cos(le_sweep_angle)
+        partials[cl_name, k_cl_slot_name] = base_delta_cl_flap * flap_3d_factor
+
+        # Drag: see _get_delta_cd() for the equations.
+        cd0_slat_percent = polynomial.polyval(slat_angle_deg, _SLAT_CD0_COEFFICIENTS)
+        cd0_flap_percent = polynomial.polyval(flap_angle_deg, _FLAP_CD0_COEFFICIENTS)
+
+        partials[cd_name, flap_angle_name] = (
+            polynomial.polyval(flap_angle_deg, polynomial.polyder(_FLAP_CD0_COEFFICIENTS))
+            * k_cd_slot
+            * flap_span_ratio
+            / 100
+        )
+        partials[cd_name, slat_angle_name] = (
+            polynomial.polyval(slat_angle_deg, polynomial.polyder(_SLAT_CD0_COEFFICIENTS))
+            * slat_span_ratio
+            / 100
+        )
+        partials[cd_name, "data:geometry:flap:span_ratio"] = cd0_flap_percent * k_cd_slot / 100
+        partials[cd_name, "data:geometry:slat:span_ratio"] = cd0_slat_percent / 100
+        partials[cd_name, k_cd_slot_name] = cd0_flap_percent * flap_span_ratio / 100
+
+    def _get_phase(self):
+        return "landing" if self.options["landing_flag"] else "takeoff"
 
     def _get_delta_cl(
         self,
@@ -172,18 +473,7 @@ class ComputeDeltaHighLift(om.ExplicitComponent):
         ratio_c_slat = 1.0 + slat_chord_ratio * np.cos(slat_angle)
 
         # leading edge slat effectiveness
-        cl_delta = (
-            5.05503e-7
-            + 0.00666 * slat_chord_ratio
-            + 0.23758 * slat_chord_ratio**2
-            - 4.3639 * slat_chord_ratio**3
-            + 51.16323 * slat_chord_ratio**4
-            - 320.10803 * slat_chord_ratio**5
-            + 1142.23033 * slat_chord_ratio**6
-            - 2340.75209 * slat_chord_ratio**7
-            + 2570.35947 * slat_chord_ratio**8
-            - 1173.73465 * slat_chord_ratio**9
-        )
+        cl_delta = polynomial.polyval(slat_chord_ratio, _SLAT_CL_DELTA_COEFFICIENTS)
 
         #  cl created by the slat in 2D
         delta_cl_slat = cl_delta * slat_angle * 57.3 * ratio_c_slat
@@ -208,29 +498,9 @@ class ComputeDeltaHighLift(om.ExplicitComponent):
         :return: increment of drag coefficient
         """
 
-        cd0_slat = (
-            (
-                -0.00266
-                + 0.06065 * slat_angle
-                - 0.03023 * slat_angle**2
-                + 0.01055 * slat_angle**3
-                - 0.00176 * slat_angle**4
-                + 1.77986e-4 * slat_angle**5
-                - 1.11754e-5 * slat_angle**6
-                + 4.19082e-7 * slat_angle**7
-                - 8.53492e-9 * slat_angle**8
-                + 7.24194e-11 * slat_angle**9
-            )
-            * slat_span_ratio
-            / 100
-        )
+        cd0_slat = polynomial.polyval(slat_angle, _SLAT_CD0_COEFFICIENTS) * slat_span_ratio / 100
         cd0_flap = (
-            (
-                -0.01523
-                + 0.05145 * flap_angle
-                - 9.53201e-4 * flap_angle**2
-                + 7.5972e-5 * flap_angle**3
-            )
+            polynomial.polyval(flap_angle, _FLAP_CD0_COEFFICIENTS)
             * k_cd_slot
             * flap_span_ratio
             / 100
@@ -239,45 +509,6 @@ class ComputeDeltaHighLift(om.ExplicitComponent):
 
         return total_cd0
 
-    def _compute_alpha_flap(self, flap_angle, ratio_cf_flap):
-        temp_array = []
-        with open_text(resources, LIFT_EFFECTIVENESS_FILENAME) as fichier:
-            for line in fichier:
-                temp_array.append([float(x) for x in line.split(",")])
-        x1 = []
-        y1 = []
-        x2 = []
-        y2 = []
-        x3 = []
-        y3 = []
-        x4 = []
-        y4 = []
-        x5 = []
-        y5 = []
-
-        for arr in temp_array:
-            x1.append(arr[0])
-            y1.append(arr[1])
-            x2.append(arr[2])
-            y2.append(arr[3])
-            x3.append(arr[4])
-            y3.append(arr[5])
-            x4.append(arr[6])
-            y4.append(arr[7])
-            x5.append(arr[8])
-            y5.append(arr[9])
-
-        tck1 = interpolate.splrep(x1, y1, s=0)
-        tck2 = interpolate.splrep(x2, y2, s=0)
-        tck3 = interpolate.splrep(x3, y3, s=0)
-        tck4 = interpolate.splrep(x4, y4, s=0)
-        tck5 = interpolate.splrep(x5, y5, s=0)
-        ynew1 = interpolate.splev(flap_angle, tck1, der=0)
-        ynew2 = interpolate.splev(flap_angle, tck2, der=0)
-        ynew3 = interpolate.splev(flap_angle, tck3, der=0)
-        ynew4 = interpolate.splev(flap_angle, tck4, der=0)
-        ynew5 = interpolate.splev(flap_angle, tck5, der=0)
-        zs = [0.15, 0.20, 0.25, 0.30, 0.40]
-        y_final = [ynew1, ynew2, ynew3, ynew4, ynew5]
-        tck6 = interpolate.splrep(zs, y_final, s=0)
-        return interpolate.splev(ratio_cf_flap, tck6, der=0)
+    @staticmethod
+    def _compute_alpha_flap(flap_angle, ratio_cf_flap):
+        return get_lift_effectiveness_interpolant()(flap_angle, ratio_cf_flap)
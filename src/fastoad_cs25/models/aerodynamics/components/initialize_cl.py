@@ -16,7 +16,8 @@ import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
 
-from ..constants import POLAR_POINT_COUNT, SERVICE_INITIALIZE_CL
+from .utils.cl_sampling import ClSampling
+from ..constants import SERVICE_INITIALIZE_CL
 
 
 @oad.RegisterSubmodel(SERVICE_INITIALIZE_CL, "fastoad.submodel.aerodynamics.initialize_CL.legacy")
@@ -25,8 +26,18 @@ class InitializeClPolar(om.ExplicitComponent):
 
     def initialize(self):
         self.options.declare("low_speed_aero", default=False, types=bool)
+        self.options.declare(
+            "cl_sampling",
+            default=None,
+            types=(ClSampling, dict),
+            allow_none=True,
+            desc="Definition of base CL values, as a ClSampling instance or a dictionary of "
+            "its arguments. If None, default ClSampling is used.",
+        )
 
     def setup(self):
+        self._base_cl = ClSampling.from_option(self.options["cl_sampling"]).get_values()
+
         self.add_input("tuning:aerodynamics:aircraft:high_speed:CL:k", val=np.nan, units="unitless")
         self.add_input(
             "tuning:aerodynamics:aircraft:high_speed:CL:offset", val=np.nan, units="unitless"
@@ -44,17 +55,38 @@ class InitializeClPolar(om.ExplicitComponent):
 
         if self.options["low_speed_aero"]:
             self.add_output(
-                "data:aerodynamics:aircraft:low_speed:CL", shape=POLAR_POINT_COUNT, units="unitless"
+                "data:aerodynamics:aircraft:low_speed:CL",
+                shape=self._base_cl.size,
+                units="unitless",
             )
         else:
             self.add_output(
                 "data:aerodynamics:aircraft:high_speed:CL",
-                shape=POLAR_POINT_COUNT,
+                shape=self._base_cl.size,
                 units="unitless",
             )
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        point_count = self._base_cl.size
+        self.declare_partials(
+            "*",
+            [
+                "tuning:aerodynamics:aircraft:high_speed:CL:k",
+                "tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:k",
+            ],
+            rows=np.arange(point_count),
+            cols=np.zeros(point_count, dtype=int),
+        )
+        self.declare_partials(
+            "*",
+            [
+                "tuning:aerodynamics:aircraft:high_speed:CL:offset",
+                "tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:offset",
+            ],
+            rows=np.arange(point_count),
+            cols=np.zeros(point_count, dtype=int),
+            val=1.0,
+        )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         k_cl = inputs["tuning:aerodynamics:aircraft:high_speed:CL:k"]
@@ -65,9 +97,25 @@ class InitializeClPolar(om.ExplicitComponent):
         ]
 
         # FIXME: initialization of CL range should be done more directly, without these coefficients
-        cl = np.arange(0.0, 1.5, 0.01) * k_cl * k_winglet_cl + offset_cl + offset_winglet_cl
+        cl = self._base_cl * k_cl * k_winglet_cl + offset_cl + offset_winglet_cl
 
         if self.options["low_speed_aero"]:
             outputs["data:aerodynamics:aircraft:low_speed:CL"] = cl
         else:
             outputs["data:aerodynamics:aircraft:high_speed:CL"] = cl
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        k_cl = inputs["tuning:aerodynamics:aircraft:high_speed:CL:k"]
+        k_winglet_cl = inputs["tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:k"]
+        cl_name = (
+            "data:aerodynamics:aircraft:low_speed:CL"
+            if self.options["low_speed_aero"]
+            else "data:aerodynamics:aircraft:high_speed:CL"
+        )
+
+        partials[cl_name, "tuning:aerodynamics:aircraft:high_speed:CL:k"] = (
+            self._base_cl * k_winglet_cl
+        )
+        partials[cl_name, "tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:k"] = (
+            self._base_cl * k_cl
+        )
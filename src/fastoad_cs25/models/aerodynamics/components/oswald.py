@@ -18,6 +18,7 @@ import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
 
+from .utils.induced_drag import compute_induced_drag_coefficient, compute_oswald_coefficient
 from ..constants import SERVICE_INDUCED_DRAG_COEFFICIENT, SERVICE_OSWALD_COEFFICIENT
 
 
@@ -58,16 +59,14 @@ class InducedDragCoefficient(om.ExplicitComponent):
         self.declare_partials("*", "*", method="fd")
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
-        wing_area = inputs["data:geometry:wing:area"]
-        span = inputs["data:geometry:wing:span"] / np.cos(5.0 / 180 * np.pi)
-        aspect_ratio = span**2 / wing_area
-
         if self.options["low_speed_aero"]:
             coef_e = inputs["data:aerodynamics:aircraft:low_speed:oswald_coefficient"]
         else:
             coef_e = inputs["data:aerodynamics:aircraft:high_speed:oswald_coefficient"]
 
-        coef_k = 1.0 / (np.pi * aspect_ratio * coef_e)
+        coef_k = compute_induced_drag_coefficient(
+            inputs["data:geometry:wing:area"], inputs["data:geometry:wing:span"], coef_e
+        )
 
         if self.options["low_speed_aero"]:
             outputs["data:aerodynamics:aircraft:low_speed:CD:induced:coefficient"] = coef_k
@@ -111,33 +110,21 @@ class OswaldCoefficient(om.ExplicitComponent):
         self.declare_partials("*", "*", method="fd")
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
-        wing_area = inputs["data:geometry:wing:area"]
-        span = inputs["data:geometry:wing:span"] / np.cos(5.0 / 180 * np.pi)
-        height_fus = inputs["data:geometry:fuselage:maximum_height"]
-        width_fus = inputs["data:geometry:fuselage:maximum_width"]
-        l2_wing = inputs["data:geometry:wing:root:chord"]
-        l4_wing = inputs["data:geometry:wing:tip:chord"]
-        sweep_25 = inputs["data:geometry:wing:sweep_25"]
         if self.options["low_speed_aero"]:
             mach = inputs["data:aerodynamics:aircraft:takeoff:mach"]
         else:
             mach = inputs["data:TLAR:cruise_mach"]
 
-        aspect_ratio = span**2 / wing_area
-        df = np.sqrt(width_fus * height_fus)
-        lamda = l4_wing / l2_wing
-        delta_lamda = -0.357 + 0.45 * np.exp(0.0375 * sweep_25 / 180.0 * np.pi)
-        lamda = lamda - delta_lamda
-        f_lamda = 0.0524 * lamda**4 - 0.15 * lamda**3 + 0.1659 * lamda**2 - 0.0706 * lamda + 0.0119
-        e_theory = 1 / (1 + f_lamda * aspect_ratio)
-
-        if mach <= 0.4:
-            ke_m = 1.0
-        else:
-            ke_m = -0.001521 * ((mach - 0.05) / 0.3 - 1) ** 10.82 + 1
-
-        ke_f = 1 - 2 * (df / span) ** 2
-        coef_e = e_theory * ke_f * ke_m * 0.9
+        coef_e = compute_oswald_coefficient(
+            inputs["data:geometry:wing:area"],
+            inputs["data:geometry:wing:span"],
+            inputs["data:geometry:fuselage:maximum_height"],
+            inputs["data:geometry:fuselage:maximum_width"],
+            inputs["data:geometry:wing:root:chord"],
+            inputs["data:geometry:wing:tip:chord"],
+            inputs["data:geometry:wing:sweep_25"],
+            mach,
+        )
 
         if self.options["low_speed_aero"]:
             outputs["data:aerodynamics:aircraft:low_speed:oswald_coefficient"] = coef_e
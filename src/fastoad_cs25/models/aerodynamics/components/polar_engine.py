@@ -0,0 +1,606 @@
+"""Fused computation of aerodynamic polar in cruise or low speed conditions."""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Dict, List, Mapping, Set, Tuple
+
+import numpy as np
+import openmdao.api as om
+
+# Modules of registered components must not be imported here: this module is imported by
+# registered groups, and these modules would then be imported while plugins are being loaded.
+from .utils.cd0_bodies import compute_cd0_fuselage, compute_cd0_nacelles, compute_cd0_pylons
+from .utils.cd0_lifting_surface import LiftingSurfaceGeometry, compute_cd0_lifting_surface
+from .utils.cl_alpha import compute_cl_alpha
+from .utils.cl_sampling import ClSampling
+from .utils.compressibility_drag import compute_compressibility_drag
+from .utils.induced_drag import compute_induced_drag_coefficient, compute_oswald_coefficient
+from .utils.parasitic_drag import get_parasitic_drag_factor
+from .utils.polar_optimum import get_optimum_cl_cd
+from .utils.trim_drag import compute_trim_drag
+from ...atmosphere import get_atmosphere
+
+#: Step for complex-step computation of partials
+COMPLEX_STEP = 1.0e-30
+
+# Altitude step for finite difference of unit Reynolds number w.r.t. altitude
+_ALTITUDE_STEP = 1.0  # in m
+
+
+class PolarEngine(om.ExplicitComponent):
+    """
+    Computes in one component what is computed by the chain of components of
+    :class:`~fastoad_cs25.models.aerodynamics.aerodynamics_high_speed.AerodynamicsHighSpeed`
+    or :class:`~fastoad_cs25.models.aerodynamics.aerodynamics_low_speed.AerodynamicsLowSpeed`
+    (Oswald coefficient, Reynolds number, CL vector, CD0 of all aircraft parts,
+    compressibility and trim drag, polar, CL gradient and angle of attack).
+
+    Inputs and outputs are the same as those of the chained components, and so are the
+    models, but all computations are done in one vectorized pass, which avoids the
+    overhead of OpenMDAO data transfers between components.
+
+    As all inputs are scalars, partials are columns. They are obtained with complex step,
+    where all inputs are perturbed at once, each one in its own row of 2D arrays.
+    """
+
+    def initialize(self):
+        self.options.declare("low_speed_aero", default=False, types=bool)
+        self.options.declare(
+            "altitude_var_name_high_speed",
+            default="data:mission:sizing:main_route:cruise:altitude_input",
+            types=str,
+            desc="Name of the variable to use for cruise altitude evaluation in Reynolds number "
+            "computation.",
+        )
+        self.options.declare(
+            "cl_sampling",
+            default=None,
+            types=(ClSampling, dict),
+            allow_none=True,
+            desc="Definition of base CL values, as a ClSampling instance or a dictionary of "
+            "its arguments. If None, default ClSampling is used.",
+        )
+
+    def setup(self):
+        self._base_cl = ClSampling.from_option(self.options["cl_sampling"]).get_values()
+
+        for name, units, default in self._get_inputs():
+            self.add_input(name, val=default, units=units)
+
+        for name, (units, is_vector, _) in self._get_outputs().items():
+            self.add_output(name, shape=self._base_cl.size if is_vector else 1, units=units)
+
+    def setup_partials(self):
+        rows = np.arange(self._base_cl.size)
+        cols = np.zeros(self._base_cl.size, dtype=int)
+        for name, (_, is_vector, dependencies) in self._get_outputs().items():
+            if not dependencies:
+                continue
+            if is_vector:
+                self.declare_partials(name, sorted(dependencies), rows=rows, cols=cols)
+            else:
+                self.declare_partials(name, sorted(dependencies))
+
+        # The only constant partial
+        ls_tag = "low_speed" if self.options["low_speed_aero"] else "high_speed"
+        self.declare_partials(
+            f"data:aerodynamics:aircraft:{ls_tag}:CD:offset",
+            "tuning:aerodynamics:aircraft:high_speed:CD:offset",
+            val=1.0,
+        )
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        values = {name: inputs[name].reshape(1, 1) for name, _, _ in self._get_inputs()}
+        results = self._compute_polar(values)
+        for name, (_, is_vector, _) in self._get_outputs().items():
+            outputs[name] = results[name][0] if is_vector else results[name][0, 0]
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        input_names = [name for name, _, _ in self._get_inputs()]
+
+        # Row i of each array has its imaginary part on input i only.
+        input_count = len(input_names)
+        perturbations = COMPLEX_STEP * 1j * np.eye(input_count)
+        values = {
+            name: (inputs[name] + perturbations[:, i]).reshape(-1, 1)
+            for i, name in enumerate(input_names)
+        }
+        results = self._compute_polar(values)
+
+        row_indices = {name: i for i, name in enumerate(input_names)}
+        for output_name, (_, is_vector, dependencies) in self._get_outputs().items():
+            derivatives = np.imag(results[output_name]) / COMPLEX_STEP
+            for input_name in dependencies:
+                if is_vector:
+                    partials[output_name, input_name] = derivatives[row_indices[input_name]]
+                else:
+                    partials[output_name, input_name] = derivatives[row_indices[input_name], 0]
+
+    def _compute_polar(self, values: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Computes outputs from input values.
+
+        Input values are expected as 2D arrays with one column. Returned values are 2D arrays
+        with the same number of rows, and with one column per CL value for vector outputs.
+
+        More generally, input values can be N-D arrays with a last dimension of size 1.
+        Computations are broadcast on leading dimensions, and CL values are on last dimension.
+        """
+        low_speed_aero = self.options["low_speed_aero"]
+        ls_tag = "low_speed" if low_speed_aero else "high_speed"
+
+        wing_area = values["data:geometry:wing:area"]
+        span = values["data:geometry:wing:span"]
+        sweep_25 = values["data:geometry:wing:sweep_25"]
+        root_chord = values["data:geometry:wing:root:chord"]
+        tip_chord = values["data:geometry:wing:tip:chord"]
+        height_max = values["data:geometry:fuselage:maximum_height"]
+        width_max = values["data:geometry:fuselage:maximum_width"]
+        mach = self._get_mach(values)
+
+        results = {}
+
+        # Oswald coefficient and induced drag coefficient -------------------------------------
+        coef_e = compute_oswald_coefficient(
+            wing_area, span, height_max, width_max, root_chord, tip_chord, sweep_25, mach
+        )
+        coef_k = compute_induced_drag_coefficient(wing_area, span, coef_e)
+        results[f"data:aerodynamics:aircraft:{ls_tag}:oswald_coefficient"] = coef_e
+        results[f"data:aerodynamics:aircraft:{ls_tag}:CD:induced:coefficient"] = coef_k
+
+        # Reynolds number ---------------------------------------------------------------------
+        reynolds = mach * self._get_unit_reynolds_per_mach(values)
+        results[f"data:aerodynamics:aircraft:{ls_tag}:unit_reynolds"] = reynolds
+
+        # CL vector ---------------------------------------------------------------------------
+        cl = (
+            self._base_cl
+            * values["tuning:aerodynamics:aircraft:high_speed:CL:k"]
+            * values["tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:k"]
+            + values["tuning:aerodynamics:aircraft:high_speed:CL:offset"]
+            + values["tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:offset"]
+        )
+        results[f"data:aerodynamics:aircraft:{ls_tag}:CL"] = cl
+
+        # CD0 ---------------------------------------------------------------------------------
+        cd0_wing = compute_cd0_lifting_surface(
+            LiftingSurfaceGeometry(
+                thickness_ratio=values["data:geometry:wing:thickness_ratio"],
+                MAC_length=values["data:geometry:wing:MAC:length"],
+                sweep_angle_25=sweep_25,
+                wet_area=values["data:geometry:wing:wetted_area"],
+                cambered=True,
+                interaction_coeff=0.04,
+            ),
+            mach,
+            reynolds,
+            wing_area,
+            cl,
+        )
+
+        cd0_fus = compute_cd0_fuselage(
+            values["data:geometry:fuselage:length"],
+            height_max,
+            width_max,
+            values["data:geometry:fuselage:wetted_area"],
+            mach,
+            reynolds,
+            wing_area,
+            cl,
+        )
+
+        cd0_tails = {}
+        for tail, interaction_coeff in [("horizontal_tail", 0.01), ("vertical_tail", 0.005)]:
+            cd0_tails[tail] = compute_cd0_lifting_surface(
+                LiftingSurfaceGeometry(
+                    thickness_ratio=values[f"data:geometry:{tail}:thickness_ratio"],
+                    MAC_length=values[f"data:geometry:{tail}:MAC:length"],
+                    sweep_angle_25=values[f"data:geometry:{tail}:sweep_25"],
+                    wet_area=values[f"data:geometry:{tail}:wetted_area"],
+                    cambered=False,
+                    interaction_coeff=interaction_coeff,
+                ),
+                mach,
+                reynolds,
+                wing_area,
+            )
+
+        n_engines = values["data:geometry:propulsion:engine:count"]
+        cd0_pylon = compute_cd0_pylons(
+            values["data:geometry:propulsion:pylon:length"],
+            values["data:geometry:propulsion:pylon:wetted_area"],
+            n_engines,
+            mach,
+            reynolds,
+            wing_area,
+        )
+        cd0_nac = compute_cd0_nacelles(
+            values["data:geometry:propulsion:nacelle:length"],
+            values["data:geometry:propulsion:nacelle:wetted_area"],
+            values["data:geometry:propulsion:fan:length"],
+            n_engines,
+            mach,
+            reynolds,
+            wing_area,
+        )
+
+        k_parasite = get_parasitic_drag_factor(values["data:geometry:aircraft:wetted_area"])
+        cd0_total_clean = (
+            cd0_wing
+            + cd0_fus
+            + cd0_tails["horizontal_tail"]
+            + cd0_tails["vertical_tail"]
+            + cd0_nac
+            + cd0_pylon
+        )
+        cd0_total = cd0_total_clean * (1.0 + k_parasite)
+
+        results[f"data:aerodynamics:wing:{ls_tag}:CD:CD0"] = cd0_wing
+        results[f"data:aerodynamics:fuselage:{ls_tag}:CD:CD0"] = cd0_fus
+        for tail, cd0_tail in cd0_tails.items():
+            results[f"data:aerodynamics:{tail}:{ls_tag}:CD:CD0"] = cd0_tail
+        results[f"data:aerodynamics:nacelles:{ls_tag}:CD:CD0"] = cd0_nac
+        results[f"data:aerodynamics:pylons:{ls_tag}:CD:CD0"] = cd0_pylon
+        results[f"data:aerodynamics:aircraft:{ls_tag}:CD:CD0"] = cd0_total
+        results[f"data:aerodynamics:aircraft:{ls_tag}:CD:CD0:clean"] = cd0_total_clean
+        results[f"data:aerodynamics:aircraft:{ls_tag}:CD:CD0:parasitic"] = (
+            cd0_total - cd0_total_clean
+        )
+
+        # Compressibility and trim drag -------------------------------------------------------
+        if low_speed_aero:
+            cd_c = 0.0
+        else:
+            cd_c = compute_compressibility_drag(
+                cl,
+                mach,
+                sweep_25,
+                values["data:geometry:wing:thickness_ratio"],
+                values["tuning:aerodynamics:aircraft:high_speed:CD:compressibility:max_value"],
+                values[
+                    "tuning:aerodynamics:aircraft:high_speed:CD:compressibility:"
+                    "characteristic_mach_increment"
+                ],
+            )
+            results["data:aerodynamics:aircraft:high_speed:CD:wave"] = cd_c
+
+        cd_trim = compute_trim_drag(cl)
+        results[f"data:aerodynamics:aircraft:{ls_tag}:CD:trim"] = cd_trim
+
+        # Polar -------------------------------------------------------------------------------
+        k_cd = values["tuning:aerodynamics:aircraft:high_speed:CD:k"]
+        cd_cd0 = cd0_total * k_cd
+        cd_wave = cd_c * k_cd
+        cd_trim_component = cd_trim * k_cd
+        cd_induced = (
+            coef_k * cl**2 * values["tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:k"]
+            + values["tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:offset"]
+        ) * k_cd
+        cd_offset = values["tuning:aerodynamics:aircraft:high_speed:CD:offset"]
+        cd = cd_cd0 + cd_wave + cd_trim_component + cd_induced + cd_offset
+
+        results[f"data:aerodynamics:aircraft:{ls_tag}:CD"] = cd
+        results[f"data:aerodynamics:aircraft:{ls_tag}:CD:induced"] = cd_induced
+        results[f"data:aerodynamics:aircraft:{ls_tag}:CD:offset"] = cd_offset
+        if low_speed_aero:
+            results["data:aerodynamics:aircraft:low_speed:CD:wave"] = np.broadcast_to(
+                cd_wave, cl.shape
+            )
+        else:
+            optimal_cl, optimal_cd = get_optimum_cl_cd(*np.broadcast_arrays(cl, cd))
+            optimal_cl = optimal_cl[..., np.newaxis]
+            optimal_cd = optimal_cd[..., np.newaxis]
+            results["data:aerodynamics:aircraft:high_speed:L_D_max"] = optimal_cl / optimal_cd
+            results["data:aerodynamics:aircraft:high_speed:optimal_CL"] = optimal_cl
+            results["data:aerodynamics:aircraft:high_speed:optimal_CD"] = optimal_cd
+
+        # CL gradient and angle of attack -----------------------------------------------------
+        cl_alpha = compute_cl_alpha(
+            0.2 if low_speed_aero else mach,
+            height_max,
+            width_max,
+            span,
+            values["data:geometry:wing:aspect_ratio"],
+            root_chord,
+            tip_chord,
+            values["data:geometry:wing:tip:thickness_ratio"],
+            sweep_25 * np.pi / 180.0,
+            wing_area,
+        )
+        results[f"data:aerodynamics:aircraft:{ls_tag}:CL_alpha"] = cl_alpha
+        results[f"data:aerodynamics:aircraft:{ls_tag}:AoA"] = (
+            cl - values[f"data:aerodynamics:aircraft:{ls_tag}:CL0"]
+        ) / cl_alpha
+
+        return results
+
+    def _get_mach(self, values: Mapping[str, np.ndarray]) -> np.ndarray:
+        """
+        :return: the Mach number used for computation of polar
+        """
+        if self.options["low_speed_aero"]:
+            return values["data:aerodynamics:aircraft:takeoff:mach"]
+        return values["data:TLAR:cruise_mach"]
+
+    def _get_unit_reynolds_per_mach(self, values: Mapping[str, np.ndarray]) -> np.ndarray:
+        """
+        Unit Reynolds number is proportional to Mach number.
+
+        In high speed, the proportionality coefficient depends on altitude. Its derivative
+        w.r.t. altitude is obtained by finite difference and used as imaginary part where
+        altitude has an imaginary part.
+        """
+        if self.options["low_speed_aero"]:
+            atm = get_atmosphere(0.0, altitude_in_feet=False)
+            atm.mach = 1.0
+            return np.asarray(atm.unitary_reynolds)
+
+        altitude = values[self.options["altitude_var_name_high_speed"]]
+        reference_altitude = float(np.real(altitude).flat[0])
+        unit_reynolds = []
+        for delta_altitude in [-_ALTITUDE_STEP, 0.0, _ALTITUDE_STEP]:
+            atm = get_atmosphere(reference_altitude + delta_altitude, altitude_in_feet=False)
+            atm.mach = 1.0
+            unit_reynolds.append(atm.unitary_reynolds)
+
+        derivative = (unit_reynolds[2] - unit_reynolds[0]) / (2.0 * _ALTITUDE_STEP)
+        return unit_reynolds[1] + derivative * (altitude - np.real(altitude))
+
+    def _get_inputs(self) -> List[Tuple[str, str, float]]:
+        """
+        :return: list of (name, units, default value) for each input
+        """
+        if self.options["low_speed_aero"]:
+            speed_inputs = [
+                ("data:aerodynamics:aircraft:takeoff:mach", "unitless", np.nan),
+                ("data:aerodynamics:aircraft:low_speed:CL0", "unitless", 0.2),
+            ]
+        else:
+            speed_inputs = [
+                ("data:TLAR:cruise_mach", "unitless", np.nan),
+                (self.options["altitude_var_name_high_speed"], "m", np.nan),
+                ("data:aerodynamics:aircraft:high_speed:CL0", "unitless", 0.1),
+                (
+                    "tuning:aerodynamics:aircraft:high_speed:CD:compressibility:max_value",
+                    "unitless",
+                    0.5,
+                ),
+                (
+                    "tuning:aerodynamics:aircraft:high_speed:CD:compressibility:"
+                    "characteristic_mach_increment",
+                    "unitless",
+                    0.0,
+                ),
+            ]
+
+        return speed_inputs + [
+            ("data:geometry:aircraft:wetted_area", "m**2", np.nan),
+            ("data:geometry:fuselage:length", "m", np.nan),
+            ("data:geometry:fuselage:maximum_height", "m", np.nan),
+            ("data:geometry:fuselage:maximum_width", "m", np.nan),
+            ("data:geometry:fuselage:wetted_area", "m**2", np.nan),
+            ("data:geometry:horizontal_tail:MAC:length", "m", np.nan),
+            ("data:geometry:horizontal_tail:sweep_25", "deg", np.nan),
+            ("data:geometry:horizontal_tail:thickness_ratio", "unitless", np.nan),
+            ("data:geometry:horizontal_tail:wetted_area", "m**2", np.nan),
+            ("data:geometry:propulsion:engine:count", "unitless", np.nan),
+            ("data:geometry:propulsion:fan:length", "m", np.nan),
+            ("data:geometry:propulsion:nacelle:length", "m", np.nan),
+            ("data:geometry:propulsion:nacelle:wetted_area", "m**2", np.nan),
+            ("data:geometry:propulsion:pylon:length", "m", np.nan),
+            ("data:geometry:propulsion:pylon:wetted_area", "m**2", np.nan),
+            ("data:geometry:vertical_tail:MAC:length", "m", np.nan),
+            ("data:geometry:vertical_tail:sweep_25", "deg", np.nan),
+            ("data:geometry:vertical_tail:thickness_ratio", "unitless", np.nan),
+            ("data:geometry:vertical_tail:wetted_area", "m**2", np.nan),
+            ("data:geometry:wing:MAC:length", "m", np.nan),
+            ("data:geometry:wing:area", "m**2", np.nan),
+            ("data:geometry:wing:aspect_ratio", "unitless", np.nan),
+            ("data:geometry:wing:root:chord", "m", np.nan),
+            ("data:geometry:wing:span", "m", np.nan),
+            ("data:geometry:wing:sweep_25", "deg", np.nan),
+            ("data:geometry:wing:thickness_ratio", "unitless", np.nan),
+            ("data:geometry:wing:tip:chord", "m", np.nan),
+            ("data:geometry:wing:tip:thickness_ratio", "unitless", np.nan),
+            ("data:geometry:wing:wetted_area", "m**2", np.nan),
+            ("tuning:aerodynamics:aircraft:high_speed:CD:k", "unitless", np.nan),
+            ("tuning:aerodynamics:aircraft:high_speed:CD:offset", "unitless", np.nan),
+            ("tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:k", "unitless", np.nan),
+            (
+                "tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:offset",
+                "unitless",
+                np.nan,
+            ),
+            ("tuning:aerodynamics:aircraft:high_speed:CL:k", "unitless", np.nan),
+            ("tuning:aerodynamics:aircraft:high_speed:CL:offset", "unitless", np.nan),
+            ("tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:k", "unitless", np.nan),
+            (
+                "tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:offset",
+                "unitless",
+                np.nan,
+            ),
+        ]
+
+    def _get_outputs(self) -> Dict[str, Tuple[str, bool, Set[str]]]:
+        """
+        :return: dict with output names as keys and (units, is_vector, dependencies) as
+                 values, where dependencies is the set of inputs the output depends on
+        """
+        low_speed_aero = self.options["low_speed_aero"]
+        ls_tag = "low_speed" if low_speed_aero else "high_speed"
+
+        if low_speed_aero:
+            mach = {"data:aerodynamics:aircraft:takeoff:mach"}
+            reynolds = mach
+        else:
+            mach = {"data:TLAR:cruise_mach"}
+            reynolds = mach | {self.options["altitude_var_name_high_speed"]}
+
+        oswald = mach | {
+            "data:geometry:wing:area",
+            "data:geometry:wing:span",
+            "data:geometry:fuselage:maximum_height",
+            "data:geometry:fuselage:maximum_width",
+            "data:geometry:wing:root:chord",
+            "data:geometry:wing:tip:chord",
+            "data:geometry:wing:sweep_25",
+        }
+        cl = {
+            "tuning:aerodynamics:aircraft:high_speed:CL:k",
+            "tuning:aerodynamics:aircraft:high_speed:CL:offset",
+            "tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:k",
+            "tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:offset",
+        }
+        cd0_wing = (
+            cl
+            | reynolds
+            | {
+                "data:geometry:wing:area",
+                "data:geometry:wing:thickness_ratio",
+                "data:geometry:wing:wetted_area",
+                "data:geometry:wing:MAC:length",
+                "data:geometry:wing:sweep_25",
+            }
+        )
+        cd0_fuselage = (
+            cl
+            | reynolds
+            | {
+                "data:geometry:wing:area",
+                "data:geometry:fuselage:length",
+                "data:geometry:fuselage:maximum_width",
+                "data:geometry:fuselage:maximum_height",
+                "data:geometry:fuselage:wetted_area",
+            }
+        )
+        cd0_tails = {
+            tail: reynolds
+            | {
+                f"data:geometry:{tail}:MAC:length",
+                f"data:geometry:{tail}:thickness_ratio",
+                f"data:geometry:{tail}:sweep_25",
+                f"data:geometry:{tail}:wetted_area",
+                "data:geometry:wing:area",
+            }
+            for tail in ["horizontal_tail", "vertical_tail"]
+        }
+        cd0_nacelles = reynolds | {
+            "data:geometry:propulsion:nacelle:length",
+            "data:geometry:propulsion:nacelle:wetted_area",
+            "data:geometry:propulsion:engine:count",
+            "data:geometry:propulsion:fan:length",
+            "data:geometry:wing:area",
+        }
+        cd0_pylons = reynolds | {
+            "data:geometry:propulsion:pylon:length",
+            "data:geometry:propulsion:pylon:wetted_area",
+            "data:geometry:propulsion:engine:count",
+            "data:geometry:wing:area",
+        }
+        cd0_clean = (
+            cd0_wing
+            | cd0_fuselage
+            | cd0_tails["horizontal_tail"]
+            | cd0_tails["vertical_tail"]
+            | cd0_nacelles
+            | cd0_pylons
+        )
+        cd0 = cd0_clean | {"data:geometry:aircraft:wetted_area"}
+        if low_speed_aero:
+            cd_wave = set()
+        else:
+            cd_wave = (
+                cl
+                | mach
+                | {
+                    "data:geometry:wing:sweep_25",
+                    "data:geometry:wing:thickness_ratio",
+                    "tuning:aerodynamics:aircraft:high_speed:CD:compressibility:max_value",
+                    "tuning:aerodynamics:aircraft:high_speed:CD:compressibility:"
+                    "characteristic_mach_increment",
+                }
+            )
+        k_cd = {"tuning:aerodynamics:aircraft:high_speed:CD:k"}
+        cd_induced = (
+            oswald
+            | cl
+            | k_cd
+            | {
+                "tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:k",
+                "tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:offset",
+            }
+        )
+        cd = cd0 | cd_wave | cd_induced | {"tuning:aerodynamics:aircraft:high_speed:CD:offset"}
+        cl_alpha = {
+            "data:geometry:fuselage:maximum_width",
+            "data:geometry:fuselage:maximum_height",
+            "data:geometry:wing:span",
+            "data:geometry:wing:aspect_ratio",
+            "data:geometry:wing:tip:chord",
+            "data:geometry:wing:sweep_25",
+            "data:geometry:wing:root:chord",
+            "data:geometry:wing:area",
+            "data:geometry:wing:tip:thickness_ratio",
+        }
+        if not low_speed_aero:
+            cl_alpha |= mach
+
+        outputs = {
+            f"data:aerodynamics:aircraft:{ls_tag}:oswald_coefficient": ("unitless", False, oswald),
+            f"data:aerodynamics:aircraft:{ls_tag}:CD:induced:coefficient": (
+                "unitless",
+                False,
+                oswald,
+            ),
+            f"data:aerodynamics:aircraft:{ls_tag}:unit_reynolds": ("unitless", False, reynolds),
+            f"data:aerodynamics:aircraft:{ls_tag}:CL": ("unitless", True, cl),
+            f"data:aerodynamics:wing:{ls_tag}:CD:CD0": ("unitless", True, cd0_wing),
+            f"data:aerodynamics:fuselage:{ls_tag}:CD:CD0": ("unitless", True, cd0_fuselage),
+            f"data:aerodynamics:horizontal_tail:{ls_tag}:CD:CD0": (
+                "unitless",
+                False,
+                cd0_tails["horizontal_tail"],
+            ),
+            f"data:aerodynamics:vertical_tail:{ls_tag}:CD:CD0": (
+                "unitless",
+                False,
+                cd0_tails["vertical_tail"],
+            ),
+            f"data:aerodynamics:nacelles:{ls_tag}:CD:CD0": ("unitless", False, cd0_nacelles),
+            f"data:aerodynamics:pylons:{ls_tag}:CD:CD0": ("unitless", False, cd0_pylons),
+            f"data:aerodynamics:aircraft:{ls_tag}:CD:CD0": ("unitless", True, cd0),
+            f"data:aerodynamics:aircraft:{ls_tag}:CD:CD0:clean": ("unitless", True, cd0_clean),
+            f"data:aerodynamics:aircraft:{ls_tag}:CD:CD0:parasitic": ("unitless", True, cd0),
+            f"data:aerodynamics:aircraft:{ls_tag}:CD:wave": ("unitless", True, cd_wave),
+            f"data:aerodynamics:aircraft:{ls_tag}:CD:trim": ("unitless", True, cl),
+            f"data:aerodynamics:aircraft:{ls_tag}:CD": ("unitless", True, cd),
+            f"data:aerodynamics:aircraft:{ls_tag}:CD:induced": ("unitless", True, cd_induced),
+            # Constant partial, declared apart
+            f"data:aerodynamics:aircraft:{ls_tag}:CD:offset": ("unitless", False, set()),
+            f"data:aerodynamics:aircraft:{ls_tag}:CL_alpha": ("1/rad", False, cl_alpha),
+            f"data:aerodynamics:aircraft:{ls_tag}:AoA": (
+                "rad",
+                True,
+                cl | cl_alpha | {f"data:aerodynamics:aircraft:{ls_tag}:CL0"},
+            ),
+        }
+        if not low_speed_aero:
+            outputs.update(
+                {
+                    "data:aerodynamics:aircraft:high_speed:L_D_max": ("unitless", False, cd),
+                    "data:aerodynamics:aircraft:high_speed:optimal_CL": ("unitless", False, cd),
+                    "data:aerodynamics:aircraft:high_speed:optimal_CD": ("unitless", False, cd),
+                }
+            )
+
+        return outputs
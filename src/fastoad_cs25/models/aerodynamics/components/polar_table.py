@@ -0,0 +1,266 @@
+"""Computation of high-speed aerodynamic polar on a grid of Mach numbers and altitudes."""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import List, Mapping, Tuple, Union
+
+import fastoad.api as oad
+import numpy as np
+import openmdao.api as om
+from fastoad.models.performances.mission.polar import Polar
+
+from .polar_engine import COMPLEX_STEP, PolarEngine
+from .utils.cl_sampling import ClSampling
+from ..constants import SERVICE_POLAR_TABLE
+from ...atmosphere import get_atmosphere
+
+DEFAULT_MACH_VALUES = np.arange(0.5, 0.86, 0.05)
+DEFAULT_ALTITUDE_VALUES = np.arange(0.0, 12001.0, 2000.0)  # in m
+
+TABLE_PREFIX = "data:aerodynamics:aircraft:high_speed:polar_table"
+
+
+@oad.RegisterSubmodel(SERVICE_POLAR_TABLE, "fastoad.submodel.aerodynamics.polar_table.legacy")
+class PolarTable(PolarEngine):
+    """
+    Computes high-speed polar on a grid of Mach numbers and altitudes.
+
+    Models are the ones of
+    :class:`~fastoad_cs25.models.aerodynamics.components.polar_engine.PolarEngine`, including
+    the dependency of friction drag to Reynolds number and of wave drag to Mach number.
+    All grid points are computed in one vectorized pass.
+
+    Outputs are the grid values and CD as a 3D array (Mach, altitude, CL). They can be used
+    through :class:`PolarTableInterpolator`.
+
+    If option "altitude_values" is None, the altitude of option "altitude_var_name_high_speed"
+    is used, and the table has only one altitude.
+
+    Low speed polar is not available with this class (option "low_speed_aero" can only be
+    False).
+    """
+
+    def initialize(self):
+        super().initialize()
+        self.options.declare(
+            "low_speed_aero",
+            default=False,
+            values=[False],
+            desc="Low speed polar is not available with this class.",
+        )
+        self.options.declare(
+            "mach_values",
+            default=DEFAULT_MACH_VALUES,
+            types=(list, tuple, np.ndarray),
+            desc="Mach numbers of the table, in increasing order.",
+        )
+        self.options.declare(
+            "altitude_values",
+            default=DEFAULT_ALTITUDE_VALUES,
+            types=(list, tuple, np.ndarray),
+            allow_none=True,
+            desc="Altitudes of the table in meters, in increasing order. If None, the altitude "
+            'of variable given by option "altitude_var_name_high_speed" is used.',
+        )
+
+    def setup(self):
+        self._base_cl = ClSampling.from_option(self.options["cl_sampling"]).get_values()
+
+        mach_values = np.asarray(self.options["mach_values"], dtype=float)
+        altitude_values = self.options["altitude_values"]
+        altitude_count = 1 if altitude_values is None else len(altitude_values)
+        self._table_shape = (len(mach_values), altitude_count, self._base_cl.size)
+
+        # Grid points are on dimension 1 of arrays used in computation, and ordered so that
+        # result can be reshaped to (Mach, altitude).
+        self._mach_grid = np.repeat(mach_values, altitude_count).reshape(1, -1, 1)
+
+        for name, units, default in self._get_inputs():
+            self.add_input(name, val=default, units=units)
+
+        self.add_output(f"{TABLE_PREFIX}:mach", val=mach_values, units="unitless")
+        self.add_output(f"{TABLE_PREFIX}:altitude", shape=altitude_count, units="m")
+        self.add_output(f"{TABLE_PREFIX}:CL", shape=self._base_cl.size, units="unitless")
+        self.add_output(f"{TABLE_PREFIX}:CD", shape=self._table_shape, units="unitless")
+
+    def setup_partials(self):
+        for name, dependencies in self._get_dependencies().items():
+            self.declare_partials(name, sorted(dependencies))
+
+        if self.options["altitude_values"] is None:
+            self.declare_partials(
+                f"{TABLE_PREFIX}:altitude", self.options["altitude_var_name_high_speed"], val=1.0
+            )
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        values = {name: inputs[name].reshape(1, 1, 1) for name, _, _ in self._get_inputs()}
+        results = self._compute_polar(values)
+
+        outputs[f"{TABLE_PREFIX}:mach"] = self.options["mach_values"]
+        if self.options["altitude_values"] is None:
+            outputs[f"{TABLE_PREFIX}:altitude"] = inputs[
+                self.options["altitude_var_name_high_speed"]
+            ]
+        else:
+            outputs[f"{TABLE_PREFIX}:altitude"] = self.options["altitude_values"]
+        outputs[f"{TABLE_PREFIX}:CL"] = results["data:aerodynamics:aircraft:high_speed:CL"][0, 0]
+        outputs[f"{TABLE_PREFIX}:CD"] = results["data:aerodynamics:aircraft:high_speed:CD"][
+            0
+        ].reshape(self._table_shape)
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        dependencies = self._get_dependencies()
+        perturbed_names = sorted(set.union(*dependencies.values()))
+
+        # Row i of each perturbed input has its imaginary part on input i only.
+        # Other inputs are given with their real value.
+        perturbations = COMPLEX_STEP * 1j * np.eye(len(perturbed_names))
+        values = {name: inputs[name].reshape(1, 1, 1) for name, _, _ in self._get_inputs()}
+        for i, name in enumerate(perturbed_names):
+            values[name] = (inputs[name] + perturbations[:, i]).reshape(-1, 1, 1)
+        results = self._compute_polar(values)
+
+        row_indices = {name: i for i, name in enumerate(perturbed_names)}
+        for output_name, result_name in [
+            (f"{TABLE_PREFIX}:CL", "data:aerodynamics:aircraft:high_speed:CL"),
+            (f"{TABLE_PREFIX}:CD", "data:aerodynamics:aircraft:high_speed:CD"),
+        ]:
+            derivatives = np.imag(results[result_name]) / COMPLEX_STEP
+            for input_name in dependencies[output_name]:
+                partials[output_name, input_name] = derivatives[row_indices[input_name]].reshape(
+                    -1, 1
+                )
+
+    def _get_mach(self, values: Mapping[str, np.ndarray]) -> np.ndarray:
+        return self._mach_grid
+
+    def _get_unit_reynolds_per_mach(self, values: Mapping[str, np.ndarray]) -> np.ndarray:
+        altitude_values = self.options["altitude_values"]
+        if altitude_values is None:
+            return super()._get_unit_reynolds_per_mach(values)
+
+        atm = get_atmosphere(np.asarray(altitude_values, dtype=float), altitude_in_feet=False)
+        atm.mach = 1.0
+        unit_reynolds = np.broadcast_to(atm.unitary_reynolds, len(altitude_values))
+        return np.tile(unit_reynolds, len(self.options["mach_values"])).reshape(1, -1, 1)
+
+    def _get_inputs(self) -> List[Tuple[str, str, float]]:
+        excluded_names = {"data:TLAR:cruise_mach"}
+        if self.options["altitude_values"] is not None:
+            excluded_names.add(self.options["altitude_var_name_high_speed"])
+        return [variable for variable in super()._get_inputs() if variable[0] not in excluded_names]
+
+    def _get_dependencies(self):
+        """
+        :return: dict with table output names as keys and sets of inputs they depend on
+                 as values
+        """
+        outputs = self._get_outputs()
+        input_names = {name for name, _, _ in self._get_inputs()}
+        return {
+            f"{TABLE_PREFIX}:CL": outputs["data:aerodynamics:aircraft:high_speed:CL"][2]
+            & input_names,
+            f"{TABLE_PREFIX}:CD": outputs["data:aerodynamics:aircraft:high_speed:CD"][2]
+            & input_names,
+        }
+
+
+class PolarTableInterpolator:
+    """
+    Fast interpolation of CD in a polar table as computed by :class:`PolarTable`.
+
+    Interpolation is linear in each dimension. Values are linearly extrapolated outside
+    the CL range. For Mach number and altitude, values are taken at table bounds.
+
+    :param cl: N-elements array of CL values, in increasing order
+    :param mach: M-elements array of Mach numbers, in increasing order
+    :param altitude: A-elements array of altitudes in meters, in increasing order
+    :param cd: (M, A, N) array of CD values
+    """
+
+    def __init__(self, cl: np.ndarray, mach: np.ndarray, altitude: np.ndarray, cd: np.ndarray):
+        self.cl = np.asarray(cl, dtype=float)
+        self.mach = np.asarray(mach, dtype=float)
+        self.altitude = np.asarray(altitude, dtype=float)
+        self.cd_table = np.asarray(cd, dtype=float).reshape(
+            len(self.mach), len(self.altitude), len(self.cl)
+        )
+
+    @classmethod
+    def from_problem(cls, problem: om.Problem) -> "PolarTableInterpolator":
+        """
+        :param problem: a problem where :class:`PolarTable` has been run
+        :return: an interpolator for the computed table
+        """
+        return cls(
+            problem.get_val(f"{TABLE_PREFIX}:CL"),
+            problem.get_val(f"{TABLE_PREFIX}:mach"),
+            problem.get_val(f"{TABLE_PREFIX}:altitude", units="m"),
+            problem.get_val(f"{TABLE_PREFIX}:CD"),
+        )
+
+    def cd(
+        self,
+        cl: Union[float, np.ndarray],
+        mach: Union[float, np.ndarray],
+        altitude: Union[float, np.ndarray],
+    ) -> Union[float, np.ndarray]:
+        """
+        Computes drag coefficient by interpolation in the table.
+
+        Arguments are broadcast together.
+
+        :param cl: lift coefficient
+        :param mach: Mach number
+        :param altitude: altitude in meters
+        :return: CD values
+        """
+        cl, mach, altitude = np.broadcast_arrays(cl, mach, altitude)
+        mach_brackets = _get_brackets(self.mach, mach, extrapolate=False)
+        altitude_brackets = _get_brackets(self.altitude, altitude, extrapolate=False)
+        cl_brackets = _get_brackets(self.cl, cl, extrapolate=True)
+
+        cd = 0.0
+        for mach_index, mach_weight in mach_brackets:
+            for altitude_index, altitude_weight in altitude_brackets:
+                for cl_index, cl_weight in cl_brackets:
+                    cd = cd + (
+                        mach_weight
+                        * altitude_weight
+                        * cl_weight
+                        * self.cd_table[mach_index, altitude_index, cl_index]
+                    )
+        return cd
+
+    def get_polar(self, mach: float, altitude: float) -> Polar:
+        """
+        :param mach: Mach number
+        :param altitude: altitude in meters
+        :return: the polar at given flight conditions, as used by mission models
+        """
+        return Polar(self.cl, self.cd(self.cl, mach, altitude))
+
+
+def _get_brackets(grid: np.ndarray, x: np.ndarray, extrapolate: bool):
+    """
+    :return: the two (indices, weights) tuples for linear interpolation of x in grid
+    """
+    if len(grid) == 1:
+        index = np.zeros(np.shape(x), dtype=np.intp)
+        return [(index, 1.0)]
+
+    index = np.clip(np.searchsorted(grid, x, side="right") - 1, 0, len(grid) - 2)
+    weight = (x - grid[index]) / (grid[index + 1] - grid[index])
+    if not extrapolate:
+        weight = np.clip(weight, 0.0, 1.0)
+    return [(index, 1.0 - weight), (index + 1, weight)]
@@ -16,25 +16,42 @@ test module for modules in aerodynamics/components
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os.path as pth
+from importlib.resources import open_text
 
 import numpy as np
+import pytest
 from fastoad.io import VariableIO
 from fastoad.testing import run_system
 from numpy.testing import assert_allclose
 from openmdao.core.group import Group
 from openmdao.core.indepvarcomp import IndepVarComp
+from openmdao.utils.assert_utils import assert_check_partials
 from pytest import approx
+from scipy import interpolate
 from stdatm import Atmosphere
 
+from .. import resources
 from ..cd0 import CD0
+from ..cd0_fuselage import Cd0Fuselage
+from ..cd0_total import Cd0Total
+from ..cd0_wing import Cd0Wing
 from ..cd_compressibility import CdCompressibility
 from ..cd_trim import CdTrim
 from ..compute_alpha import ComputeAlpha
 from ..compute_cl_alpha import ComputeCLAlpha
-from ..compute_polar import ComputePolar
+from ..compute_polar import ComputeMultiPolar, ComputePolar
 from ..compute_reynolds import ComputeReynolds
-from ..high_lift_aero import ComputeDeltaHighLift
+from ..high_lift_aero import (
+    LIFT_EFFECTIVENESS_FILENAME,
+    ComputeDeltaHighLift,
+    get_lift_effectiveness_interpolant,
+)
+from ..initialize_cl import InitializeClPolar
 from ..oswald import InducedDragCoefficient, OswaldCoefficient
+from ..polar_engine import PolarEngine
+from ..polar_table import PolarTable, PolarTableInterpolator
+from ..utils.cl_sampling import ClSampling
+from ..utils.polar_optimum import get_optimum_cl_cd, get_optimum_cl_cd_partials
 from ...constants import PolarType
 
 
@@ -113,6 +130,86 @@ def test_high_lift_aero():
     assert cd == approx(0.02230, abs=1e-5)
 
 
+def test_high_lift_aero_settings_table():
+    """Tests ComputeDeltaHighLift with vectors of flap and slat angles"""
+    input_list = [
+        "data:geometry:wing:sweep_0",
+        "data:geometry:wing:sweep_100_outer",
+        "data:geometry:flap:chord_ratio",
+        "data:geometry:flap:span_ratio",
+        "data:geometry:slat:chord_ratio",
+        "data:geometry:slat:span_ratio",
+    ]
+    ivc = get_indep_var_comp(input_list)
+    ivc.add_output("data:mission:sizing:landing:slat_angle", [18.0, 27.0, 22.0], units="deg")
+    ivc.add_output("data:mission:sizing:landing:flap_angle", [10.0, 35.0, 20.0], units="deg")
+    ivc.add_output("data:aerodynamics:aircraft:landing:mach", 0.2, units="unitless")
+    ivc.add_output(
+        "tuning:aerodynamics:high_lift_devices:landing:CL:multi_slotted_flap_effect:k",
+        1.1,
+        units="unitless",
+    )
+    ivc.add_output(
+        "tuning:aerodynamics:high_lift_devices:landing:CD:multi_slotted_flap_effect:k",
+        1.01,
+        units="unitless",
+    )
+
+    problem = run_system(ComputeDeltaHighLift(landing_flag=True, setting_count=3), ivc)
+    assert_allclose(
+        problem["data:aerodynamics:high_lift_devices:landing:CL"],
+        [0.5609, 1.4696, 1.0208],
+        atol=1e-3,
+    )
+    assert_allclose(
+        problem["data:aerodynamics:high_lift_devices:landing:CD"],
+        [0.01433, 0.04675, 0.02230],
+        atol=1e-5,
+    )
+
+    data = problem.check_partials(out_stream=None)
+    assert_check_partials(data, atol=1e-5, rtol=1e-4)
+
+    # Partials must stay defined without flap contribution to lift
+    problem["tuning:aerodynamics:high_lift_devices:landing:CL:multi_slotted_flap_effect:k"] = 0.0
+    problem.run_model()
+    data = problem.check_partials(out_stream=None)
+    assert_check_partials(data, atol=1e-5, rtol=1e-4)
+
+
+def _legacy_lift_effectiveness(flap_angle, ratio_cf_flap):
+    """Former implementation, that reads the data file and builds splines on each call."""
+    data = []
+    with open_text(resources, LIFT_EFFECTIVENESS_FILENAME) as data_file:
+        for line in data_file:
+            data.append([float(x) for x in line.split(",")])
+    data = np.array(data)
+
+    y_final = [
+        interpolate.splev(flap_angle, interpolate.splrep(data[:, i], data[:, i + 1], s=0))
+        for i in range(0, 10, 2)
+    ]
+    tck = interpolate.splrep([0.15, 0.20, 0.25, 0.30, 0.40], y_final, s=0)
+    return interpolate.splev(ratio_cf_flap, tck)
+
+
+def test_lift_effectiveness_interpolant():
+    """Tests vectorized interpolation of flap lift effectiveness against former implementation."""
+    interpolant = get_lift_effectiveness_interpolant()
+    assert get_lift_effectiveness_interpolant() is interpolant
+
+    flap_angles = np.linspace(0.0, 60.0, 13)
+    chord_ratios = np.linspace(0.15, 0.40, 6)
+    expected = [
+        [_legacy_lift_effectiveness(angle, ratio) for ratio in chord_ratios]
+        for angle in flap_angles
+    ]
+    assert_allclose(
+        interpolant(flap_angles[:, np.newaxis], chord_ratios), expected, rtol=1e-10, atol=1e-12
+    )
+    assert np.shape(interpolant(20.0, 0.25)) == ()
+
+
 def test_compute_reynolds():
     """Tests ComputeReynolds"""
     from stdatm import AtmosphereSI
@@ -412,8 +509,8 @@ def test_polar_high_speed():
     assert cd[cl == 0.85] == approx(0.24041, abs=1e-5)
     assert_allclose(cd, cd_sum, atol=1e-12)
 
-    assert problem["data:aerodynamics:aircraft:high_speed:optimal_CL"] == approx(0.51, abs=1e-3)
-    assert problem["data:aerodynamics:aircraft:high_speed:optimal_CD"] == approx(0.03487, abs=1e-5)
+    assert problem["data:aerodynamics:aircraft:high_speed:optimal_CL"] == approx(0.5136, abs=1e-4)
+    assert problem["data:aerodynamics:aircraft:high_speed:optimal_CD"] == approx(0.03511, abs=1e-5)
 
 
 def test_polar_low_speed():
@@ -650,3 +747,427 @@ def test_compute_alpha_cruise():
         np.linspace(-0.882832, 7.9454856, 101) + np.degrees(0.05 / 6.49),
         atol=1e-4,
     )
+
+
+def test_get_optimum_cl_cd():
+    """Tests refinement of maximum lift/drag ratio"""
+    cl = np.arange(0.0, 1.5, 0.1)
+
+    # For a parabolic polar, the exact optimum is found.
+    cd = 0.02 + 0.05 * cl**2
+    cl_opt, cd_opt = get_optimum_cl_cd(cl, cd)
+    assert cl_opt == approx(np.sqrt(0.4), rel=1e-12)
+    assert cd_opt == approx(0.04, rel=1e-12)
+
+    # Leading dimensions
+    cd_batch = np.array([[0.02], [0.03]]) + np.array([[0.05], [0.04]]) * cl**2
+    cl_opt, cd_opt = get_optimum_cl_cd(cl, cd_batch)
+    assert_allclose(cl_opt, np.sqrt([0.4, 0.75]), rtol=1e-12)
+    assert_allclose(cd_opt, [0.04, 0.06], rtol=1e-12)
+
+    # Optimum out of CL range: last point is returned.
+    cl_opt, cd_opt = get_optimum_cl_cd(cl[:5], cd[:5])
+    assert cl_opt == approx(0.4)
+    assert cd_opt == approx(cd[4])
+
+    # Partials are checked against complex step.
+    cd = 0.02 + 0.05 * cl**2 + 0.01 * cl**3
+    partials = get_optimum_cl_cd_partials(cl, cd)
+    step = 1.0e-30
+    for input_key, input_value in [("cl", cl), ("cd", cd)]:
+        perturbed = input_value + 1j * step * np.eye(cl.size)
+        if input_key == "cl":
+            optimum = get_optimum_cl_cd(perturbed, cd)
+        else:
+            optimum = get_optimum_cl_cd(cl, perturbed)
+        for output_key, output_value in zip(["cl", "cd"], optimum):
+            assert_allclose(
+                partials[(output_key, input_key)], np.imag(output_value) / step, atol=1e-12
+            )
+
+
+def _assert_partials(component, ivc):
+    problem = run_system(component, ivc)
+    data = problem.check_partials(out_stream=None, method="fd", form="central", step=1e-7)
+    assert_check_partials(data, atol=1e-8, rtol=1e-5)
+
+
+@pytest.mark.parametrize("low_speed_aero", [False, True])
+def test_per_cl_point_partials(low_speed_aero):
+    """Checks analytic partials of components that compute one value per CL point"""
+    ls_tag = "low_speed" if low_speed_aero else "high_speed"
+    cl = np.linspace(0.05, 1.4, 20)
+
+    ivc = get_indep_var_comp(
+        [
+            "data:geometry:fuselage:maximum_height",
+            "data:geometry:fuselage:length",
+            "data:geometry:fuselage:wetted_area",
+            "data:geometry:fuselage:maximum_width",
+            "data:geometry:wing:area",
+            "data:geometry:wing:MAC:length",
+            "data:geometry:wing:sweep_25",
+            "data:geometry:wing:thickness_ratio",
+            "data:geometry:wing:wetted_area",
+        ]
+    )
+    ivc.add_output(f"data:aerodynamics:aircraft:{ls_tag}:CL", cl)
+    ivc.add_output(
+        f"data:aerodynamics:aircraft:{ls_tag}:unit_reynolds", 5.0e6 if low_speed_aero else 7.0e6
+    )
+    if low_speed_aero:
+        ivc.add_output("data:aerodynamics:aircraft:takeoff:mach", 0.2)
+    else:
+        ivc.add_output("data:TLAR:cruise_mach", 0.78)
+    _assert_partials(Cd0Wing(low_speed_aero=low_speed_aero), ivc)
+    _assert_partials(Cd0Fuselage(low_speed_aero=low_speed_aero), ivc)
+
+    ivc = IndepVarComp()
+    ivc.add_output("data:geometry:aircraft:wetted_area", 800.0, units="m**2")
+    for component in ["wing", "fuselage"]:
+        ivc.add_output(f"data:aerodynamics:{component}:{ls_tag}:CD:CD0", 0.005 + 0.001 * cl)
+    for component in ["horizontal_tail", "vertical_tail", "nacelles", "pylons"]:
+        ivc.add_output(f"data:aerodynamics:{component}:{ls_tag}:CD:CD0", 0.001)
+    _assert_partials(Cd0Total(low_speed_aero=low_speed_aero), ivc)
+
+    ivc = IndepVarComp()
+    ivc.add_output(f"data:aerodynamics:aircraft:{ls_tag}:CL", cl)
+    ivc.add_output(f"data:aerodynamics:aircraft:{ls_tag}:CL_alpha", 5.5)
+    _assert_partials(CdTrim(low_speed_aero=low_speed_aero), ivc)
+    _assert_partials(ComputeAlpha(low_speed_aero=low_speed_aero), ivc)
+
+    ivc = IndepVarComp()
+    ivc.add_output("tuning:aerodynamics:aircraft:high_speed:CL:k", 1.02)
+    ivc.add_output("tuning:aerodynamics:aircraft:high_speed:CL:offset", 0.01)
+    ivc.add_output("tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:k", 0.99)
+    ivc.add_output("tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:offset", 0.002)
+    _assert_partials(InitializeClPolar(low_speed_aero=low_speed_aero), ivc)
+
+
+@pytest.mark.parametrize("mach", [0.78, 0.84])
+def test_cd_compressibility_partials(mach):
+    """Checks analytic partials of CdCompressibility, including capped values"""
+    ivc = IndepVarComp()
+    ivc.add_output("data:aerodynamics:aircraft:high_speed:CL", np.linspace(0.05, 1.4, 20))
+    ivc.add_output("data:TLAR:cruise_mach", mach)
+    ivc.add_output("data:geometry:wing:sweep_25", 28.0, units="deg")
+    ivc.add_output("data:geometry:wing:thickness_ratio", 0.12)
+    ivc.add_output("tuning:aerodynamics:aircraft:high_speed:CD:compressibility:max_value", 0.1)
+    ivc.add_output(
+        "tuning:aerodynamics:aircraft:high_speed:CD:compressibility:characteristic_mach_increment",
+        0.01,
+    )
+    problem = run_system(CdCompressibility(), ivc)
+    data = problem.check_partials(out_stream=None, method="fd", form="central", step=1e-7)
+    # FD steps across the kinks of the wave drag law lead to larger absolute errors
+    assert_check_partials(data, atol=1e-6, rtol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "polar_type",
+    [PolarType.HIGH_SPEED, PolarType.LOW_SPEED, PolarType.TAKEOFF, PolarType.LANDING],
+)
+def test_polar_partials(polar_type):
+    """Checks analytic partials of ComputePolar"""
+    ls_tag = "high_speed" if polar_type == PolarType.HIGH_SPEED else "low_speed"
+    cl = np.linspace(0.05, 1.4, 20) + 0.003
+
+    ivc = IndepVarComp()
+    ivc.add_output("tuning:aerodynamics:aircraft:high_speed:CD:k", 1.1)
+    ivc.add_output("tuning:aerodynamics:aircraft:high_speed:CD:offset", 0.001)
+    ivc.add_output("tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:k", 0.95)
+    ivc.add_output("tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:offset", 0.0005)
+    ivc.add_output(f"data:aerodynamics:aircraft:{ls_tag}:CL", cl)
+    ivc.add_output(f"data:aerodynamics:aircraft:{ls_tag}:CD:CD0", 0.02 + 0.001 * cl)
+    ivc.add_output(f"data:aerodynamics:aircraft:{ls_tag}:CD:trim", 0.0005 * cl)
+    ivc.add_output(f"data:aerodynamics:aircraft:{ls_tag}:CD:induced:coefficient", 0.04)
+    if polar_type == PolarType.HIGH_SPEED:
+        ivc.add_output("data:aerodynamics:aircraft:high_speed:CD:wave", 0.001 * cl**3)
+    elif polar_type != PolarType.LOW_SPEED:
+        ivc.add_output(f"data:aerodynamics:high_lift_devices:{polar_type.value}:CL", 0.5)
+        ivc.add_output(f"data:aerodynamics:high_lift_devices:{polar_type.value}:CD", 0.02)
+
+    _assert_partials(ComputePolar(polar_type=polar_type), ivc)
+
+
+def _get_low_speed_polar_ivc():
+    cl = np.linspace(0.05, 1.4, 20) + 0.003
+
+    ivc = IndepVarComp()
+    ivc.add_output("tuning:aerodynamics:aircraft:high_speed:CD:k", 1.1)
+    ivc.add_output("tuning:aerodynamics:aircraft:high_speed:CD:offset", 0.001)
+    ivc.add_output("tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:k", 0.95)
+    ivc.add_output("tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:offset", 0.0005)
+    ivc.add_output("data:aerodynamics:aircraft:low_speed:CL", cl)
+    ivc.add_output("data:aerodynamics:aircraft:low_speed:CD:CD0", 0.02 + 0.001 * cl)
+    ivc.add_output("data:aerodynamics:aircraft:low_speed:CD:trim", 0.0005 * cl)
+    ivc.add_output("data:aerodynamics:aircraft:low_speed:CD:induced:coefficient", 0.04)
+    ivc.add_output("data:aerodynamics:high_lift_devices:takeoff:CL", 0.5)
+    ivc.add_output("data:aerodynamics:high_lift_devices:takeoff:CD", 0.02)
+    ivc.add_output("data:aerodynamics:high_lift_devices:landing:CL", 1.1)
+    ivc.add_output("data:aerodynamics:high_lift_devices:landing:CD", 0.05)
+    return ivc
+
+
+def test_multi_polar():
+    """Checks ComputeMultiPolar against ComputePolar"""
+    polar_types = [PolarType.LOW_SPEED, PolarType.TAKEOFF, PolarType.LANDING]
+
+    reference = Group()
+    for polar_type in polar_types:
+        reference.add_subsystem(
+            polar_type.value, ComputePolar(polar_type=polar_type), promotes=["*"]
+        )
+    reference_problem = run_system(reference, _get_low_speed_polar_ivc())
+    problem = run_system(ComputeMultiPolar(), _get_low_speed_polar_ivc())
+
+    output_names = [
+        metadata["prom_name"]
+        for _, metadata in problem.model.component.list_outputs(out_stream=None, prom_name=True)
+    ]
+    assert len(output_names) == 18
+    for name in output_names:
+        assert_allclose(problem[name], reference_problem[name], rtol=1e-12, err_msg=name)
+
+    # Only required polars are computed
+    problem = run_system(
+        ComputeMultiPolar(polar_types=[PolarType.LANDING]), _get_low_speed_polar_ivc()
+    )
+    assert len(problem.model.component.list_outputs(out_stream=None)) == 7
+    assert_allclose(
+        problem["data:aerodynamics:aircraft:landing:CD"],
+        reference_problem["data:aerodynamics:aircraft:landing:CD"],
+        rtol=1e-12,
+    )
+
+    with pytest.raises(AttributeError):
+        run_system(
+            ComputeMultiPolar(polar_types=[PolarType.HIGH_SPEED]), _get_low_speed_polar_ivc()
+        )
+
+
+def test_multi_polar_partials():
+    """Checks analytic partials of ComputeMultiPolar"""
+    _assert_partials(ComputeMultiPolar(), _get_low_speed_polar_ivc())
+
+
+POLAR_ENGINE_INPUTS = [
+    "data:geometry:aircraft:wetted_area",
+    "data:geometry:fuselage:length",
+    "data:geometry:fuselage:maximum_height",
+    "data:geometry:fuselage:maximum_width",
+    "data:geometry:fuselage:wetted_area",
+    "data:geometry:horizontal_tail:MAC:length",
+    "data:geometry:horizontal_tail:sweep_25",
+    "data:geometry:horizontal_tail:thickness_ratio",
+    "data:geometry:horizontal_tail:wetted_area",
+    "data:geometry:propulsion:engine:count",
+    "data:geometry:propulsion:fan:length",
+    "data:geometry:propulsion:nacelle:length",
+    "data:geometry:propulsion:nacelle:wetted_area",
+    "data:geometry:propulsion:pylon:length",
+    "data:geometry:propulsion:pylon:wetted_area",
+    "data:geometry:vertical_tail:MAC:length",
+    "data:geometry:vertical_tail:sweep_25",
+    "data:geometry:vertical_tail:thickness_ratio",
+    "data:geometry:vertical_tail:wetted_area",
+    "data:geometry:wing:MAC:length",
+    "data:geometry:wing:area",
+    "data:geometry:wing:aspect_ratio",
+    "data:geometry:wing:root:chord",
+    "data:geometry:wing:span",
+    "data:geometry:wing:sweep_25",
+    "data:geometry:wing:thickness_ratio",
+    "data:geometry:wing:tip:chord",
+    "data:geometry:wing:tip:thickness_ratio",
+    "data:geometry:wing:wetted_area",
+    "tuning:aerodynamics:aircraft:high_speed:CD:k",
+    "tuning:aerodynamics:aircraft:high_speed:CD:offset",
+    "tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:k",
+    "tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:offset",
+    "tuning:aerodynamics:aircraft:high_speed:CL:k",
+    "tuning:aerodynamics:aircraft:high_speed:CL:offset",
+    "tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:k",
+    "tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:offset",
+]
+
+
+@pytest.mark.parametrize(
+    "low_speed_aero, cl_sampling",
+    [(False, None), (True, None), (False, {"point_count": 40, "spacing": "clustered"})],
+)
+def test_polar_engine(low_speed_aero, cl_sampling):
+    """Compares PolarEngine to the chain of components it replaces"""
+    input_list = list(POLAR_ENGINE_INPUTS)
+    if low_speed_aero:
+        input_list.append("data:aerodynamics:aircraft:takeoff:mach")
+        polar_type = PolarType.LOW_SPEED
+    else:
+        input_list += [
+            "data:TLAR:cruise_mach",
+            "data:mission:sizing:main_route:cruise:altitude_input",
+        ]
+        polar_type = PolarType.HIGH_SPEED
+
+    options = {"low_speed_aero": low_speed_aero}
+    reference_group = Group()
+    reference_group.add_subsystem("reynolds", ComputeReynolds(**options), promotes=["*"])
+    reference_group.add_subsystem("oswald", OswaldCoefficient(**options), promotes=["*"])
+    reference_group.add_subsystem("induced", InducedDragCoefficient(**options), promotes=["*"])
+    reference_group.add_subsystem(
+        "init_cl", InitializeClPolar(**options, cl_sampling=cl_sampling), promotes=["*"]
+    )
+    reference_group.add_subsystem("cd0", CD0(**options), promotes=["*"])
+    if not low_speed_aero:
+        reference_group.add_subsystem("cd_wave", CdCompressibility(), promotes=["*"])
+    reference_group.add_subsystem("cd_trim", CdTrim(**options), promotes=["*"])
+    reference_group.add_subsystem("polar", ComputePolar(polar_type=polar_type), promotes=["*"])
+    reference_group.add_subsystem("cl_alpha", ComputeCLAlpha(**options), promotes=["*"])
+    reference_group.add_subsystem("alpha", ComputeAlpha(**options), promotes=["*"])
+
+    ref_problem = run_system(reference_group, get_indep_var_comp(input_list))
+    problem = run_system(
+        PolarEngine(low_speed_aero=low_speed_aero, cl_sampling=cl_sampling),
+        get_indep_var_comp(input_list),
+    )
+
+    ref_outputs = ref_problem.model.component.list_outputs(out_stream=None, prom_name=True)
+    outputs = problem.model.component.list_outputs(out_stream=None, prom_name=True)
+    assert {meta["prom_name"] for _, meta in outputs} == {
+        meta["prom_name"] for _, meta in ref_outputs
+    }
+    for _, meta in outputs:
+        assert_allclose(
+            problem[meta["prom_name"]], ref_problem[meta["prom_name"]], rtol=1e-12, atol=1e-15
+        )
+
+    data = problem.check_partials(out_stream=None, method="fd", form="central", step=1e-6)
+    assert_check_partials(data, atol=1e-7, rtol=1e-4)
+
+
+def test_cl_sampling():
+    """Tests definition of CL values"""
+    # Default sampling is the historical one
+    assert np.array_equal(ClSampling().get_values(), np.arange(0.0, 1.5, 0.01))
+
+    for spacing in ["uniform", "chebyshev", "clustered"]:
+        values = ClSampling(point_count=30, cl_range=(0.1, 1.2), spacing=spacing).get_values()
+        assert values.size == 30
+        assert values[0] == approx(0.1, abs=1e-12)
+        assert values[-1] == approx(1.2, abs=1e-12)
+        assert np.all(np.diff(values) > 0.0)
+
+    # Clustered spacing is denser around cluster center than elsewhere.
+    steps = np.diff(
+        ClSampling(point_count=40, spacing="clustered", cluster_center=0.5).get_values()
+    )
+    assert np.min(steps) < 0.5 * np.max(steps)
+
+    with pytest.raises(ValueError):
+        ClSampling(spacing="random")
+
+    assert ClSampling.from_option(None) == ClSampling()
+    assert ClSampling.from_option({"point_count": 20}) == ClSampling(point_count=20)
+
+
+@pytest.mark.parametrize("spacing", ["uniform", "chebyshev", "clustered"])
+def test_cl_sampling_accuracy(spacing):
+    """Compares polar results with 60 CL values to the ones with a dense CL grid"""
+    input_list = POLAR_ENGINE_INPUTS + [
+        "data:TLAR:cruise_mach",
+        "data:mission:sizing:main_route:cruise:altitude_input",
+    ]
+    dense_problem = run_system(
+        PolarEngine(cl_sampling={"point_count": 1491}), get_indep_var_comp(input_list)
+    )
+    problem = run_system(
+        PolarEngine(cl_sampling={"point_count": 60, "spacing": spacing}),
+        get_indep_var_comp(input_list),
+    )
+
+    assert problem["data:aerodynamics:aircraft:high_speed:optimal_CL"] == approx(
+        dense_problem["data:aerodynamics:aircraft:high_speed:optimal_CL"], abs=1e-3
+    )
+    assert problem["data:aerodynamics:aircraft:high_speed:L_D_max"] == approx(
+        dense_problem["data:aerodynamics:aircraft:high_speed:L_D_max"], rel=5e-4
+    )
+
+    # CD values in usual range, by quadratic interpolation
+    dense_cl = dense_problem["data:aerodynamics:aircraft:high_speed:CL"]
+    dense_cd = dense_problem["data:aerodynamics:aircraft:high_speed:CD"]
+    cd_function = interpolate.interp1d(
+        problem["data:aerodynamics:aircraft:high_speed:CL"],
+        problem["data:aerodynamics:aircraft:high_speed:CD"],
+        kind="quadratic",
+    )
+    is_in_range = dense_cl <= 0.7
+    assert_allclose(cd_function(dense_cl[is_in_range]), dense_cd[is_in_range], rtol=1e-2)
+
+
+def test_polar_table():
+    """Tests PolarTable against PolarEngine, and PolarTableInterpolator"""
+    mach_values = [0.70, 0.78, 0.82]
+    altitude_values = [9000.0, 11000.0]
+    problem = run_system(
+        PolarTable(mach_values=mach_values, altitude_values=altitude_values),
+        get_indep_var_comp(POLAR_ENGINE_INPUTS),
+    )
+    cd_table = problem["data:aerodynamics:aircraft:high_speed:polar_table:CD"]
+    assert cd_table.shape == (3, 2, 150)
+
+    for i, mach in enumerate(mach_values):
+        for j, altitude in enumerate(altitude_values):
+            ivc = get_indep_var_comp(POLAR_ENGINE_INPUTS)
+            ivc.add_output("data:TLAR:cruise_mach", mach)
+            ivc.add_output(
+                "data:mission:sizing:main_route:cruise:altitude_input", altitude, units="m"
+            )
+            ref_problem = run_system(PolarEngine(), ivc)
+            assert_allclose(
+                problem["data:aerodynamics:aircraft:high_speed:polar_table:CL"],
+                ref_problem["data:aerodynamics:aircraft:high_speed:CL"],
+            )
+            assert_allclose(
+                cd_table[i, j], ref_problem["data:aerodynamics:aircraft:high_speed:CD"], rtol=1e-12
+            )
+
+    data = problem.check_partials(out_stream=None, method="fd", form="central", step=1e-6)
+    assert_check_partials(data, atol=1e-7, rtol=1e-4)
+
+    interpolator = PolarTableInterpolator.from_problem(problem)
+    cl = interpolator.cl
+    assert_allclose(interpolator.cd(cl, 0.78, 11000.0), cd_table[1, 1])
+    assert_allclose(interpolator.cd(cl[10:12].mean(), 0.74, 10000.0), cd_table[:2, :, 10:12].mean())
+    # Values at bounds are used for Mach and altitude out of the table
+    assert_allclose(interpolator.cd(cl, 0.9, 13000.0), cd_table[2, 1])
+    # Arguments are broadcast
+    assert interpolator.cd(0.5, [0.7, 0.75, 0.8], 10000.0).shape == (3,)
+
+    polar = interpolator.get_polar(0.78, 9000.0)
+    assert_allclose(polar.cd(cl), cd_table[1, 0], rtol=1e-12)
+
+
+def test_polar_table_at_cruise_altitude():
+    """Tests PolarTable with altitude from problem variable"""
+    input_list = POLAR_ENGINE_INPUTS + ["data:mission:sizing:main_route:cruise:altitude_input"]
+    problem = run_system(
+        PolarTable(mach_values=[0.76, 0.8], altitude_values=None), get_indep_var_comp(input_list)
+    )
+    assert problem["data:aerodynamics:aircraft:high_speed:polar_table:CD"].shape == (2, 1, 150)
+    assert_allclose(
+        problem.get_val("data:aerodynamics:aircraft:high_speed:polar_table:altitude", units="m"),
+        problem.get_val("data:mission:sizing:main_route:cruise:altitude_input", units="m"),
+    )
+
+    interpolator = PolarTableInterpolator.from_problem(problem)
+    assert_allclose(
+        interpolator.cd(interpolator.cl, 0.8, 0.0),
+        problem["data:aerodynamics:aircraft:high_speed:polar_table:CD"][1, 0],
+    )
+
+    data = problem.check_partials(out_stream=None, method="fd", form="central", step=1e-6)
+    assert_check_partials(data, atol=1e-7, rtol=1e-4)
+
+    # Low speed polar is not available
+    with pytest.raises(ValueError):
+        PolarTable(low_speed_aero=True)
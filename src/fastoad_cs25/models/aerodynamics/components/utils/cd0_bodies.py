@@ -0,0 +1,91 @@
+"""Computation of CD0 for fuselage, nacelles and pylons."""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from .friction_drag import get_flat_plate_friction_drag_coefficient
+
+
+def compute_cd0_fuselage(
+    fuselage_length,
+    fuselage_height,
+    fuselage_width,
+    fuselage_wet_area,
+    mach,
+    reynolds,
+    wing_area,
+    lift_coefficient,
+):
+    """
+    Computes CD0 of fuselage, as the sum of friction drag and of upsweep drag.
+
+    :param fuselage_length: in meters
+    :param fuselage_height: maximum height of fuselage, in meters
+    :param fuselage_width: maximum width of fuselage, in meters
+    :param fuselage_wet_area: in m**2
+    :param mach: Mach number
+    :param reynolds: unit Reynolds number
+    :param wing_area: wing area (will be used for getting CD specific to wing area)
+    :param lift_coefficient: aircraft CL
+    :return: CD0 value
+    """
+    cf_fus = get_flat_plate_friction_drag_coefficient(fuselage_length, mach, reynolds)
+    cd0_friction_fus = (
+        (0.98 + 0.745 * np.sqrt(fuselage_height * fuselage_width) / fuselage_length)
+        * cf_fus
+        * fuselage_wet_area
+        / wing_area
+    )
+    cd0_upsweep_fus = (
+        (0.0029 * lift_coefficient**2 - 0.0066 * lift_coefficient + 0.0043)
+        * (0.67 * 3.6 * fuselage_height * fuselage_width)
+        / wing_area
+    )
+    return cd0_friction_fus + cd0_upsweep_fus
+
+
+def compute_cd0_nacelles(
+    nacelle_length, nacelle_wet_area, fan_length, engine_count, mach, reynolds, wing_area
+):
+    """
+    :param nacelle_length: in meters
+    :param nacelle_wet_area: wet area of one nacelle, in m**2
+    :param fan_length: in meters
+    :param engine_count:
+    :param mach: Mach number
+    :param reynolds: unit Reynolds number
+    :param wing_area: wing area (will be used for getting CD specific to wing area)
+    :return: CD0 of all nacelles
+    """
+    cf_nac = get_flat_plate_friction_drag_coefficient(nacelle_length, mach, reynolds)
+    e_fan = 0.22
+    kn_cd0_nac = 1 + 0.05 + 5.8 * e_fan / fan_length
+    cd0_int_nac = 0.0002
+    return engine_count * (kn_cd0_nac * cf_nac * nacelle_wet_area / wing_area + cd0_int_nac)
+
+
+def compute_cd0_pylons(pylon_length, pylon_wet_area, engine_count, mach, reynolds, wing_area):
+    """
+    :param pylon_length: in meters
+    :param pylon_wet_area: wet area of one pylon, in m**2
+    :param engine_count:
+    :param mach: Mach number
+    :param reynolds: unit Reynolds number
+    :param wing_area: wing area (will be used for getting CD specific to wing area)
+    :return: CD0 of all pylons
+    """
+    cf_pylon = get_flat_plate_friction_drag_coefficient(pylon_length, mach, reynolds)
+    el_pylon = 0.06
+    ke_cd0_pylon = 4.688 * el_pylon**2 + 3.146 * el_pylon
+    return engine_count * (1 + ke_cd0_pylon) * cf_pylon * pylon_wet_area / wing_area
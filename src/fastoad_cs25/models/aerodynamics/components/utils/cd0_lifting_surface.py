@@ -13,10 +13,14 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from dataclasses import dataclass
+from typing import Dict
 
 import numpy as np
 
-from .friction_drag import get_flat_plate_friction_drag_coefficient
+from .friction_drag import (
+    get_flat_plate_friction_drag_coefficient,
+    get_flat_plate_friction_drag_coefficient_partials,
+)
 
 
 @dataclass
@@ -58,7 +62,8 @@ def compute_cd0_lifting_surface(
     thickness_contribution = 4.688 * geometry.thickness_ratio**2 + 3.146 * geometry.thickness_ratio
 
     # Contribution of camber
-    sweep_25 = np.radians(geometry.sweep_angle_25)
+    # (np.radians() would not accept complex values, that are used for complex step)
+    sweep_25 = geometry.sweep_angle_25 * np.pi / 180.0
     if geometry.cambered:
         camber_contribution = (
             2.859 * (lift_coefficient / np.cos(sweep_25) ** 2) ** 3
@@ -83,3 +88,73 @@ def compute_cd0_lifting_surface(
         / wing_area
     )
     return cd0_ht
+
+
+def compute_cd0_lifting_surface_partials(
+    geometry: LiftingSurfaceGeometry,
+    mach: float,
+    reynolds: float,
+    wing_area: float,
+    lift_coefficient: float = 0.0,
+) -> Dict[str, float]:
+    """
+    Partial derivatives of :func:`compute_cd0_lifting_surface`.
+
+    :param geometry: definition of lifting surface geometry
+    :param mach: Mach number
+    :param reynolds: Reynolds number
+    :param wing_area: wing area (will be used for getting CD specific to wing area
+    :param lift_coefficient: needed if wing is cambered
+    :return: dictionary of partial derivatives with keys "thickness_ratio", "MAC_length",
+             "sweep_angle_25" (per degree), "wet_area", "wing_area", "mach", "reynolds"
+             and "lift_coefficient"
+    """
+    cf = get_flat_plate_friction_drag_coefficient(geometry.MAC_length, mach, reynolds)
+    d_cf = get_flat_plate_friction_drag_coefficient_partials(geometry.MAC_length, mach, reynolds)
+
+    thickness_contribution = 4.688 * geometry.thickness_ratio**2 + 3.146 * geometry.thickness_ratio
+    d_thickness_contribution = 9.376 * geometry.thickness_ratio + 3.146
+
+    sweep_25 = np.radians(geometry.sweep_angle_25)
+    if geometry.cambered:
+        reduced_cl = lift_coefficient / np.cos(sweep_25) ** 2
+        camber_contribution = (
+            2.859 * reduced_cl**3 - 1.849 * reduced_cl**2 + 0.382 * reduced_cl + 0.06
+        )
+        d_camber_contribution = 8.577 * reduced_cl**2 - 3.698 * reduced_cl + 0.382
+        d_reduced_cl_d_cl = 1.0 / np.cos(sweep_25) ** 2
+        d_reduced_cl_d_sweep = 2.0 * reduced_cl * np.tan(sweep_25) * np.pi / 180.0
+    else:
+        camber_contribution = d_camber_contribution = 0.0
+        d_reduced_cl_d_cl = d_reduced_cl_d_sweep = 0.0
+
+    sweep_correction = 1 - 0.000178 * geometry.sweep_angle_25**2 - 0.0065 * geometry.sweep_angle_25
+    d_sweep_correction = -0.000356 * geometry.sweep_angle_25 - 0.0065
+
+    form_factor = (
+        (thickness_contribution + camber_contribution) * sweep_correction
+        + geometry.interaction_coeff
+        + 1
+    )
+    area_ratio = geometry.wet_area / wing_area
+    cd0 = form_factor * cf * area_ratio
+
+    return {
+        "thickness_ratio": d_thickness_contribution * sweep_correction * cf * area_ratio,
+        "MAC_length": form_factor * d_cf["length"] * area_ratio,
+        "sweep_angle_25": (
+            d_camber_contribution * d_reduced_cl_d_sweep * sweep_correction
+            + (thickness_contribution + camber_contribution) * d_sweep_correction
+        )
+        * cf
+        * area_ratio,
+        "wet_area": form_factor * cf / wing_area,
+        "wing_area": -cd0 / wing_area,
+        "mach": form_factor * d_cf["mach"] * area_ratio,
+        "reynolds": form_factor * d_cf["reynolds"] * area_ratio,
+        "lift_coefficient": d_camber_contribution
+        * d_reduced_cl_d_cl
+        * sweep_correction
+        * cf
+        * area_ratio,
+    }
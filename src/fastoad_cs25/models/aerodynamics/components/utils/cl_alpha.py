@@ -0,0 +1,66 @@
+"""Computation of CL gradient."""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+
+def compute_cl_alpha(
+    mach,
+    fuselage_height,
+    fuselage_width,
+    span,
+    aspect_ratio,
+    root_chord,
+    tip_chord,
+    tip_thickness_ratio,
+    sweep_25,
+    wing_area,
+):
+    """
+    Computes CL gradient, from :cite:`raymer:1999` Eq 12.6.
+
+    :param mach: Mach number
+    :param fuselage_height: maximum height of fuselage, in meters
+    :param fuselage_width: maximum width of fuselage, in meters
+    :param span: in meters
+    :param aspect_ratio: wing aspect ratio
+    :param root_chord: in meters
+    :param tip_chord: in meters
+    :param tip_thickness_ratio: thickness ratio at wing tip
+    :param sweep_25: sweep angle at 25% chord, in radians
+    :param wing_area: in m**2
+    :return: CL gradient, in 1/rad
+    """
+    beta = np.sqrt(1.0 - mach**2)
+    d_f = np.sqrt(fuselage_width * fuselage_height)
+    fuselage_lift_factor = 1.07 * (1.0 + d_f / span) ** 2
+    lambda_wing_eff = aspect_ratio * (1.0 + 1.9 * tip_chord * tip_thickness_ratio / span)
+    return (
+        2.0
+        * np.pi
+        * lambda_wing_eff
+        / (
+            2.0
+            + np.sqrt(
+                4.0
+                + lambda_wing_eff**2
+                * beta**2
+                / 0.9025  # equals 0.95**2
+                * (1.0 + (np.tan(sweep_25)) ** 2 / beta**2)
+            )
+        )
+        * (wing_area - root_chord * fuselage_width)
+        / wing_area
+        * fuselage_lift_factor
+    )
@@ -0,0 +1,118 @@
+"""Definition of CL values for computation of polars."""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from ...constants import POLAR_POINT_COUNT
+
+CL_SPACINGS = ("uniform", "chebyshev", "clustered")
+
+# Parameters of point density for "clustered" spacing: a constant density, plus gaussian
+# bumps around cluster center and last CL value, with given relative height and width.
+_CLUSTER_HEIGHT = 4.0
+_CLUSTER_RELATIVE_WIDTH = 0.08
+
+
+@dataclass(frozen=True)
+class ClSampling:
+    """
+    Definition of the base CL values where polars are computed.
+
+    Actual CL values are obtained from these base values by applying tuning coefficients
+    (tuning:aerodynamics:aircraft:high_speed:CL:*).
+
+    Default values provide the historical grid, i.e. 150 values from 0.0 to 1.49 with a 0.01
+    step.
+    """
+
+    #: number of CL values
+    point_count: int = POLAR_POINT_COUNT
+
+    #: first and last CL values
+    cl_range: Tuple[float, float] = (0.0, 1.49)
+
+    #: "uniform", "chebyshev" (Chebyshev-Lobatto points, denser near both ends of CL range)
+    #: or "clustered" (denser around cluster_center and near last CL value)
+    spacing: str = "uniform"
+
+    #: CL value where points are clustered with "clustered" spacing, typically the expected
+    #: CL of maximum lift/drag ratio
+    cluster_center: float = 0.5
+
+    def __post_init__(self):
+        if self.spacing not in CL_SPACINGS:
+            raise ValueError(f'CL spacing should be one of {CL_SPACINGS}, not "{self.spacing}".')
+        if self.point_count < 3:
+            raise ValueError("CL point count should be at least 3.")
+        if not self.cl_range[0] < self.cl_range[1]:
+            raise ValueError("CL range should be given as (min value, max value).")
+
+    @classmethod
+    def from_option(
+        cls, option: Optional[Union["ClSampling", Mapping[str, object]]]
+    ) -> "ClSampling":
+        """
+        :param option: a ClSampling instance, a dictionary of ClSampling arguments (as
+                       provided in configuration files), or None for default sampling
+        :return: a ClSampling instance
+        """
+        if option is None:
+            return cls()
+        if isinstance(option, cls):
+            return option
+        return cls(**option)
+
+    def get_values(self) -> np.ndarray:
+        """
+        :return: base CL values, in increasing order
+        """
+        cl_min, cl_max = self.cl_range
+        if self.spacing == "uniform":
+            return np.linspace(cl_min, cl_max, self.point_count)
+
+        if self.spacing == "chebyshev":
+            angles = np.linspace(np.pi, 0.0, self.point_count)
+            return cl_min + (cl_max - cl_min) * 0.5 * (1.0 + np.cos(angles))
+
+        # Clustered spacing: points are placed at regular steps of the cumulated density.
+        fine_cl = np.linspace(cl_min, cl_max, 50 * self.point_count)
+        width = _CLUSTER_RELATIVE_WIDTH * (cl_max - cl_min)
+        density = (
+            1.0
+            + _CLUSTER_HEIGHT * np.exp(-0.5 * ((fine_cl - self.cluster_center) / width) ** 2)
+            + _CLUSTER_HEIGHT * np.exp(-0.5 * ((fine_cl - cl_max) / width) ** 2)
+        )
+        cumulated_density = np.concatenate(
+            ([0.0], np.cumsum(0.5 * (density[1:] + density[:-1]) * np.diff(fine_cl)))
+        )
+        return np.interp(
+            np.linspace(0.0, cumulated_density[-1], self.point_count), cumulated_density, fine_cl
+        )
+
+
+def get_cl_sampling_option(cl_sampling: Optional[Mapping[str, object]]) -> Dict[str, object]:
+    """
+    Provides the options to give to components for defining CL sampling.
+
+    As submodels may not have the "cl_sampling" option, it is provided only if needed.
+
+    :param cl_sampling: the "cl_sampling" option of the calling group
+    :return: an empty dictionary if cl_sampling is None, {"cl_sampling": cl_sampling} otherwise
+    """
+    if cl_sampling is None:
+        return {}
+    return {"cl_sampling": cl_sampling}
@@ -0,0 +1,61 @@
+"""Computation of drag increment due to compressibility effects."""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+
+def get_characteristic_mach(lift_coefficient, sweep_25, thickness_ratio, mach_increment=0.0):
+    """
+    Computes characteristic Mach number from §4.2.4 of :cite:`supaero:2014`.
+
+    Values with an imaginary part are accepted, for complex-step computation of partials.
+
+    :param lift_coefficient: aircraft CL
+    :param sweep_25: sweep angle at 25% chord, in degrees
+    :param thickness_ratio: wing thickness ratio
+    :param mach_increment: added to characteristic Mach number for 28° sweep and 0.12 of
+                           relative thickness
+    :return: characteristic Mach number
+    """
+    # Computation of characteristic Mach for 28° sweep and 0.12 of relative thickness
+    cl_charac = np.where(np.real(lift_coefficient) > 0.35, lift_coefficient, 0.35)
+    m_charac_comp_0 = -0.5 * cl_charac**2 + 0.35 * cl_charac + 0.765 + mach_increment
+
+    # Computation of characteristic Mach for actual sweep angle and relative thickness
+    # (np.radians() would not accept complex values, that are used for complex step)
+    return (m_charac_comp_0 * np.cos(np.radians(28)) + 0.12 - thickness_ratio) / np.cos(
+        sweep_25 * np.pi / 180.0
+    )
+
+
+def compute_compressibility_drag(
+    lift_coefficient, mach, sweep_25, thickness_ratio, max_value=0.5, mach_increment=0.0
+):
+    """
+    Computes drag increment due to compressibility effects, from §4.2.4 of
+    :cite:`supaero:2014`.
+
+    :param lift_coefficient: aircraft CL
+    :param mach: Mach number
+    :param sweep_25: sweep angle at 25% chord, in degrees
+    :param thickness_ratio: wing thickness ratio
+    :param max_value: upper limit of drag increment
+    :param mach_increment: see :func:`get_characteristic_mach`
+    :return: drag increment
+    """
+    m_charac_comp = get_characteristic_mach(
+        lift_coefficient, sweep_25, thickness_ratio, mach_increment
+    )
+    cd_comp = 0.002 * np.exp(42.58 * (mach - m_charac_comp))
+    return np.where(np.real(cd_comp) < np.real(max_value), cd_comp, max_value)
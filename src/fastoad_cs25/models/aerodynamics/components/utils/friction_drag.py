@@ -25,3 +25,21 @@ def get_flat_plate_friction_drag_coefficient(length, mach, reynolds):
     """
     c_f = 0.455 / ((1 + 0.144 * mach**2) ** 0.65 * (np.log10(reynolds * length)) ** 2.58)
     return c_f
+
+
+def get_flat_plate_friction_drag_coefficient_partials(length, mach, reynolds):
+    """
+    Partial derivatives of :func:`get_flat_plate_friction_drag_coefficient`.
+
+    :param length: flat plate length in meters
+    :param mach: Mach number
+    :param reynolds: Reynolds number
+    :return: dictionary of partial derivatives with keys "length", "mach" and "reynolds"
+    """
+    c_f = get_flat_plate_friction_drag_coefficient(length, mach, reynolds)
+    d_c_f_d_log = -2.58 * c_f / (np.log10(reynolds * length) * np.log(10.0))
+    return {
+        "length": d_c_f_d_log / length,
+        "mach": -0.65 * c_f * 0.288 * mach / (1 + 0.144 * mach**2),
+        "reynolds": d_c_f_d_log / reynolds,
+    }
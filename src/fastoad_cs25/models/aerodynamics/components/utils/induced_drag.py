@@ -0,0 +1,70 @@
+"""Computation of Oswald coefficient and induced drag coefficient."""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+
+def get_corrected_span(span):
+    """
+    :param span: wing span in meters
+    :return: span corrected for dihedral angle (5°), in meters
+    """
+    return span / np.cos(5.0 / 180 * np.pi)
+
+
+def compute_oswald_coefficient(
+    wing_area, span, fuselage_height, fuselage_width, root_chord, tip_chord, sweep_25, mach
+):
+    """
+    Computes Oswald efficiency number.
+
+    Values with an imaginary part are accepted, for complex-step computation of partials.
+
+    :param wing_area: in m**2
+    :param span: in meters
+    :param fuselage_height: maximum height of fuselage, in meters
+    :param fuselage_width: maximum width of fuselage, in meters
+    :param root_chord: in meters
+    :param tip_chord: in meters
+    :param sweep_25: sweep angle at 25% chord, in degrees
+    :param mach: Mach number
+    :return: Oswald coefficient
+    """
+    span = get_corrected_span(span)
+    aspect_ratio = span**2 / wing_area
+    df = np.sqrt(fuselage_width * fuselage_height)
+    lamda = tip_chord / root_chord
+    delta_lamda = -0.357 + 0.45 * np.exp(0.0375 * sweep_25 / 180.0 * np.pi)
+    lamda = lamda - delta_lamda
+    f_lamda = 0.0524 * lamda**4 - 0.15 * lamda**3 + 0.1659 * lamda**2 - 0.0706 * lamda + 0.0119
+    e_theory = 1 / (1 + f_lamda * aspect_ratio)
+
+    # Mach factor is computed apart so that no negative value is raised to a decimal power.
+    is_low_mach = np.real(mach) <= 0.4
+    mach_factor = np.where(is_low_mach, 1.0, (mach - 0.05) / 0.3 - 1)
+    ke_m = np.where(is_low_mach, 1.0, -0.001521 * mach_factor**10.82 + 1)
+
+    ke_f = 1 - 2 * (df / span) ** 2
+    return e_theory * ke_f * ke_m * 0.9
+
+
+def compute_induced_drag_coefficient(wing_area, span, oswald_coefficient):
+    """
+    :param wing_area: in m**2
+    :param span: in meters
+    :param oswald_coefficient:
+    :return: the coefficient that should be multiplied by CL**2 to get induced drag
+    """
+    aspect_ratio = get_corrected_span(span) ** 2 / wing_area
+    return 1.0 / (np.pi * aspect_ratio * oswald_coefficient)
@@ -0,0 +1,38 @@
+"""Computation of parasitic drag."""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+def get_parasitic_drag_factor(wet_area):
+    """
+    :param wet_area: wet area of the whole aircraft, in m**2
+    :return: ratio of parasitic drag to the sum of CD0 of aircraft parts
+    """
+    return (
+        -2.39 * pow(10, -12) * wet_area**3
+        + 2.58 * pow(10, -8) * wet_area**2
+        - 0.89 * pow(10, -4) * wet_area
+        + 0.163
+    )
+
+
+def get_parasitic_drag_factor_derivative(wet_area):
+    """
+    :param wet_area: wet area of the whole aircraft, in m**2
+    :return: derivative of :func:`get_parasitic_drag_factor` w.r.t. wet area
+    """
+    return (
+        -3 * 2.39 * pow(10, -12) * wet_area**2
+        + 2 * 2.58 * pow(10, -8) * wet_area
+        - 0.89 * pow(10, -4)
+    )
@@ -0,0 +1,160 @@
+"""Computation of the point of maximum lift/drag ratio of a polar."""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+
+def get_optimum_cl_cd(cl: np.ndarray, cd: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the point of maximum lift/drag ratio of a polar.
+
+    The discrete maximum of CL/CD is refined with a quadratic fit CD = a + b*CL + c*CL**2
+    through the discrete maximum and its two neighbours. On this fit, the maximum of CL/CD,
+    where dCD/dCL = CD/CL, is at CL = sqrt(a/c).
+
+    The discrete maximum is returned if it is at one end of the polar, or if the fit does
+    not provide a maximum between the two neighbours.
+
+    Arrays can have leading dimensions, CL values are expected on last dimension. Complex
+    values are accepted (the discrete maximum is searched using real parts).
+
+    :param cl: lift coefficient values, in increasing order
+    :param cd: drag coefficient values
+    :return: CL and CD at maximum lift/drag ratio, with the leading dimensions of inputs
+    """
+    fit = _fit_optimum(*np.broadcast_arrays(cl, cd))
+    return (
+        np.where(fit.is_refined, fit.refined_cl, fit.discrete_cl),
+        np.where(fit.is_refined, fit.refined_cd, fit.discrete_cd),
+    )
+
+
+def get_optimum_cl_cd_partials(cl: np.ndarray, cd: np.ndarray) -> Dict[Tuple[str, str], np.ndarray]:
+    """
+    Partial derivatives of :func:`get_optimum_cl_cd` for 1D arrays.
+
+    :param cl: lift coefficient values, in increasing order
+    :param cd: drag coefficient values
+    :return: dictionary with keys ("cl", "cl"), ("cl", "cd"), ("cd", "cl") and ("cd", "cd"),
+             where ("cd", "cl") is the derivative of optimal CD w.r.t. each CL value.
+             Values have the same size as inputs.
+    """
+    cl = np.asarray(cl, dtype=float)
+    cd = np.asarray(cd, dtype=float)
+    partials = {
+        (output_key, input_key): np.zeros_like(cl)
+        for output_key in ["cl", "cd"]
+        for input_key in ["cl", "cd"]
+    }
+
+    fit = _fit_optimum(cl, cd)
+    i = int(fit.index)
+    if not fit.is_refined:
+        partials[("cl", "cl")][i] = 1.0
+        partials[("cd", "cd")][i] = 1.0
+        return partials
+
+    # Coefficients (a, b, c) are M.cd where M is the inverse of the Vandermonde matrix.
+    # Derivative of coefficients w.r.t. i-th CL value is -M[:, i] * (dCD/dCL at i-th CL).
+    points = slice(i - 1, i + 2)
+    a, b, c = fit.coefficients
+    refined_cl = fit.refined_cl
+    inverse_vandermonde = np.linalg.inv(np.vander(cl[points], 3, increasing=True))
+    fit_slopes = b + 2.0 * c * cl[points]
+
+    # From refined_cl = sqrt(a/c) and refined_cd = 2*a + b*refined_cl
+    d_refined_cl_d_coeffs = np.array([0.5 / (c * refined_cl), 0.0, -0.5 * refined_cl / c])
+    d_refined_cd_d_coeffs = np.array([2.0, refined_cl, 0.0]) + b * d_refined_cl_d_coeffs
+
+    for key, d_d_coeffs in [("cl", d_refined_cl_d_coeffs), ("cd", d_refined_cd_d_coeffs)]:
+        d_d_cd = d_d_coeffs @ inverse_vandermonde
+        partials[(key, "cd")][points] = d_d_cd
+        partials[(key, "cl")][points] = -d_d_cd * fit_slopes
+
+    return partials
+
+
+class _OptimumFit(NamedTuple):
+    """Intermediate results of the refinement of maximum lift/drag ratio."""
+
+    #: index of the discrete maximum
+    index: np.ndarray
+    #: CL value of the discrete maximum
+    discrete_cl: np.ndarray
+    #: CD value of the discrete maximum
+    discrete_cd: np.ndarray
+    #: CL values of the discrete maximum and its neighbours
+    points_cl: List[np.ndarray]
+    #: CD values of the discrete maximum and its neighbours
+    points_cd: List[np.ndarray]
+    #: coefficients (a, b, c) of the quadratic fit
+    coefficients: Tuple[np.ndarray, np.ndarray, np.ndarray]
+    refined_cl: np.ndarray
+    refined_cd: np.ndarray
+    #: False where the refined values are not valid
+    is_refined: np.ndarray
+
+
+def _fit_optimum(cl: np.ndarray, cd: np.ndarray) -> _OptimumFit:
+    """Does the refinement described in :func:`get_optimum_cl_cd`."""
+    index = np.argmax(np.real(cl / cd), axis=-1)
+    is_refined = (index > 0) & (index < cl.shape[-1] - 1)
+
+    # Index is clipped so that the discrete maximum has two neighbours
+    center_index = np.clip(index, 1, cl.shape[-1] - 2)
+    points_cl = [
+        np.take_along_axis(cl, (center_index + i)[..., np.newaxis], axis=-1)[..., 0]
+        for i in (-1, 0, 1)
+    ]
+    points_cd = [
+        np.take_along_axis(cd, (center_index + i)[..., np.newaxis], axis=-1)[..., 0]
+        for i in (-1, 0, 1)
+    ]
+    a, b, c = _get_quadratic_coefficients(points_cl, points_cd)
+
+    # Maximum of CL/CD exists only for a convex fit with positive CD at CL=0.
+    is_refined = is_refined & (np.real(a) > 0.0) & (np.real(c) > 0.0)
+    refined_cl = np.sqrt(np.where(is_refined, a, 1.0) / np.where(is_refined, c, 1.0))
+    refined_cd = 2.0 * a + b * refined_cl
+    is_refined = (
+        is_refined
+        & (np.real(refined_cl) > np.real(points_cl[0]))
+        & (np.real(refined_cl) < np.real(points_cl[2]))
+    )
+    return _OptimumFit(
+        index,
+        np.take_along_axis(cl, index[..., np.newaxis], axis=-1)[..., 0],
+        np.take_along_axis(cd, index[..., np.newaxis], axis=-1)[..., 0],
+        points_cl,
+        points_cd,
+        (a, b, c),
+        refined_cl,
+        refined_cd,
+        is_refined,
+    )
+
+
+def _get_quadratic_coefficients(x, y):
+    """
+    :return: coefficients (a, b, c) of the quadratic function a + b*x + c*x**2 that goes
+             through the three points defined by x and y
+    """
+    slope_01 = (y[1] - y[0]) / (x[1] - x[0])
+    slope_12 = (y[2] - y[1]) / (x[2] - x[1])
+    c = (slope_12 - slope_01) / (x[2] - x[0])
+    b = slope_01 - c * (x[0] + x[1])
+    a = y[0] - b * x[0] - c * x[0] ** 2
+    return a, b, c
@@ -0,0 +1,24 @@
+"""Computation of trim drag."""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Ratio between trim drag coefficient and lift coefficient
+TRIM_DRAG_FACTOR = 5.89e-4
+
+
+def compute_trim_drag(lift_coefficient):
+    """
+    :param lift_coefficient: aircraft CL
+    :return: trim drag coefficient
+    """
+    return TRIM_DRAG_FACTOR * lift_coefficient
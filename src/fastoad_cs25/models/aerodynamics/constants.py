@@ -30,8 +30,11 @@ SERVICE_CD0_SUM = "service.aerodynamics.CD0.sum"
 SERVICE_CD_COMPRESSIBILITY = "service.aerodynamics.CD.compressibility"
 SERVICE_CD_TRIM = "service.aerodynamics.CD.trim"
 SERVICE_POLAR = "service.aerodynamics.polar"
+SERVICE_POLAR_TABLE = "service.aerodynamics.polar_table"
+SERVICE_MULTI_POLAR = "service.aerodynamics.multi_polar"
 SERVICE_HIGH_LIFT = "service.aerodynamics.high_lift"
 SERVICE_XFOIL = "service.aerodynamics.xfoil"
+SERVICE_XFOIL_TABLE = "service.aerodynamics.xfoil.table"
 SERVICE_LANDING_MAX_CL_CLEAN = "service.aerodynamics.landing.max_CL_clean"
 SERVICE_LANDING_MAX_CL = "service.aerodynamics.landing.max_CL"
 SERVICE_LANDING_MACH_REYNOLDS = "service.aerodynamics.landing.mach_reynolds"
@@ -0,0 +1,107 @@
+"""
+Adaptive alpha sweep for finding 2D max lift coefficient with few XFOIL points
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_ALPHA_STEP = 0.5  # in degrees
+DEFAULT_COARSE_ALPHA_STEP = 2.0  # in degrees
+DEFAULT_STALL_CL_DROP = 0.05
+DEFAULT_CHUNK_POINT_COUNT = 4
+
+SweepFunction = Callable[[float, float, float, bool], np.ndarray]
+"""
+Signature of functions that run XFOIL for a sweep: (alpha_start, alpha_end, alpha_step,
+is_continued) -> polar. If is_continued is True, the sweep continues the previous one, and the
+boundary layer solution of the previous point can be used as starting point.
+"""
+
+
+def run_adaptive_sweep(
+    sweep: SweepFunction,
+    alpha_start: float,
+    alpha_end: float,
+    coarse_alpha_step: float = DEFAULT_COARSE_ALPHA_STEP,
+    fine_alpha_step: float = DEFAULT_ALPHA_STEP,
+    stall_cl_drop: float = DEFAULT_STALL_CL_DROP,
+    chunk_point_count: Optional[int] = None,
+) -> Tuple[np.ndarray, int]:
+    """
+    Runs a coarse alpha sweep, then a fine sweep around the CL peak of the coarse sweep.
+
+    If chunk_point_count is provided, the coarse sweep is run by chunks of this number of
+    points, and stops as soon as CL has decreased by more than stall_cl_drop below the maximum
+    CL found so far. Otherwise, the coarse sweep is run at once from alpha_start to alpha_end.
+
+    The fine sweep explores one coarse step on each side of the coarse CL peak.
+
+    :param sweep: the function that runs XFOIL
+    :param alpha_start: in degrees
+    :param alpha_end: in degrees
+    :param coarse_alpha_step: in degrees
+    :param fine_alpha_step: in degrees
+    :param stall_cl_drop: CL decrease after peak that stops the coarse sweep
+    :param chunk_point_count: number of alpha values in each chunk of coarse sweep
+    :return: the merged polar, sorted by alpha, and the number of points computed by XFOIL
+    """
+    polars: List[np.ndarray] = []
+    point_count = 0
+
+    coarse_alphas = get_alpha_values(alpha_start, alpha_end, coarse_alpha_step)
+    if not chunk_point_count:
+        chunk_point_count = len(coarse_alphas)
+
+    max_cl = -np.inf
+    for i in range(0, len(coarse_alphas), chunk_point_count):
+        chunk = coarse_alphas[i : i + chunk_point_count]
+        polar = sweep(chunk[0], chunk[-1], coarse_alpha_step, i > 0)
+        if polar.size == 0:
+            continue
+        polar = np.atleast_1d(polar)
+        point_count += polar.size
+        polars.append(polar)
+        max_cl = max(max_cl, np.max(polar["CL"]))
+        if max_cl - polar["CL"][-1] > stall_cl_drop:
+            break
+
+    if not polars:
+        return np.array([]), point_count
+
+    coarse_polar = _merge_polars(polars)
+    alpha_peak = coarse_polar["alpha"][np.argmax(coarse_polar["CL"])]
+    fine_start = max(alpha_start, alpha_peak - coarse_alpha_step + fine_alpha_step)
+    fine_end = min(alpha_end, alpha_peak + coarse_alpha_step - fine_alpha_step)
+    if fine_end > fine_start:
+        polar = sweep(fine_start, fine_end, fine_alpha_step, False)
+        if polar.size > 0:
+            polars.append(np.atleast_1d(polar))
+            point_count += polar.size
+
+    return _merge_polars(polars), point_count
+
+
+def get_alpha_values(alpha_start: float, alpha_end: float, alpha_step: float) -> np.ndarray:
+    """Alpha values as computed by XFOIL ASEQ command."""
+    point_count = int(np.floor((alpha_end - alpha_start) / alpha_step + 1.0e-6)) + 1
+    return alpha_start + alpha_step * np.arange(point_count)
+
+
+def _merge_polars(polars: List[np.ndarray]) -> np.ndarray:
+    """Concatenates polars, sorts them by alpha, and removes duplicate alpha values."""
+    polar = np.concatenate(polars)
+    _, indices = np.unique(polar["alpha"], return_index=True)
+    return polar[indices]
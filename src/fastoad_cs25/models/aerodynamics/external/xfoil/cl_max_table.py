@@ -0,0 +1,333 @@
+"""
+Computation of 2D max lift coefficient from a table of precomputed XFOIL results
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+import os
+import os.path as pth
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import fastoad.api as oad
+import numpy as np
+import openmdao.api as om
+import pandas as pd
+from scipy.interpolate import make_interp_spline
+
+from .xfoil_batch import XfoilBatchRunner
+from .xfoil_polar import DEFAULT_PROFILE_FILENAME, OPTION_PROFILE_NAME
+from ...constants import SERVICE_XFOIL_TABLE
+
+OPTION_TABLE_FILE_PATH = "table_file_path"
+
+PROFILE_NAME = "profile_name"
+REYNOLDS = "reynolds"
+MACH = "mach"
+THICKNESS_RATIO = "thickness_ratio"
+CL_MAX_2D = "CL_max_2D"
+
+DEFAULT_REYNOLDS_VALUES = np.geomspace(1.0e6, 5.0e7, 8)
+DEFAULT_MACH_VALUES = np.linspace(0.1, 0.3, 5)
+DEFAULT_THICKNESS_RATIO_VALUES = np.linspace(0.08, 0.16, 5)
+
+
+class CLMax2DInterpolant:
+    """
+    Trivariate interpolant of 2D max lift coefficient w.r.t. Reynolds number (in log scale),
+    Mach number and thickness ratio.
+
+    Interpolation uses cubic splines along each axis (or lower degree if the axis has less
+    than 4 values). Because an interpolating spline is linear w.r.t. its ordinates, each
+    axis is handled by weighting tabulated values with the splines of the unit vectors, which
+    are computed once for all. This gives a smooth tensor-product interpolation, with analytic
+    derivatives, that is vectorized w.r.t. evaluation points.
+
+    Outside the table, inputs are clipped to table bounds.
+
+    :param reynolds: sorted Reynolds numbers of the table
+    :param mach: sorted Mach numbers of the table
+    :param thickness_ratio: sorted thickness ratios of the table
+    :param cl_max: table values, with shape (len(reynolds), len(mach), len(thickness_ratio))
+    """
+
+    def __init__(
+        self,
+        reynolds: Sequence[float],
+        mach: Sequence[float],
+        thickness_ratio: Sequence[float],
+        cl_max: np.ndarray,
+    ):
+        self._axes = tuple(
+            np.array(values, dtype=float) for values in (np.log10(reynolds), mach, thickness_ratio)
+        )
+        self._cl_max = np.array(cl_max, dtype=float)
+        if self._cl_max.shape != tuple(len(axis) for axis in self._axes):
+            raise ValueError(
+                "Shape of CL max table %s does not match axes." % (self._cl_max.shape,)
+            )
+
+        self._weight_splines = tuple(self._get_weight_spline(axis) for axis in self._axes)
+        self._weight_derivative_splines = tuple(
+            self._get_weight_spline(axis, derivative=True) for axis in self._axes
+        )
+
+    @classmethod
+    def from_file(
+        cls, file_path: str, profile_name: str = DEFAULT_PROFILE_FILENAME
+    ) -> "CLMax2DInterpolant":
+        """
+        :param file_path: CSV file as generated by :func:`generate_cl_max_table`
+        :param profile_name: the profile whose values will be used
+        :return: the interpolant built from the file
+        """
+        data = pd.read_csv(file_path)
+        data = data.loc[data[PROFILE_NAME] == profile_name]
+        if len(data) == 0:
+            raise ValueError("No data for profile %s in %s" % (profile_name, file_path))
+
+        data = data.sort_values([REYNOLDS, MACH, THICKNESS_RATIO])
+        axes = [np.unique(data[name]) for name in (REYNOLDS, MACH, THICKNESS_RATIO)]
+        shape = tuple(len(axis) for axis in axes)
+        if np.prod(shape) != len(data):
+            raise ValueError(
+                "Data for profile %s in %s is not a full grid of Reynolds number, Mach number "
+                "and thickness ratio." % (profile_name, file_path)
+            )
+
+        return cls(*axes, data[CL_MAX_2D].to_numpy().reshape(shape))
+
+    def __call__(self, reynolds, mach, thickness_ratio) -> np.ndarray:
+        """
+        Inputs are broadcast against each other.
+
+        :param reynolds:
+        :param mach:
+        :param thickness_ratio:
+        :return: 2D max lift coefficient, with the broadcast shape of inputs
+        """
+        x_values, _ = self._get_axis_values(reynolds, mach, thickness_ratio)
+        weights = [spline(x) for spline, x in zip(self._weight_splines, x_values)]
+        return self._contract(*weights)
+
+    def partial_derivatives(
+        self, reynolds, mach, thickness_ratio
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Inputs are broadcast against each other.
+
+        :param reynolds:
+        :param mach:
+        :param thickness_ratio:
+        :return: derivatives of 2D max lift coefficient w.r.t. Reynolds number, Mach number and
+                 thickness ratio, with the broadcast shape of inputs
+        """
+        x_values, is_inside = self._get_axis_values(reynolds, mach, thickness_ratio)
+        weights = [spline(x) for spline, x in zip(self._weight_splines, x_values)]
+        weight_derivatives = [
+            spline(x) for spline, x in zip(self._weight_derivative_splines, x_values)
+        ]
+
+        partials = []
+        for i in range(3):
+            axis_weights = list(weights)
+            axis_weights[i] = weight_derivatives[i]
+            partials.append(np.where(is_inside[i], self._contract(*axis_weights), 0.0))
+
+        # Reynolds axis is log10(reynolds)
+        partials[0] = partials[0] / (np.log(10.0) * np.asarray(reynolds, dtype=float))
+        return partials[0], partials[1], partials[2]
+
+    def _get_axis_values(self, reynolds, mach, thickness_ratio):
+        reynolds, mach, thickness_ratio = np.broadcast_arrays(
+            np.asarray(reynolds, dtype=float),
+            np.asarray(mach, dtype=float),
+            np.asarray(thickness_ratio, dtype=float),
+        )
+        x_values = []
+        is_inside = []
+        for axis, x in zip(self._axes, (np.log10(reynolds), mach, thickness_ratio)):
+            clipped_x = np.clip(x, axis[0], axis[-1])
+            x_values.append(clipped_x)
+            is_inside.append(clipped_x == x)
+        return x_values, is_inside
+
+    def _contract(self, reynolds_weights, mach_weights, thickness_ratio_weights) -> np.ndarray:
+        return np.einsum(
+            "...i,...j,...k,ijk->...",
+            reynolds_weights,
+            mach_weights,
+            thickness_ratio_weights,
+            self._cl_max,
+        )
+
+    @staticmethod
+    def _get_weight_spline(axis: np.ndarray, derivative=False):
+        """
+        :return: a callable that provides, for each x value, the weight of each axis value
+        """
+        if len(axis) == 1:
+            weight = 0.0 if derivative else 1.0
+            return lambda x: np.full(np.shape(x) + (1,), weight)
+
+        spline = make_interp_spline(axis, np.eye(len(axis)), k=min(3, len(axis) - 1), axis=0)
+        if derivative:
+            spline = spline.derivative()
+        spline.t.setflags(write=False)
+        spline.c.setflags(write=False)
+        return spline
+
+
+def get_cl_max_2d_interpolant(
+    file_path: str, profile_name: str = DEFAULT_PROFILE_FILENAME
+) -> CLMax2DInterpolant:
+    """
+    :param file_path: CSV file as generated by :func:`generate_cl_max_table`
+    :param profile_name: the profile whose values will be used
+    :return: the interpolant, built only if file has been modified since last call
+    """
+    file_path = pth.abspath(file_path)
+    return _read_interpolant(file_path, profile_name, os.stat(file_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _read_interpolant(file_path: str, profile_name: str, mtime: int) -> CLMax2DInterpolant:
+    """File modification time is used as argument only for invalidating lru_cache."""
+    return CLMax2DInterpolant.from_file(file_path, profile_name)
+
+
+@oad.RegisterSubmodel(SERVICE_XFOIL_TABLE, "fastoad.submodel.aerodynamics.xfoil.table")
+class CLMax2DTable(om.ExplicitComponent):
+    """
+    Interpolates 2D max lift coefficient in a table of precomputed XFOIL results.
+
+    Inputs and output are the ones of
+    :class:`~fastoad_cs25.models.aerodynamics.external.xfoil.xfoil_polar.XfoilPolar`.
+
+    The table is generated beforehand with :func:`generate_cl_max_table`, so XFOIL is not
+    needed when this component is used. For generating the table with default settings, run::
+
+        python -m fastoad_cs25.models.aerodynamics.external.xfoil.cl_max_table -o my_table.csv
+    """
+
+    def initialize(self):
+        self.options.declare(
+            OPTION_TABLE_FILE_PATH,
+            types=str,
+            desc="CSV file as generated by generate_cl_max_table().",
+        )
+        self.options.declare(OPTION_PROFILE_NAME, default=DEFAULT_PROFILE_FILENAME, types=str)
+
+    def setup(self):
+        self.add_input("xfoil:reynolds", val=np.nan, units="unitless")
+        self.add_input("xfoil:mach", val=np.nan, units="unitless")
+        self.add_input("data:geometry:wing:thickness_ratio", val=np.nan, units="unitless")
+
+        self.add_output("xfoil:CL_max_2D", units="unitless")
+
+    def setup_partials(self):
+        self.declare_partials("*", "*", method="exact")
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        outputs["xfoil:CL_max_2D"] = self._get_interpolant()(
+            inputs["xfoil:reynolds"],
+            inputs["xfoil:mach"],
+            inputs["data:geometry:wing:thickness_ratio"],
+        )
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        d_reynolds, d_mach, d_thickness_ratio = self._get_interpolant().partial_derivatives(
+            inputs["xfoil:reynolds"],
+            inputs["xfoil:mach"],
+            inputs["data:geometry:wing:thickness_ratio"],
+        )
+        partials["xfoil:CL_max_2D", "xfoil:reynolds"] = d_reynolds
+        partials["xfoil:CL_max_2D", "xfoil:mach"] = d_mach
+        partials["xfoil:CL_max_2D", "data:geometry:wing:thickness_ratio"] = d_thickness_ratio
+
+    def _get_interpolant(self) -> CLMax2DInterpolant:
+        return get_cl_max_2d_interpolant(
+            self.options[OPTION_TABLE_FILE_PATH], self.options[OPTION_PROFILE_NAME]
+        )
+
+
+def generate_cl_max_table(
+    file_path: str,
+    reynolds_values: Sequence[float] = DEFAULT_REYNOLDS_VALUES,
+    mach_values: Sequence[float] = DEFAULT_MACH_VALUES,
+    thickness_ratio_values: Sequence[float] = DEFAULT_THICKNESS_RATIO_VALUES,
+    profile_name: str = DEFAULT_PROFILE_FILENAME,
+    **runner_options,
+):
+    """
+    Computes 2D max lift coefficient with XFOIL for each combination of provided values, and
+    writes them in a CSV file that can be used by :class:`CLMax2DTable`.
+
+    If the file already exists, data for other profiles are kept.
+
+    :param file_path: the CSV file to write
+    :param reynolds_values:
+    :param mach_values:
+    :param thickness_ratio_values:
+    :param profile_name: name of profile resource
+    :param runner_options: keyword arguments for
+                           :class:`~fastoad_cs25.models.aerodynamics.external.xfoil.xfoil_batch.XfoilBatchRunner`
+    """
+    reynolds, mach, thickness_ratio = (
+        values.ravel()
+        for values in np.meshgrid(
+            reynolds_values, mach_values, thickness_ratio_values, indexing="ij"
+        )
+    )
+    runner = XfoilBatchRunner(profile_name=profile_name, **runner_options)
+    cl_max = runner.compute_max_cl(reynolds, mach, thickness_ratio)
+
+    data = pd.DataFrame(
+        {
+            PROFILE_NAME: profile_name,
+            REYNOLDS: reynolds,
+            MACH: mach,
+            THICKNESS_RATIO: thickness_ratio,
+            CL_MAX_2D: cl_max,
+        }
+    )
+    if pth.isfile(file_path):
+        previous_data = pd.read_csv(file_path)
+        data = pd.concat([previous_data.loc[previous_data[PROFILE_NAME] != profile_name], data])
+
+    os.makedirs(pth.dirname(pth.abspath(file_path)), exist_ok=True)
+    data.to_csv(file_path, index=False)
+
+
+def main():
+    """Command line entry point for :func:`generate_cl_max_table`."""
+    parser = argparse.ArgumentParser(
+        description="Generates the table of 2D max lift coefficient used by CLMax2DTable."
+    )
+    parser.add_argument("-o", "--output", required=True, help="CSV file path")
+    parser.add_argument("--profile", default=DEFAULT_PROFILE_FILENAME, help="profile name")
+    parser.add_argument("--xfoil-exe-path", default="", help="path to XFOIL executable")
+    parser.add_argument("--max-workers", type=int, default=None, help="XFOIL process count")
+    args = parser.parse_args()
+
+    generate_cl_max_table(
+        args.output,
+        profile_name=args.profile,
+        xfoil_exe_path=args.xfoil_exe_path,
+        max_workers=args.max_workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
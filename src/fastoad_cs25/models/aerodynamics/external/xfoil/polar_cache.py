@@ -0,0 +1,180 @@
+"""
+Persistent cache for XFOIL polar results
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+import logging
+import os
+import os.path as pth
+from functools import lru_cache
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Optional, Sequence
+
+import numpy as np
+
+DEFAULT_CACHE_FOLDER_PATH = pth.join(str(Path.home()), ".fast", "cache", "xfoil_polars")
+DEFAULT_CACHE_MAX_SIZE = 50 * 1024**2  # in bytes
+
+_CACHE_FILE_EXTENSION = ".npy"
+_CACHE_FORMAT_VERSION = b"1"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class XfoilPolarCache:
+    """
+    On-disk cache of XFOIL polar results.
+
+    Each polar is stored as a numpy binary file, whose name is a hash of everything that can
+    affect the XFOIL result (profile coordinates, Reynolds number, Mach number, iteration limit,
+    alpha range, XFOIL input template and XFOIL executable).
+
+    When total size of stored files exceeds max_size, least recently used files are deleted.
+
+    :param folder_path: where polar results are stored
+    :param max_size: maximum total size of stored files, in bytes
+    """
+
+    def __init__(
+        self, folder_path: str = DEFAULT_CACHE_FOLDER_PATH, max_size: int = DEFAULT_CACHE_MAX_SIZE
+    ):
+        self.folder_path = folder_path
+        self.max_size = max_size
+
+    @staticmethod
+    def get_key(
+        profile_points: np.ndarray,
+        reynolds: float,
+        mach: float,
+        iter_limit: int,
+        alpha_start: float,
+        alpha_end: float,
+        xfoil_exe_path: str,
+        input_template_path: str,
+        sweep_parameters: Sequence[float] = (),
+    ) -> str:
+        """
+        :param profile_points: (N, 2) array of profile coordinates, as provided to XFOIL
+        :param reynolds:
+        :param mach:
+        :param iter_limit: max number of iterations per XFOIL point
+        :param alpha_start: in degrees
+        :param alpha_end: in degrees
+        :param xfoil_exe_path: the XFOIL executable whose content will be hashed
+        :param input_template_path: the XFOIL input template whose content will be hashed
+        :param sweep_parameters: any other numeric parameter that changes how the alpha
+                                 sweep is done (not hashed if empty)
+        :return: the cache key for provided inputs
+        """
+        hash_ = hashlib.sha256(_CACHE_FORMAT_VERSION)
+        hash_.update(np.ascontiguousarray(profile_points, dtype=np.float64).tobytes())
+        hash_.update(
+            np.array(
+                [reynolds, mach, iter_limit, alpha_start, alpha_end], dtype=np.float64
+            ).tobytes()
+        )
+        hash_.update(_get_file_hash(xfoil_exe_path).encode())
+        hash_.update(_get_file_hash(input_template_path).encode())
+        if len(sweep_parameters) > 0:
+            hash_.update(np.array(sweep_parameters, dtype=np.float64).tobytes())
+        return hash_.hexdigest()
+
+    def load(self, key: str) -> Optional[np.ndarray]:
+        """
+        :param key: as provided by :meth:`get_key`
+        :return: the stored polar result, or None if not in cache
+        """
+        file_path = self._get_file_path(key)
+        try:
+            result_array = np.load(file_path, allow_pickle=False)
+            os.utime(file_path)  # Marks the file as recently used
+        except (OSError, ValueError):
+            return None
+
+        _LOGGER.debug("XFOIL polar loaded from cache file %s", file_path)
+        return result_array
+
+    def save(self, key: str, result_array: np.ndarray):
+        """
+        Stores provided polar result, and removes least recently used results if max size is
+        exceeded.
+
+        :param key: as provided by :meth:`get_key`
+        :param result_array: the XFOIL polar result
+        """
+        os.makedirs(self.folder_path, exist_ok=True)
+
+        # Writing to a temporary file, then renaming, ensures other processes will never read
+        # an incomplete file.
+        with NamedTemporaryFile(dir=self.folder_path, suffix=".tmp", delete=False) as tmp_file:
+            np.save(tmp_file, result_array, allow_pickle=False)
+        os.replace(tmp_file.name, self._get_file_path(key))
+
+        self._evict()
+
+    def clear(self):
+        """Removes all stored results."""
+        for file_path in self._get_file_paths():
+            _remove_file(file_path)
+
+    def _get_file_path(self, key: str) -> str:
+        return pth.join(self.folder_path, key + _CACHE_FILE_EXTENSION)
+
+    def _get_file_paths(self):
+        if not pth.isdir(self.folder_path):
+            return []
+        return [
+            entry.path
+            for entry in os.scandir(self.folder_path)
+            if entry.name.endswith(_CACHE_FILE_EXTENSION)
+        ]
+
+    def _evict(self):
+        file_stats = []
+        for file_path in self._get_file_paths():
+            try:
+                file_stats.append((file_path, os.stat(file_path)))
+            except OSError:
+                pass  # File has been removed by another process.
+
+        total_size = sum(stat.st_size for _, stat in file_stats)
+        for file_path, stat in sorted(file_stats, key=lambda item: item[1].st_mtime):
+            if total_size <= self.max_size:
+                break
+            _remove_file(file_path)
+            total_size -= stat.st_size
+
+
+def _get_file_hash(file_path: str) -> str:
+    stat = os.stat(file_path)
+    return _get_file_content_hash(pth.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _get_file_content_hash(file_path: str, size: int, mtime: int) -> str:
+    """File size and modification time are used as arguments only for invalidating lru_cache."""
+    hash_ = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(1024**2), b""):
+            hash_.update(block)
+    return hash_.hexdigest()
+
+
+def _remove_file(file_path: str):
+    try:
+        os.remove(file_path)
+    except OSError:
+        pass  # File has been removed by another process.
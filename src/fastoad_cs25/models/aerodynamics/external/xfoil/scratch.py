@@ -0,0 +1,205 @@
+"""
+Management of XFOIL executable and working directories
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import atexit
+import hashlib
+import logging
+import os
+import os.path as pth
+import shutil
+import stat
+from contextlib import contextmanager
+from functools import lru_cache
+from importlib.resources import files
+from pathlib import Path
+from tempfile import NamedTemporaryFile, gettempdir, mkdtemp
+from threading import Lock
+from typing import Iterator, List, Set
+
+from . import xfoil699
+
+XFOIL_EXE_NAME = "xfoil.exe"  # name of embedded XFoil executable
+
+DEFAULT_STAGING_FOLDER_PATH = pth.join(str(Path.home()), ".fast", "cache", "xfoil_exe")
+RAM_DISK_PATH = "/dev/shm"
+DEFAULT_MAX_IDLE_DIRECTORY_COUNT = 8
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_staged_xfoil_exe_path(staging_folder_path: str = DEFAULT_STAGING_FOLDER_PATH) -> str:
+    """
+    Provides the embedded XFOIL executable as a file.
+
+    The executable is copied once in a folder named after the hash of its content, so it can
+    be shared by all processes. An already existing copy is used only if its content is
+    verified. Verification and copy are done only on first call in each process.
+
+    :param staging_folder_path: where the executable is copied
+    :return: path of the copied executable
+    """
+    content = files(xfoil699).joinpath(XFOIL_EXE_NAME).read_bytes()
+    digest = hashlib.sha256(content).hexdigest()
+    folder_path = pth.join(staging_folder_path, digest[:16])
+    exe_path = pth.join(folder_path, XFOIL_EXE_NAME)
+
+    if pth.isfile(exe_path):
+        with open(exe_path, "rb") as exe_file:
+            if hashlib.sha256(exe_file.read()).hexdigest() == digest:
+                return exe_path
+        _LOGGER.warning("Corrupted XFOIL executable in %s will be replaced.", folder_path)
+
+    os.makedirs(folder_path, exist_ok=True)
+    # Writing to a temporary file, then renaming, ensures other processes will never use
+    # an incomplete file.
+    with NamedTemporaryFile(dir=folder_path, suffix=".tmp", delete=False) as tmp_file:
+        tmp_file.write(content)
+    os.chmod(tmp_file.name, os.stat(tmp_file.name).st_mode | stat.S_IXUSR)
+    os.replace(tmp_file.name, exe_path)
+
+    return exe_path
+
+
+class ScratchDirectoryPool:
+    """
+    Pool of working directories for XFOIL.
+
+    XFOIL fails if the path of a provided file exceeds a length limit. Directories of the pool
+    are created in the first candidate location where this limit is respected:
+
+        - RAM disk (/dev/shm), if use_ram_disk is True and if it is available
+        - default temporary directory
+        - .fast folder in user home directory
+
+    Directories are emptied when released, and kept for reuse. All directories are removed at
+    exit of the process.
+
+    Directories can be acquired from several threads.
+
+    :param path_length_limit: maximum length of the path of a file in a pool directory
+    :param file_name_length: maximum length of the names of files that will be used
+    :param use_ram_disk: if True, RAM disk is preferred if available
+    :param max_idle_count: maximum number of released directories that are kept for reuse
+    """
+
+    def __init__(
+        self,
+        path_length_limit: int,
+        file_name_length: int,
+        use_ram_disk: bool = False,
+        max_idle_count: int = DEFAULT_MAX_IDLE_DIRECTORY_COUNT,
+    ):
+        self.path_length_limit = path_length_limit
+        self.file_name_length = file_name_length
+        self.use_ram_disk = use_ram_disk
+        self.max_idle_count = max_idle_count
+
+        self._idle_directories: List[str] = []
+        self._all_directories: Set[str] = set()
+        self._lock = Lock()
+        atexit.register(self.cleanup)
+
+    @contextmanager
+    def directory(self) -> Iterator[str]:
+        """
+        Context manager that provides a pool directory, and releases it on exit.
+
+        :return: path of the directory
+        """
+        directory_path = self.acquire()
+        try:
+            yield directory_path
+        finally:
+            self.release(directory_path)
+
+    def acquire(self) -> str:
+        """
+        :return: path of an empty directory, to be given back using :meth:`release`
+        """
+        with self._lock:
+            while self._idle_directories:
+                directory_path = self._idle_directories.pop()
+                if pth.isdir(directory_path):
+                    return directory_path
+                self._all_directories.discard(directory_path)
+
+        directory_path = self._create_directory()
+        with self._lock:
+            self._all_directories.add(directory_path)
+        return directory_path
+
+    def release(self, directory_path: str):
+        """
+        Empties provided directory and makes it available for further use.
+
+        :param directory_path: as provided by :meth:`acquire`
+        """
+        with self._lock:
+            keep = len(self._idle_directories) < self.max_idle_count
+            if not keep:
+                self._all_directories.discard(directory_path)
+
+        if keep:
+            try:
+                for entry in os.scandir(directory_path):
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.remove(entry.path)
+            except OSError:
+                keep = False
+
+        if keep:
+            with self._lock:
+                self._idle_directories.append(directory_path)
+        else:
+            shutil.rmtree(directory_path, ignore_errors=True)
+
+    def cleanup(self):
+        """Removes all directories of the pool, including the ones that are in use."""
+        with self._lock:
+            directory_paths = list(self._all_directories)
+            self._all_directories.clear()
+            self._idle_directories.clear()
+        for directory_path in directory_paths:
+            shutil.rmtree(directory_path, ignore_errors=True)
+
+    def _get_base_candidates(self) -> List[str]:
+        base_candidates = [gettempdir(), pth.join(str(Path.home()), ".fast")]
+        if self.use_ram_disk and pth.isdir(RAM_DISK_PATH) and os.access(RAM_DISK_PATH, os.W_OK):
+            base_candidates.insert(0, RAM_DISK_PATH)
+        return base_candidates
+
+    def _create_directory(self) -> str:
+        # Dev Note: On Windows, the default (user-dependent) tmp dir can exceed the limit.
+        #           Therefore, as a last choice, directory is created as close of user home
+        #           directory as possible.
+        base_candidates = self._get_base_candidates()
+        tried_paths = []
+        for base_path in base_candidates:
+            os.makedirs(base_path, exist_ok=True)
+            directory_path = mkdtemp(dir=base_path)
+            if len(directory_path) + 1 + self.file_name_length <= self.path_length_limit:
+                return directory_path
+            # directory has a too long path. Erase and continue...
+            tried_paths.append(directory_path)
+            os.rmdir(directory_path)
+
+        raise IOError(
+            "Could not create a tmp directory where file path will respect XFOIL "
+            "limitation (%i): tried %s" % (self.path_length_limit, tried_paths)
+        )
@@ -0,0 +1,139 @@
+"""
+Test module for adaptive alpha sweep
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+from fastoad.testing import run_system
+from openmdao.core.indepvarcomp import IndepVarComp
+
+from ..adaptive_sweep import get_alpha_values, run_adaptive_sweep
+from ..xfoil_polar import XFOIL_OUTPUT_NAMES, XfoilPolar
+
+
+class AnalyticSweep:
+    """Sweep function with a lift curve that peaks at CL=1.9 for alpha=17.25 degrees."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, alpha_start, alpha_end, alpha_step, is_continued):
+        self.calls.append((alpha_start, alpha_end, alpha_step, is_continued))
+        alpha = get_alpha_values(alpha_start, alpha_end, alpha_step)
+        polar = np.zeros(len(alpha), dtype=[(name, "f8") for name in XFOIL_OUTPUT_NAMES])
+        polar["alpha"] = alpha
+        polar["CL"] = 1.9 - 0.01 * (alpha - 17.25) ** 2
+        return polar
+
+
+def test_get_alpha_values():
+    np.testing.assert_allclose(get_alpha_values(0.0, 30.0, 0.5), np.arange(61) * 0.5)
+    np.testing.assert_allclose(get_alpha_values(0.0, 29.0, 2.0), np.arange(15) * 2.0)
+    np.testing.assert_allclose(get_alpha_values(0.1, 0.7, 0.2), [0.1, 0.3, 0.5, 0.7])
+
+
+def test_run_adaptive_sweep():
+    # Coarse sweep at once
+    sweep = AnalyticSweep()
+    polar, point_count = run_adaptive_sweep(sweep, 0.0, 30.0, 2.0, 0.5)
+    assert sweep.calls == [(0.0, 30.0, 2.0, False), (16.5, 19.5, 0.5, False)]
+    assert point_count == 16 + 7
+    assert np.all(np.diff(polar["alpha"]) > 0.0)
+    assert np.max(polar["CL"]) == pytest.approx(1.9 - 0.01 * 0.25**2)
+
+    # Coarse sweep by chunks, with early stop
+    sweep = AnalyticSweep()
+    polar, point_count = run_adaptive_sweep(sweep, 0.0, 30.0, 2.0, 0.5, 0.05, 4)
+    assert sweep.calls == [
+        (0.0, 6.0, 2.0, False),
+        (8.0, 14.0, 2.0, True),
+        (16.0, 22.0, 2.0, True),
+        (16.5, 19.5, 0.5, False),
+    ]
+    assert point_count == 12 + 7
+    assert np.max(polar["CL"]) == pytest.approx(1.9 - 0.01 * 0.25**2)
+
+    # Peak at end of alpha range
+    sweep = AnalyticSweep()
+    polar, point_count = run_adaptive_sweep(sweep, 0.0, 15.0, 2.0, 0.5)
+    assert sweep.calls[-1] == (12.5, 15.0, 0.5, False)
+    assert np.max(polar["CL"]) == pytest.approx(1.9 - 0.01 * 2.25**2)
+
+    # Unconverged points are not counted
+    def sweep(alpha_start, alpha_end, alpha_step, is_continued):
+        polar = AnalyticSweep()(alpha_start, alpha_end, alpha_step, is_continued)
+        return polar[polar["alpha"] <= 18.0]
+
+    polar, point_count = run_adaptive_sweep(sweep, 0.0, 30.0, 2.0, 0.5)
+    assert point_count == 10 + 4
+    assert polar.size == point_count - 1  # alpha=18 is computed by both sweeps
+
+    # No result
+    polar, point_count = run_adaptive_sweep(lambda *args: np.array([]), 0.0, 30.0, 2.0, 0.5)
+    assert polar.size == 0
+    assert point_count == 0
+
+
+@pytest.mark.skip_if_no_xfoil()
+@pytest.mark.parametrize("persistent_session", [False, True])
+def test_compute_with_adaptive_sweep(xfoil_path, persistent_session):
+    """Tests that adaptive sweep finds the same max CL with less XFOIL points"""
+    ivc = IndepVarComp()
+    ivc.add_output("xfoil:reynolds", 18000000, units="unitless")
+    ivc.add_output("xfoil:mach", 0.20, units="unitless")
+    ivc.add_output("data:geometry:wing:thickness_ratio", 0.1284, units="unitless")
+
+    xfoil_comp = XfoilPolar(
+        iter_limit=20,
+        xfoil_exe_path=xfoil_path or "",
+        use_polar_cache=False,
+        persistent_session=persistent_session,
+    )
+    problem = run_system(xfoil_comp, ivc)
+    expected_max_cl = problem["xfoil:CL_max_2D"]
+    assert 30 < xfoil_comp.computed_point_count <= 61
+
+    xfoil_comp = XfoilPolar(
+        iter_limit=20,
+        xfoil_exe_path=xfoil_path or "",
+        use_polar_cache=False,
+        persistent_session=persistent_session,
+        adaptive_sweep=True,
+    )
+    problem = run_system(xfoil_comp, ivc)
+    assert problem["xfoil:CL_max_2D"] == pytest.approx(expected_max_cl, abs=5e-3)
+    assert xfoil_comp.computed_point_count < 30
+
+
+@pytest.mark.skip_if_no_xfoil()
+def test_adaptive_sweep_result_files(xfoil_path, tmp_path):
+    """Tests that result files of all XFOIL runs are kept."""
+    ivc = IndepVarComp()
+    ivc.add_output("xfoil:reynolds", 18000000, units="unitless")
+    ivc.add_output("xfoil:mach", 0.20, units="unitless")
+    ivc.add_output("data:geometry:wing:thickness_ratio", 0.1284, units="unitless")
+
+    xfoil_comp = XfoilPolar(
+        iter_limit=20,
+        xfoil_exe_path=xfoil_path or "",
+        use_polar_cache=False,
+        adaptive_sweep=True,
+        result_folder_path=str(tmp_path),
+    )
+    run_system(xfoil_comp, ivc)
+
+    assert (tmp_path / "polar_result.txt").exists()
+    assert (tmp_path / f"polar_result_{xfoil_comp._run_count - 1}.txt").exists()
+    assert xfoil_comp._run_count > 2
@@ -0,0 +1,146 @@
+"""
+Test module for 2D max CL table
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastoad.testing import run_system
+from openmdao.core.indepvarcomp import IndepVarComp
+from openmdao.utils.assert_utils import assert_check_partials
+
+from ..cl_max_table import (
+    CLMax2DInterpolant,
+    CLMax2DTable,
+    generate_cl_max_table,
+    get_cl_max_2d_interpolant,
+)
+from ..xfoil_batch import XfoilBatchRunner
+
+
+def _cl_max(reynolds, mach, thickness_ratio):
+    """Smooth function used for building test tables."""
+    return (
+        1.2
+        + 0.15 * np.log10(reynolds / 1.0e6)
+        - 0.8 * mach**2
+        + 4.0 * thickness_ratio
+        - 10.0 * thickness_ratio**2
+    )
+
+
+@pytest.fixture()
+def table_file_path(tmp_path):
+    reynolds, mach, thickness_ratio = (
+        values.ravel()
+        for values in np.meshgrid(
+            np.geomspace(1.0e6, 5.0e7, 8),
+            np.linspace(0.1, 0.3, 5),
+            np.linspace(0.08, 0.16, 5),
+            indexing="ij",
+        )
+    )
+    data = pd.DataFrame(
+        {
+            "profile_name": "BACJ.txt",
+            "reynolds": reynolds,
+            "mach": mach,
+            "thickness_ratio": thickness_ratio,
+            "CL_max_2D": _cl_max(reynolds, mach, thickness_ratio),
+        }
+    )
+    # Shuffled rows and another profile should not be a problem.
+    other_data = data.copy()
+    other_data["profile_name"] = "other.txt"
+    other_data["CL_max_2D"] = 0.0
+    file_path = tmp_path / "table.csv"
+    pd.concat([other_data, data]).sample(frac=1.0, random_state=1).to_csv(file_path, index=False)
+    return str(file_path)
+
+
+def test_interpolant(table_file_path):
+    interpolant = CLMax2DInterpolant.from_file(table_file_path)
+    reynolds = np.array([[1.8e7, 3.3e6], [1.0e6, 4.2e7]])
+    mach = np.array([0.2, 0.13])
+    thickness_ratio = 0.1284
+
+    np.testing.assert_allclose(
+        interpolant(reynolds, mach, thickness_ratio),
+        _cl_max(reynolds, mach, thickness_ratio),
+        rtol=1e-6,
+    )
+
+    # Derivatives are checked against finite differences
+    d_reynolds, d_mach, d_thickness_ratio = interpolant.partial_derivatives(
+        reynolds, mach, thickness_ratio
+    )
+    assert d_reynolds.shape == (2, 2)
+    np.testing.assert_allclose(
+        d_reynolds,
+        (
+            interpolant(reynolds * 1.0001, mach, thickness_ratio)
+            - interpolant(reynolds, mach, thickness_ratio)
+        )
+        / (reynolds * 0.0001),
+        rtol=1e-3,
+    )
+    np.testing.assert_allclose(d_mach, -1.6 * mach * np.ones((2, 2)), rtol=1e-3)
+    np.testing.assert_allclose(d_thickness_ratio, 4.0 - 20.0 * thickness_ratio, rtol=1e-3)
+
+    # Outside table, values are clipped
+    assert interpolant(1.0e8, 0.5, 0.2) == pytest.approx(_cl_max(5.0e7, 0.3, 0.16))
+    assert interpolant.partial_derivatives(1.0e8, 0.5, 0.2) == (0.0, 0.0, 0.0)
+
+    # Lower degree is used for short axes
+    interpolant = CLMax2DInterpolant([1.0e6, 1.0e7], [0.2], [0.1, 0.12, 0.14], np.ones((2, 1, 3)))
+    assert interpolant(3.0e6, 0.25, 0.11) == pytest.approx(1.0)
+
+    with pytest.raises(ValueError):
+        CLMax2DInterpolant.from_file(table_file_path, "unknown.txt")
+    with pytest.raises(ValueError):
+        CLMax2DInterpolant([1.0e6, 1.0e7], [0.2], [0.1], np.ones((2, 2, 1)))
+
+
+def test_get_interpolant(table_file_path):
+    interpolant = get_cl_max_2d_interpolant(table_file_path)
+    assert get_cl_max_2d_interpolant(table_file_path) is interpolant
+    assert get_cl_max_2d_interpolant(table_file_path, "other.txt") is not interpolant
+
+
+def test_compute(table_file_path):
+    ivc = IndepVarComp()
+    ivc.add_output("xfoil:reynolds", 18000000, units="unitless")
+    ivc.add_output("xfoil:mach", 0.20, units="unitless")
+    ivc.add_output("data:geometry:wing:thickness_ratio", 0.1284, units="unitless")
+
+    component = CLMax2DTable(table_file_path=table_file_path)
+    problem = run_system(component, ivc)
+    assert problem["xfoil:CL_max_2D"] == pytest.approx(_cl_max(1.8e7, 0.2, 0.1284), rel=1e-6)
+
+    data = problem.check_partials(compact_print=True, out_stream=None)
+    assert_check_partials(data, atol=1e-4, rtol=1e-4)
+
+
+@pytest.mark.skip_if_no_xfoil()
+def test_generate_cl_max_table(xfoil_path, tmp_path):
+    file_path = str(tmp_path / "table.csv")
+    runner_options = dict(
+        xfoil_exe_path=xfoil_path or "", alpha_start=15.0, alpha_end=25.0, iter_limit=20
+    )
+    generate_cl_max_table(file_path, [1.0e7, 1.8e7], [0.2], [0.1284], **runner_options)
+
+    max_cl = XfoilBatchRunner(**runner_options).compute_max_cl(1.8e7, 0.2, 0.1284)
+    interpolant = get_cl_max_2d_interpolant(file_path)
+    assert interpolant(1.8e7, 0.2, 0.1284) == pytest.approx(max_cl[0], rel=1e-10)
@@ -0,0 +1,93 @@
+"""
+Tests of cache of XFOIL results
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from ..polar_cache import XfoilPolarCache
+from ..xfoil_polar import XFOIL_OUTPUT_NAMES
+
+
+@pytest.fixture()
+def key_files(tmp_path):
+    """Dummy XFOIL executable and input template"""
+    xfoil_exe_path = tmp_path / "xfoil.exe"
+    xfoil_exe_path.write_bytes(b"dummy xfoil")
+    input_template_path = tmp_path / "template.txt"
+    input_template_path.write_text("template")
+    return str(xfoil_exe_path), str(input_template_path)
+
+
+def _get_polar(cl_max):
+    polar = np.zeros(10, dtype=[(name, "f8") for name in XFOIL_OUTPUT_NAMES])
+    polar["alpha"] = np.arange(10.0)
+    polar["CL"] = np.linspace(0.0, cl_max, 10)
+    return polar
+
+
+def test_get_key(key_files):
+    profile_points = np.array([[1.0, 0.0], [0.0, 0.0], [1.0, 0.001]])
+    args = [profile_points, 1.0e7, 0.2, 500, 0.0, 30.0, *key_files]
+
+    key = XfoilPolarCache.get_key(*args)
+    assert XfoilPolarCache.get_key(*args) == key
+
+    # Any modification of inputs should modify the key
+    for i, modified_value in enumerate(
+        [profile_points * 1.001, 1.01e7, 0.21, 100, 1.0, 25.0], start=0
+    ):
+        modified_args = list(args)
+        modified_args[i] = modified_value
+        assert XfoilPolarCache.get_key(*modified_args) != key
+
+    with open(key_files[0], "ab") as xfoil_exe:
+        xfoil_exe.write(b" modified")
+    assert XfoilPolarCache.get_key(*args) != key
+
+
+def test_save_load(tmp_path):
+    cache = XfoilPolarCache(str(tmp_path / "cache"))
+    assert cache.load("a") is None
+
+    polar = _get_polar(1.5)
+    cache.save("a", polar)
+    loaded_polar = cache.load("a")
+    assert loaded_polar.dtype == polar.dtype
+    for name in polar.dtype.names:
+        assert_allclose(loaded_polar[name], polar[name])
+
+    cache.clear()
+    assert cache.load("a") is None
+
+
+def test_eviction(tmp_path):
+    cache = XfoilPolarCache(str(tmp_path / "cache"))
+    cache.save("a", _get_polar(1.5))
+    file_size = os.path.getsize(tmp_path / "cache" / "a.npy")
+
+    cache.max_size = 2 * file_size
+    cache.save("b", _get_polar(1.6))
+    os.utime(tmp_path / "cache" / "a.npy", (0, 0))
+    os.utime(tmp_path / "cache" / "b.npy", (1, 1))
+    assert cache.load("a") is not None  # "a" becomes the most recently used.
+
+    cache.save("c", _get_polar(1.7))
+    assert cache.load("a") is not None
+    assert cache.load("b") is None
+    assert cache.load("c") is not None
@@ -0,0 +1,90 @@
+"""
+Test module for management of XFOIL executable and working directories
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import os.path as pth
+from importlib.resources import files
+
+import pytest
+
+from .. import xfoil699
+from ..scratch import RAM_DISK_PATH, ScratchDirectoryPool, get_staged_xfoil_exe_path
+from ..xfoil_polar import get_scratch_directory_pool
+
+
+def test_get_staged_xfoil_exe_path(tmp_path):
+    expected_content = files(xfoil699).joinpath("xfoil.exe").read_bytes()
+
+    exe_path = get_staged_xfoil_exe_path(str(tmp_path))
+    assert pth.dirname(pth.dirname(exe_path)) == str(tmp_path)
+    with open(exe_path, "rb") as exe_file:
+        assert exe_file.read() == expected_content
+    assert os.access(exe_path, os.X_OK)
+
+    # Staging is done once per process.
+    os.remove(exe_path)
+    assert get_staged_xfoil_exe_path(str(tmp_path)) == exe_path
+    assert not pth.exists(exe_path)
+
+    # Existing copy is used only if verified (as it would be done in another process).
+    with open(exe_path, "wb") as exe_file:
+        exe_file.write(b"corrupted")
+    assert get_staged_xfoil_exe_path.__wrapped__(str(tmp_path)) == exe_path
+    with open(exe_path, "rb") as exe_file:
+        assert exe_file.read() == expected_content
+
+
+def test_scratch_directory_pool():
+    pool = ScratchDirectoryPool(64, 3, max_idle_count=1)
+
+    directory_path_1 = pool.acquire()
+    directory_path_2 = pool.acquire()
+    assert directory_path_2 != directory_path_1
+    assert len(pth.join(directory_path_1, "out")) <= 64
+    with open(pth.join(directory_path_1, "out"), "w") as file:
+        file.write("result")
+    os.mkdir(pth.join(directory_path_1, "subfolder"))
+
+    # Only one idle directory is kept, and it is empty.
+    pool.release(directory_path_1)
+    pool.release(directory_path_2)
+    assert pth.isdir(directory_path_1)
+    assert os.listdir(directory_path_1) == []
+    assert not pth.exists(directory_path_2)
+
+    with pool.directory() as directory_path:
+        assert directory_path == directory_path_1
+
+    # A directory that has been removed by someone else is not reused.
+    os.rmdir(directory_path_1)
+    with pool.directory() as directory_path:
+        assert pth.isdir(directory_path)
+
+    # Cleanup removes directories, even those in use.
+    directory_path = pool.acquire()
+    pool.cleanup()
+    assert not pth.exists(directory_path)
+
+    with pytest.raises(IOError):
+        ScratchDirectoryPool(5, 3).acquire()
+
+
+@pytest.mark.skipif(not os.access(RAM_DISK_PATH, os.W_OK), reason="no RAM disk")
+def test_scratch_directory_pool_on_ram_disk():
+    pool = get_scratch_directory_pool(use_ram_disk=True)
+    assert get_scratch_directory_pool(use_ram_disk=True) is pool
+    with pool.directory() as directory_path:
+        assert directory_path.startswith(RAM_DISK_PATH)
@@ -16,14 +16,21 @@ Test module for XFOIL component
 
 # pylint: disable=redefined-outer-name  # needed for fixtures
 
+import os
 import os.path as pth
 import shutil
+from importlib.resources import path
 
+import numpy as np
 import pytest
 from fastoad.testing import run_system
 from openmdao.core.indepvarcomp import IndepVarComp
 
-from ..xfoil_polar import DEFAULT_2D_CL_MAX, XfoilPolar
+from fastoad_cs25.models.geometry.profiles.profile_getter import get_profile
+
+from .. import resources
+from ..polar_cache import XfoilPolarCache
+from ..xfoil_polar import DEFAULT_2D_CL_MAX, XFOIL_OUTPUT_NAMES, XfoilPolar
 
 XFOIL_RESULTS = pth.join(pth.dirname(__file__), "results")
 
@@ -94,3 +101,46 @@ def test_compute_with_provided_path(xfoil_path):
     )
     problem = run_system(xfoil_comp, ivc)
     assert problem["xfoil:CL_max_2D"] == pytest.approx(1.94, 1e-2)
+
+
+def test_compute_with_polar_cache(tmp_path):
+    """Tests that XFOIL is not run if result is in cache"""
+    ivc = IndepVarComp()
+    ivc.add_output("xfoil:reynolds", 18000000, units="unitless")
+    ivc.add_output("xfoil:mach", 0.20, units="unitless")
+    ivc.add_output("data:geometry:wing:thickness_ratio", 0.1284, units="unitless")
+
+    # This executable cannot run, so the test fails if XFOIL is run.
+    xfoil_exe_path = str(tmp_path / "xfoil.exe")
+    with open(xfoil_exe_path, "w") as xfoil_exe:
+        xfoil_exe.write("dummy")
+    os.chmod(xfoil_exe_path, 0o755)
+
+    profile = get_profile(thickness_ratio=0.1284, array_backed=True).get_sides()
+    with path(resources, "polar_session.txt") as input_template_path:
+        key = XfoilPolarCache.get_key(
+            np.column_stack((profile.x, profile.z)),
+            18000000.0,
+            0.2,
+            20,
+            15.0,
+            25.0,
+            xfoil_exe_path,
+            input_template_path,
+        )
+    polar = np.zeros(21, dtype=[(name, "f8") for name in XFOIL_OUTPUT_NAMES])
+    polar["alpha"] = np.linspace(15.0, 25.0, 21)
+    polar["CL"] = np.linspace(1.5, 1.8, 21)
+    cache_folder_path = str(tmp_path / "cache")
+    XfoilPolarCache(cache_folder_path).save(key, polar)
+
+    xfoil_comp = XfoilPolar(
+        alpha_start=15.0,
+        alpha_end=25.0,
+        iter_limit=20,
+        xfoil_exe_path=xfoil_exe_path,
+        use_polar_cache=True,
+        polar_cache_folder_path=cache_folder_path,
+    )
+    problem = run_system(xfoil_comp, ivc)
+    assert problem["xfoil:CL_max_2D"] == pytest.approx(1.8, 1e-6)
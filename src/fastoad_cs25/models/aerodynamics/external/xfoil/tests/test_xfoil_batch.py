@@ -0,0 +1,171 @@
+"""
+Test module for concurrent XFOIL computations
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+
+import numpy as np
+import pytest
+from fastoad.testing import run_system
+from openmdao.core.indepvarcomp import IndepVarComp
+
+from fastoad_cs25.models.geometry.profiles.profile_getter import get_profile
+
+from ..polar_cache import XfoilPolarCache
+from ..xfoil_batch import XfoilBatchRunner, XfoilPolarBatch
+from ..xfoil_polar import (
+    DEFAULT_2D_CL_MAX,
+    XFOIL_OUTPUT_NAMES,
+    XfoilPolar,
+    build_polar_cache_key,
+)
+
+REYNOLDS = [18000000.0, 18000000.0, 10000000.0]
+MACH = [0.20, 0.20, 0.15]
+THICKNESS_RATIO = [0.1284, 0.1000, 0.1284]
+
+
+@pytest.mark.skip_if_no_xfoil()
+def test_compute_max_cl(xfoil_path, tmp_path):
+    """Tests that concurrent runs give the same results as XfoilPolar"""
+    runner = XfoilBatchRunner(
+        max_workers=3,
+        xfoil_exe_path=xfoil_path or "",
+        alpha_start=15.0,
+        alpha_end=25.0,
+        iter_limit=20,
+        use_polar_cache=False,
+    )
+    max_cl = runner.compute_max_cl(REYNOLDS, MACH, THICKNESS_RATIO)
+
+    expected_max_cl = []
+    for reynolds, mach, thickness_ratio in zip(REYNOLDS, MACH, THICKNESS_RATIO):
+        ivc = IndepVarComp()
+        ivc.add_output("xfoil:reynolds", reynolds, units="unitless")
+        ivc.add_output("xfoil:mach", mach, units="unitless")
+        ivc.add_output("data:geometry:wing:thickness_ratio", thickness_ratio, units="unitless")
+        xfoil_comp = XfoilPolar(
+            alpha_start=15.0,
+            alpha_end=25.0,
+            iter_limit=20,
+            xfoil_exe_path=xfoil_path or "",
+            use_polar_cache=False,
+        )
+        problem = run_system(xfoil_comp, ivc)
+        expected_max_cl.append(problem["xfoil:CL_max_2D"].item())
+
+    np.testing.assert_allclose(max_cl, expected_max_cl, rtol=1e-10)
+    assert max_cl[0] == pytest.approx(1.94, 1e-2)
+
+
+def test_compute_with_polar_cache(tmp_path):
+    """Tests that XFOIL is run only for conditions that are not in cache"""
+
+    # This executable cannot run, so the test fails if XFOIL is run for cached conditions.
+    xfoil_exe_path = str(tmp_path / "xfoil.exe")
+    with open(xfoil_exe_path, "w") as xfoil_exe:
+        xfoil_exe.write("#!/bin/sh\nexit 0\n")
+    os.chmod(xfoil_exe_path, 0o755)
+
+    cache_folder_path = str(tmp_path / "cache")
+    runner = XfoilBatchRunner(
+        max_workers=2,
+        xfoil_exe_path=xfoil_exe_path,
+        alpha_start=15.0,
+        alpha_end=25.0,
+        iter_limit=20,
+        use_polar_cache=True,
+        polar_cache_folder_path=cache_folder_path,
+    )
+
+    # Filling the cache for the 2 first conditions
+    for i, (reynolds, mach, thickness_ratio) in enumerate(
+        zip(REYNOLDS[:2], MACH[:2], THICKNESS_RATIO[:2])
+    ):
+        profile = get_profile(thickness_ratio=thickness_ratio, array_backed=True).get_sides()
+        key = build_polar_cache_key(
+            np.column_stack((profile.x, profile.z)),
+            reynolds,
+            mach,
+            20,
+            15.0,
+            25.0,
+            xfoil_exe_path,
+        )
+        polar = np.zeros(21, dtype=[(name, "f8") for name in XFOIL_OUTPUT_NAMES])
+        polar["alpha"] = np.linspace(15.0, 25.0, 21)
+        polar["CL"] = np.linspace(1.5, 1.8 - 0.1 * i, 21)
+        XfoilPolarCache(cache_folder_path).save(key, polar)
+
+    # Third condition is not in cache: the dummy XFOIL produces no result.
+    max_cl = runner.compute_max_cl(REYNOLDS, MACH, THICKNESS_RATIO)
+    np.testing.assert_allclose(max_cl, [1.8, 1.7, DEFAULT_2D_CL_MAX])
+
+    ivc = IndepVarComp()
+    ivc.add_output("xfoil:reynolds", REYNOLDS[:2], units="unitless")
+    ivc.add_output("xfoil:mach", MACH[:2], units="unitless")
+    ivc.add_output("data:geometry:wing:thickness_ratio", THICKNESS_RATIO[:2], units="unitless")
+    xfoil_comp = XfoilPolarBatch(
+        condition_count=2,
+        alpha_start=15.0,
+        alpha_end=25.0,
+        iter_limit=20,
+        xfoil_exe_path=xfoil_exe_path,
+        use_polar_cache=True,
+        polar_cache_folder_path=cache_folder_path,
+    )
+    problem = run_system(xfoil_comp, ivc)
+    np.testing.assert_allclose(problem["xfoil:CL_max_2D"], [1.8, 1.7])
+
+
+def test_failed_xfoil_runs(tmp_path):
+    """Tests that failed XFOIL runs give the default CL max, without stopping other runs"""
+    failing_exe_path = str(tmp_path / "xfoil.exe")
+    with open(failing_exe_path, "w") as xfoil_exe:
+        xfoil_exe.write("#!/bin/sh\nexit 1\n")
+    os.chmod(failing_exe_path, 0o755)
+
+    for xfoil_exe_path in [failing_exe_path, str(tmp_path / "missing_xfoil.exe")]:
+        runner = XfoilBatchRunner(max_workers=2, xfoil_exe_path=xfoil_exe_path)
+        max_cl = runner.compute_max_cl(REYNOLDS, MACH, THICKNESS_RATIO)
+        np.testing.assert_allclose(max_cl, [DEFAULT_2D_CL_MAX] * 3)
+
+
+def test_partials(monkeypatch):
+    """Tests that partials are computed with one batch of XFOIL runs"""
+    batch_sizes = []
+
+    def compute_max_cl(runner, reynolds, mach, thickness_ratio):
+        batch_sizes.append(len(reynolds))
+        return 1.0e-8 * reynolds + 2.0 * mach - 3.0 * thickness_ratio
+
+    monkeypatch.setattr(XfoilBatchRunner, "compute_max_cl", compute_max_cl)
+
+    ivc = IndepVarComp()
+    ivc.add_output("xfoil:reynolds", REYNOLDS, units="unitless")
+    ivc.add_output("xfoil:mach", MACH, units="unitless")
+    ivc.add_output("data:geometry:wing:thickness_ratio", THICKNESS_RATIO, units="unitless")
+    problem = run_system(XfoilPolarBatch(condition_count=3, timeout=10.0), ivc)
+    assert batch_sizes == [3]
+
+    input_names = ["xfoil:reynolds", "xfoil:mach", "data:geometry:wing:thickness_ratio"]
+    totals = problem.compute_totals(of=["xfoil:CL_max_2D"], wrt=input_names)
+    # Result of compute() is reused, so only perturbed conditions are computed.
+    assert batch_sizes == [3, 9]
+
+    for input_name, expected in zip(input_names, [1.0e-8, 2.0, -3.0]):
+        partials = totals["xfoil:CL_max_2D", input_name]
+        np.testing.assert_allclose(np.diag(partials), expected, rtol=1e-2)
+        np.testing.assert_allclose(partials - np.diag(np.diag(partials)), 0.0)
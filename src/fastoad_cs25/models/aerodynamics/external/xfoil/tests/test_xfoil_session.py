@@ -0,0 +1,102 @@
+"""
+Test module for persistent XFOIL session
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+from platform import system
+
+import numpy as np
+import pytest
+from fastoad.testing import run_system
+from openmdao.core.indepvarcomp import IndepVarComp
+
+from fastoad_cs25.models.geometry.profiles.profile_getter import get_profile
+
+from ..xfoil_polar import XfoilPolar, get_max_cl
+from ..xfoil_session import XfoilSession
+
+
+def _get_profile_points(thickness_ratio):
+    profile = get_profile(thickness_ratio=thickness_ratio, array_backed=True).get_sides()
+    return np.column_stack((profile.x, profile.z))
+
+
+@pytest.mark.skip_if_no_xfoil()
+def test_session(xfoil_path):
+    """Tests that session results are the same as results of separate XFOIL runs"""
+    conditions = [(18000000.0, 0.20, 0.1284), (10000000.0, 0.15, 0.1284), (18000000.0, 0.2, 0.1)]
+
+    with XfoilSession(xfoil_path or "") as session:
+        for reynolds, mach, thickness_ratio in conditions:
+            ivc = IndepVarComp()
+            ivc.add_output("xfoil:reynolds", reynolds, units="unitless")
+            ivc.add_output("xfoil:mach", mach, units="unitless")
+            ivc.add_output("data:geometry:wing:thickness_ratio", thickness_ratio, units="unitless")
+            xfoil_comp = XfoilPolar(
+                alpha_start=15.0,
+                alpha_end=25.0,
+                iter_limit=20,
+                xfoil_exe_path=xfoil_path or "",
+                use_polar_cache=False,
+            )
+            expected_max_cl = run_system(xfoil_comp, ivc)["xfoil:CL_max_2D"]
+
+            polar = session.compute_polar(
+                _get_profile_points(thickness_ratio), reynolds, mach, 20, 15.0, 25.0
+            )
+            assert get_max_cl(polar["alpha"], polar["CL"]) == pytest.approx(
+                expected_max_cl, rel=1e-3
+            )
+        assert session.is_running
+    assert not session.is_running
+
+
+@pytest.mark.skip_if_no_xfoil()
+def test_compute_with_session(xfoil_path):
+    """Tests XfoilPolar with persistent_session option"""
+    ivc = IndepVarComp()
+    ivc.add_output("xfoil:reynolds", 18000000, units="unitless")
+    ivc.add_output("xfoil:mach", 0.20, units="unitless")
+    ivc.add_output("data:geometry:wing:thickness_ratio", 0.1284, units="unitless")
+
+    xfoil_comp = XfoilPolar(
+        alpha_start=15.0,
+        alpha_end=25.0,
+        iter_limit=20,
+        xfoil_exe_path=xfoil_path or "",
+        use_polar_cache=False,
+        persistent_session=True,
+    )
+    problem = run_system(xfoil_comp, ivc)
+    assert problem["xfoil:CL_max_2D"] == pytest.approx(1.94, 1e-2)
+
+    problem.run_model()
+    assert problem["xfoil:CL_max_2D"] == pytest.approx(1.94, 1e-2)
+    assert xfoil_comp._session.is_running
+
+
+@pytest.mark.skipif(system() == "Windows", reason="needs a shell script")
+def test_session_watchdog(tmp_path):
+    """Tests that a hung XFOIL process is killed"""
+    # This executable never answers.
+    xfoil_exe_path = str(tmp_path / "xfoil.exe")
+    with open(xfoil_exe_path, "w") as xfoil_exe:
+        xfoil_exe.write("#!/bin/sh\nsleep 60\n")
+    os.chmod(xfoil_exe_path, 0o755)
+
+    session = XfoilSession(xfoil_exe_path, timeout=0.5)
+    with pytest.raises(RuntimeError):
+        session.compute_polar(_get_profile_points(0.1284), 18000000.0, 0.2, 20, 15.0, 25.0)
+    assert not session.is_running
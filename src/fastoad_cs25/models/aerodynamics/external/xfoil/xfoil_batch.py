@@ -0,0 +1,348 @@
+"""
+This module launches concurrent XFOIL computations for several flight conditions
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import os
+import os.path as pth
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+import openmdao.api as om
+
+from fastoad_cs25.models.geometry.profiles.profile_getter import get_profile
+
+from .polar_cache import DEFAULT_CACHE_FOLDER_PATH, DEFAULT_CACHE_MAX_SIZE, XfoilPolarCache
+from .scratch import get_staged_xfoil_exe_path
+from .xfoil_polar import (
+    DEFAULT_2D_CL_MAX,
+    DEFAULT_PROFILE_FILENAME,
+    INPUT_FILE_NAME,
+    OPTION_ALPHA_END,
+    OPTION_ALPHA_START,
+    OPTION_ITER_LIMIT,
+    OPTION_POLAR_CACHE_FOLDER_PATH,
+    OPTION_POLAR_CACHE_MAX_SIZE,
+    OPTION_PROFILE_NAME,
+    OPTION_USE_POLAR_CACHE,
+    OPTION_USE_RAM_DISK,
+    OPTION_XFOIL_EXE_PATH,
+    STDERR_FILE_NAME,
+    STDOUT_FILE_NAME,
+    TMP_PROFILE_FILE_NAME,
+    TMP_RESULT_FILE_NAME,
+    build_polar_cache_key,
+    get_max_cl,
+    get_scratch_directory_pool,
+    read_polar,
+    write_input_file,
+    write_profile_file,
+)
+
+OPTION_CONDITION_COUNT = "condition_count"
+OPTION_MAX_WORKERS = "max_workers"
+OPTION_TIMEOUT = "timeout"
+
+# Step for finite difference computation of partials (same as OpenMDAO default)
+_FD_STEP = 1.0e-6
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class XfoilBatchRunner:
+    """
+    Runs XFOIL for several (Reynolds, Mach, thickness ratio) conditions.
+
+    Each worker of the pool drives one XFOIL process at a time, in its own short-path
+    temporary directory. Workers are threads, as the actual work is done in XFOIL processes.
+
+    XFOIL results are cached in the same way as in
+    :class:`~fastoad_cs25.models.aerodynamics.external.xfoil.xfoil_polar.XfoilPolar`.
+
+    :param max_workers: maximum number of XFOIL processes that are run simultaneously. If None,
+                        the number of CPUs is used.
+    :param profile_name: name of profile resource
+    :param xfoil_exe_path: path to XFOIL executable. If empty, the embedded one is used.
+    :param alpha_start: start of the alpha sweep, in degrees
+    :param alpha_end: end of the alpha sweep, in degrees
+    :param iter_limit: maximum number of iterations for each XFOIL point
+    :param use_polar_cache: if True, XFOIL is not run again for already computed conditions
+    :param polar_cache_folder_path: where XFOIL results are cached
+    :param polar_cache_max_size: maximum size in bytes of cached XFOIL results
+    :param timeout: maximum duration of one XFOIL run, in seconds. None means no limit.
+    :param use_ram_disk: if True, XFOIL files are written on a RAM disk, if available
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        profile_name: str = DEFAULT_PROFILE_FILENAME,
+        xfoil_exe_path: str = "",
+        alpha_start: float = 0.0,
+        alpha_end: float = 30.0,
+        iter_limit: int = 500,
+        use_polar_cache: bool = False,
+        polar_cache_folder_path: str = DEFAULT_CACHE_FOLDER_PATH,
+        polar_cache_max_size: int = DEFAULT_CACHE_MAX_SIZE,
+        timeout: Optional[float] = None,
+        use_ram_disk: bool = False,
+    ):
+        self.max_workers = max_workers if max_workers else os.cpu_count()
+        self.profile_name = profile_name
+        self.xfoil_exe_path = xfoil_exe_path
+        self.alpha_start = alpha_start
+        self.alpha_end = alpha_end
+        self.iter_limit = iter_limit
+        self.use_polar_cache = use_polar_cache
+        self.polar_cache = XfoilPolarCache(polar_cache_folder_path, polar_cache_max_size)
+        self.timeout = timeout
+        self.use_ram_disk = use_ram_disk
+
+    def compute_polars(self, reynolds, mach, thickness_ratio) -> List[np.ndarray]:
+        """
+        Inputs are broadcast against each other.
+
+        :param reynolds:
+        :param mach:
+        :param thickness_ratio:
+        :return: the XFOIL polar result for each condition
+        """
+        conditions = np.broadcast_arrays(
+            np.asarray(reynolds, dtype=float).ravel(),
+            np.asarray(mach, dtype=float).ravel(),
+            np.asarray(thickness_ratio, dtype=float).ravel(),
+        )
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.compute_polar, *conditions))
+
+    def compute_max_cl(self, reynolds, mach, thickness_ratio) -> np.ndarray:
+        """
+        Inputs are broadcast against each other.
+
+        :param reynolds:
+        :param mach:
+        :param thickness_ratio:
+        :return: the 2D max CL for each condition, as a 1D array
+        """
+        max_cl = []
+        for polar in self.compute_polars(reynolds, mach, thickness_ratio):
+            if polar.size == 0:
+                # XFOIL run failed or timed out: there is no column to look into.
+                _LOGGER.warning("No XFOIL result. Using default 2D CL max (%s)", DEFAULT_2D_CL_MAX)
+                max_cl.append(DEFAULT_2D_CL_MAX)
+            else:
+                polar = np.atleast_1d(polar)
+                max_cl.append(get_max_cl(polar["alpha"], polar["CL"]))
+        return np.array(max_cl)
+
+    def compute_polar(self, reynolds: float, mach: float, thickness_ratio: float) -> np.ndarray:
+        """
+        :param reynolds:
+        :param mach:
+        :param thickness_ratio:
+        :return: the XFOIL polar result for one condition
+        """
+        profile = get_profile(
+            file_name=self.profile_name, thickness_ratio=thickness_ratio, array_backed=True
+        ).get_sides()
+        profile_points = np.column_stack((profile.x, profile.z))
+
+        polar_cache_key = ""
+        if self.use_polar_cache:
+            polar_cache_key = build_polar_cache_key(
+                profile_points,
+                reynolds,
+                mach,
+                self.iter_limit,
+                self.alpha_start,
+                self.alpha_end,
+                self.xfoil_exe_path,
+            )
+            if polar_cache_key:
+                result_array = self.polar_cache.load(polar_cache_key)
+                if result_array is not None:
+                    return result_array
+
+        result_array = self._run_xfoil(profile_points, reynolds, mach)
+        if polar_cache_key and result_array.size > 0:
+            self.polar_cache.save(polar_cache_key, result_array)
+
+        return result_array
+
+    def _run_xfoil(self, profile_points, reynolds, mach) -> np.ndarray:
+        with get_scratch_directory_pool(self.use_ram_disk).directory() as tmp_directory_path:
+            return self._run_xfoil_in(tmp_directory_path, profile_points, reynolds, mach)
+
+    def _run_xfoil_in(self, tmp_directory_path, profile_points, reynolds, mach) -> np.ndarray:
+        command = [self.xfoil_exe_path or get_staged_xfoil_exe_path()]
+        input_file_path = pth.join(tmp_directory_path, INPUT_FILE_NAME)
+        profile_file_path = pth.join(tmp_directory_path, TMP_PROFILE_FILE_NAME)
+        result_file_path = pth.join(tmp_directory_path, TMP_RESULT_FILE_NAME)
+        try:
+            write_profile_file(profile_file_path, profile_points)
+            write_input_file(
+                input_file_path,
+                profile_file_path,
+                result_file_path,
+                reynolds,
+                mach,
+                self.iter_limit,
+                self.alpha_start,
+                self.alpha_end,
+            )
+
+            with (
+                open(input_file_path) as stdin,
+                open(pth.join(tmp_directory_path, STDOUT_FILE_NAME), "w") as stdout,
+                open(pth.join(tmp_directory_path, STDERR_FILE_NAME), "w") as stderr,
+            ):
+                subprocess.run(
+                    command,
+                    stdin=stdin,
+                    stdout=stdout,
+                    stderr=stderr,
+                    timeout=self.timeout,
+                    check=True,
+                )
+
+            return read_polar(result_file_path)
+        except subprocess.TimeoutExpired:
+            _LOGGER.error("XFOIL run timed out for Re=%g and Mach=%g", reynolds, mach)
+            return np.array([])
+        except (subprocess.CalledProcessError, OSError) as exc:
+            # One failed condition must not abort the computation of other ones.
+            _LOGGER.error("XFOIL run failed for Re=%g and Mach=%g: %s", reynolds, mach, exc)
+            return np.array([])
+
+
+class XfoilPolarBatch(om.ExplicitComponent):
+    """
+    Runs concurrent XFOIL polar computations and returns the 2D max lift coefficient for each
+    provided (Reynolds, Mach, thickness ratio) condition.
+
+    Partials are computed by forward finite differences, where all perturbed conditions are
+    computed in one batch.
+    """
+
+    _input_names = ["xfoil:reynolds", "xfoil:mach", "data:geometry:wing:thickness_ratio"]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._last_conditions = None
+        self._last_max_cl = None
+
+    def initialize(self):
+        self.options.declare(OPTION_CONDITION_COUNT, default=1, types=int, lower=1)
+        self.options.declare(
+            OPTION_MAX_WORKERS,
+            default=None,
+            types=int,
+            allow_none=True,
+            desc="Maximum number of XFOIL processes that are run simultaneously. If None, "
+            "the number of CPUs is used.",
+        )
+        self.options.declare(OPTION_XFOIL_EXE_PATH, default="", types=str, allow_none=True)
+        self.options.declare(OPTION_PROFILE_NAME, default=DEFAULT_PROFILE_FILENAME, types=str)
+        self.options.declare(OPTION_ALPHA_START, default=0.0, types=float)
+        self.options.declare(OPTION_ALPHA_END, default=30.0, types=float)
+        self.options.declare(OPTION_ITER_LIMIT, default=500, types=int)
+        self.options.declare(OPTION_USE_POLAR_CACHE, default=False, types=bool)
+        self.options.declare(
+            OPTION_POLAR_CACHE_FOLDER_PATH, default=DEFAULT_CACHE_FOLDER_PATH, types=str
+        )
+        self.options.declare(OPTION_POLAR_CACHE_MAX_SIZE, default=DEFAULT_CACHE_MAX_SIZE, types=int)
+        self.options.declare(
+            OPTION_TIMEOUT,
+            default=None,
+            types=(int, float),
+            allow_none=True,
+            desc="Maximum duration of one XFOIL run, in seconds. None means no limit.",
+        )
+        self.options.declare(OPTION_USE_RAM_DISK, default=False, types=bool)
+
+    def setup(self):
+        condition_count = self.options[OPTION_CONDITION_COUNT]
+
+        self.add_input("xfoil:reynolds", val=np.nan, shape=condition_count, units="unitless")
+        self.add_input("xfoil:mach", val=np.nan, shape=condition_count, units="unitless")
+        self.add_input(
+            "data:geometry:wing:thickness_ratio",
+            val=np.nan,
+            shape=condition_count,
+            units="unitless",
+        )
+
+        self.add_output("xfoil:CL_max_2D", shape=condition_count, units="unitless")
+
+    def setup_partials(self):
+        diagonal = np.arange(self.options[OPTION_CONDITION_COUNT])
+        self.declare_partials("*", "*", rows=diagonal, cols=diagonal)
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        conditions = self._get_conditions(inputs)
+        max_cl = self._get_runner().compute_max_cl(*conditions)
+
+        self._last_conditions = conditions
+        self._last_max_cl = max_cl
+        outputs["xfoil:CL_max_2D"] = max_cl
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        conditions = self._get_conditions(inputs)
+
+        # Each condition depends only on its own inputs, so perturbing one input for all
+        # conditions at once gives the diagonal of its partials.
+        condition_sets = [
+            conditions + _FD_STEP * np.eye(len(conditions))[:, [i]] for i in range(len(conditions))
+        ]
+        reuse_last_result = self._last_conditions is not None and np.array_equal(
+            self._last_conditions, conditions
+        )
+        if not reuse_last_result:
+            condition_sets.insert(0, conditions)
+
+        max_cl = self._get_runner().compute_max_cl(*np.concatenate(condition_sets, axis=1))
+        max_cl = max_cl.reshape(len(condition_sets), -1)
+        if reuse_last_result:
+            reference_max_cl = self._last_max_cl
+        else:
+            reference_max_cl, max_cl = max_cl[0], max_cl[1:]
+
+        for input_name, perturbed_max_cl in zip(self._input_names, max_cl):
+            partials["xfoil:CL_max_2D", input_name] = (
+                perturbed_max_cl - reference_max_cl
+            ) / _FD_STEP
+
+    def _get_conditions(self, inputs) -> np.ndarray:
+        """
+        :return: (3, N) array of Reynolds numbers, Mach numbers and thickness ratios
+        """
+        return np.array([inputs[name] for name in self._input_names])
+
+    def _get_runner(self) -> XfoilBatchRunner:
+        return XfoilBatchRunner(
+            max_workers=self.options[OPTION_MAX_WORKERS],
+            profile_name=self.options[OPTION_PROFILE_NAME],
+            xfoil_exe_path=self.options[OPTION_XFOIL_EXE_PATH] or "",
+            alpha_start=self.options[OPTION_ALPHA_START],
+            alpha_end=self.options[OPTION_ALPHA_END],
+            iter_limit=self.options[OPTION_ITER_LIMIT],
+            use_polar_cache=self.options[OPTION_USE_POLAR_CACHE],
+            polar_cache_folder_path=self.options[OPTION_POLAR_CACHE_FOLDER_PATH],
+            polar_cache_max_size=self.options[OPTION_POLAR_CACHE_MAX_SIZE],
+            timeout=self.options[OPTION_TIMEOUT],
+            use_ram_disk=self.options[OPTION_USE_RAM_DISK],
+        )
@@ -18,19 +18,27 @@ import logging
 import os
 import os.path as pth
 import shutil
+from contextlib import ExitStack
+from functools import lru_cache
 from importlib.resources import path
-from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
-from fastoad._utils.resource_management.copy import copy_resource
 from openmdao.utils.file_wrap import InputFileGenerator
 
 from fastoad_cs25.models.geometry.profiles.profile_getter import get_profile
 
 from . import resources, xfoil699
+from .adaptive_sweep import (
+    DEFAULT_ALPHA_STEP,
+    DEFAULT_CHUNK_POINT_COUNT,
+    DEFAULT_COARSE_ALPHA_STEP,
+    DEFAULT_STALL_CL_DROP,
+    run_adaptive_sweep,
+)
+from .polar_cache import DEFAULT_CACHE_FOLDER_PATH, DEFAULT_CACHE_MAX_SIZE, XfoilPolarCache
+from .scratch import XFOIL_EXE_NAME, ScratchDirectoryPool, get_staged_xfoil_exe_path
 from ...constants import SERVICE_XFOIL
 
 OPTION_RESULT_POLAR_FILENAME = "result_polar_filename"
@@ -39,33 +47,182 @@ OPTION_PROFILE_NAME = "profile_name"
 OPTION_XFOIL_EXE_PATH = "xfoil_exe_path"
 OPTION_ALPHA_START = "alpha_start"
 OPTION_ALPHA_END = "alpha_end"
+OPTION_ALPHA_STEP = "alpha_step"
 OPTION_ITER_LIMIT = "iter_limit"
+OPTION_USE_POLAR_CACHE = "use_polar_cache"
+OPTION_POLAR_CACHE_FOLDER_PATH = "polar_cache_folder_path"
+OPTION_POLAR_CACHE_MAX_SIZE = "polar_cache_max_size"
+OPTION_PERSISTENT_SESSION = "persistent_session"
+OPTION_SESSION_TIMEOUT = "session_timeout"
+OPTION_ADAPTIVE_SWEEP = "adaptive_sweep"
+OPTION_COARSE_ALPHA_STEP = "coarse_alpha_step"
+OPTION_STALL_CL_DROP = "stall_cl_drop"
+OPTION_USE_RAM_DISK = "use_ram_disk"
 
 DEFAULT_2D_CL_MAX = 1.9
 
-_INPUT_FILE_NAME = "polar_session.txt"
-_STDOUT_FILE_NAME = "polar_calc.log"
-_STDERR_FILE_NAME = "polar_calc.err"
-_TMP_PROFILE_FILE_NAME = "in"  # as short as possible to avoid problems of path length
-_TMP_RESULT_FILE_NAME = "out"  # as short as possible to avoid problems of path length
+INPUT_FILE_NAME = "polar_session.txt"
+STDOUT_FILE_NAME = "polar_calc.log"
+STDERR_FILE_NAME = "polar_calc.err"
+TMP_PROFILE_FILE_NAME = "in"  # as short as possible to avoid problems of path length
+TMP_RESULT_FILE_NAME = "out"  # as short as possible to avoid problems of path length
 
-XFOIL_EXE_NAME = "xfoil.exe"  # name of embedded XFoil executable
 DEFAULT_PROFILE_FILENAME = "BACJ.txt"
 
+XFOIL_OUTPUT_NAMES = ["alpha", "CL", "CD", "CDp", "CM", "Top_Xtr", "Bot_Xtr"]
+"""Column names in XFOIL polar result"""
+
 _LOGGER = logging.getLogger(__name__)
 
 _XFOIL_PATH_LIMIT = 64
 
 
+@lru_cache(maxsize=None)
+def get_scratch_directory_pool(use_ram_disk: bool = False) -> ScratchDirectoryPool:
+    """
+    :param use_ram_disk: if True, RAM disk is preferred for XFOIL files, if available
+    :return: the pool of working directories for XFOIL, created on first call only
+    """
+    # Dev Note: XFOIL fails if length of provided file path exceeds 64 characters.
+    #           Changing working directory to the tmp dir would allow to just provide file name,
+    #           but it is not really safe (at least, it does mess with the coverage report).
+    #           Then the point is to get a tmp directory with a short path.
+    return ScratchDirectoryPool(
+        _XFOIL_PATH_LIMIT,
+        max(len(TMP_PROFILE_FILE_NAME), len(TMP_RESULT_FILE_NAME)),
+        use_ram_disk=use_ram_disk,
+    )
+
+
+def build_polar_cache_key(
+    profile_points,
+    reynolds,
+    mach,
+    iter_limit,
+    alpha_start,
+    alpha_end,
+    xfoil_exe_path,
+    sweep_parameters=(),
+) -> str:
+    """
+    :param xfoil_exe_path: if empty, the embedded XFOIL executable is assumed
+    :param sweep_parameters: see :meth:`~.polar_cache.XfoilPolarCache.get_key`
+    :return: the key for polar cache, or an empty string if XFOIL executable cannot be found
+    """
+    with ExitStack() as stack:
+        if xfoil_exe_path:
+            xfoil_exe_path = shutil.which(xfoil_exe_path)
+        else:
+            xfoil_exe_path = stack.enter_context(path(xfoil699, XFOIL_EXE_NAME))
+        if not xfoil_exe_path or not pth.isfile(xfoil_exe_path):
+            return ""
+
+        input_template_path = stack.enter_context(path(resources, INPUT_FILE_NAME))
+        return XfoilPolarCache.get_key(
+            profile_points,
+            reynolds,
+            mach,
+            iter_limit,
+            alpha_start,
+            alpha_end,
+            xfoil_exe_path,
+            input_template_path,
+            sweep_parameters,
+        )
+
+
+def write_profile_file(profile_file_path: str, profile_points: np.ndarray):
+    """
+    :param profile_file_path:
+    :param profile_points: (N, 2) array of profile coordinates
+    """
+    np.savetxt(
+        profile_file_path,
+        profile_points,
+        fmt="%.15f",
+        delimiter=" ",
+        header="Wing",
+        comments="",
+    )
+
+
+def write_input_file(
+    input_file_path: str,
+    profile_file_path: str,
+    result_file_path: str,
+    reynolds: float,
+    mach: float,
+    iter_limit: int,
+    alpha_start: float,
+    alpha_end: float,
+    alpha_step: float = DEFAULT_ALPHA_STEP,
+):
+    """
+    Generates the file of XFOIL commands from template.
+    """
+    parser = InputFileGenerator()
+    with path(resources, INPUT_FILE_NAME) as input_template_path:
+        parser.set_template_file(input_template_path)
+        parser.set_generated_file(input_file_path)
+
+        # Fills numeric values
+        parser.mark_anchor("RE")
+        parser.transfer_var(reynolds, 1, 1)
+        parser.mark_anchor("M")
+        parser.transfer_var(mach, 1, 1)
+        parser.mark_anchor("ITER")
+        parser.transfer_var(iter_limit, 1, 1)
+        parser.mark_anchor("ASEQ")
+        parser.transfer_var(alpha_start, 1, 1)
+        parser.transfer_var(alpha_end, 2, 1)
+        parser.transfer_var(alpha_step, 3, 1)
+
+        # Fills string values
+        # If a provide path contains the string that is used as next anchor, the process
+        # will fail. Doing these replacements at the end prevent this to happen.
+        parser.reset_anchor()
+        parser.mark_anchor("LOAD")
+        parser.transfer_var(profile_file_path, 1, 1)
+        parser.mark_anchor("PACC", -2)
+        parser.transfer_var(result_file_path, 1, 1)
+
+        parser.generate()
+
+
+def read_polar(xfoil_result_file_path: str) -> np.ndarray:
+    """
+    :param xfoil_result_file_path:
+    :return: numpy array with XFoil polar results
+    """
+    if os.path.isfile(xfoil_result_file_path):
+        dtypes = [(name, "f8") for name in XFOIL_OUTPUT_NAMES]
+        result_array = np.genfromtxt(xfoil_result_file_path, skip_header=12, dtype=dtypes)
+        return result_array
+
+    _LOGGER.error("XFOIL results file not found")
+    return np.array([])
+
+
+def get_max_cl(alpha: np.ndarray, lift_coeff: np.ndarray) -> float:
+    """
+
+    :param alpha:
+    :param lift_coeff: CL
+    :return: max CL if enough alpha computed, or default value otherwise
+    """
+    if len(alpha) > 0 and max(alpha) >= 5.0:
+        return max(lift_coeff)
+
+    _LOGGER.warning("2D CL max not found. Using default value (%s)", DEFAULT_2D_CL_MAX)
+    return DEFAULT_2D_CL_MAX
+
+
 @oad.RegisterSubmodel(SERVICE_XFOIL, "fastoad.submodel.aerodynamics.xfoil")
 class XfoilPolar(om.ExternalCodeComp):
     """
     Runs a polar computation with XFOIL and returns the 2D max lift coefficient
     """
 
-    _xfoil_output_names = ["alpha", "CL", "CD", "CDp", "CM", "Top_Xtr", "Bot_Xtr"]
-    """Column names in XFOIL polar result"""
-
     def initialize(self):
         self.options.declare(OPTION_XFOIL_EXE_PATH, default="", types=str, allow_none=True)
         self.options.declare(OPTION_PROFILE_NAME, default="BACJ.txt", types=str)
@@ -73,7 +230,86 @@ class XfoilPolar(om.ExternalCodeComp):
         self.options.declare(OPTION_RESULT_POLAR_FILENAME, default="polar_result.txt", types=str)
         self.options.declare(OPTION_ALPHA_START, default=0.0, types=float)
         self.options.declare(OPTION_ALPHA_END, default=30.0, types=float)
+        self.options.declare(
+            OPTION_ALPHA_STEP,
+            default=DEFAULT_ALPHA_STEP,
+            types=float,
+            desc="Alpha step of the sweep, in degrees. If adaptive_sweep is True, this is the "
+            "step of the fine sweep around the CL peak.",
+        )
         self.options.declare(OPTION_ITER_LIMIT, default=500, types=int)
+        self.options.declare(
+            OPTION_ADAPTIVE_SWEEP,
+            default=False,
+            types=bool,
+            desc="If True, a coarse alpha sweep is done first, then a fine sweep around the "
+            "CL peak. The coarse sweep is done by chunks and stops as soon as CL has clearly "
+            "decreased after its maximum. Without persistent session, each chunk is a separate "
+            "XFOIL run. If result_folder_path is provided, files of each run are kept, with "
+            "the run index as suffix for runs after the first one.",
+        )
+        self.options.declare(
+            OPTION_COARSE_ALPHA_STEP,
+            default=DEFAULT_COARSE_ALPHA_STEP,
+            types=float,
+            desc="Used if adaptive_sweep is True. Alpha step of the coarse sweep, in degrees.",
+        )
+        self.options.declare(
+            OPTION_STALL_CL_DROP,
+            default=DEFAULT_STALL_CL_DROP,
+            types=float,
+            desc="Used if adaptive_sweep is True. CL decrease after the CL peak that stops "
+            "the coarse sweep.",
+        )
+        self.options.declare(
+            OPTION_USE_POLAR_CACHE,
+            default=False,
+            types=bool,
+            desc="If True, XFOIL results are stored on disk, and XFOIL is not run again for "
+            "an already computed set of inputs and options.",
+        )
+        self.options.declare(
+            OPTION_POLAR_CACHE_FOLDER_PATH,
+            default=DEFAULT_CACHE_FOLDER_PATH,
+            types=str,
+            desc="Folder where XFOIL results are stored if use_polar_cache is True.",
+        )
+        self.options.declare(
+            OPTION_POLAR_CACHE_MAX_SIZE,
+            default=DEFAULT_CACHE_MAX_SIZE,
+            types=int,
+            desc="Maximum size in bytes of stored XFOIL results. When exceeded, least recently "
+            "used results are deleted.",
+        )
+        self.options.declare(
+            OPTION_USE_RAM_DISK,
+            default=False,
+            types=bool,
+            desc="If True, XFOIL files are written on a RAM disk (/dev/shm), if available.",
+        )
+        self.options.declare(
+            OPTION_PERSISTENT_SESSION,
+            default=False,
+            types=bool,
+            desc="If True, one XFOIL process is kept alive for the component's lifetime and "
+            "driven interactively, instead of running XFOIL for each computation. Not used if "
+            "result_folder_path is provided.",
+        )
+        self.options.declare(
+            OPTION_SESSION_TIMEOUT,
+            default=60.0,
+            types=float,
+            desc="Used if persistent_session is True. Maximum duration in seconds of one polar "
+            "computation. If exceeded, XFOIL process is restarted.",
+        )
+
+        self._session = None
+
+        self.computed_point_count = 0
+        """Number of polar points computed by XFOIL during last compute."""
+
+        # Number of XFOIL runs done in current compute, used for naming result files
+        self._run_count = 0
 
     def setup(self):
         self.add_input("xfoil:reynolds", val=np.nan, units="unitless")
@@ -91,159 +327,232 @@ class XfoilPolar(om.ExternalCodeComp):
             os.makedirs(result_folder_path, exist_ok=True)
 
         # Get inputs
-        reynolds = inputs["xfoil:reynolds"]
-        mach = inputs["xfoil:mach"]
+        reynolds = float(inputs["xfoil:reynolds"].item())
+        mach = float(inputs["xfoil:mach"].item())
         thickness_ratio = inputs["data:geometry:wing:thickness_ratio"]
 
-        # Pre-processing (populating temp directory) -----------------------------------------------
-        # XFoil exe
-        tmp_directory = self._create_tmp_directory()
-        if self.options[OPTION_XFOIL_EXE_PATH]:
-            # if a path for Xfoil has been provided, simply use it
-            self.options["command"] = [self.options[OPTION_XFOIL_EXE_PATH]]
-        else:
-            # otherwise, copy the embedded resource in tmp dir
-            copy_resource(xfoil699, XFOIL_EXE_NAME, tmp_directory.name)
-            self.options["command"] = [pth.join(tmp_directory.name, XFOIL_EXE_NAME)]
-
-        # I/O files
-        self.stdin = pth.join(tmp_directory.name, _INPUT_FILE_NAME)
-        self.stdout = pth.join(tmp_directory.name, _STDOUT_FILE_NAME)
-        self.stderr = pth.join(tmp_directory.name, _STDERR_FILE_NAME)
-
-        # profile file
-        tmp_profile_file_path = pth.join(tmp_directory.name, _TMP_PROFILE_FILE_NAME)
         profile = get_profile(
-            file_name=self.options[OPTION_PROFILE_NAME], thickness_ratio=thickness_ratio
+            file_name=self.options[OPTION_PROFILE_NAME],
+            thickness_ratio=thickness_ratio,
+            array_backed=True,
         ).get_sides()
-        np.savetxt(
-            tmp_profile_file_path,
-            profile.to_numpy(),
-            fmt="%.15f",
-            delimiter=" ",
-            header="Wing",
-            comments="",
-        )
-
-        # standard input file
-        tmp_result_file_path = pth.join(tmp_directory.name, _TMP_RESULT_FILE_NAME)
-        parser = InputFileGenerator()
-        with path(resources, _INPUT_FILE_NAME) as input_template_path:
-            parser.set_template_file(input_template_path)
-            parser.set_generated_file(self.stdin)
-
-            # Fills numeric values
-            parser.mark_anchor("RE")
-            parser.transfer_var(float(reynolds.item()), 1, 1)
-            parser.mark_anchor("M")
-            parser.transfer_var(float(mach.item()), 1, 1)
-            parser.mark_anchor("ITER")
-            parser.transfer_var(self.options[OPTION_ITER_LIMIT], 1, 1)
-            parser.mark_anchor("ASEQ")
-            parser.transfer_var(self.options[OPTION_ALPHA_START], 1, 1)
-            parser.transfer_var(self.options[OPTION_ALPHA_END], 2, 1)
-
-            # Fills string values
-            # If a provide path contains the string that is used as next anchor, the process
-            # will fail. Doing these replacements at the end prevent this to happen.
-            parser.reset_anchor()
-            parser.mark_anchor("LOAD")
-            parser.transfer_var(tmp_profile_file_path, 1, 1)
-            parser.mark_anchor("PACC", -2)
-            parser.transfer_var(tmp_result_file_path, 1, 1)
-
-            parser.generate()
-
-        # Run XFOIL --------------------------------------------------------------------------------
-        self.options["external_input_files"] = [self.stdin, tmp_profile_file_path]
-        self.options["external_output_files"] = [tmp_result_file_path]
-        super().compute(inputs, outputs)
-
-        # Post-processing --------------------------------------------------------------------------
-        result_array = self._read_polar(tmp_result_file_path)
-        outputs["xfoil:CL_max_2D"] = self._get_max_cl(result_array["alpha"], result_array["CL"])
-
-        # Getting output files if needed
-        if self.options[OPTION_RESULT_FOLDER_PATH]:
-            if pth.exists(tmp_result_file_path):
-                polar_file_path = pth.join(
-                    result_folder_path, self.options[OPTION_RESULT_POLAR_FILENAME]
-                )
-                shutil.move(tmp_result_file_path, polar_file_path)
-
-            if pth.exists(self.stdin):
-                stdin_file_path = pth.join(result_folder_path, _INPUT_FILE_NAME)
-                shutil.move(self.stdin, stdin_file_path)
-
-            if pth.exists(self.stdout):
-                stdout_file_path = pth.join(result_folder_path, _STDOUT_FILE_NAME)
-                shutil.move(self.stdout, stdout_file_path)
-
-            if pth.exists(self.stderr):
-                stderr_file_path = pth.join(result_folder_path, _STDERR_FILE_NAME)
-                shutil.move(self.stderr, stderr_file_path)
-
-        tmp_directory.cleanup()
-
-    @staticmethod
-    def _read_polar(xfoil_result_file_path: str) -> np.ndarray:
+        profile_points = np.column_stack((profile.x, profile.z))
+
+        polar_cache_key = self._get_polar_cache_key(profile_points, reynolds, mach)
+        result_array = None
+        # If result files are required, XFOIL has to be run.
+        if polar_cache_key and not result_folder_path:
+            result_array = self._get_polar_cache().load(polar_cache_key)
+
+        self.computed_point_count = 0
+        self._run_count = 0
+        if result_array is None:
+            if self.options[OPTION_PERSISTENT_SESSION] and not result_folder_path:
+                session = self._get_session()
+
+                def sweep(alpha_start, alpha_end, alpha_step, is_continued):
+                    return session.compute_polar(
+                        profile_points,
+                        reynolds,
+                        mach,
+                        self.options[OPTION_ITER_LIMIT],
+                        alpha_start,
+                        alpha_end,
+                        alpha_step,
+                        initialize_boundary_layer=not is_continued,
+                    )
+
+            else:
+                # Each call is a new XFOIL run, so is_continued cannot be honored.
+                def sweep(alpha_start, alpha_end, alpha_step, is_continued):
+                    return self._run_xfoil(
+                        inputs,
+                        outputs,
+                        profile_points,
+                        reynolds,
+                        mach,
+                        alpha_start,
+                        alpha_end,
+                        alpha_step,
+                    )
+
+            result_array = self._sweep(sweep)
+            if polar_cache_key and result_array.size > 0:
+                self._get_polar_cache().save(polar_cache_key, result_array)
+
+        outputs["xfoil:CL_max_2D"] = get_max_cl(result_array["alpha"], result_array["CL"])
+
+    def _sweep(self, sweep) -> np.ndarray:
         """
-        :param xfoil_result_file_path:
-        :return: numpy array with XFoil polar results
+        Runs the alpha sweep according to options, using provided sweep function.
+
+        :param sweep: see :data:`~.adaptive_sweep.SweepFunction`
+        :return: the polar result
         """
-        if os.path.isfile(xfoil_result_file_path):
-            dtypes = [(name, "f8") for name in XfoilPolar._xfoil_output_names]
-            result_array = np.genfromtxt(xfoil_result_file_path, skip_header=12, dtype=dtypes)
+        alpha_start = self.options[OPTION_ALPHA_START]
+        alpha_end = self.options[OPTION_ALPHA_END]
+        alpha_step = self.options[OPTION_ALPHA_STEP]
+
+        if not self.options[OPTION_ADAPTIVE_SWEEP]:
+            result_array = sweep(alpha_start, alpha_end, alpha_step, False)
+            self.computed_point_count = result_array.size
             return result_array
 
-        _LOGGER.error("XFOIL results file not found")
-        return np.array([])
+        result_array, self.computed_point_count = run_adaptive_sweep(
+            sweep,
+            alpha_start,
+            alpha_end,
+            coarse_alpha_step=self.options[OPTION_COARSE_ALPHA_STEP],
+            fine_alpha_step=alpha_step,
+            stall_cl_drop=self.options[OPTION_STALL_CL_DROP],
+            chunk_point_count=DEFAULT_CHUNK_POINT_COUNT,
+        )
+        return result_array
+
+    def _run_xfoil(
+        self,
+        inputs,
+        outputs,
+        profile_points,
+        reynolds,
+        mach,
+        alpha_start,
+        alpha_end,
+        alpha_step=DEFAULT_ALPHA_STEP,
+    ) -> np.ndarray:
+        """
+        Runs XFOIL and returns the polar result.
+
+        If result_folder_path option is set, XFOIL files of this run are moved to this folder.
+        Files of the first run of current computation keep their name. Files of next runs are
+        suffixed with the run index.
+        """
+        result_folder_path = self.options[OPTION_RESULT_FOLDER_PATH]
+
+        scratch_directory_pool = get_scratch_directory_pool(self.options[OPTION_USE_RAM_DISK])
+        with scratch_directory_pool.directory() as tmp_directory_path:
+            # Pre-processing (populating temp directory) -------------------------------------------
+            # XFoil exe
+            if self.options[OPTION_XFOIL_EXE_PATH]:
+                # if a path for Xfoil has been provided, simply use it
+                self.options["command"] = [self.options[OPTION_XFOIL_EXE_PATH]]
+            else:
+                # otherwise, use the embedded one
+                self.options["command"] = [get_staged_xfoil_exe_path()]
+
+            # I/O files
+            self.stdin = pth.join(tmp_directory_path, INPUT_FILE_NAME)
+            self.stdout = pth.join(tmp_directory_path, STDOUT_FILE_NAME)
+            self.stderr = pth.join(tmp_directory_path, STDERR_FILE_NAME)
+
+            # profile file
+            tmp_profile_file_path = pth.join(tmp_directory_path, TMP_PROFILE_FILE_NAME)
+            write_profile_file(tmp_profile_file_path, profile_points)
+
+            # standard input file
+            tmp_result_file_path = pth.join(tmp_directory_path, TMP_RESULT_FILE_NAME)
+            write_input_file(
+                self.stdin,
+                tmp_profile_file_path,
+                tmp_result_file_path,
+                reynolds,
+                mach,
+                self.options[OPTION_ITER_LIMIT],
+                alpha_start,
+                alpha_end,
+                alpha_step,
+            )
 
-    @staticmethod
-    def _get_max_cl(alpha: np.ndarray, lift_coeff: np.ndarray) -> float:
+            # Run XFOIL ----------------------------------------------------------------------------
+            self.options["external_input_files"] = [self.stdin, tmp_profile_file_path]
+            self.options["external_output_files"] = [tmp_result_file_path]
+            super().compute(inputs, outputs)
+
+            # Post-processing ----------------------------------------------------------------------
+            result_array = read_polar(tmp_result_file_path)
+
+            # Getting output files if needed
+            if result_folder_path:
+                for file_path, file_name in [
+                    (tmp_result_file_path, self.options[OPTION_RESULT_POLAR_FILENAME]),
+                    (self.stdin, INPUT_FILE_NAME),
+                    (self.stdout, STDOUT_FILE_NAME),
+                    (self.stderr, STDERR_FILE_NAME),
+                ]:
+                    if pth.exists(file_path):
+                        shutil.move(
+                            file_path,
+                            pth.join(result_folder_path, self._get_run_file_name(file_name)),
+                        )
+
+        self._run_count += 1
+        return result_array
+
+    def _get_run_file_name(self, file_name: str) -> str:
         """
+        :return: file_name, with the index of current XFOIL run as suffix if it is not the
+                 first run of current computation
+        """
+        if self._run_count == 0:
+            return file_name
+        root, extension = pth.splitext(file_name)
+        return f"{root}_{self._run_count}{extension}"
 
-        :param alpha:
-        :param lift_coeff: CL
-        :return: max CL if enough alpha computed, or default value otherwise
+    def _get_session(self):
+        """
+        :return: the XFOIL session of this component, started with current options
         """
-        if len(alpha) > 0 and max(alpha) >= 5.0:
-            return max(lift_coeff)
-
-        _LOGGER.warning("2D CL max not found. Using default value (%s)", DEFAULT_2D_CL_MAX)
-        return DEFAULT_2D_CL_MAX
-
-    @staticmethod
-    def _create_tmp_directory() -> TemporaryDirectory:
-        # Dev Note: XFOIL fails if length of provided file path exceeds 64 characters.
-        #           Changing working directory to the tmp dir would allow to just provide file name,
-        #           but it is not really safe (at least, it does mess with the coverage report).
-        #           Then the point is to get a tmp directory with a short path.
-        #           On Windows, the default (user-dependent) tmp dir can exceed the limit.
-        #           Therefore, as a second choice, tmp dir is created as close of user home
-        #           directory as possible.
-
-        tmp_base_candidates = [None, pth.join(str(Path.home()), ".fast")]
-
-        tmp_candidates = []
-        for tmp_base_path in tmp_base_candidates:
-            if tmp_base_path is not None:
-                os.makedirs(tmp_base_path, exist_ok=True)
-            tmp_directory = TemporaryDirectory(dir=tmp_base_path)
-            tmp_candidates.append(tmp_directory.name)
-            tmp_profile_file_path = pth.join(tmp_directory.name, _TMP_PROFILE_FILE_NAME)
-            tmp_result_file_path = pth.join(tmp_directory.name, _TMP_RESULT_FILE_NAME)
-
-            if max(len(tmp_profile_file_path), len(tmp_result_file_path)) <= _XFOIL_PATH_LIMIT:
-                # tmp_directory is OK. Stop there
-                break
-            # tmp_directory has a too long path. Erase and continue...
-            tmp_directory.cleanup()
-
-        if max(len(tmp_profile_file_path), len(tmp_result_file_path)) > _XFOIL_PATH_LIMIT:
-            raise IOError(
-                "Could not create a tmp directory where file path will respect XFOIL "
-                "limitation (%i): tried %s" % (_XFOIL_PATH_LIMIT, tmp_candidates)
+        # Imported here because xfoil_session module depends on this one.
+        from .xfoil_session import XfoilSession
+
+        xfoil_exe_path = self.options[OPTION_XFOIL_EXE_PATH] or ""
+        if (
+            self._session is None
+            or self._session.xfoil_exe_path != xfoil_exe_path
+            or self._session.use_ram_disk != self.options[OPTION_USE_RAM_DISK]
+        ):
+            if self._session is not None:
+                self._session.close()
+            self._session = XfoilSession(
+                xfoil_exe_path, use_ram_disk=self.options[OPTION_USE_RAM_DISK]
             )
+        self._session.timeout = self.options[OPTION_SESSION_TIMEOUT]
+        return self._session
+
+    def _get_polar_cache(self) -> XfoilPolarCache:
+        return XfoilPolarCache(
+            self.options[OPTION_POLAR_CACHE_FOLDER_PATH], self.options[OPTION_POLAR_CACHE_MAX_SIZE]
+        )
 
-        return tmp_directory
+    def _get_polar_cache_key(self, profile_points, reynolds, mach) -> str:
+        """
+        :return: the key for polar cache, or an empty string if cache is not used or if XFOIL
+                 executable cannot be found (in which case, XFOIL run will fail anyway)
+        """
+        if not self.options[OPTION_USE_POLAR_CACHE]:
+            return ""
+
+        # Parameters are added only if needed, so that keys of default sweep stay unchanged.
+        sweep_parameters = []
+        if self.options[OPTION_ADAPTIVE_SWEEP]:
+            # Without persistent session, chunks of coarse sweep are separate XFOIL runs, with
+            # no continuity of boundary layer solution, so results may differ.
+            sweep_parameters = [
+                self.options[OPTION_ALPHA_STEP],
+                self.options[OPTION_COARSE_ALPHA_STEP],
+                self.options[OPTION_STALL_CL_DROP],
+                float(self.options[OPTION_PERSISTENT_SESSION]),
+            ]
+        elif self.options[OPTION_ALPHA_STEP] != DEFAULT_ALPHA_STEP:
+            sweep_parameters = [self.options[OPTION_ALPHA_STEP]]
+
+        return build_polar_cache_key(
+            profile_points,
+            reynolds,
+            mach,
+            self.options[OPTION_ITER_LIMIT],
+            self.options[OPTION_ALPHA_START],
+            self.options[OPTION_ALPHA_END],
+            self.options[OPTION_XFOIL_EXE_PATH],
+            sweep_parameters,
+        )
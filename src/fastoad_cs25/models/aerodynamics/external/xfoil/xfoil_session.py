@@ -0,0 +1,262 @@
+"""
+This module drives a long-lived XFOIL process
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import os
+import os.path as pth
+import queue
+import subprocess
+import weakref
+from threading import Thread
+from typing import Optional
+
+import numpy as np
+
+from .scratch import ScratchDirectoryPool, get_staged_xfoil_exe_path
+from .xfoil_polar import (
+    DEFAULT_ALPHA_STEP,
+    TMP_PROFILE_FILE_NAME,
+    TMP_RESULT_FILE_NAME,
+    get_scratch_directory_pool,
+    read_polar,
+    write_profile_file,
+)
+
+DEFAULT_SESSION_TIMEOUT = 60.0  # in seconds
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class XfoilSession:
+    """
+    Keeps one XFOIL process alive and drives it through its standard input and output.
+
+    Compared to one XFOIL run per polar, process start-up and input file generation are
+    avoided, and the profile is loaded again only when it changes.
+
+    XFOIL is synchronized by sending a dummy command, and waiting for the message that
+    reports it as unknown. If this message is not received within the timeout, XFOIL is
+    considered as hung: the process is killed and will be restarted for next computation.
+
+    The process is terminated when the session is closed or garbage-collected.
+
+    :param xfoil_exe_path: path to XFOIL executable. If empty, the embedded one is used.
+    :param timeout: maximum duration of one polar computation, in seconds
+    :param use_ram_disk: if True, XFOIL files are written on a RAM disk, if available
+    """
+
+    def __init__(
+        self,
+        xfoil_exe_path: str = "",
+        timeout: float = DEFAULT_SESSION_TIMEOUT,
+        use_ram_disk: bool = False,
+    ):
+        self.xfoil_exe_path = xfoil_exe_path
+        self.timeout = timeout
+        self.use_ram_disk = use_ram_disk
+
+        self._process: Optional[subprocess.Popen] = None
+        self._tmp_directory_path: Optional[str] = None
+        self._output_lines: Optional[queue.Queue] = None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._loaded_profile_points: Optional[np.ndarray] = None
+        self._marker_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def is_running(self) -> bool:
+        """True if the XFOIL process is alive."""
+        return self._process is not None and self._process.poll() is None
+
+    def compute_polar(
+        self,
+        profile_points: np.ndarray,
+        reynolds: float,
+        mach: float,
+        iter_limit: int,
+        alpha_start: float,
+        alpha_end: float,
+        alpha_step: float = DEFAULT_ALPHA_STEP,
+        initialize_boundary_layer: bool = True,
+    ) -> np.ndarray:
+        """
+        Starts XFOIL if needed, and computes a polar.
+
+        :param profile_points: (N, 2) array of profile coordinates
+        :param reynolds:
+        :param mach:
+        :param iter_limit: maximum number of iterations for each XFOIL point
+        :param alpha_start: in degrees
+        :param alpha_end: in degrees
+        :param alpha_step: in degrees
+        :param initialize_boundary_layer: if False, and if profile is unchanged, the sweep
+                                          continues the previous one: Reynolds and Mach
+                                          numbers are not sent, and the boundary layer
+                                          solution of the last computed point is used as
+                                          starting point
+        :return: the XFOIL polar result, or an empty array if XFOIL did not answer in time
+        """
+        if not self.is_running:
+            self._start()
+
+        commands = []
+        if self._loaded_profile_points is None or not np.array_equal(
+            profile_points, self._loaded_profile_points
+        ):
+            write_profile_file(self._profile_file_path, profile_points)
+            commands += ["", f"LOAD {self._profile_file_path}", "OPER"]
+            self._loaded_profile_points = np.array(profile_points)
+
+        if commands or initialize_boundary_layer:
+            commands += [f"RE {reynolds}", f"M {mach}", f"ITER {iter_limit}", "INIT"]
+
+        if pth.exists(self._result_file_path):
+            os.remove(self._result_file_path)  # XFOIL would append to existing file
+        commands += [
+            "PACC",
+            self._result_file_path,
+            "",
+            f"ASEQ {alpha_start} {alpha_end} {alpha_step}",
+            "PACC",
+        ]
+
+        if not self._send(*commands):
+            _LOGGER.error(
+                "XFOIL session did not answer within %s s for Re=%g and Mach=%g. "
+                "XFOIL will be restarted.",
+                self.timeout,
+                reynolds,
+                mach,
+            )
+            self.close()
+            return np.array([])
+
+        return read_polar(self._result_file_path)
+
+    def close(self):
+        """Terminates the XFOIL process and releases its working directory."""
+        if self._finalizer is not None:
+            self._finalizer()
+        self._process = None
+        self._tmp_directory_path = None
+        self._output_lines = None
+        self._finalizer = None
+        self._loaded_profile_points = None
+
+    @property
+    def _profile_file_path(self) -> str:
+        return pth.join(self._tmp_directory_path, TMP_PROFILE_FILE_NAME)
+
+    @property
+    def _result_file_path(self) -> str:
+        return pth.join(self._tmp_directory_path, TMP_RESULT_FILE_NAME)
+
+    def _start(self):
+        self.close()
+
+        scratch_directory_pool = get_scratch_directory_pool(self.use_ram_disk)
+        self._tmp_directory_path = scratch_directory_pool.acquire()
+        command = [self.xfoil_exe_path or get_staged_xfoil_exe_path()]
+
+        # XFOIL output would be buffered when going to a pipe, which would prevent
+        # synchronization.
+        env = dict(os.environ, GFORTRAN_UNBUFFERED_PRECONNECTED="y")
+        try:
+            self._process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                cwd=self._tmp_directory_path,
+                env=env,
+            )
+        except OSError:
+            scratch_directory_pool.release(self._tmp_directory_path)
+            self._tmp_directory_path = None
+            raise
+        self._finalizer = weakref.finalize(
+            self,
+            _terminate_session,
+            self._process,
+            scratch_directory_pool,
+            self._tmp_directory_path,
+        )
+
+        self._output_lines = queue.Queue()
+        Thread(
+            target=_read_lines, args=(self._process.stdout, self._output_lines), daemon=True
+        ).start()
+
+        # Disables graphics, then enables viscous mode (VISC is a toggle, so it is sent once).
+        if not self._send("PLOP", "G", "", "OPER", "VISC 1000000"):
+            self.close()
+            raise RuntimeError("Could not start XFOIL session with command %s" % command)
+
+    def _send(self, *commands: str) -> bool:
+        """
+        Sends commands to XFOIL, and waits for them to be processed.
+
+        :return: False if XFOIL did not answer in time
+        """
+        self._marker_count = (self._marker_count + 1) % 1000
+        # XFOIL commands are 4 characters long. No XFOIL command looks like this one.
+        marker = "Z%03i" % self._marker_count
+
+        try:
+            self._process.stdin.write("\n".join(commands + (marker,)) + "\n")
+            self._process.stdin.flush()
+        except OSError:
+            return False
+
+        answer = f"{marker} command not recognized"
+        try:
+            while True:
+                line = self._output_lines.get(timeout=self.timeout)
+                if line is None:
+                    return False  # XFOIL process has ended
+                if answer in line:
+                    return True
+        except queue.Empty:
+            return False
+
+
+def _read_lines(stream, output_lines: queue.Queue):
+    for line in iter(stream.readline, ""):
+        output_lines.put(line)
+    output_lines.put(None)
+
+
+def _terminate_session(
+    process: subprocess.Popen,
+    scratch_directory_pool: ScratchDirectoryPool,
+    tmp_directory_path: str,
+):
+    if process.poll() is None:
+        try:
+            process.stdin.write("\n\nQUIT\n")
+            process.stdin.close()
+            process.wait(timeout=1.0)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+    scratch_directory_pool.release(tmp_directory_path)
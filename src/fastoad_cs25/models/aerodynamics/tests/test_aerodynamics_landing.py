@@ -16,12 +16,18 @@ Test module for aerodynamics groups
 
 import os.path as pth
 
+import numpy as np
+import openmdao.api as om
+import pandas as pd
 import pytest
 from fastoad.io import VariableIO
 from fastoad.testing import run_system
+from numpy.testing import assert_allclose
 from pytest import approx
 
 from ..aerodynamics_landing import AerodynamicsLanding
+from ..aerodynamics_low_speed import AerodynamicsLowSpeed, AerodynamicsLowSpeedFused
+from ..aerodynamics_takeoff import AerodynamicsTakeoff
 
 
 def get_indep_var_comp(var_names):
@@ -74,6 +80,54 @@ def test_aerodynamics_landing_with_xfoil(xfoil_path):
     assert CD[100] == approx(0.2615, abs=1e-4)
 
 
+@pytest.mark.parametrize("use_xfoil", [True, False])
+def test_aerodynamics_landing_with_xfoil_table(tmp_path, use_xfoil):
+    """Tests AerodynamicsLanding with 2D max CL interpolated in a table"""
+    input_list = [
+        "data:TLAR:approach_speed",
+        "data:mission:sizing:landing:flap_angle",
+        "data:mission:sizing:landing:slat_angle",
+        "data:geometry:wing:MAC:length",
+        "data:geometry:wing:thickness_ratio",
+        "data:geometry:wing:sweep_25",
+        "data:geometry:wing:sweep_0",
+        "data:geometry:wing:sweep_100_outer",
+        "data:geometry:flap:chord_ratio",
+        "data:geometry:flap:span_ratio",
+        "data:geometry:slat:chord_ratio",
+        "data:geometry:slat:span_ratio",
+        "tuning:aerodynamics:aircraft:landing:CL_max:landing_gear_effect:k",
+    ]
+
+    # Table with constant value, that is the one of CL_max_clean_2D in input data.
+    reynolds, mach, thickness_ratio = (
+        values.ravel()
+        for values in np.meshgrid([1.0e6, 1.0e7, 1.0e8], [0.1, 0.3], [0.08, 0.16], indexing="ij")
+    )
+    table_file_path = tmp_path / "table.csv"
+    pd.DataFrame(
+        {
+            "profile_name": "BACJ.txt",
+            "reynolds": reynolds,
+            "mach": mach,
+            "thickness_ratio": thickness_ratio,
+            "CL_max_2D": 1.9,
+        }
+    ).to_csv(table_file_path, index=False)
+
+    ivc = get_indep_var_comp(input_list)
+    problem = run_system(
+        AerodynamicsLanding(
+            compute_polar=False,
+            use_xfoil=use_xfoil,
+            xfoil_table_file_path=str(table_file_path),
+        ),
+        ivc,
+    )
+    assert problem["data:aerodynamics:aircraft:landing:CL_max_clean"] == approx(1.54978, abs=1e-5)
+    assert problem["data:aerodynamics:aircraft:landing:CL_max"] == approx(2.77798, abs=1e-5)
+
+
 def test_aerodynamics_landing_without_xfoil():
     """Tests AerodynamicsHighSpeed"""
     input_list = [
@@ -114,3 +168,101 @@ def test_aerodynamics_landing_without_xfoil():
     assert CD[0] == approx(0.11483, abs=1e-4)
     assert CD[50] == approx(0.17367, abs=1e-4)
     assert CD[100] == approx(0.2615, abs=1e-4)
+
+    # Without polar (when it is computed along with low speed polar)
+    ivc = get_indep_var_comp(input_list[:14])
+    problem = run_system(AerodynamicsLanding(use_xfoil=False, compute_polar=False), ivc)
+    assert problem["data:aerodynamics:aircraft:landing:CL_max"] == approx(2.77798, abs=1e-5)
+    output_names = [
+        metadata["prom_name"]
+        for _, metadata in problem.model.list_outputs(out_stream=None, prom_name=True)
+    ]
+    assert "data:aerodynamics:aircraft:landing:CD" not in output_names
+
+
+@pytest.mark.parametrize("low_speed_class", [AerodynamicsLowSpeed, AerodynamicsLowSpeedFused])
+def test_high_lift_polars(low_speed_class):
+    """Tests that high-lift polars computed along with low speed polar are unchanged"""
+    input_list = [
+        "data:TLAR:approach_speed",
+        "data:mission:sizing:landing:flap_angle",
+        "data:mission:sizing:landing:slat_angle",
+        "data:geometry:wing:MAC:length",
+        "data:geometry:wing:thickness_ratio",
+        "data:geometry:wing:sweep_25",
+        "data:geometry:wing:sweep_0",
+        "data:geometry:wing:sweep_100_outer",
+        "data:geometry:flap:chord_ratio",
+        "data:geometry:flap:span_ratio",
+        "data:geometry:slat:chord_ratio",
+        "data:geometry:slat:span_ratio",
+        "tuning:aerodynamics:aircraft:landing:CL_max:landing_gear_effect:k",
+        "data:aerodynamics:aircraft:landing:CL_max_clean_2D",
+        "data:geometry:aircraft:wetted_area",
+        "data:geometry:fuselage:length",
+        "data:geometry:fuselage:maximum_height",
+        "data:geometry:fuselage:maximum_width",
+        "data:geometry:fuselage:wetted_area",
+        "data:geometry:horizontal_tail:MAC:length",
+        "data:geometry:horizontal_tail:sweep_25",
+        "data:geometry:horizontal_tail:thickness_ratio",
+        "data:geometry:horizontal_tail:wetted_area",
+        "data:geometry:propulsion:engine:count",
+        "data:geometry:propulsion:fan:length",
+        "data:geometry:propulsion:nacelle:length",
+        "data:geometry:propulsion:nacelle:wetted_area",
+        "data:geometry:propulsion:pylon:length",
+        "data:geometry:propulsion:pylon:wetted_area",
+        "data:geometry:vertical_tail:MAC:length",
+        "data:geometry:vertical_tail:sweep_25",
+        "data:geometry:vertical_tail:thickness_ratio",
+        "data:geometry:vertical_tail:wetted_area",
+        "data:geometry:wing:area",
+        "data:geometry:wing:aspect_ratio",
+        "data:geometry:wing:root:chord",
+        "data:geometry:wing:span",
+        "data:geometry:wing:tip:chord",
+        "data:geometry:wing:tip:thickness_ratio",
+        "data:geometry:wing:wetted_area",
+        "tuning:aerodynamics:aircraft:high_speed:CD:k",
+        "tuning:aerodynamics:aircraft:high_speed:CD:offset",
+        "tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:k",
+        "tuning:aerodynamics:aircraft:high_speed:CD:winglet_effect:offset",
+        "tuning:aerodynamics:aircraft:high_speed:CL:k",
+        "tuning:aerodynamics:aircraft:high_speed:CL:offset",
+        "tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:k",
+        "tuning:aerodynamics:aircraft:high_speed:CL:winglet_effect:offset",
+    ]
+
+    def run(high_lift_polars):
+        # Groups are run once, so the ones that provide inputs to the polars come first.
+        group = om.Group()
+        if not high_lift_polars:
+            group.add_subsystem("low_speed", low_speed_class(), promotes=["*"])
+        group.add_subsystem(
+            "takeoff", AerodynamicsTakeoff(compute_polar=not high_lift_polars), promotes=["*"]
+        )
+        group.add_subsystem(
+            "landing",
+            AerodynamicsLanding(use_xfoil=False, compute_polar=not high_lift_polars),
+            promotes=["*"],
+        )
+        if high_lift_polars:
+            group.add_subsystem("low_speed", low_speed_class(high_lift_polars=True), promotes=["*"])
+        ivc = get_indep_var_comp(input_list)
+        ivc.add_output("data:mission:sizing:takeoff:flap_angle", 10.0, units="deg")
+        ivc.add_output("data:mission:sizing:takeoff:slat_angle", 18.0, units="deg")
+        problem = run_system(group, ivc)
+        return problem, {
+            metadata["prom_name"]
+            for _, metadata in problem.model.component.list_outputs(out_stream=None, prom_name=True)
+        }
+
+    ref_problem, ref_output_names = run(False)
+    problem, output_names = run(True)
+
+    assert output_names == ref_output_names
+    assert "data:aerodynamics:aircraft:takeoff:CD" in output_names
+    assert "data:aerodynamics:aircraft:landing:CD" in output_names
+    for name in output_names:
+        assert_allclose(problem[name], ref_problem[name], rtol=1e-12, atol=1e-15)
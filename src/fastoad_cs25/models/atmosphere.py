@@ -0,0 +1,224 @@
+"""
+Shared evaluation of atmosphere state.
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy.constants import foot
+from stdatm import Atmosphere
+from stdatm.state_parameters import compute_pressure
+
+DEFAULT_ALTITUDE_STEP = 1.0  # in m
+DEFAULT_ALTITUDE_BOUNDS = (-2000.0, 20000.0)  # in m
+DEFAULT_CACHE_SIZE = 1024
+
+
+class AtmosphereCacheInfo(NamedTuple):
+    """Statistics of the scalar cache of :class:`AtmosphereService`."""
+
+    hits: int
+    misses: int
+    size: int
+
+
+class AtmosphereService:
+    """
+    Provides :class:`~stdatm.Atmosphere` instances with memoised state.
+
+    - Scalar altitudes (and size-1 arrays) are cached exactly, with a least-recently-used
+      policy. Each call returns a copy of the cached instance, so speed values can be set
+      without side effects.
+    - For arrays of altitudes within the bounds of the table, pressure is linearly
+      interpolated in a table with regular altitude steps. As pressure does not depend on
+      ISA offset, and temperature is a linear function of ISA offset, the table does not
+      need an ISA offset dimension: temperature is computed exactly.
+
+    The table is built on first use. All methods are thread-safe.
+
+    :param altitude_step: (unit=m) step of the pressure table
+    :param altitude_bounds: (unit=m) altitude bounds of the pressure table
+    :param cache_size: maximum number of cached scalar atmosphere states
+    """
+
+    def __init__(
+        self,
+        altitude_step: float = DEFAULT_ALTITUDE_STEP,
+        altitude_bounds: Tuple[float, float] = DEFAULT_ALTITUDE_BOUNDS,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.altitude_step = altitude_step
+        self.altitude_bounds = altitude_bounds
+        self.cache_size = cache_size
+
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple[float, float, bool], Atmosphere]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._pressure_table: Optional[_PressureTable] = None
+
+    def get(
+        self,
+        altitude: Union[float, Sequence[float]],
+        delta_t: Union[float, Sequence[float]] = 0.0,
+        altitude_in_feet: bool = True,
+    ) -> Atmosphere:
+        """
+        Same arguments as :class:`~stdatm.Atmosphere`.
+
+        :param altitude: altitude (units decided by altitude_in_feet)
+        :param delta_t: temperature increment (°C) applied to whole temperature profile
+        :param altitude_in_feet: if True, altitude should be provided in feet. Otherwise,
+                                 it should be provided in meters.
+        :return: an Atmosphere instance
+        """
+        if isinstance(altitude, float) and isinstance(delta_t, float):
+            return self._get_scalar(altitude, delta_t, altitude_in_feet)
+        if np.size(altitude) == 1 and np.size(delta_t) == 1:
+            return self._get_scalar(
+                np.asarray(altitude).item(), np.asarray(delta_t).item(), altitude_in_feet
+            )
+
+        altitude_in_meters = np.asarray(altitude) * (foot if altitude_in_feet else 1.0)
+        # (written so that NaN values lead to exact computation)
+        if np.size(altitude_in_meters) == 0 or not (
+            np.min(altitude_in_meters) >= self.altitude_bounds[0]
+            and np.max(altitude_in_meters) <= self.altitude_bounds[1]
+        ):
+            return Atmosphere(altitude, delta_t, altitude_in_feet=altitude_in_feet)
+
+        return TabulatedAtmosphere(
+            altitude_in_meters, delta_t, altitude_in_feet=False, table=self._get_pressure_table()
+        )
+
+    def cache_info(self) -> AtmosphereCacheInfo:
+        """
+        :return: hit and miss counts of the scalar cache, and its current size
+        """
+        with self._lock:
+            return AtmosphereCacheInfo(self._hits, self._misses, len(self._cache))
+
+    def cache_clear(self):
+        """Empties the scalar cache and resets its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def _get_scalar(self, altitude: float, delta_t: float, altitude_in_feet: bool) -> Atmosphere:
+        key = (float(altitude), float(delta_t), bool(altitude_in_feet))
+        with self._lock:
+            atmosphere = self._cache.get(key)
+            if atmosphere is not None:
+                self._hits += 1
+                self._cache.move_to_end(key)
+            else:
+                self._misses += 1
+                atmosphere = Atmosphere(key[0], key[1], altitude_in_feet=key[2])
+                # Evaluating properties stores their values in the instance
+                _ = atmosphere.density, atmosphere.speed_of_sound, atmosphere.kinematic_viscosity
+                self._cache[key] = atmosphere
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        # Shallow copy, faster than copy.copy()
+        atmosphere_copy = Atmosphere.__new__(Atmosphere)
+        atmosphere_copy.__dict__.update(atmosphere.__dict__)
+        return atmosphere_copy
+
+    def _get_pressure_table(self) -> "_PressureTable":
+        with self._lock:
+            if self._pressure_table is None:
+                self._pressure_table = _PressureTable(self.altitude_step, self.altitude_bounds)
+            return self._pressure_table
+
+
+class TabulatedAtmosphere(Atmosphere):
+    """
+    Same as :class:`~stdatm.Atmosphere`, except that pressure is interpolated in a table.
+
+    Should be obtained from :meth:`AtmosphereService.get`.
+    """
+
+    def __init__(
+        self,
+        altitude: Union[float, Sequence[float]],
+        delta_t: Union[float, Sequence[float]] = 0.0,
+        altitude_in_feet: bool = True,
+        *,
+        table: "_PressureTable",
+    ):
+        super().__init__(altitude, delta_t, altitude_in_feet=altitude_in_feet)
+        self._table = table
+        self._tabulated_pressure = None
+
+    @property
+    def pressure(self) -> Union[float, np.ndarray]:
+        """Pressure in Pa."""
+        if self._tabulated_pressure is None:
+            self._tabulated_pressure = self._table(self.get_altitude(altitude_in_feet=False))
+        return self._tabulated_pressure
+
+
+class _PressureTable:
+    """
+    Linear interpolation of pressure on regular altitude steps.
+
+    Pressure model is slightly discontinuous at tropopause. Therefore, in each step, the
+    upper value is the limit from below, so that the discontinuity is kept at tropopause.
+    """
+
+    def __init__(self, altitude_step: float, altitude_bounds: Tuple[float, float]):
+        self.altitude_step = altitude_step
+        self.min_altitude = altitude_bounds[0]
+        altitudes = np.arange(altitude_bounds[0], altitude_bounds[1] + altitude_step, altitude_step)
+        self.pressure = compute_pressure(altitudes)
+        self.pressure_steps = (
+            compute_pressure(np.nextafter(altitudes[1:], -np.inf)) - self.pressure[:-1]
+        )
+
+    def __call__(self, altitude: np.ndarray) -> np.ndarray:
+        position = (altitude - self.min_altitude) / self.altitude_step
+        index = np.minimum(position.astype(np.intp), len(self.pressure_steps) - 1)
+        return self.pressure[index] + self.pressure_steps[index] * (position - index)
+
+
+_ATMOSPHERE_SERVICE = AtmosphereService()
+
+
+def get_atmosphere_service() -> AtmosphereService:
+    """
+    :return: the atmosphere service that is shared by models
+    """
+    return _ATMOSPHERE_SERVICE
+
+
+def get_atmosphere(
+    altitude: Union[float, Sequence[float]],
+    delta_t: Union[float, Sequence[float]] = 0.0,
+    altitude_in_feet: bool = True,
+) -> Atmosphere:
+    """
+    Shortcut for :meth:`AtmosphereService.get` with the shared atmosphere service.
+
+    :param altitude: altitude (units decided by altitude_in_feet)
+    :param delta_t: temperature increment (°C) applied to whole temperature profile
+    :param altitude_in_feet: if True, altitude should be provided in feet. Otherwise,
+                             it should be provided in meters.
+    :return: an Atmosphere instance
+    """
+    return _ATMOSPHERE_SERVICE.get(altitude, delta_t, altitude_in_feet)
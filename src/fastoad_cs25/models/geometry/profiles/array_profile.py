@@ -0,0 +1,199 @@
+"""
+NumPy-based management of 2D wing profiles
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .profile import THICKNESS, X, Z, compute_mean_line_and_thickness, get_upper_lower_sides
+
+
+class ArrayProfile:
+    """
+    Class for managing 2D wing profiles, with the same API and results as
+    :class:`~fastoad_cs25.models.geometry.profiles.profile.Profile`, but without pandas.
+
+    Unlike Profile, point sets are returned as numpy record arrays, whose fields can be
+    accessed the same way as DataFrame columns (e.g. `points.x` or `points["x"]`).
+    DataFrame-only features, like `to_numpy()`, `columns`, `loc` or `iloc`, are not
+    available on record arrays. When they are needed, DataFrames can be obtained by
+    using `as_dataframe=True` in any `get_*()` method.
+
+    :param chord_length:
+    """
+
+    # pylint: disable=invalid-name  # X and Z are valid names in this context
+
+    __slots__ = ("chord_length", "_max_relative_thickness", "_rel_x", "_rel_z", "_rel_thickness")
+
+    def __init__(self, chord_length: float = 0.0):
+        self.chord_length: float = chord_length
+        """ in meters """
+
+        self._max_relative_thickness: float = 0.0
+        """ max thickness / chord length"""
+
+        # Data of mean line and thickness, computed after inputs of set_points().
+        # - _rel_x and _rel_z are relative to chord_length
+        # - _rel_thickness is relative to max thickness (and given according to _rel_x)
+        # These arrays are never modified in place, so shallow copies can share them.
+        self._rel_x = np.empty(0)
+        self._rel_z = np.empty(0)
+        self._rel_thickness = np.empty(0)
+
+    @property
+    def thickness_ratio(self) -> float:
+        """thickness-to-chord ratio"""
+        return self._max_relative_thickness
+
+    @thickness_ratio.setter
+    def thickness_ratio(self, value: float):
+        # Mean line is modified to conform to legacy algorithm (see Profile class)
+        if self._max_relative_thickness != 0.0:
+            self._rel_z = self._rel_z * (value / self._max_relative_thickness)
+        self._max_relative_thickness = value
+
+    def set_points(
+        self,
+        x: Sequence,
+        z: Sequence,
+        keep_chord_length: bool = True,
+        keep_relative_thickness: bool = True,
+    ):
+        """
+        Sets points of the 2D profile.
+
+        Provided points are expected to be in order around the profile (clockwise
+        or anti-clockwise).
+
+        :param x: in meters
+        :param z: in meters
+        :param keep_relative_thickness:
+        :param keep_chord_length:
+        """
+        x = np.asarray(x, dtype=np.float64)
+        z = np.asarray(z, dtype=np.float64)
+
+        upper, lower = get_upper_lower_sides(x, z)
+        chord_length, max_thickness = self._compute_mean_line_and_thickness(upper, lower)
+
+        if not keep_chord_length or self.chord_length == 0.0:
+            self.chord_length = chord_length
+        if not keep_relative_thickness or self.thickness_ratio == 0.0:
+            self.thickness_ratio = max_thickness / chord_length
+
+    def get_mean_line(self, as_dataframe: bool = False) -> Union[np.recarray, pd.DataFrame]:
+        """Point set of mean line of the profile.
+
+        Fields are 'x' and 'z', given in meters.
+        """
+        return self._make_point_set(
+            X, self._rel_x * self.chord_length, Z, self._rel_z * self.chord_length, as_dataframe
+        )
+
+    def get_relative_thickness(
+        self, as_dataframe: bool = False
+    ) -> Union[np.recarray, pd.DataFrame]:
+        """Point set of relative thickness of the profile.
+
+        Fields are 'x' and 'thickness' and are relative to chord_length.
+        'x' is from 0. to 1.
+        """
+        return self._make_point_set(
+            X,
+            self._rel_x,
+            THICKNESS,
+            self._rel_thickness * self.thickness_ratio,
+            as_dataframe,
+        )
+
+    def get_upper_side(self, as_dataframe: bool = False) -> Union[np.recarray, pd.DataFrame]:
+        """Point set of upper side of the profile.
+
+        Fields are 'x' and 'z', given in meters.
+        """
+        x, z = self._get_side_points(1.0)
+        return self._make_point_set(X, x, Z, z, as_dataframe)
+
+    def get_lower_side(self, as_dataframe: bool = False) -> Union[np.recarray, pd.DataFrame]:
+        """Point set of lower side of the profile.
+
+        Fields are 'x' and 'z', given in meters.
+        """
+        x, z = self._get_side_points(-1.0)
+        return self._make_point_set(X, x, Z, z, as_dataframe)
+
+    def get_sides(self, as_dataframe: bool = False) -> Union[np.recarray, pd.DataFrame]:
+        """Point set of the whole profile
+
+        Points are given from trailing edge to trailing edge, starting by upper side.
+        """
+        upper_x, upper_z = self._get_side_points(1.0)
+        lower_x, lower_z = self._get_side_points(-1.0)
+
+        # Relative x values are sorted and unique, so reversing is sorting by descending x.
+        return self._make_point_set(
+            X,
+            np.concatenate((upper_x[::-1], lower_x[1:])),
+            Z,
+            np.concatenate((upper_z[::-1], lower_z[1:])),
+            as_dataframe,
+        )
+
+    def _get_side_points(self, sign: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computes upper or lower side points.
+
+        sign == 1.0 -> upper side
+        sign == -1.0 -> lower side
+        """
+        half_thickness = self._rel_thickness / 2.0 * self.thickness_ratio
+        return (
+            self._rel_x * self.chord_length,
+            (self._rel_z + sign * half_thickness) * self.chord_length,
+        )
+
+    def _compute_mean_line_and_thickness(
+        self, upper_side_points: np.ndarray, lower_side_points: np.ndarray
+    ) -> Tuple[float, float]:
+        """
+        Computes mean line and thickness from upper_side_points and lower_side_points, given
+        as (2, N) arrays of x and z.
+
+        Fills self._rel_* arrays with relative values.
+        Returns actual chord length and maximum thickness (in meters)
+        """
+        x, z, thickness = compute_mean_line_and_thickness(upper_side_points, lower_side_points)
+
+        chord_length = np.max(x) - np.min(x)
+        max_thickness = np.max(thickness)
+        self._rel_x = x / chord_length
+        self._rel_z = z / chord_length
+        self._rel_thickness = thickness / max_thickness
+        return chord_length, max_thickness
+
+    @staticmethod
+    def _make_point_set(
+        name1: str, values1: np.ndarray, name2: str, values2: np.ndarray, as_dataframe: bool
+    ) -> Union[np.recarray, pd.DataFrame]:
+        if as_dataframe:
+            return pd.DataFrame({name1: values1, name2: values2})
+
+        point_set = np.empty(len(values1), dtype=[(name1, np.float64), (name2, np.float64)])
+        point_set[name1] = values1
+        point_set[name2] = values2
+        return point_set.view(np.recarray)
@@ -61,9 +61,13 @@ class Profile:
     def thickness_ratio(self, value: float):
         # FIXME: mean line is modified accordingly to conform to legacy algorithm, but it
         #        is questionable
+        # Data are not modified in place, so that shallow copies of a profile (as provided by
+        # profile_getter.get_profile()) do not affect each other.
         if self._max_relative_thickness != 0.0:
             coeff = value / self._max_relative_thickness
-            self._rel_mean_line_and_thickness[Z] *= coeff
+            self._rel_mean_line_and_thickness = self._rel_mean_line_and_thickness.assign(
+                **{Z: self._rel_mean_line_and_thickness[Z] * coeff}
+            )
         self._max_relative_thickness = value
 
     def set_points(
@@ -85,11 +89,12 @@ class Profile:
         :param keep_chord_length:
         """
 
-        x = np.asarray(x)
+        x = np.asarray(x, dtype=np.float64)
+        z = np.asarray(z, dtype=np.float64)
 
         # Separate upper surface from lower surface (easier for computation
         # of thickness and mean line)
-        upper, lower = self._create_upper_lower_sides(x, z)
+        upper, lower = get_upper_lower_sides(x, z)
 
         # Upper and lower sides are defined, we can compute mean line and thickness
         chord_length, max_thickness = self._compute_mean_line_and_thickness(upper, lower)
@@ -155,26 +160,16 @@ class Profile:
         return points
 
     def _compute_mean_line_and_thickness(
-        self, upper_side_points, lower_side_points
+        self, upper_side_points: np.ndarray, lower_side_points: np.ndarray
     ) -> Tuple[float, float]:
         """
-        Computes mean line and thickness from upper_side_points and lower_side_points.
+        Computes mean line and thickness from upper_side_points and lower_side_points, given
+        as (2, N) arrays of x and z.
 
         Fills self._rel_mean_line_and_thickness with relative values.
         Returns actual chord length and maximum thickness (in meters)
         """
-        x = (
-            pd.concat([lower_side_points[X], upper_side_points[X]])
-            .sort_values()
-            .drop_duplicates()
-            .reset_index(drop=True)
-        )
-
-        interp_lower = interp1d(lower_side_points[X], lower_side_points[Z], kind="quadratic")
-        interp_upper = interp1d(upper_side_points[X], upper_side_points[Z], kind="quadratic")
-        z_sides = pd.DataFrame({"z_lower": interp_lower(x), "z_upper": interp_upper(x)})
-        z = z_sides.mean(axis=1)
-        thickness = z_sides.diff(axis=1).iloc[:, -1]
+        x, z, thickness = compute_mean_line_and_thickness(upper_side_points, lower_side_points)
 
         chord_length = np.max(x) - np.min(x)
         max_thickness = np.max(thickness)
@@ -183,41 +178,65 @@ class Profile:
         )
         return chord_length, max_thickness
 
-    @staticmethod
-    def _create_upper_lower_sides(x: Sequence, z: Sequence) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        """returns upper side points and lower side points using provided x and z"""
-        # FIXME: leading and trailing edges are located roughly.
-        i_leading_edge = np.argmin(x)
-        i_trailing_edge = np.argmax(x)
-
-        i1 = min(i_leading_edge, i_trailing_edge)
-        i2 = max(i_leading_edge, i_trailing_edge)
-        side1 = pd.DataFrame({X: x[i1 : i2 + 1], Z: z[i1 : i2 + 1]})
-        side2_1 = pd.DataFrame({X: x[i2:], Z: z[i2:]})
-        side2_2 = pd.DataFrame({X: x[: i1 + 1], Z: z[: i1 + 1]})
-        side2 = pd.concat((side2_1, side2_2)).reset_index(drop=True)
-
-        side1.sort_values(by=X, inplace=True)
-        side2.sort_values(by=X, inplace=True)
-
-        # At this point, side2 and side1 have the same last point, but in in case of thick
-        # trailing edge, it could lead to side2 having 2 points for the same X, which will be
-        # harmful in next operations.
-        # In that case, we simply have to remove last point of side2, as it actually belongs to
-        # side1.
-        if side2[X].iloc[-1] == side2[X].iloc[-2]:
-            side2 = side2.iloc[:-1]
-
-        if np.max(side1[Z]) > np.max(side2[Z]):
-            upper_side_points = side1
-            lower_side_points = side2
-        else:
-            upper_side_points = side2
-            lower_side_points = side1
-
-        upper_side_points.drop_duplicates(inplace=True)
-        lower_side_points.drop_duplicates(inplace=True)
-        upper_side_points.reset_index(drop=True, inplace=True)
-        lower_side_points.reset_index(drop=True, inplace=True)
-
-        return upper_side_points, lower_side_points
+
+def get_upper_lower_sides(x: np.ndarray, z: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Separates upper side from lower side of a profile.
+
+    :param x: x values of profile points, in order around the profile
+    :param z: z values of profile points, in order around the profile
+    :return: upper side points and lower side points, as (2, N) arrays of x and z, sorted
+             by x and without duplicate points
+    """
+    # FIXME: leading and trailing edges are located roughly.
+    i_leading_edge = np.argmin(x)
+    i_trailing_edge = np.argmax(x)
+
+    i1 = min(i_leading_edge, i_trailing_edge)
+    i2 = max(i_leading_edge, i_trailing_edge)
+    side1 = np.array((x[i1 : i2 + 1], z[i1 : i2 + 1]))
+    side2 = np.array((np.concatenate((x[i2:], x[: i1 + 1])), np.concatenate((z[i2:], z[: i1 + 1]))))
+
+    side1 = side1[:, np.argsort(side1[0], kind="quicksort")]
+    side2 = side2[:, np.argsort(side2[0], kind="quicksort")]
+
+    # At this point, side2 and side1 have the same last point, but in in case of thick
+    # trailing edge, it could lead to side2 having 2 points for the same X, which will be
+    # harmful in next operations.
+    # In that case, we simply have to remove last point of side2, as it actually belongs to
+    # side1.
+    if side2[0, -1] == side2[0, -2]:
+        side2 = side2[:, :-1]
+
+    if np.max(side1[1]) > np.max(side2[1]):
+        upper_side_points = side1
+        lower_side_points = side2
+    else:
+        upper_side_points = side2
+        lower_side_points = side1
+
+    return _drop_duplicates(upper_side_points), _drop_duplicates(lower_side_points)
+
+
+def compute_mean_line_and_thickness(
+    upper_side_points: np.ndarray, lower_side_points: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes mean line and thickness of a profile.
+
+    :param upper_side_points: (2, N) array of x and z, sorted by x
+    :param lower_side_points: (2, N) array of x and z, sorted by x
+    :return: sorted unique x values of both sides, z of mean line and thickness at these
+             x values, in the same unit as inputs
+    """
+    x = np.unique(np.concatenate((lower_side_points[0], upper_side_points[0])))
+
+    z_lower = interp1d(*lower_side_points, kind="quadratic")(x)
+    z_upper = interp1d(*upper_side_points, kind="quadratic")(x)
+    return x, (z_lower + z_upper) / 2.0, z_upper - z_lower
+
+
+def _drop_duplicates(points: np.ndarray) -> np.ndarray:
+    """Removes duplicate (x, z) points, keeping first occurrences in original order."""
+    _, indices = np.unique(points, axis=1, return_index=True)
+    return points[:, np.sort(indices)]
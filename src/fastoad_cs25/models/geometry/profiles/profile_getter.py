@@ -14,29 +14,69 @@ Airfoil reshape function
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from copy import copy
+from functools import lru_cache
 from importlib.resources import open_text
+from typing import Union
 
 import numpy as np
 
 from . import resources
+from .array_profile import ArrayProfile
 from .profile import Profile
 
+PROFILE_CACHE_SIZE = 32
+"""Maximum number of profiles kept in cache of :func:`get_profile`."""
+
 
 # FIXME: user currently has to know the name of available resources. A class would allow
 #        to provide more introspection.
-def get_profile(file_name: str = "BACJ.txt", chord_length=1.0, thickness_ratio=None) -> Profile:
+def get_profile(
+    file_name: str = "BACJ.txt", chord_length=1.0, thickness_ratio=None, array_backed=False
+) -> Union[Profile, ArrayProfile]:
     """
     Reads profile from indicated resource file and returns it after resize
 
+    Resulting profiles are cached, so that resource file is read only once for a given set of
+    arguments. Each call returns a new shallow copy of the cached profile, which can be
+    modified without affecting the cache.
+
     :param file_name: name of resource
     :param chord_length: set to None to get original chord length
     :param thickness_ratio:
-    :return: the Profile instance
+    :param array_backed: if True, an ArrayProfile instance is returned instead of a Profile
+                         instance (point sets are then numpy record arrays instead of
+                         DataFrames, see :class:`~.array_profile.ArrayProfile`)
+    :return: the profile instance
+    """
+    if chord_length is not None:
+        chord_length = float(np.asarray(chord_length).item())
+    if thickness_ratio is not None:
+        thickness_ratio = float(np.asarray(thickness_ratio).item())
+
+    return copy(_read_profile(file_name, chord_length, thickness_ratio, array_backed))
+
+
+def get_profile_cache_info():
+    """
+    :return: hit and miss statistics of the cache used by :func:`get_profile`, as a named tuple
+             (hits, misses, maxsize, currsize)
     """
+    return _read_profile.cache_info()
+
+
+def clear_profile_cache():
+    """Empties the cache used by :func:`get_profile` and resets its statistics."""
+    _read_profile.cache_clear()
+
 
+@lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def _read_profile(
+    file_name: str, chord_length, thickness_ratio, array_backed
+) -> Union[Profile, ArrayProfile]:
     with open_text(resources, file_name) as source:
         x_z = np.genfromtxt(source, skip_header=1, delimiter="\t", names="x, z")
-    profile = Profile()
+    profile = ArrayProfile() if array_backed else Profile()
     profile.set_points(x_z["x"], x_z["z"])
 
     if thickness_ratio:
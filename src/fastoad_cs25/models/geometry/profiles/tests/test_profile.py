@@ -15,11 +15,13 @@
 # pylint: disable=redefined-outer-name  # false positive on pytest fixtures
 
 import numpy as np
+import pandas as pd
 import pytest
 from numpy.testing import assert_allclose
 
+from ..array_profile import ArrayProfile
 from ..profile import Profile
-from ..profile_getter import get_profile
+from ..profile_getter import clear_profile_cache, get_profile, get_profile_cache_info
 
 
 @pytest.fixture()
@@ -176,6 +178,63 @@ def test_set_points(point_set):
     # plt.show()
 
 
+def test_array_profile(point_set):
+    """ArrayProfile should give the same results as Profile"""
+
+    x = point_set[:, 0]  # pylint:disable=invalid-name
+    z = point_set[:, 1]  # pylint:disable=invalid-name
+
+    profile = Profile()
+    profile.set_points(x * 2.5, z * 2.5)
+    profile.thickness_ratio = 0.12
+    array_profile = ArrayProfile()
+    array_profile.set_points(x * 2.5, z * 2.5)
+    array_profile.thickness_ratio = 0.12
+
+    assert_allclose(array_profile.chord_length, profile.chord_length)
+    assert_allclose(array_profile.thickness_ratio, profile.thickness_ratio)
+    for method_name in [
+        "get_mean_line",
+        "get_relative_thickness",
+        "get_upper_side",
+        "get_lower_side",
+        "get_sides",
+    ]:
+        expected = getattr(profile, method_name)()
+        dataframe = getattr(array_profile, method_name)(as_dataframe=True)
+        assert list(dataframe.columns) == list(expected.columns)
+        assert_allclose(dataframe.to_numpy(), expected.to_numpy())
+
+        record_array = getattr(array_profile, method_name)()
+        for column in expected.columns:
+            assert_allclose(record_array[column], expected[column])
+            assert_allclose(getattr(record_array, column), expected[column])
+
+    assert not hasattr(array_profile, "__dict__")
+
+
+def test_array_profile_point_sets(point_set):
+    """ArrayProfile returns record arrays, or DataFrames on demand"""
+    array_profile = ArrayProfile()
+    array_profile.set_points(point_set[:, 0], point_set[:, 1])
+
+    points = array_profile.get_sides()
+    assert isinstance(points, np.recarray)
+    assert points.dtype.names == ("x", "z")
+    assert_allclose(points.x, points["x"])
+    assert not hasattr(points, "to_numpy")
+    with pytest.raises(ValueError):
+        _ = points["thickness"]
+
+    dataframe = array_profile.get_sides(as_dataframe=True)
+    assert isinstance(dataframe, pd.DataFrame)
+    assert_allclose(dataframe.to_numpy(), np.column_stack((points.x, points.z)))
+    assert_allclose(dataframe.loc[0, "x"], points.x[0])
+
+    assert isinstance(get_profile(array_backed=True).get_upper_side(), np.recarray)
+    assert isinstance(get_profile().get_upper_side(), pd.DataFrame)
+
+
 def test_get_profile():
     # Default profile ("BACJ.txt")
     profile = get_profile()
@@ -244,3 +303,37 @@ def test_get_profile():
         assert_allclose(np.max(vect.x), 1.0, rtol=1e-4)
     thickness = profile.get_relative_thickness()
     assert_allclose(np.max(thickness.thickness), 0.12006, rtol=1e-4)
+
+
+def test_get_profile_cache():
+    clear_profile_cache()
+
+    profile = get_profile("airfoil_f_15_12.txt", thickness_ratio=0.12)
+    assert get_profile_cache_info().misses == 1
+    assert get_profile_cache_info().hits == 0
+
+    # Same arguments, including the numpy scalar/array forms that come from OpenMDAO inputs
+    other_profile = get_profile("airfoil_f_15_12.txt", thickness_ratio=np.array([0.12]))
+    assert get_profile_cache_info().misses == 1
+    assert get_profile_cache_info().hits == 1
+    assert other_profile is not profile
+    assert_allclose(other_profile.get_sides(), profile.get_sides())
+
+    # Modifying returned profiles does not affect the cached one
+    other_profile.thickness_ratio = 0.2
+    other_profile.chord_length = 2.0
+    assert_allclose(other_profile.thickness_ratio, 0.2)
+    assert_allclose(other_profile.chord_length, 2.0)
+    last_profile = get_profile("airfoil_f_15_12.txt", thickness_ratio=0.12)
+    assert_allclose(last_profile.thickness_ratio, 0.12)
+    assert_allclose(last_profile.chord_length, 1.0)
+    assert_allclose(last_profile.get_sides(), profile.get_sides())
+    assert get_profile_cache_info().hits == 2
+
+    # Different thickness ratio
+    get_profile("airfoil_f_15_12.txt", thickness_ratio=0.11)
+    assert get_profile_cache_info().misses == 2
+    assert get_profile_cache_info().currsize == 2
+
+    clear_profile_cache()
+    assert get_profile_cache_info().currsize == 0
@@ -17,7 +17,8 @@ Estimation of horizontal tail area
 import numpy as np
 import openmdao.api as om
 from scipy.constants import g
-from stdatm import Atmosphere
+
+from ...atmosphere import get_atmosphere
 
 
 class ComputeHTArea(om.ExplicitComponent):
@@ -102,7 +103,7 @@ class ComputeHTArea(om.ExplicitComponent):
         htp_area_factor = inputs["tuning:geometry:horizontal_tail:area_factor"]
 
         delta_lg = x_main_lg - x_front_lg
-        atm = Atmosphere(0.0)
+        atm = get_atmosphere(0.0)
         rho = atm.density
         vspeed = atm.speed_of_sound * 0.2  # assume the corresponding Mach of VR is 0.2
 
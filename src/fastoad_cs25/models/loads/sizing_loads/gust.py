@@ -18,9 +18,9 @@ import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
 from scipy.constants import g
-from stdatm import Atmosphere
 
 from ..constants import SERVICE_GUST_LOADS
+from ...atmosphere import get_atmosphere
 
 
 @oad.RegisterSubmodel(SERVICE_GUST_LOADS, "fastoad.submodel.loads.gust.legacy")
@@ -86,7 +86,7 @@ class GustLoads(om.ExplicitComponent):
         )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
-        sea_level_density = Atmosphere(0).density
+        sea_level_density = get_atmosphere(0.0).density
         wing_area = inputs["data:geometry:wing:area"]
         span = inputs["data:geometry:wing:span"]
         mzfw = inputs["data:weight:aircraft:MZFW"]
@@ -109,7 +109,7 @@ class GustLoads(om.ExplicitComponent):
         n_gust_1 = self.__n_gust(
             m1,
             wing_area,
-            Atmosphere(alt_1).density,
+            get_atmosphere(alt_1).density,
             sea_level_density,
             chord_geom,
             vc_eas1,
@@ -122,7 +122,7 @@ class GustLoads(om.ExplicitComponent):
         n_gust_2 = self.__n_gust(
             mtow,
             wing_area,
-            Atmosphere(alt_2).density,
+            get_atmosphere(alt_2).density,
             sea_level_density,
             chord_geom,
             vc_eas2,
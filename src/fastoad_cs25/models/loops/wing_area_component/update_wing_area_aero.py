@@ -18,8 +18,8 @@ import fastoad.api as oad
 import numpy as np
 import openmdao.api as om
 from scipy.constants import g
-from stdatm import Atmosphere
 
+from fastoad_cs25.models.atmosphere import get_atmosphere
 from fastoad_cs25.models.loops.constants import (
     SERVICE_WING_AREA_CONSTRAINT_AERO,
     SERVICE_WING_AREA_LOOP_AERO,
@@ -49,7 +49,7 @@ class UpdateWingAreaAero(om.ExplicitComponent):
         mlw = inputs["data:weight:aircraft:MLW"]
         max_cl = inputs["data:aerodynamics:aircraft:landing:CL_max"]
 
-        rho_sl = Atmosphere(0.0).density
+        rho_sl = get_atmosphere(0.0).density
         stall_speed = approach_speed / 1.23
 
         wing_area_approach = mlw * g / (0.5 * rho_sl * stall_speed**2.0 * max_cl)
@@ -61,7 +61,7 @@ class UpdateWingAreaAero(om.ExplicitComponent):
         mlw = inputs["data:weight:aircraft:MLW"]
         max_cl = inputs["data:aerodynamics:aircraft:landing:CL_max"]
 
-        rho_sl = Atmosphere(0.0).density
+        rho_sl = get_atmosphere(0.0).density
         stall_speed = approach_speed / 1.23
 
         partials["wing_area:aero", "data:TLAR:approach_speed"] = (
@@ -98,7 +98,7 @@ class WingAreaConstraintsAero(om.ExplicitComponent):
         max_cl = inputs["data:aerodynamics:aircraft:landing:CL_max"]
         wing_area = inputs["data:geometry:wing:area"]
 
-        rho_sl = Atmosphere(0.0).density
+        rho_sl = get_atmosphere(0.0).density
         stall_speed = approach_speed / 1.23
 
         outputs["data:aerodynamics:aircraft:landing:additional_CL_capacity"] = max_cl - mlw * g / (
@@ -110,7 +110,7 @@ class WingAreaConstraintsAero(om.ExplicitComponent):
         mlw = inputs["data:weight:aircraft:MLW"]
         wing_area = inputs["data:geometry:wing:area"]
 
-        rho_sl = Atmosphere(0.0).density
+        rho_sl = get_atmosphere(0.0).density
         stall_speed = approach_speed / 1.23
 
         partials[
@@ -20,5 +20,8 @@ Provides a parametric model for turbofan:
 
 # flake8: noqa
 
-from .openmdao import OMRubberEngineComponent, OMRubberEngineWrapper
-from .rubber_engine import RubberEngine
+from .engine_deck import EngineDeckGrid, TabulatedRubberEngine
+from .flight_condition import FlightCondition
+from .openmdao import OMRubberEngineComponent, OMRubberEngineDeckWrapper, OMRubberEngineWrapper
+from .rubber_engine import RubberEngine, get_engine_setting_codes
+from .validity_domain import BatchedValidityChecker, OutOfDomainCount
@@ -24,6 +24,13 @@ Implementation of E. Roux models for fuel consumption of low bypass ratio engine
 For more information, see RubberEngine class in FAST-OAD developer documentation.
 """
 
+RUBBER_ENGINE_DECK_DESCRIPTION = """
+Parametric engine model, where maximum thrust and SFC at maximum thrust are interpolated in an
+engine deck that is computed once for each set of engine parameters.
+
+For more information, see TabulatedRubberEngine class in FAST-OAD developer documentation.
+"""
+
 # Atmosphere at limits of troposhere
 ATM_SEA_LEVEL = AtmosphereSI(0)
 ATM_TROPOPAUSE = AtmosphereSI(11000)
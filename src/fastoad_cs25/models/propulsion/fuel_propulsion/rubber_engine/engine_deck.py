@@ -0,0 +1,448 @@
+"""Tabulated version of the parametric turbofan engine."""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+from stdatm import Atmosphere
+
+from .rubber_engine import RubberEngine
+
+INTERPOLATION_METHODS = ("linear", "cubic")
+
+TROPOPAUSE_ALTITUDE = 11000.0  # in m
+
+# Altitudes where the analytical model is not smooth. They are always grid nodes.
+_ALTITUDE_BREAKPOINTS = (0.0, TROPOPAUSE_ALTITUDE)
+
+
+@dataclass(frozen=True)
+class EngineDeckGrid:
+    """
+    Definition of the grid of an engine deck.
+
+    Each axis is a sorted tuple of values. Accuracy of the deck increases with the number of
+    values, as does the computation time of the deck. Outside of the grid, values are
+    extrapolated.
+
+    Cubic interpolation needs at least 4 values on each axis.
+    """
+
+    mach: Tuple[float, ...]  #: Mach number values
+    altitude: Tuple[float, ...]  #: altitude values, in m
+    delta_t4: Tuple[float, ...]  #: values of difference from design T4, in K
+    isa_offset: Tuple[float, ...]  #: values of temperature difference from ISA, in K
+
+    @classmethod
+    def regular(
+        cls,
+        mach_step: float = 0.05,
+        altitude_step: float = 1000.0,
+        delta_t4_step: float = 25.0,
+        isa_offset_step: float = 10.0,
+        mach_bounds: Tuple[float, float] = (0.0, 1.0),
+        altitude_bounds: Tuple[float, float] = (-2000.0, 20000.0),
+        delta_t4_bounds: Tuple[float, float] = (-150.0, 0.0),
+        isa_offset_bounds: Tuple[float, float] = (-20.0, 40.0),
+        delta_t4_nodes: Sequence[float] = (),
+    ) -> "EngineDeckGrid":
+        """
+        Builds a grid with regularly spaced values.
+
+        Altitudes of the tropopause and of sea level are added to altitude values, because the
+        analytical model is not smooth there.
+
+        :param mach_step:
+        :param altitude_step: in m
+        :param delta_t4_step: in K
+        :param isa_offset_step: in K
+        :param mach_bounds:
+        :param altitude_bounds: in m
+        :param delta_t4_bounds: in K
+        :param isa_offset_bounds: in K
+        :param delta_t4_nodes: delta_t4 values that will be added to the grid (typically, the
+                               values used for engine settings, so they are computed without
+                               interpolation error)
+        :return: the grid
+        """
+        altitude_nodes = [
+            altitude
+            for altitude in _ALTITUDE_BREAKPOINTS
+            if altitude_bounds[0] < altitude < altitude_bounds[1]
+        ]
+        return cls(
+            mach=_get_axis_values(mach_bounds, mach_step),
+            altitude=_get_axis_values(altitude_bounds, altitude_step, altitude_nodes),
+            delta_t4=_get_axis_values(delta_t4_bounds, delta_t4_step, delta_t4_nodes),
+            isa_offset=_get_axis_values(isa_offset_bounds, isa_offset_step),
+        )
+
+    @property
+    def shape(self) -> Tuple[int, int, int, int]:
+        """Number of values on each axis."""
+        return len(self.mach), len(self.altitude), len(self.delta_t4), len(self.isa_offset)
+
+    @property
+    def size(self) -> int:
+        """Total number of grid points."""
+        return int(np.prod(self.shape))
+
+
+@dataclass
+class EngineDeckValidationReport:
+    """Errors of an engine deck with respect to the analytical model."""
+
+    sample_count: int  #: number of random flight conditions used for the comparison
+    max_thrust_max_error: float  #: maximum relative error on maximum thrust
+    max_thrust_mean_error: float  #: mean relative error on maximum thrust
+    sfc_max_error: float  #: maximum relative error on SFC at maximum thrust
+    sfc_mean_error: float  #: mean relative error on SFC at maximum thrust
+
+    def __str__(self):
+        return (
+            f"Engine deck vs analytical model ({self.sample_count} samples):\n"
+            f"  max thrust: max relative error = {self.max_thrust_max_error:.3e}, "
+            f"mean relative error = {self.max_thrust_mean_error:.3e}\n"
+            f"  SFC: max relative error = {self.sfc_max_error:.3e}, "
+            f"mean relative error = {self.sfc_mean_error:.3e}"
+        )
+
+
+class TabulatedRubberEngine(RubberEngine):
+    def __init__(
+        self,
+        bypass_ratio: float,
+        overall_pressure_ratio: float,
+        turbine_inlet_temperature: float,
+        mto_thrust: float,
+        maximum_mach: float,
+        design_altitude: float,
+        delta_t4_climb: float = -50,
+        delta_t4_cruise: float = -100,
+        k_sfc_sl: float = 1.0,
+        k_sfc_cr: float = 1.0,
+        grid: Optional[EngineDeckGrid] = None,
+        interpolation_method: str = "linear",
+    ):
+        """
+        Parametric turbofan engine that uses an engine deck.
+
+        Maximum thrust and SFC at maximum thrust are computed once with the analytical model
+        of :class:`RubberEngine` on the points of provided grid. Then they are interpolated
+        for each flight point. SFC ratio and SFC corrections are still computed analytically.
+
+        Engine decks are shared by all instances with the same bypass ratio, overall pressure
+        ratio and turbine inlet temperature. As maximum thrust is tabulated relatively to
+        MTO thrust, resizing the engine does not need a new deck.
+
+        Accuracy can be assessed with :meth:`validate`.
+
+        :param grid: definition of the engine deck. If not provided, the default regular grid
+                     is used, with the delta T4 values of engine settings as nodes.
+        :param interpolation_method: "linear" or "cubic"
+
+        See :class:`RubberEngine` for other parameters.
+        """
+        # pylint: disable=too-many-arguments  # they define the engine
+        super().__init__(
+            bypass_ratio,
+            overall_pressure_ratio,
+            turbine_inlet_temperature,
+            mto_thrust,
+            maximum_mach,
+            design_altitude,
+            delta_t4_climb,
+            delta_t4_cruise,
+            k_sfc_sl,
+            k_sfc_cr,
+        )
+        if (
+            max(np.size(self.bypass_ratio), np.size(self.overall_pressure_ratio), np.size(self.t_4))
+            > 1
+        ):
+            raise ValueError(
+                "An engine deck is for one engine design: bypass ratio, overall pressure ratio "
+                "and turbine inlet temperature should be scalars."
+            )
+        if interpolation_method not in INTERPOLATION_METHODS:
+            raise ValueError(
+                "Interpolation method should be one of %s. Got %s."
+                % (INTERPOLATION_METHODS, interpolation_method)
+            )
+
+        if grid is None:
+            grid = EngineDeckGrid.regular(delta_t4_nodes=tuple(self.dt4_values.values()))
+        self.grid = grid
+        self.interpolation_method = interpolation_method
+
+    def validate(self, sample_count: int = 1000, seed: int = 0) -> EngineDeckValidationReport:
+        """
+        Compares the engine deck to the analytical model on random flight conditions within
+        the bounds of the grid.
+
+        :param sample_count: number of flight conditions
+        :param seed: seed of the random generator
+        :return: the validation report
+        """
+        rng = np.random.default_rng(seed)
+        mach, altitude, delta_t4, isa_offset = (
+            rng.uniform(np.min(axis), np.max(axis), sample_count)
+            for axis in (
+                self.grid.mach,
+                self.grid.altitude,
+                self.grid.delta_t4,
+                self.grid.isa_offset,
+            )
+        )
+
+        deck_max_thrust, deck_sfc = self._compute_max_thrust_and_sfc(
+            mach, altitude, delta_t4, isa_offset
+        )
+        ref_max_thrust, ref_sfc = super()._compute_max_thrust_and_sfc(
+            mach, altitude, delta_t4, isa_offset
+        )
+        max_thrust_error = np.abs(deck_max_thrust / ref_max_thrust - 1.0)
+        sfc_error = np.abs(deck_sfc / ref_sfc - 1.0)
+
+        return EngineDeckValidationReport(
+            sample_count=sample_count,
+            max_thrust_max_error=float(np.max(max_thrust_error)),
+            max_thrust_mean_error=float(np.mean(max_thrust_error)),
+            sfc_max_error=float(np.max(sfc_error)),
+            sfc_mean_error=float(np.mean(sfc_error)),
+        )
+
+    def _compute_max_thrust_and_sfc(
+        self,
+        mach: np.ndarray,
+        altitude: np.ndarray,
+        delta_t4: np.ndarray,
+        isa_offset: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        max_thrust_table, sfc_table = _get_engine_deck(
+            float(np.squeeze(self.bypass_ratio)),
+            float(np.squeeze(self.overall_pressure_ratio)),
+            float(np.squeeze(self.t_4)),
+            self.grid,
+            self.interpolation_method,
+        )
+
+        mach, altitude, delta_t4, isa_offset = np.broadcast_arrays(
+            mach, altitude, delta_t4, isa_offset
+        )
+        shape = np.shape(mach)
+        mach, altitude, delta_t4, isa_offset = (
+            np.ravel(mach),
+            np.ravel(altitude),
+            np.ravel(delta_t4),
+            np.ravel(isa_offset),
+        )
+
+        max_thrust = self.f_0 * max_thrust_table(mach, altitude, delta_t4, isa_offset).reshape(
+            shape
+        )
+        sfc = sfc_table(mach, altitude, isa_offset).reshape(shape)
+
+        return max_thrust, sfc
+
+    def _compute_scalar_max_thrust_and_sfc(
+        self, mach: float, altitude: float, delta_t4: float, isa_offset: float
+    ) -> Tuple[float, float]:
+        max_thrust, sfc = self._compute_max_thrust_and_sfc(mach, altitude, delta_t4, isa_offset)
+        return float(np.squeeze(max_thrust)), float(np.squeeze(sfc))
+
+
+class _DeckTable:
+    """
+    Interpolation table on a grid.
+
+    The altitude axis (second axis) may contain repeated values. They define a discontinuity:
+    the first value is used for the altitude range below, and the second one for the
+    altitude range above. For cubic interpolation, it also avoids oscillations where the
+    tabulated function is not smooth. Altitude segments with less than 4 values are
+    interpolated linearly.
+
+    Values are extrapolated outside of the grid.
+
+    Linear interpolation is implemented here because scipy's RegularGridInterpolator has a
+    large overhead for small numbers of points.
+
+    :param axes: values of each axis
+    :param values: array of values, with one dimension per axis
+    :param interpolation_method: "linear" or "cubic"
+    """
+
+    def __init__(self, axes: Sequence[np.ndarray], values: np.ndarray, interpolation_method: str):
+        axes = [np.asarray(axis, dtype=float) for axis in axes]
+        values = np.ascontiguousarray(values, dtype=float)
+
+        if interpolation_method == "linear":
+            self._interpolators = None
+            self._flat_values = values.ravel()
+            strides = np.array(values.strides) // values.itemsize
+            self._axis_data = []
+            for axis, stride in zip(axes, strides):
+                steps = np.diff(axis)
+                inverse_steps = np.divide(1.0, steps, out=np.zeros_like(steps), where=steps > 0)
+                self._axis_data.append((axis[1:-1], axis[:-1], inverse_steps, stride))
+
+            # Offsets of the corners of a grid cell in the flattened array of values. The first
+            # axis varies the slowest.
+            corners = np.array(list(product((0, 1), repeat=len(axes))))
+            self._corner_offsets = (corners @ strides)[:, np.newaxis]
+        else:
+            # Spline coefficients are computed by an iterative solver with an absolute
+            # tolerance, so values are normalized.
+            self._scale = np.max(np.abs(values)) or 1.0
+            altitudes = axes[1]
+            break_indices = np.flatnonzero(np.diff(altitudes) == 0.0)
+            self._segment_bounds = altitudes[break_indices]
+            self._interpolators = []
+            for start, end in zip(
+                np.concatenate(([0], break_indices + 1)),
+                np.concatenate((break_indices + 1, [len(altitudes)])),
+            ):
+                segment_axes = list(axes)
+                segment_axes[1] = altitudes[start:end]
+                self._interpolators.append(
+                    RegularGridInterpolator(
+                        segment_axes,
+                        values[:, start:end] / self._scale,
+                        method=interpolation_method if end - start >= 4 else "linear",
+                        bounds_error=False,
+                        fill_value=None,
+                    )
+                )
+
+    def __call__(self, *coordinates: np.ndarray) -> np.ndarray:
+        """
+        :param coordinates: a 1D array of coordinates for each axis
+        :return: 1D array of interpolated values
+        """
+        if self._interpolators is not None:
+            return self._interpolate_by_segment(coordinates)
+
+        flat_index = 0
+        ratios = []
+        for (inner_values, lower_values, inverse_steps, stride), value in zip(
+            self._axis_data, coordinates
+        ):
+            # With side="left", a point at a repeated value goes to the cell below.
+            cell_index = np.searchsorted(inner_values, value)
+            ratios.append((value - lower_values[cell_index]) * inverse_steps[cell_index])
+            flat_index = flat_index + cell_index * stride
+
+        # Values at cell corners, reduced one axis after the other.
+        values = self._flat_values[self._corner_offsets + flat_index]
+        for ratio in ratios:
+            half_count = len(values) // 2
+            lower = values[:half_count]
+            values = lower + ratio * (values[half_count:] - lower)
+
+        return values[0]
+
+    def _interpolate_by_segment(self, coordinates: Sequence[np.ndarray]) -> np.ndarray:
+        points = np.column_stack(coordinates)
+        segment_index = np.searchsorted(self._segment_bounds, coordinates[1])
+        result = np.empty(len(points))
+        for i, interpolator in enumerate(self._interpolators):
+            idx = segment_index == i
+            if np.any(idx):
+                result[idx] = interpolator(points[idx])
+        return result * self._scale
+
+
+@lru_cache(maxsize=32)
+def _get_engine_deck(
+    bypass_ratio: float,
+    overall_pressure_ratio: float,
+    turbine_inlet_temperature: float,
+    grid: EngineDeckGrid,
+    interpolation_method: str,
+) -> Tuple[_DeckTable, _DeckTable]:
+    """
+    Computes the engine deck for given engine parameters.
+
+    :return: table of maximum thrust (relatively to MTO thrust) on (Mach, altitude,
+             delta_t4, ISA offset), and table of SFC at maximum thrust on (Mach, altitude,
+             ISA offset)
+    """
+    engine = RubberEngine(
+        bypass_ratio, overall_pressure_ratio, turbine_inlet_temperature, 1.0, 0, 0
+    )
+
+    # Maximum thrust is not continuous at tropopause when ISA offset is not zero.
+    altitude_axis, computed_altitudes = _get_altitude_axis(grid.altitude, [TROPOPAUSE_ALTITUDE])
+    mach, altitude, delta_t4, isa_offset = np.meshgrid(
+        grid.mach, computed_altitudes, grid.delta_t4, grid.isa_offset, indexing="ij"
+    )
+    atmosphere = Atmosphere(altitude.ravel(), delta_t=isa_offset.ravel(), altitude_in_feet=False)
+    max_thrust = engine.max_thrust(atmosphere, mach.ravel(), delta_t4.ravel())
+    max_thrust_table = _DeckTable(
+        (grid.mach, altitude_axis, grid.delta_t4, grid.isa_offset),
+        max_thrust.reshape(np.shape(mach)),
+        interpolation_method,
+    )
+
+    # SFC at max thrust does not depend on delta_t4. It is continuous, but not smooth at
+    # sea level and tropopause.
+    altitude_axis, computed_altitudes = _get_altitude_axis(grid.altitude, _ALTITUDE_BREAKPOINTS)
+    mach, altitude, isa_offset = np.meshgrid(
+        grid.mach, computed_altitudes, grid.isa_offset, indexing="ij"
+    )
+    atmosphere = Atmosphere(altitude.ravel(), delta_t=isa_offset.ravel(), altitude_in_feet=False)
+    sfc = engine.sfc_at_max_thrust(atmosphere, mach.ravel())
+    sfc_table = _DeckTable(
+        (grid.mach, altitude_axis, grid.isa_offset),
+        sfc.reshape(np.shape(mach)),
+        interpolation_method,
+    )
+
+    return max_thrust_table, sfc_table
+
+
+def _get_altitude_axis(
+    altitudes: Sequence[float], breakpoints: Sequence[float]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Repeats in altitude values the breakpoints that are strictly inside the grid.
+
+    :return: the altitude axis for _DeckTable, and the altitudes where values should be
+             computed (the second occurrence of a breakpoint is slightly above it)
+    """
+    altitude_axis = np.asarray(altitudes, dtype=float)
+    computed_altitudes = altitude_axis
+    for breakpoint in breakpoints:
+        if altitude_axis[0] < breakpoint < altitude_axis[-1] and breakpoint in altitude_axis:
+            index = np.searchsorted(altitude_axis, breakpoint, side="right")
+            altitude_axis = np.insert(altitude_axis, index, breakpoint)
+            computed_altitudes = np.insert(
+                computed_altitudes, index, np.nextafter(breakpoint, np.inf)
+            )
+    return altitude_axis, computed_altitudes
+
+
+def _get_axis_values(
+    bounds: Tuple[float, float], step: float, nodes: Sequence[float] = ()
+) -> Tuple[float, ...]:
+    """Regularly spaced values between bounds, merged with provided nodes."""
+    point_count = max(2, int(np.ceil((bounds[1] - bounds[0]) / step - 1.0e-6)) + 1)
+    values = np.hstack(
+        [np.linspace(bounds[0], bounds[1], point_count)] + [np.ravel(node) for node in nodes]
+    )
+    return tuple(float(value) for value in np.unique(np.round(values, 9)))
@@ -0,0 +1,86 @@
+"""
+Engine state at given flight conditions, for fast re-evaluation with different thrusts.
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from dataclasses import dataclass
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class FlightCondition:
+    """
+    Terms of the rubber engine model that depend only on flight conditions (Mach, altitude,
+    engine setting and ISA offset).
+
+    Should be obtained from
+    :meth:`~fastoad_cs25.models.propulsion.fuel_propulsion.rubber_engine.rubber_engine.RubberEngine.get_flight_condition`.
+
+    Once built, thrust or thrust rate can be changed at the cost of a few multiplications,
+    which is useful for solvers that iterate on thrust at constant flight conditions.
+
+    SFC is computed as:
+    sfc_at_max_thrust * (sfc_ratio_coeff * (thrust_rate - thrust_rate_at_min_sfc)**2
+    + min_sfc_ratio)
+    """
+
+    #: (unit=N) maximum thrust
+    max_thrust: Union[float, np.ndarray]
+
+    #: (unit=kg/s/N) SFC at maximum thrust, including the altitude-dependent SFC correction
+    sfc_at_max_thrust: Union[float, np.ndarray]
+
+    #: thrust rate where SFC ratio is minimum
+    thrust_rate_at_min_sfc: Union[float, np.ndarray]
+
+    #: minimum SFC ratio
+    min_sfc_ratio: Union[float, np.ndarray]
+
+    #: coefficient of the quadratic law of SFC ratio
+    sfc_ratio_coeff: Union[float, np.ndarray]
+
+    def sfc(self, thrust_rate: Union[float, Sequence[float]]) -> Union[float, np.ndarray]:
+        """
+        :param thrust_rate:
+        :return: SFC (in kg/s/N)
+        """
+        delta_thrust_rate = np.subtract(thrust_rate, self.thrust_rate_at_min_sfc)
+        return self.sfc_at_max_thrust * (
+            self.sfc_ratio_coeff * delta_thrust_rate * delta_thrust_rate + self.min_sfc_ratio
+        )
+
+    def compute_from_thrust(
+        self, thrust: Union[float, Sequence[float]]
+    ) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+        """
+        Computes engine state when thrust is regulated.
+
+        :param thrust: (unit=N) required thrust
+        :return: SFC (in kg/s/N), thrust rate
+        """
+        thrust_rate = np.divide(thrust, self.max_thrust)
+        return self.sfc(thrust_rate), thrust_rate
+
+    def compute_from_thrust_rate(
+        self, thrust_rate: Union[float, Sequence[float]]
+    ) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+        """
+        Computes engine state when thrust rate is imposed.
+
+        :param thrust_rate: required thrust rate
+        :return: SFC (in kg/s/N), thrust (in N)
+        """
+        return self.sfc(thrust_rate), np.multiply(thrust_rate, self.max_thrust)
@@ -14,6 +14,7 @@
 
 import fastoad.api as oad
 import numpy as np
+from fastoad.constants import EngineSetting
 from fastoad.model_base.propulsion import (
     BaseOMPropulsionComponent,
     FuelEngineSet,
@@ -22,9 +23,27 @@ from fastoad.model_base.propulsion import (
 )
 from fastoad.openmdao.validity_checker import ValidityDomainChecker
 from openmdao.core.component import Component
+from stdatm import AtmosphereWithPartials
 
-from .constants import RUBBER_ENGINE_DESCRIPTION
-from .rubber_engine import RubberEngine
+from .constants import RUBBER_ENGINE_DECK_DESCRIPTION, RUBBER_ENGINE_DESCRIPTION
+from .engine_deck import TabulatedRubberEngine
+from .rubber_engine import RubberEngine, get_engine_setting_codes
+from .validity_domain import BatchedValidityChecker
+
+# Names of OpenMDAO inputs for parameters of RubberEngine
+ENGINE_PARAMETER_INPUTS = {
+    "bypass_ratio": "data:propulsion:rubber_engine:bypass_ratio",
+    "overall_pressure_ratio": "data:propulsion:rubber_engine:overall_pressure_ratio",
+    "turbine_inlet_temperature": "data:propulsion:rubber_engine:turbine_inlet_temperature",
+    "maximum_mach": "data:propulsion:rubber_engine:maximum_mach",
+    "design_altitude": "data:propulsion:rubber_engine:design_altitude",
+    "delta_t4_climb": "data:propulsion:rubber_engine:delta_t4_climb",
+    "delta_t4_cruise": "data:propulsion:rubber_engine:delta_t4_cruise",
+    "mto_thrust": "data:propulsion:MTO_thrust",
+    "k_sfc_sl": "tuning:propulsion:rubber_engine:SFC:k_sl",
+    "k_sfc_cr": "tuning:propulsion:rubber_engine:SFC:k_cr",
+}
+ENGINE_COUNT_INPUT = "data:geometry:propulsion:engine:count"
 
 
 @oad.RegisterPropulsion("fastoad.wrapper.propulsion.rubber_engine", desc=RUBBER_ENGINE_DESCRIPTION)
@@ -110,49 +129,69 @@ class OMRubberEngineWrapper(IOMPropulsionWrapper):
         :param inputs: input parameters that define the engine
         :return: a RubberEngine instance
         """
-        engine_params = {
-            "bypass_ratio": inputs["data:propulsion:rubber_engine:bypass_ratio"],
-            "overall_pressure_ratio": inputs[
-                "data:propulsion:rubber_engine:overall_pressure_ratio"
-            ],
-            "turbine_inlet_temperature": inputs[
-                "data:propulsion:rubber_engine:turbine_inlet_temperature"
-            ],
-            "maximum_mach": inputs["data:propulsion:rubber_engine:maximum_mach"],
-            "design_altitude": inputs["data:propulsion:rubber_engine:design_altitude"],
-            "delta_t4_climb": inputs["data:propulsion:rubber_engine:delta_t4_climb"],
-            "delta_t4_cruise": inputs["data:propulsion:rubber_engine:delta_t4_cruise"],
-            "mto_thrust": inputs["data:propulsion:MTO_thrust"],
-            "k_sfc_sl": inputs["tuning:propulsion:rubber_engine:SFC:k_sl"],
-            "k_sfc_cr": inputs["tuning:propulsion:rubber_engine:SFC:k_cr"],
+        return FuelEngineSet(
+            RubberEngine(**OMRubberEngineWrapper._get_engine_parameters(inputs)),
+            inputs[ENGINE_COUNT_INPUT],
+        )
+
+    @staticmethod
+    def _get_engine_parameters(inputs) -> dict:
+        """
+        :param inputs: input parameters that define the engine
+        :return: keyword arguments for RubberEngine instantiation
+        """
+        return {
+            parameter_name: inputs[input_name]
+            for parameter_name, input_name in ENGINE_PARAMETER_INPUTS.items()
         }
 
+
+@oad.RegisterPropulsion(
+    "fastoad.wrapper.propulsion.rubber_engine_deck", desc=RUBBER_ENGINE_DECK_DESCRIPTION
+)
+class OMRubberEngineDeckWrapper(OMRubberEngineWrapper):
+    """
+    Same as :class:`OMRubberEngineWrapper`, except that the provided engine model is a
+    :class:`~fastoad_cs25.models.propulsion.fuel_propulsion.rubber_engine.engine_deck.TabulatedRubberEngine`
+    with default engine deck.
+    """
+
+    @staticmethod
+    def get_model(inputs) -> IPropulsion:
+        """
+
+        :param inputs: input parameters that define the engine
+        :return: a TabulatedRubberEngine instance
+        """
         return FuelEngineSet(
-            RubberEngine(**engine_params), inputs["data:geometry:propulsion:engine:count"]
+            TabulatedRubberEngine(**OMRubberEngineWrapper._get_engine_parameters(inputs)),
+            inputs[ENGINE_COUNT_INPUT],
         )
 
 
-@ValidityDomainChecker(
-    {
-        "data:propulsion:altitude": (None, 20000.0),
-        "data:propulsion:mach": (0.75, 0.85),  # limitation of SFC ratio model
-        "data:propulsion:rubber_engine:overall_pressure_ratio": (20.0, 40.0),
-        "data:propulsion:rubber_engine:bypass_ratio": (3.0, 6.0),
-        "data:propulsion:thrust_rate": (0.5, 1.0),  # limitation of SFC ratio model
-        "data:propulsion:rubber_engine:turbine_inlet_temperature": (
-            1400.0,
-            1600.0,
-        ),  # limitation of max thrust model
-        "data:propulsion:rubber_engine:delta_t4_climb": (
-            -100.0,
-            0.0,
-        ),  # limitation of max thrust model
-        "data:propulsion:rubber_engine:delta_t4_cruise": (
-            -100.0,
-            0.0,
-        ),  # limitation of max thrust model
-    }
-)
+# Validity domain of the rubber engine model
+VALIDITY_DOMAIN = {
+    "data:propulsion:altitude": (None, 20000.0),
+    "data:propulsion:mach": (0.75, 0.85),  # limitation of SFC ratio model
+    "data:propulsion:rubber_engine:overall_pressure_ratio": (20.0, 40.0),
+    "data:propulsion:rubber_engine:bypass_ratio": (3.0, 6.0),
+    "data:propulsion:thrust_rate": (0.5, 1.0),  # limitation of SFC ratio model
+    "data:propulsion:rubber_engine:turbine_inlet_temperature": (
+        1400.0,
+        1600.0,
+    ),  # limitation of max thrust model
+    "data:propulsion:rubber_engine:delta_t4_climb": (
+        -100.0,
+        0.0,
+    ),  # limitation of max thrust model
+    "data:propulsion:rubber_engine:delta_t4_cruise": (
+        -100.0,
+        0.0,
+    ),  # limitation of max thrust model
+}
+
+
+@ValidityDomainChecker(VALIDITY_DOMAIN)
 class OMRubberEngineComponent(BaseOMPropulsionComponent):
     """
     Parametric engine model as OpenMDAO component. Used for unit and integration tests.
@@ -160,15 +199,159 @@ class OMRubberEngineComponent(BaseOMPropulsionComponent):
     See
     :class:`~fastoad.models.propulsion.fuel_propulsion.rubber_engine.rubber_engine.RubberEngine`
     for more information.
+
+    Besides the check of FAST-OAD once problem has run, values of flight point variables
+    can be checked against validity domain during computations by :attr:`validity_checker`,
+    that counts out-of-domain elements. These checks are enabled and sampled with the
+    "validity_check_period" option.
     """
 
+    def initialize(self):
+        super().initialize()
+        self.options.declare(
+            "validity_check_period",
+            default=0,
+            types=int,
+            lower=0,
+            desc="Validity domain is checked once every N computations. "
+            "If 0 (default), validity domain is not checked during computations.",
+        )
+
     def setup(self):
         super().setup()
         self.get_wrapper().setup(self)
 
+        #: Instance that checks flight point variables at each computation.
+        self.validity_checker = BatchedValidityChecker(
+            VALIDITY_DOMAIN, check_period=self.options["validity_check_period"]
+        )
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        super().compute(inputs, outputs, discrete_inputs, discrete_outputs)
+        if self.validity_checker.check_period:
+            self.validity_checker.check(
+                {
+                    name: outputs[name] if name in outputs else inputs[name]
+                    for name in VALIDITY_DOMAIN
+                }
+            )
+
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        mach_metadata = self.get_io_metadata(
+            metadata_keys=["size"], includes=["data:propulsion:mach"]
+        )
+        diagonal = np.arange(mach_metadata["data:propulsion:mach"]["size"])
+        engine_inputs = list(ENGINE_PARAMETER_INPUTS.values()) + [ENGINE_COUNT_INPUT]
+        for output_name in _OUTPUTS.values():
+            self.declare_partials(
+                output_name, list(_FLIGHT_POINT_INPUTS.values()), rows=diagonal, cols=diagonal
+            )
+            self.declare_partials(output_name, engine_inputs)
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        # pylint: disable=too-many-locals  # chain rule needs them
+        # Engine is obtained as in compute(). Analytic partials are the ones of RubberEngine.
+        engine_set = self.get_wrapper().get_model(inputs)
+        engine: RubberEngine = engine_set.engine
+        engine_count = engine_set.engine_count
+
+        mach = inputs["data:propulsion:mach"].ravel()
+        altitude = inputs["data:propulsion:altitude"].ravel()
+        engine_setting = get_engine_setting_codes(inputs["data:propulsion:engine_setting"].ravel())
+        thrust_is_regulated = np.logical_not(
+            inputs["data:propulsion:use_thrust_rate"].ravel().astype(int)
+        )
+        required_thrust_rate = inputs["data:propulsion:required_thrust_rate"].ravel()
+        required_thrust = inputs["data:propulsion:required_thrust"].ravel()
+
+        delta_t4 = engine._get_delta_t4(engine_setting)
+        atmosphere = AtmosphereWithPartials(altitude, altitude_in_feet=False)
+        max_thrust = engine.max_thrust(atmosphere, mach, delta_t4)
+        thrust_rate = np.where(
+            thrust_is_regulated, required_thrust / engine_count / max_thrust, required_thrust_rate
+        )
+        sfc_0 = engine.sfc_at_max_thrust(atmosphere, mach)
+        sfc_ratio = engine.sfc_ratio(altitude, thrust_rate)
+        sfc_correction = engine.sfc_correction(altitude)
+
+        d_max_thrust = engine.max_thrust_partials(atmosphere, mach, delta_t4)
+        d_delta_t4 = {
+            "delta_t4_climb": engine_setting == EngineSetting.CLIMB,
+            "delta_t4_cruise": np.isin(engine_setting, [EngineSetting.CRUISE, EngineSetting.IDLE]),
+        }
+        for name, is_concerned in d_delta_t4.items():
+            d_max_thrust[name] = np.where(is_concerned, d_max_thrust["delta_t4"], 0.0)
+        d_sfc_0 = engine.sfc_at_max_thrust_partials(atmosphere, mach)
+        d_sfc_ratio = engine.sfc_ratio_partials(altitude, thrust_rate)
+        d_sfc_correction = engine.sfc_correction_partials(altitude)
+
+        # Partials of thrust rate and thrust, with respect to variables that are involved
+        # through max thrust.
+        # If thrust is regulated: thrust_rate = required_thrust / engine_count / max_thrust
+        # Otherwise: thrust = engine_count * required_thrust_rate * max_thrust
+        d_thrust_rate = {
+            name: np.where(thrust_is_regulated, -thrust_rate / max_thrust * value, 0.0)
+            for name, value in d_max_thrust.items()
+        }
+        d_thrust = {
+            name: np.where(thrust_is_regulated, 0.0, engine_count * thrust_rate * value)
+            for name, value in d_max_thrust.items()
+        }
+        d_thrust_rate["required_thrust"] = np.where(
+            thrust_is_regulated, 1.0 / engine_count / max_thrust, 0.0
+        )
+        d_thrust_rate["required_thrust_rate"] = np.where(thrust_is_regulated, 0.0, 1.0)
+        d_thrust_rate["engine_count"] = np.where(
+            thrust_is_regulated, -thrust_rate / engine_count, 0.0
+        )
+        d_thrust["required_thrust"] = np.where(thrust_is_regulated, 1.0, 0.0)
+        d_thrust["required_thrust_rate"] = np.where(
+            thrust_is_regulated, 0.0, engine_count * max_thrust
+        )
+        d_thrust["engine_count"] = np.where(thrust_is_regulated, 0.0, thrust_rate * max_thrust)
+
+        # SFC = sfc_0 * sfc_ratio * sfc_correction
+        d_sfc = {}
+        for name, d_thrust_rate_value in d_thrust_rate.items():
+            d_sfc_value = (
+                sfc_0
+                * sfc_correction
+                * (d_sfc_ratio["thrust_rate"] * d_thrust_rate_value + d_sfc_ratio.get(name, 0.0))
+            )
+            d_sfc_value += d_sfc_0.get(name, 0.0) * sfc_ratio * sfc_correction
+            d_sfc_value += sfc_0 * sfc_ratio * d_sfc_correction.get(name, 0.0)
+            d_sfc[name] = d_sfc_value
+        for name in ["design_altitude", "k_sfc_sl", "k_sfc_cr"]:
+            d_sfc[name] = sfc_0 * sfc_ratio * d_sfc_correction.get(name, 0.0) + (
+                sfc_0 * sfc_correction * d_sfc_ratio.get(name, 0.0)
+            )
+
+        input_names = dict(_FLIGHT_POINT_INPUTS, engine_count=ENGINE_COUNT_INPUT)
+        input_names.update(ENGINE_PARAMETER_INPUTS)
+        for output_key, output_partials in zip(
+            ["sfc", "thrust_rate", "thrust"], [d_sfc, d_thrust_rate, d_thrust]
+        ):
+            output_name = _OUTPUTS[output_key]
+            for name, input_name in input_names.items():
+                value = np.broadcast_to(output_partials.get(name, 0.0), mach.shape)
+                if name in _FLIGHT_POINT_INPUTS:
+                    partials[output_name, input_name] = value
+                else:
+                    partials[output_name, input_name] = value.reshape((-1, 1))
 
     @staticmethod
     def get_wrapper() -> OMRubberEngineWrapper:
         return OMRubberEngineWrapper()
+
+
+_OUTPUTS = {
+    "sfc": "data:propulsion:SFC",
+    "thrust_rate": "data:propulsion:thrust_rate",
+    "thrust": "data:propulsion:thrust",
+}
+_FLIGHT_POINT_INPUTS = {
+    "mach": "data:propulsion:mach",
+    "altitude": "data:propulsion:altitude",
+    "required_thrust_rate": "data:propulsion:required_thrust_rate",
+    "required_thrust": "data:propulsion:required_thrust",
+}
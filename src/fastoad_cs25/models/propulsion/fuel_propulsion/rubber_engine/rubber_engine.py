@@ -13,7 +13,8 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
-from typing import Optional, Sequence, Tuple, Union
+import math
+from typing import Dict, MutableMapping, NamedTuple, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -21,8 +22,10 @@ from fastoad.constants import EngineSetting
 from fastoad.exceptions import FastUnknownEngineSettingError
 from fastoad.model_base import FlightPoint
 from fastoad.model_base.propulsion import AbstractFuelPropulsion
-from scipy.interpolate import interp1d
-from stdatm import Atmosphere
+from stdatm import Atmosphere, AtmosphereWithPartials
+from stdatm.state_parameters import compute_density, compute_pressure, compute_temperature
+
+from fastoad_cs25.models.atmosphere import get_atmosphere
 
 from .constants import (
     ALPHA,
@@ -42,10 +45,58 @@ from .constants import (
     MAX_SFC_RATIO_COEFF,
 )
 from .exceptions import FastRubberEngineInconsistentInputParametersError
+from .flight_condition import FlightCondition
 
 # Logger for this module
 _LOGGER = logging.getLogger(__name__)
 
+# Altitudes (in m) that define the SFC correction: sea level and 43000ft are the limits of
+# linear evolution.
+_K_SFC_ALTITUDES = [-1000.0, 0.0, 13106.4, 20000.0]
+
+# Fields of flight points that are used as input by compute_flight_point_columns()
+FLIGHT_POINT_INPUT_FIELDS = (
+    "mach",
+    "altitude",
+    "engine_setting",
+    "isa_offset",
+    "thrust_is_regulated",
+    "thrust_rate",
+    "thrust",
+)
+# Fields of flight points that are computed by compute_flight_point_columns()
+FLIGHT_POINT_OUTPUT_FIELDS = ("sfc", "thrust_rate", "thrust")
+
+# Flight point columns: mapping of 1D arrays (struct of arrays) or numpy structured array
+FlightPointColumns = Union[MutableMapping[str, np.ndarray], np.ndarray]
+
+
+class _ScalarCoefficients(NamedTuple):
+    """
+    Terms of the engine model that depend only on engine parameters, as Python floats.
+
+    Terms that are linear with delta_t4 are stored as (value at delta_t4=0, slope).
+    """
+
+    f_0: float
+    design_altitude: float
+    delta_t4_values: Dict[EngineSetting, float]
+    k_sfc_sl: float
+    k_sfc_slope: float  # per meter, between sea level and 43000ft
+    m_s_11000: Tuple[float, float]
+    f_m_11000: Tuple[float, float]
+    f_ms: Tuple[float, float]
+    g_ms: Tuple[float, float]
+    f_fm: Tuple[float, float]
+    g_fm: Tuple[float, float]
+    residuals: float
+    sfc_mach: Tuple[float, float]  # (value at altitude 0, slope with bounded altitude)
+    sfc_theta: Tuple[float, float]  # (value at altitude 0, slope with bounded altitude)
+    sfc_opr: Tuple[float, float]  # (constant term, slope with altitude)
+    sea_level_density: float
+    sea_level_temperature: float
+    tropopause_density: float
+
 
 class RubberEngine(AbstractFuelPropulsion):
     def __init__(
@@ -70,6 +121,13 @@ class RubberEngine(AbstractFuelPropulsion):
         .. bibliography:: ../refs.bib
            :filter: docname in docnames
 
+        Several engine designs can be evaluated at once by providing arrays as engine
+        parameters. Computations follow numpy broadcasting rules between engine parameters
+        and flight point data. E.g. engine parameters of shape (n_engines, 1) and flight
+        point arrays of shape (n_points,) lead to results of shape (n_engines, n_points), as
+        long as :meth:`compute_flight_points_from_dt4` is used (the pandas-based
+        :meth:`compute_flight_points` needs one engine design).
+
         :param bypass_ratio:
         :param overall_pressure_ratio:
         :param turbine_inlet_temperature: (unit=K) also noted T4
@@ -84,21 +142,21 @@ class RubberEngine(AbstractFuelPropulsion):
         """
         # pylint: disable=too-many-arguments  # they define the engine
 
-        self.bypass_ratio = bypass_ratio
-        self.overall_pressure_ratio = overall_pressure_ratio
-        self.t_4 = turbine_inlet_temperature
-        self.f_0 = mto_thrust
-        self.mach_max = maximum_mach
-        self.design_alt = design_altitude
-        self.k_sfc_sl = k_sfc_sl
-        self.k_sfc_cr = k_sfc_cr
+        self.bypass_ratio = _as_parameter(bypass_ratio)
+        self.overall_pressure_ratio = _as_parameter(overall_pressure_ratio)
+        self.t_4 = _as_parameter(turbine_inlet_temperature)
+        self.f_0 = _as_parameter(mto_thrust)
+        self.mach_max = _as_parameter(maximum_mach)
+        self.design_alt = _as_parameter(design_altitude)
+        self.k_sfc_sl = _as_parameter(k_sfc_sl)
+        self.k_sfc_cr = _as_parameter(k_sfc_cr)
 
         # This dictionary is expected to have a dT4 value for all EngineSetting values
         self.dt4_values = {
             EngineSetting.TAKEOFF: 0.0,
-            EngineSetting.CLIMB: delta_t4_climb,
-            EngineSetting.CRUISE: delta_t4_cruise,
-            EngineSetting.IDLE: delta_t4_cruise,
+            EngineSetting.CLIMB: _as_parameter(delta_t4_climb),
+            EngineSetting.CRUISE: _as_parameter(delta_t4_cruise),
+            EngineSetting.IDLE: _as_parameter(delta_t4_cruise),
         }
 
         # ... so check that all EngineSetting values are in dict
@@ -106,8 +164,33 @@ class RubberEngine(AbstractFuelPropulsion):
         if unknown_keys:
             raise FastUnknownEngineSettingError("Unknown flight phases: %s", unknown_keys)
 
+        # dT4 values indexed by engine setting codes. Slots of unused codes, and the last
+        # slot where out-of-range codes are clipped, contain NaN.
+        # Not available for batched engine designs with different dT4 values.
+        self._dt4_table: Optional[np.ndarray] = None
+        if all(np.size(value) == 1 for value in self.dt4_values.values()):
+            self._dt4_table = np.full(max(self.dt4_values) + 2, np.nan)
+            for engine_setting, value in self.dt4_values.items():
+                self._dt4_table[engine_setting] = np.squeeze(value)
+
+        # Computed on first use by the scalar path of compute_flight_points()
+        self._scalar_coefficients: Optional[_ScalarCoefficients] = None
+
     def compute_flight_points(self, flight_points: Union[FlightPoint, pd.DataFrame]):
         # pylint: disable=too-many-arguments  # they define the trajectory
+        if (
+            isinstance(flight_points, FlightPoint)
+            and np.size(flight_points.mach) == 1
+            and np.size(flight_points.altitude) == 1
+            and self._get_scalar_coefficients() is not None
+        ):
+            self._compute_scalar_flight_point(flight_points)
+            return
+
+        if isinstance(flight_points, pd.DataFrame):
+            self._compute_dataframe_flight_points(flight_points)
+            return
+
         sfc, thrust_rate, thrust = self.compute_flight_points_from_dt4(
             flight_points.mach,
             flight_points.altitude,
@@ -117,27 +200,349 @@ class RubberEngine(AbstractFuelPropulsion):
             flight_points.thrust_rate,
             flight_points.thrust,
         )
-        # flight_points.sfc = sfc raises a warning if flight_points is a DataFrame that has not
-        # already this field, so we add needed fields before setting values
-        if isinstance(flight_points, pd.DataFrame):
-            new_column_names = flight_points.columns.tolist()
-            for name in ["sfc", "thrust_rate", "thrust"]:
-                if name not in new_column_names:
-                    flight_points.insert(len(flight_points.columns), name, value=np.nan)
-
-        # SFC correction for NEO engines dependent on altitude.
-        k_sfc_alt = interp1d(
-            [-1000.0, 0.0, 13106.4, 20000.0],
-            np.hstack((self.k_sfc_sl, self.k_sfc_sl, self.k_sfc_cr, self.k_sfc_cr)),
-            bounds_error=False,
-            fill_value=(self.k_sfc_sl, self.k_sfc_cr),
-        )
-        k_sfc = k_sfc_alt(flight_points.altitude)
-
-        flight_points.sfc = sfc * k_sfc
+        flight_points.sfc = sfc * self.sfc_correction(flight_points.altitude)
         flight_points.thrust_rate = thrust_rate
         flight_points.thrust = thrust
 
+    def get_flight_condition(
+        self,
+        mach: Union[float, Sequence[float]],
+        altitude: Union[float, Sequence[float]],
+        engine_setting: Union[EngineSetting, Sequence],
+        isa_offset: Union[float, Sequence[float]] = 0.0,
+    ) -> FlightCondition:
+        """
+        Computes terms of the model that depend only on flight conditions.
+
+        Results of :meth:`compute_flight_points` can then be obtained for any thrust or
+        thrust rate at these flight conditions, without computing again maximum thrust::
+
+            >>> condition = engine.get_flight_condition(0.78, 10000.0, EngineSetting.CRUISE)
+            >>> sfc, thrust_rate = condition.compute_from_thrust(30000.0)
+            >>> sfc, thrust_rate = condition.compute_from_thrust(31000.0)
+
+        :param mach: Mach number
+        :param altitude: (unit=m) altitude w.r.t. to sea level
+        :param engine_setting: engine setting(s)
+        :param isa_offset: (unit=degK) temperature difference from isa conditions
+        :return: the flight condition
+        """
+        return self.get_flight_condition_from_dt4(
+            mach, altitude, self._get_delta_t4(engine_setting), isa_offset
+        )
+
+    def get_flight_condition_from_dt4(
+        self,
+        mach: Union[float, Sequence[float]],
+        altitude: Union[float, Sequence[float]],
+        delta_t4: Union[float, Sequence[float]],
+        isa_offset: Union[float, Sequence[float]] = 0.0,
+    ) -> FlightCondition:
+        """
+        Same as :meth:`get_flight_condition` except that delta_t4 is used directly
+        instead of specifying flight engine_setting.
+
+        :param mach: Mach number
+        :param altitude: (unit=m) altitude w.r.t. to sea level
+        :param delta_t4: (unit=K) difference between operational and design values of
+                         turbine inlet temperature in K
+        :param isa_offset: (unit=degK) temperature difference from isa conditions
+        :return: the flight condition
+        """
+        max_thrust, sfc_0 = self._compute_max_thrust_and_sfc(
+            np.asarray(mach), np.asarray(altitude), np.asarray(delta_t4), np.asarray(isa_offset)
+        )
+        thrust_rate_at_min_sfc, min_sfc_ratio, sfc_ratio_coeff = self._get_sfc_ratio_coefficients(
+            altitude
+        )
+        return FlightCondition(
+            max_thrust=max_thrust,
+            sfc_at_max_thrust=sfc_0 * self.sfc_correction(altitude),
+            thrust_rate_at_min_sfc=thrust_rate_at_min_sfc,
+            min_sfc_ratio=min_sfc_ratio,
+            sfc_ratio_coeff=sfc_ratio_coeff,
+        )
+
+    def compute_flight_point_columns(
+        self, flight_points: FlightPointColumns, out: Optional[FlightPointColumns] = None
+    ) -> FlightPointColumns:
+        """
+        Same as :meth:`compute_flight_points` for flight points that are stored as columns,
+        for large batches of flight points.
+
+        Flight points are provided as a mapping of 1D arrays (struct of arrays) or as a numpy
+        structured array, with fields "mach", "altitude", "engine_setting",
+        "thrust_is_regulated", "thrust_rate", "thrust" and, optionally, "isa_offset".
+
+        Results ("sfc", "thrust_rate" and "thrust") are written in place in provided arrays
+        of `out`. For a mapping, missing output arrays are allocated.
+
+        :param flight_points: flight point columns
+        :param out: flight point columns where results are written. If not provided,
+                    results are written in `flight_points`.
+        :return: `out`
+        """
+        if out is None:
+            out = flight_points
+        if isinstance(out, np.ndarray):
+            missing_fields = set(FLIGHT_POINT_OUTPUT_FIELDS) - set(out.dtype.names)
+            if missing_fields:
+                raise ValueError("Output structured array misses fields %s." % missing_fields)
+        else:
+            for name in FLIGHT_POINT_OUTPUT_FIELDS:
+                if name not in out:
+                    out[name] = np.empty(np.shape(flight_points["mach"]))
+
+        altitude = flight_points["altitude"]
+        isa_offset = flight_points["isa_offset"] if _has_field(flight_points, "isa_offset") else 0.0
+        # As OpenMDAO may provide floats that could be slightly different
+        # from 0. or 1., a rounding operation is needed before converting
+        # to booleans
+        thrust_is_regulated = np.round(
+            np.asarray(flight_points["thrust_is_regulated"], dtype=float)
+        ).astype(bool)
+
+        max_thrust, sfc_0 = self._compute_max_thrust_and_sfc(
+            flight_points["mach"],
+            altitude,
+            self._get_delta_t4(flight_points["engine_setting"]),
+            isa_offset,
+        )
+
+        out_thrust = out["thrust"]
+        out_thrust_rate = out["thrust_rate"]
+        np.multiply(flight_points["thrust_rate"], max_thrust, out=out_thrust_rate)
+        np.copyto(out_thrust, flight_points["thrust"], where=thrust_is_regulated)
+        np.copyto(out_thrust, out_thrust_rate, where=~thrust_is_regulated)
+        np.divide(out_thrust, max_thrust, out=out_thrust_rate)
+
+        sfc = np.multiply(sfc_0, self.sfc_ratio(altitude, out_thrust_rate), out=sfc_0)
+        np.multiply(sfc, self.sfc_correction(altitude), out=out["sfc"])
+
+        return out
+
+    def _compute_dataframe_flight_points(self, flight_points: pd.DataFrame):
+        """
+        Adapter of :meth:`compute_flight_point_columns` for pandas DataFrames.
+
+        :param flight_points: flight points, that get columns "sfc", "thrust_rate" and
+                              "thrust" updated or added
+        """
+        columns = {
+            name: flight_points[name].to_numpy()
+            for name in FLIGHT_POINT_INPUT_FIELDS
+            if name in flight_points.columns
+        }
+        out = {name: np.empty(len(flight_points)) for name in FLIGHT_POINT_OUTPUT_FIELDS}
+        self.compute_flight_point_columns(columns, out)
+        for name, values in out.items():
+            flight_points[name] = values
+
+    def _compute_scalar_flight_point(self, flight_point: FlightPoint):
+        """
+        Same as :meth:`compute_flight_points` for a flight point with scalar values, as
+        used by time-step mission integrators.
+
+        Computations are done with Python floats, using terms that are computed once per
+        engine by :meth:`_get_scalar_coefficients`.
+        """
+        thrust_is_regulated = flight_point.thrust_is_regulated
+        if thrust_is_regulated is None:
+            if flight_point.thrust_rate is not None:
+                thrust_is_regulated = False
+            elif flight_point.thrust is not None:
+                thrust_is_regulated = True
+            else:
+                raise FastRubberEngineInconsistentInputParametersError(
+                    "When use_thrust_rate is None, either thrust_rate or thrust should be provided."
+                )
+        else:
+            # As OpenMDAO may provide floats that could be slightly different
+            # from 0. or 1., a rounding operation is needed before converting
+            # to booleans
+            thrust_is_regulated = bool(round(_as_float(thrust_is_regulated)))
+            if thrust_is_regulated and flight_point.thrust is None:
+                raise FastRubberEngineInconsistentInputParametersError(
+                    "When thrust_is_regulated is True, thrust should be provided."
+                )
+            if not thrust_is_regulated and flight_point.thrust_rate is None:
+                raise FastRubberEngineInconsistentInputParametersError(
+                    "When thrust_is_regulated is False, thrust_rate should be provided."
+                )
+
+        altitude = _as_float(flight_point.altitude)
+        max_thrust, sfc_0 = self._compute_scalar_max_thrust_and_sfc(
+            _as_float(flight_point.mach),
+            altitude,
+            self._scalar_coefficients.delta_t4_values[_as_scalar(flight_point.engine_setting)],
+            _as_float(flight_point.isa_offset),
+        )
+
+        if thrust_is_regulated:
+            thrust = _as_float(flight_point.thrust)
+        else:
+            thrust = _as_float(flight_point.thrust_rate) * max_thrust
+        thrust_rate = thrust / max_thrust
+
+        coefficients = self._scalar_coefficients
+        sfc_correction = coefficients.k_sfc_sl + coefficients.k_sfc_slope * min(
+            max(altitude, 0.0), _K_SFC_ALTITUDES[2]
+        )
+
+        flight_point.sfc = (
+            sfc_0
+            * self._compute_scalar_sfc_ratio(altitude - coefficients.design_altitude, thrust_rate)
+            * sfc_correction
+        )
+        flight_point.thrust_rate = thrust_rate
+        flight_point.thrust = thrust
+
+    def _get_scalar_coefficients(self) -> Optional[_ScalarCoefficients]:
+        """
+        :return: the terms of the model that depend only on engine parameters, or None if
+                 engine parameters are not scalars (batched engine designs)
+        """
+        if self._scalar_coefficients is not None:
+            return self._scalar_coefficients
+
+        parameters = [
+            self.bypass_ratio,
+            self.overall_pressure_ratio,
+            self.t_4,
+            self.f_0,
+            self.design_alt,
+            self.k_sfc_sl,
+            self.k_sfc_cr,
+        ] + list(self.dt4_values.values())
+        if any(np.size(value) != 1 for value in parameters):
+            return None
+
+        bypass_ratio, opr, t_4, f_0, design_altitude, k_sfc_sl, k_sfc_cr = (
+            float(np.squeeze(value)) for value in parameters[:7]
+        )
+        opr_delta = opr - 30.0
+        vect = [opr_delta**2, opr_delta, 1.0, t_4]
+
+        def _calc_coef(a_coeffs, b_coeffs):
+            return (
+                sum(a * v for a, v in zip(a_coeffs, vect)) * bypass_ratio
+                + sum(b * v for b, v in zip(b_coeffs, vect)),
+                a_coeffs[4] * bypass_ratio + b_coeffs[4],
+            )
+
+        self._scalar_coefficients = _ScalarCoefficients(
+            f_0=f_0,
+            design_altitude=design_altitude,
+            delta_t4_values={
+                engine_setting: float(np.squeeze(value))
+                for engine_setting, value in self.dt4_values.items()
+            },
+            k_sfc_sl=k_sfc_sl,
+            k_sfc_slope=(k_sfc_cr - k_sfc_sl) / _K_SFC_ALTITUDES[2],
+            m_s_11000=(A_MS * t_4 + B_MS * bypass_ratio + C_MS * opr_delta + E_MS, D_MS),
+            f_m_11000=(A_FM * t_4 + B_FM * bypass_ratio + C_FM * opr_delta + E_FM, D_FM),
+            f_ms=_calc_coef(ALPHA[0], BETA[0]),
+            g_ms=_calc_coef(ALPHA[1], BETA[1]),
+            f_fm=_calc_coef(ALPHA[2], BETA[2]),
+            g_fm=_calc_coef(ALPHA[3], BETA[3]),
+            residuals=-4.51e-3 * bypass_ratio + 2.19e-5 * t_4 - 3.09e-4 * opr_delta + 0.945,
+            sfc_mach=(6.54e-7 * bypass_ratio + 8.54e-6, -7.44e-13 * bypass_ratio - 3.32e-10),
+            sfc_theta=(-6.58e-7 * bypass_ratio + 1.32e-5, -3.47e-11 * bypass_ratio + 4.23e-10),
+            sfc_opr=(-1.05e-7 * opr_delta, 7.4e-13 * opr_delta**2),
+            sea_level_density=float(ATM_SEA_LEVEL.density),
+            sea_level_temperature=float(ATM_SEA_LEVEL.temperature),
+            tropopause_density=float(ATM_TROPOPAUSE.density),
+        )
+        return self._scalar_coefficients
+
+    def _compute_scalar_max_thrust_and_sfc(
+        self, mach: float, altitude: float, delta_t4: float, isa_offset: float
+    ) -> Tuple[float, float]:
+        """
+        Same as :meth:`_compute_max_thrust_and_sfc`, for Python floats.
+
+        :param mach: Mach number
+        :param altitude: (unit=m) altitude w.r.t. to sea level
+        :param delta_t4: (unit=K) difference between operational and design values of
+                         turbine inlet temperature in K
+        :param isa_offset: (unit=degK) temperature difference from isa conditions
+        :return: maximum thrust (in N), SFC at maximum thrust (in kg/s/N)
+        """
+        # pylint: disable=invalid-name  # coefficients are named after model
+        coefficients = self._scalar_coefficients
+        temperature = compute_temperature(altitude, isa_offset)
+        density = compute_density(compute_pressure(altitude), temperature)
+
+        # Mach effect
+        delta_altitude = min(altitude, 11000.0) - 11000.0
+        (ms_0, ms_1), (fm_0, fm_1) = coefficients.m_s_11000, coefficients.f_m_11000
+        (f_ms_0, f_ms_1), (g_ms_0, g_ms_1) = coefficients.f_ms, coefficients.g_ms
+        (f_fm_0, f_fm_1), (g_fm_0, g_fm_1) = coefficients.f_fm, coefficients.g_fm
+        m_s = (
+            ms_0
+            + ms_1 * delta_t4
+            + (f_ms_0 + f_ms_1 * delta_t4) * delta_altitude**2
+            + (g_ms_0 + g_ms_1 * delta_t4) * delta_altitude
+        )
+        f_m = (
+            fm_0
+            + fm_1 * delta_t4
+            + (f_fm_0 + f_fm_1 * delta_t4) * delta_altitude**2
+            + (g_fm_0 + g_fm_1 * delta_t4) * delta_altitude
+        )
+        mach_effect = (1.0 - f_m) / (m_s * m_s) * (mach - m_s) ** 2 + f_m
+
+        # Altitude effect
+        k = 1.0 + 1.2e-3 * delta_t4
+        nf = 0.98 + 8e-4 * delta_t4
+        if altitude <= 11000.0:
+            altitude_effect = (
+                k
+                * (density / coefficients.sea_level_density) ** nf
+                / (1.0 - 0.04 * math.sin(math.pi * altitude / 11000.0))
+            )
+        else:
+            altitude_effect = (
+                k
+                * (coefficients.tropopause_density / coefficients.sea_level_density) ** nf
+                * density
+                / coefficients.tropopause_density
+            )
+
+        max_thrust = coefficients.f_0 * mach_effect * altitude_effect * coefficients.residuals
+
+        # SFC at max thrust
+        bound_altitude = min(11000.0, max(0.0, altitude))
+        sfc = (
+            mach * (coefficients.sfc_mach[0] + coefficients.sfc_mach[1] * bound_altitude)
+            + (coefficients.sfc_theta[0] + coefficients.sfc_theta[1] * bound_altitude)
+            * math.sqrt(temperature / coefficients.sea_level_temperature)
+            + coefficients.sfc_opr[0]
+            + coefficients.sfc_opr[1] * altitude
+        )
+
+        return max_thrust, sfc
+
+    @staticmethod
+    def _compute_scalar_sfc_ratio(delta_h: float, thrust_rate: float) -> float:
+        """
+        Same as :meth:`sfc_ratio`, for Python floats.
+
+        :param delta_h: (unit=m) difference between altitude and design altitude
+        :param thrust_rate:
+        :return: SFC ratio
+        """
+        thrust_ratio_at_min_sfc_ratio = -9.6e-5 * delta_h + 0.85
+        if thrust_ratio_at_min_sfc_ratio == 1.0:
+            return MAX_SFC_RATIO_COEFF * (thrust_rate - 1.0) ** 2 + 1.0
+
+        min_sfc_ratio = max(
+            min(0.998, -3.385e-5 * delta_h + 0.995),
+            1 - MAX_SFC_RATIO_COEFF * (1 - thrust_ratio_at_min_sfc_ratio) ** 2,
+        )
+        coeff = (1 - min_sfc_ratio) / (1 - thrust_ratio_at_min_sfc_ratio) ** 2
+        return coeff * (thrust_rate - thrust_ratio_at_min_sfc_ratio) ** 2 + min_sfc_ratio
+
     def compute_flight_points_from_dt4(
         self,
         mach: Union[float, Sequence],
@@ -180,41 +585,38 @@ class RubberEngine(AbstractFuelPropulsion):
         thrust_rate = np.asarray(thrust_rate)
         thrust = np.asarray(thrust)
 
-        atmosphere = Atmosphere(altitude, delta_t=isa_offset, altitude_in_feet=False)
-
-        max_thrust = self.max_thrust(atmosphere, mach, delta_t4)
+        max_thrust, sfc_0 = self._compute_max_thrust_and_sfc(mach, altitude, delta_t4, isa_offset)
 
         # We compute thrust values from thrust rates when needed
-        idx = np.logical_not(thrust_is_regulated)
-        if np.size(max_thrust) == 1:
-            maximum_thrust = max_thrust
-            out_thrust_rate = thrust_rate
-            out_thrust = thrust
-        else:
-            out_thrust_rate = (
-                np.full(np.shape(max_thrust), thrust_rate.item())
-                if np.size(thrust_rate) == 1
-                else thrust_rate
-            )
-            out_thrust = (
-                np.full(np.shape(max_thrust), thrust.item()) if np.size(thrust) == 1 else thrust
-            )
-
-            maximum_thrust = max_thrust[idx]
-
-        if np.any(idx):
-            out_thrust[idx] = out_thrust_rate[idx] * maximum_thrust
+        out_thrust = np.where(thrust_is_regulated, thrust, thrust_rate * max_thrust)
 
         # thrust_rate is obtained from entire thrust vector (could be optimized if needed,
         # as some thrust rates that are computed may have been provided as input)
         out_thrust_rate = out_thrust / max_thrust
 
         # Now SFC can be computed
-        sfc_0 = self.sfc_at_max_thrust(atmosphere, mach)
         sfc = sfc_0 * self.sfc_ratio(altitude, out_thrust_rate)
 
         return sfc, out_thrust_rate, out_thrust
 
+    def _compute_max_thrust_and_sfc(
+        self,
+        mach: np.ndarray,
+        altitude: np.ndarray,
+        delta_t4: np.ndarray,
+        isa_offset: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :param mach: Mach number
+        :param altitude: (unit=m) altitude w.r.t. to sea level
+        :param delta_t4: (unit=K) difference between operational and design values of
+                         turbine inlet temperature in K
+        :param isa_offset: (unit=degK) temperature difference from isa conditions
+        :return: maximum thrust (in N), SFC at maximum thrust (in kg/s/N)
+        """
+        atmosphere = get_atmosphere(altitude, isa_offset, altitude_in_feet=False)
+        return self.max_thrust(atmosphere, mach, delta_t4), self.sfc_at_max_thrust(atmosphere, mach)
+
     @staticmethod
     def _check_thrust_inputs(
         thrust_is_regulated: Optional[Union[float, Sequence]],
@@ -247,10 +649,10 @@ class RubberEngine(AbstractFuelPropulsion):
         if thrust_is_regulated is None:
             if thrust_rate is not None:
                 thrust_is_regulated = False
-                thrust = np.empty_like(thrust_rate)
+                thrust = np.zeros_like(thrust_rate)
             elif thrust is not None:
                 thrust_is_regulated = True
-                thrust_rate = np.empty_like(thrust)
+                thrust_rate = np.zeros_like(thrust)
             else:
                 raise FastRubberEngineInconsistentInputParametersError(
                     "When use_thrust_rate is None, either thrust_rate or thrust should be provided."
@@ -264,13 +666,13 @@ class RubberEngine(AbstractFuelPropulsion):
                     raise FastRubberEngineInconsistentInputParametersError(
                         "When thrust_is_regulated is True, thrust should be provided."
                     )
-                thrust_rate = np.empty_like(thrust)
+                thrust_rate = np.zeros_like(thrust)
             else:
                 if thrust_rate is None:
                     raise FastRubberEngineInconsistentInputParametersError(
                         "When thrust_is_regulated is False, thrust_rate should be provided."
                     )
-                thrust = np.empty_like(thrust_rate)
+                thrust = np.zeros_like(thrust_rate)
 
         else:
             # Check inputs: if use_thrust_rate is not a scalar, both thrust_rate and thrust must be
@@ -327,6 +729,47 @@ class RubberEngine(AbstractFuelPropulsion):
 
         return sfc
 
+    def sfc_at_max_thrust_partials(
+        self, atmosphere: AtmosphereWithPartials, mach: Union[float, Sequence[float]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Partial derivatives of :meth:`sfc_at_max_thrust`.
+
+        :param atmosphere: AtmosphereWithPartials instance at intended altitude, in meters
+        :param mach: Mach number(s)
+        :return: partial derivatives with respect to "mach", "altitude", "bypass_ratio" and
+                 "overall_pressure_ratio"
+        """
+        altitude = atmosphere.get_altitude(False)
+        mach = np.asarray(mach)
+
+        bound_altitude = np.minimum(11000, np.maximum(0, altitude))
+        d_bound_altitude = np.where((altitude > 0) & (altitude < 11000), 1.0, 0.0)
+
+        # pylint: disable=invalid-name  # coefficients are named after model
+        a1 = -7.44e-13 * bound_altitude + 6.54e-7
+        a2 = -3.32e-10 * bound_altitude + 8.54e-6
+        b1 = -3.47e-11 * bound_altitude - 6.58e-7
+        b2 = 4.23e-10 * bound_altitude + 1.32e-5
+        c = -1.05e-7
+
+        theta = atmosphere.temperature / ATM_SEA_LEVEL.temperature
+        d_theta = atmosphere.partial_temperature_altitude / ATM_SEA_LEVEL.temperature
+        sqrt_theta = np.sqrt(theta)
+
+        return {
+            "mach": a1 * self.bypass_ratio + a2,
+            "altitude": (
+                mach * (-7.44e-13 * self.bypass_ratio - 3.32e-10) * d_bound_altitude
+                + (-3.47e-11 * self.bypass_ratio + 4.23e-10) * d_bound_altitude * sqrt_theta
+                + (b1 * self.bypass_ratio + b2) * 0.5 * d_theta / sqrt_theta
+                + 7.4e-13 * (self.overall_pressure_ratio - 30) ** 2
+            ),
+            "bypass_ratio": mach * a1 + b1 * sqrt_theta,
+            "overall_pressure_ratio": 2 * 7.4e-13 * (self.overall_pressure_ratio - 30) * altitude
+            + c,
+        }
+
     def sfc_ratio(
         self,
         altitude: Union[float, Sequence[float]],
@@ -347,9 +790,23 @@ class RubberEngine(AbstractFuelPropulsion):
         :return: SFC ratio
         """
 
-        altitude = np.asarray(altitude)
         thrust_rate = np.asarray(thrust_rate)
-        mach = np.asarray(mach)
+        thrust_ratio_at_min_sfc_ratio, min_sfc_ratio, coeff = self._get_sfc_ratio_coefficients(
+            altitude
+        )
+
+        return coeff * (thrust_rate - thrust_ratio_at_min_sfc_ratio) ** 2 + min_sfc_ratio
+
+    def _get_sfc_ratio_coefficients(
+        self, altitude: Union[float, Sequence[float]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The SFC ratio is coeff * (thrust_rate - thrust_ratio_at_min_sfc_ratio)**2 + min_sfc_ratio
+
+        :param altitude:
+        :return: thrust_ratio_at_min_sfc_ratio, min_sfc_ratio, coeff
+        """
+        altitude = np.asarray(altitude)
 
         delta_h = altitude - self.design_alt
         thrust_ratio_at_min_sfc_ratio = -9.6e-5 * delta_h + 0.85  # =Fi in model
@@ -373,7 +830,101 @@ class RubberEngine(AbstractFuelPropulsion):
             min_sfc_ratio = 1.0
             coeff = MAX_SFC_RATIO_COEFF
 
-        return coeff * (thrust_rate - thrust_ratio_at_min_sfc_ratio) ** 2 + min_sfc_ratio
+        return thrust_ratio_at_min_sfc_ratio, min_sfc_ratio, coeff
+
+    def sfc_ratio_partials(
+        self,
+        altitude: Union[float, Sequence[float]],
+        thrust_rate: Union[float, Sequence[float]],
+    ) -> Dict[str, np.ndarray]:
+        """
+        Partial derivatives of :meth:`sfc_ratio`.
+
+        :param altitude:
+        :param thrust_rate:
+        :return: partial derivatives with respect to "altitude", "thrust_rate" and
+                 "design_altitude"
+        """
+        altitude = np.asarray(altitude)
+        thrust_rate = np.asarray(thrust_rate)
+
+        delta_h = altitude - self.design_alt
+        thrust_ratio_at_min_sfc_ratio = -9.6e-5 * delta_h + 0.85
+        d_thrust_ratio = -9.6e-5
+        delta_thrust_ratio = 1 - thrust_ratio_at_min_sfc_ratio
+
+        linear_min_sfc_ratio = -3.385e-5 * delta_h + 0.995
+        min_sfc_ratio = np.minimum(0.998, linear_min_sfc_ratio)
+        d_min_sfc_ratio = np.where(linear_min_sfc_ratio < 0.998, -3.385e-5, 0.0)
+
+        bounded_min_sfc_ratio = 1 - MAX_SFC_RATIO_COEFF * delta_thrust_ratio**2
+        is_bounded = bounded_min_sfc_ratio > min_sfc_ratio
+        min_sfc_ratio = np.where(is_bounded, bounded_min_sfc_ratio, min_sfc_ratio)
+        d_min_sfc_ratio = np.where(
+            is_bounded,
+            2 * MAX_SFC_RATIO_COEFF * delta_thrust_ratio * d_thrust_ratio,
+            d_min_sfc_ratio,
+        )
+
+        # When coeff is bounded, it is constant (and equal to MAX_SFC_RATIO_COEFF)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coeff = np.where(
+                is_bounded, MAX_SFC_RATIO_COEFF, (1 - min_sfc_ratio) / delta_thrust_ratio**2
+            )
+            d_coeff = np.where(
+                is_bounded,
+                0.0,
+                -d_min_sfc_ratio / delta_thrust_ratio**2
+                + 2 * (1 - min_sfc_ratio) * d_thrust_ratio / delta_thrust_ratio**3,
+            )
+
+        delta_thrust_rate = thrust_rate - thrust_ratio_at_min_sfc_ratio
+        d_altitude = (
+            d_coeff * delta_thrust_rate**2
+            - 2 * coeff * delta_thrust_rate * d_thrust_ratio
+            + d_min_sfc_ratio
+        )
+
+        return {
+            "altitude": d_altitude,
+            "thrust_rate": 2 * coeff * delta_thrust_rate,
+            "design_altitude": -d_altitude,
+        }
+
+    def sfc_correction(self, altitude: Union[float, Sequence[float]]) -> np.ndarray:
+        """
+        SFC correction for NEO engines, dependent on altitude.
+
+        Correction is k_sfc_sl at sea level and below, k_sfc_cr at 43000ft and above, and
+        is linearly interpolated in between.
+
+        :param altitude: (unit=m)
+        :return: SFC correction factor
+        """
+        ratio = np.clip(np.asarray(altitude) / _K_SFC_ALTITUDES[2], 0.0, 1.0)
+        return self.k_sfc_sl + (self.k_sfc_cr - self.k_sfc_sl) * ratio
+
+    def sfc_correction_partials(
+        self, altitude: Union[float, Sequence[float]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Partial derivatives of :meth:`sfc_correction`.
+
+        :param altitude: (unit=m)
+        :return: partial derivatives with respect to "altitude", "k_sfc_sl" and "k_sfc_cr"
+        """
+        altitude = np.asarray(altitude)
+        cruise_altitude = _K_SFC_ALTITUDES[2]
+        ratio = np.clip(altitude / cruise_altitude, 0.0, 1.0)
+        is_in_transition = (altitude > 0.0) & (altitude < cruise_altitude)
+
+        return {
+            "altitude": np.where(
+                is_in_transition, (self.k_sfc_cr - self.k_sfc_sl) / cruise_altitude, 0.0
+            ),
+            "k_sfc_sl": 1.0 - ratio,
+            "k_sfc_cr": ratio,
+        }
 
     def max_thrust(
         self,
@@ -461,41 +1012,23 @@ class RubberEngine(AbstractFuelPropulsion):
             k = 1 + 1.2e-3 * delta_t4
             nf = 0.98 + 8e-4 * delta_t4
 
-            def _troposhere_effect(density, altitude, k, nf):
-                return (
-                    k
-                    * ((density / ATM_SEA_LEVEL.density) ** nf)
-                    * (1 / (1 - (0.04 * np.sin((np.pi * altitude) / 11000))))
-                )
-
-            def _stratosphere_effect(density, k, nf):
-                return (
-                    k
-                    * ((ATM_TROPOPAUSE.density / ATM_SEA_LEVEL.density) ** nf)
-                    * density
-                    / ATM_TROPOPAUSE.density
-                )
+            density = atmosphere.density
 
-            if np.size(altitude) == 1:
-                if altitude <= 11000:
-                    h = _troposhere_effect(atmosphere.density, altitude, k, nf)
-                else:
-                    h = _stratosphere_effect(atmosphere.density, k, nf)
-            else:
-                h = np.empty(np.shape(altitude))
-                idx = altitude <= 11000
-                if np.size(delta_t4) == 1:
-                    h[idx] = _troposhere_effect(atmosphere.density[idx], altitude[idx], k, nf)
-                    idx = np.logical_not(idx)
-                    h[idx] = _stratosphere_effect(atmosphere.density[idx], k, nf)
-                else:
-                    h[idx] = _troposhere_effect(
-                        atmosphere.density[idx], altitude[idx], k[idx], nf[idx]
-                    )
-                    idx = np.logical_not(idx)
-                    h[idx] = _stratosphere_effect(atmosphere.density[idx], k[idx], nf[idx])
+            # Both expressions are computed everywhere so that engine parameters and flight
+            # points can be broadcast together.
+            troposphere_effect = (
+                k
+                * ((density / ATM_SEA_LEVEL.density) ** nf)
+                * (1 / (1 - (0.04 * np.sin((np.pi * altitude) / 11000))))
+            )
+            stratosphere_effect = (
+                k
+                * ((ATM_TROPOPAUSE.density / ATM_SEA_LEVEL.density) ** nf)
+                * density
+                / ATM_TROPOPAUSE.density
+            )
 
-            return h
+            return np.where(altitude <= 11000, troposphere_effect, stratosphere_effect)
 
         def _residuals():
             """Computation of residuals."""
@@ -508,7 +1041,156 @@ class RubberEngine(AbstractFuelPropulsion):
 
         return self.f_0 * _mach_effect() * _altitude_effect() * _residuals()
 
-    def installed_weight(self) -> float:
+    def max_thrust_partials(
+        self,
+        atmosphere: AtmosphereWithPartials,
+        mach: Union[float, Sequence[float]],
+        delta_t4: Union[float, Sequence[float]],
+    ) -> Dict[str, np.ndarray]:
+        """
+        Partial derivatives of :meth:`max_thrust`.
+
+        :param atmosphere: AtmosphereWithPartials instance at intended altitude, in meters
+        :param mach: Mach number(s)
+        :param delta_t4: (unit=K) difference between operational and design values of
+                         turbine inlet temperature in K
+        :return: partial derivatives with respect to "mach", "altitude", "delta_t4",
+                 "bypass_ratio", "overall_pressure_ratio", "turbine_inlet_temperature" and
+                 "mto_thrust"
+        """
+        # pylint: disable=too-many-locals  # the model has many terms
+        altitude = np.asarray(atmosphere.get_altitude(altitude_in_feet=False))
+        mach = np.asarray(mach)
+        delta_t4 = np.asarray(delta_t4)
+        opr_delta = self.overall_pressure_ratio - 30
+
+        # Mach effect ---------------------------------------------------------
+        # For each coefficient, value and derivatives with respect to bypass ratio, OPR, T4
+        # and delta_t4 are stored in that order.
+        vect = [opr_delta**2, opr_delta, 1.0, self.t_4, delta_t4]
+        d_vect_opr = [2 * opr_delta, 1.0, 0.0, 0.0, 0.0]
+
+        def _calc_coef(a_coeffs, b_coeffs):
+            a_term = sum(a_coeff * value for a_coeff, value in zip(a_coeffs, vect))
+            b_term = sum(b_coeff * value for b_coeff, value in zip(b_coeffs, vect))
+            return (
+                a_term * self.bypass_ratio + b_term,
+                a_term,
+                sum(
+                    (a_coeff * self.bypass_ratio + b_coeff) * d_value
+                    for a_coeff, b_coeff, d_value in zip(a_coeffs, b_coeffs, d_vect_opr)
+                ),
+                a_coeffs[3] * self.bypass_ratio + b_coeffs[3],
+                a_coeffs[4] * self.bypass_ratio + b_coeffs[4],
+            )
+
+        f_ms = _calc_coef(ALPHA[0], BETA[0])
+        g_ms = _calc_coef(ALPHA[1], BETA[1])
+        f_fm = _calc_coef(ALPHA[2], BETA[2])
+        g_fm = _calc_coef(ALPHA[3], BETA[3])
+
+        ms_11000 = (
+            A_MS * self.t_4 + B_MS * self.bypass_ratio + C_MS * opr_delta + D_MS * delta_t4 + E_MS,
+            B_MS,
+            C_MS,
+            A_MS,
+            D_MS,
+        )
+        fm_11000 = (
+            A_FM * self.t_4 + B_FM * self.bypass_ratio + C_FM * opr_delta + D_FM * delta_t4 + E_FM,
+            B_FM,
+            C_FM,
+            A_FM,
+            D_FM,
+        )
+
+        delta_altitude = np.minimum(11000, altitude) - 11000
+        d_delta_altitude = np.where(altitude < 11000, 1.0, 0.0)
+
+        m_s = [
+            ms + f * delta_altitude**2 + g * delta_altitude
+            for ms, f, g in zip(ms_11000, f_ms, g_ms)
+        ]
+        f_m = [
+            fm + f * delta_altitude**2 + g * delta_altitude
+            for fm, f, g in zip(fm_11000, f_fm, g_fm)
+        ]
+        d_m_s_altitude = (2 * f_ms[0] * delta_altitude + g_ms[0]) * d_delta_altitude
+        d_f_m_altitude = (2 * f_fm[0] * delta_altitude + g_fm[0]) * d_delta_altitude
+
+        alpha_mach_effect = (1 - f_m[0]) / m_s[0] ** 2
+        mach_delta = mach - m_s[0]
+        mach_effect = alpha_mach_effect * mach_delta**2 + f_m[0]
+        d_mach_effect_m_s = (
+            -2 * (1 - f_m[0]) / m_s[0] ** 3 * mach_delta**2 - 2 * alpha_mach_effect * mach_delta
+        )
+        d_mach_effect_f_m = 1 - mach_delta**2 / m_s[0] ** 2
+
+        d_mach_effect = [
+            d_mach_effect_m_s * d_m_s + d_mach_effect_f_m * d_f_m
+            for d_m_s, d_f_m in zip(m_s[1:], f_m[1:])
+        ]
+        d_mach_effect_mach = 2 * alpha_mach_effect * mach_delta
+        d_mach_effect_altitude = (
+            d_mach_effect_m_s * d_m_s_altitude + d_mach_effect_f_m * d_f_m_altitude
+        )
+
+        # Altitude effect -----------------------------------------------------
+        # pylint: disable=invalid-name  # coefficients are named after model
+        k = 1 + 1.2e-3 * delta_t4
+        nf = 0.98 + 8e-4 * delta_t4
+        density = atmosphere.density
+        d_density = atmosphere.partial_density_altitude
+
+        is_troposphere = altitude <= 11000
+        sine_term = 1 - 0.04 * np.sin((np.pi * altitude) / 11000)
+        density_ratio = np.where(
+            is_troposphere,
+            density / ATM_SEA_LEVEL.density,
+            ATM_TROPOPAUSE.density / ATM_SEA_LEVEL.density,
+        )
+        altitude_effect = np.where(
+            is_troposphere,
+            k * density_ratio**nf / sine_term,
+            k * density_ratio**nf * density / ATM_TROPOPAUSE.density,
+        )
+        d_altitude_effect_altitude = altitude_effect * np.where(
+            is_troposphere,
+            nf * d_density / density
+            + 0.04 * np.pi / 11000 * np.cos((np.pi * altitude) / 11000) / sine_term,
+            d_density / density,
+        )
+        d_altitude_effect_delta_t4 = altitude_effect * (1.2e-3 / k + 8e-4 * np.log(density_ratio))
+
+        # Residuals -----------------------------------------------------------
+        residuals = -4.51e-3 * self.bypass_ratio + 2.19e-5 * self.t_4 - 3.09e-4 * opr_delta + 0.945
+        d_residuals = [-4.51e-3, -3.09e-4, 2.19e-5]
+
+        reduced_thrust = mach_effect * altitude_effect * residuals
+        partials = {
+            "mach": self.f_0 * d_mach_effect_mach * altitude_effect * residuals,
+            "altitude": self.f_0
+            * residuals
+            * (d_mach_effect_altitude * altitude_effect + mach_effect * d_altitude_effect_altitude),
+            "delta_t4": self.f_0
+            * residuals
+            * (d_mach_effect[3] * altitude_effect + mach_effect * d_altitude_effect_delta_t4),
+            "mto_thrust": reduced_thrust,
+        }
+        for name, d_mach_effect_value, d_residuals_value in zip(
+            ["bypass_ratio", "overall_pressure_ratio", "turbine_inlet_temperature"],
+            d_mach_effect,
+            d_residuals,
+        ):
+            partials[name] = (
+                self.f_0
+                * altitude_effect
+                * (d_mach_effect_value * residuals + mach_effect * d_residuals_value)
+            )
+
+        return partials
+
+    def installed_weight(self) -> Union[float, np.ndarray]:
         """
         Computes weight of installed engine, depending on MTO thrust (F0).
 
@@ -519,16 +1201,13 @@ class RubberEngine(AbstractFuelPropulsion):
         # FIXME : separate raw engine weight and installation factor
         installation_factor = 1.2
 
-        if self.f_0 < 80000:
-            weight = 22.2e-3 * self.f_0
-        else:
-            weight = 14.1e-3 * self.f_0 + 648
+        weight = np.where(self.f_0 < 80000, 22.2e-3 * self.f_0, 14.1e-3 * self.f_0 + 648)
 
         installed_weight = installation_factor * weight
 
         return installed_weight
 
-    def length(self) -> float:
+    def length(self) -> Union[float, np.ndarray]:
         # TODO: update model reference with last edition of Raymer
         """
         Computes engine length from MTO thrust and maximum Mach.
@@ -541,7 +1220,7 @@ class RubberEngine(AbstractFuelPropulsion):
 
         return length
 
-    def nacelle_diameter(self) -> float:
+    def nacelle_diameter(self) -> Union[float, np.ndarray]:
         # TODO: update model reference with last edition of Raymer
         """
         Computes nacelle diameter from MTO thrust and bypass ratio.
@@ -566,11 +1245,87 @@ class RubberEngine(AbstractFuelPropulsion):
         if np.shape(phase) == ():  # engine_setting is a scalar
             return self.dt4_values[phase]
 
-        # Here engine_setting is a sequence. Ensure now it is a numpy array
-        phase_array = np.asarray(phase)
+        codes = get_engine_setting_codes(phase)
 
-        delta_t4 = np.empty(phase_array.shape)
-        for phase_value, dt4_value in self.dt4_values.items():
-            delta_t4[phase_array == phase_value] = dt4_value
+        if self._dt4_table is None:
+            # np.select allows dT4 values to be arrays (batched engine designs)
+            return np.select(
+                [codes == phase_value for phase_value in self.dt4_values],
+                list(self.dt4_values.values()),
+                np.nan,
+            )
 
+        delta_t4 = np.take(self._dt4_table, codes, mode="clip")
+        if np.isnan(delta_t4).any():
+            raise FastUnknownEngineSettingError(
+                "Unknown engine setting codes: %s" % np.unique(codes[np.isnan(delta_t4)])
+            )
         return delta_t4
+
+
+def get_engine_setting_codes(
+    engine_setting: Union[EngineSetting, int, str, Sequence],
+) -> np.ndarray:
+    """
+    Converts engine settings to their integer codes (the values of
+    :class:`~fastoad.constants.EngineSetting`).
+
+    Mission tables can store these codes instead of EngineSetting instances, so that
+    engine setting lookups are done by direct indexing.
+
+    :param engine_setting: EngineSetting instance(s), integer code(s) (floats are rounded),
+                           or engine setting name(s)
+    :return: numpy array of integer codes
+    """
+    settings = np.asarray(engine_setting)
+    if settings.dtype.kind in "iu":
+        return settings
+    if settings.dtype.kind in "fb":
+        return np.rint(settings).astype(np.int8)
+    try:
+        return settings.astype(np.int8)
+    except (TypeError, ValueError):
+        # Here we have engine setting names. Mixed sequences have been converted to strings
+        # by np.asarray(), so original objects are retrieved.
+        settings = np.asarray(engine_setting, dtype=object)
+        codes = [
+            EngineSetting.convert(value) if isinstance(value, str) else value
+            for value in settings.ravel()
+        ]
+        if None in codes:
+            raise FastUnknownEngineSettingError(
+                "Unknown engine settings: %s" % set(settings.ravel()[np.equal(codes, None)])
+            )
+        return np.array(codes, dtype=np.int8).reshape(settings.shape)
+
+
+def _as_parameter(value: Union[float, Sequence[float]]) -> Union[float, np.ndarray]:
+    """
+    :param value: an engine parameter
+    :return: the value as is if it is a scalar, or as a numpy array
+    """
+    if np.ndim(value) == 0:
+        return value
+    return np.asarray(value, dtype=float)
+
+
+def _has_field(flight_points: FlightPointColumns, name: str) -> bool:
+    if isinstance(flight_points, np.ndarray):
+        return name in flight_points.dtype.names
+    return name in flight_points
+
+
+def _as_scalar(value):
+    """
+    :param value: a scalar, or a numpy array with one element
+    :return: the value as a Python scalar
+    """
+    return value.item() if isinstance(value, np.ndarray) else value
+
+
+def _as_float(value) -> float:
+    """
+    :param value: a scalar, or a numpy array with one element
+    :return: the value as a float
+    """
+    return float(_as_scalar(value))
@@ -0,0 +1,132 @@
+"""
+Test module for engine_deck.py
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastoad.constants import EngineSetting
+
+from ..engine_deck import EngineDeckGrid, TabulatedRubberEngine, _get_engine_deck
+from ..rubber_engine import RubberEngine
+
+
+@pytest.mark.parametrize("interpolation_method, rtol", [("linear", 1e-2), ("cubic", 1e-3)])
+def test_compute_flight_points(interpolation_method, rtol):
+    engine_params = (5, 30, 1500, 1, 0.95, 10000)
+    engine = TabulatedRubberEngine(*engine_params, interpolation_method=interpolation_method)
+    ref_engine = RubberEngine(*engine_params)
+
+    machs = [0, 0.3, 0.3, 0.8, 0.8, 0.78]
+    altitudes = [0, 0, 0, 10000, 13000, 11000]
+    thrust_rates = [0.8, 0.5, 0.5, 0.4, 0.7, 0.9]
+    engine_settings = [
+        EngineSetting.TAKEOFF,
+        EngineSetting.TAKEOFF,
+        EngineSetting.CLIMB,
+        EngineSetting.IDLE,
+        EngineSetting.CRUISE,
+        EngineSetting.CLIMB,
+    ]
+
+    results = []
+    for tested_engine in [engine, ref_engine]:
+        flight_points = pd.DataFrame()
+        flight_points["mach"] = machs
+        flight_points["altitude"] = altitudes
+        flight_points["engine_setting"] = engine_settings
+        flight_points["thrust_is_regulated"] = False
+        flight_points["thrust_rate"] = thrust_rates
+        flight_points["thrust"] = 0.0
+        flight_points["isa_offset"] = [0.0, 15.0, -10.0, 0.0, 20.0, 20.0]
+        tested_engine.compute_flight_points(flight_points)
+        results.append(flight_points)
+
+    np.testing.assert_allclose(results[0].thrust, results[1].thrust, rtol=rtol)
+    np.testing.assert_allclose(results[0].sfc, results[1].sfc, rtol=rtol)
+    np.testing.assert_allclose(results[0].thrust_rate, thrust_rates)
+
+    # With scalars
+    sfc, thrust_rate, thrust = engine.compute_flight_points_from_dt4(
+        0.8, 11001.0, -100.0, 20.0, 1, 0.0, 0.1
+    )
+    ref_sfc, _, _ = ref_engine.compute_flight_points_from_dt4(
+        0.8, 11001.0, -100.0, 20.0, 1, 0.0, 0.1
+    )
+    assert np.shape(sfc) == ()
+    assert sfc == pytest.approx(ref_sfc, rel=rtol)
+    assert thrust == pytest.approx(0.1)
+
+
+def test_validate():
+    report = TabulatedRubberEngine(5, 30, 1500, 1, 0.95, 10000).validate()
+    assert report.sample_count == 1000
+    assert report.max_thrust_max_error < 1.0e-2
+    assert report.max_thrust_mean_error < 3.0e-3
+    assert report.sfc_max_error < 1.0e-3
+
+    # A finer grid is more accurate
+    fine_report = TabulatedRubberEngine(
+        5, 30, 1500, 1, 0.95, 10000, grid=EngineDeckGrid.regular(0.025, 500.0, 12.5, 5.0)
+    ).validate()
+    assert fine_report.max_thrust_mean_error < 0.5 * report.max_thrust_mean_error
+
+    # Cubic interpolation is more accurate
+    cubic_report = TabulatedRubberEngine(
+        5, 30, 1500, 1, 0.95, 10000, interpolation_method="cubic"
+    ).validate()
+    assert cubic_report.max_thrust_max_error < 1.0e-3
+    assert cubic_report.sfc_max_error < 1.0e-4
+
+    assert "1000 samples" in str(cubic_report)
+
+
+def test_grid():
+    grid = EngineDeckGrid.regular(
+        mach_step=0.25,
+        altitude_step=4000.0,
+        altitude_bounds=(-1000.0, 15000.0),
+        delta_t4_nodes=[-50.0, np.array([-30.0])],
+    )
+    assert grid.mach == (0.0, 0.25, 0.5, 0.75, 1.0)
+    assert grid.altitude == (-1000.0, 0.0, 3000.0, 7000.0, 11000.0, 15000.0)
+    assert grid.delta_t4 == (-150.0, -125.0, -100.0, -75.0, -50.0, -30.0, -25.0, 0.0)
+    assert grid.shape == (5, 6, 8, 7)
+    assert grid.size == 5 * 6 * 8 * 7
+
+    # Default grid contains delta_t4 values of engine settings
+    engine = TabulatedRubberEngine(5, 30, 1500, 1, 0.95, 10000, delta_t4_climb=-60)
+    assert -60.0 in engine.grid.delta_t4
+
+    with pytest.raises(ValueError):
+        TabulatedRubberEngine(5, 30, 1500, 1, 0.95, 10000, interpolation_method="quadratic")
+    with pytest.raises(ValueError):
+        TabulatedRubberEngine([5, 6], 30, 1500, 1, 0.95, 10000)
+
+
+def test_deck_sharing():
+    _get_engine_deck.cache_clear()
+    engine = TabulatedRubberEngine(5, 30, 1500, 100000, 0.95, 10000)
+    _, _, thrust_1 = engine.compute_flight_points_from_dt4(0.8, 10000.0, -50.0, 0.0, 0, 1.0, 0)
+
+    # Deck is computed again only if a parameter of the deck is changed
+    engine = TabulatedRubberEngine(5, 30, 1500, 200000, 0.9, 12000)
+    _, _, thrust_2 = engine.compute_flight_points_from_dt4(0.8, 10000.0, -50.0, 0.0, 0, 1.0, 0)
+    assert _get_engine_deck.cache_info().misses == 1
+    assert thrust_2 == pytest.approx(2.0 * thrust_1)
+
+    engine = TabulatedRubberEngine(5, 30, 1550, 100000, 0.95, 10000)
+    engine.compute_flight_points_from_dt4(0.8, 10000.0, -50.0, 0.0, 0, 1.0, 0)
+    assert _get_engine_deck.cache_info().misses == 2
@@ -16,10 +16,13 @@ Test module for OpenMDAO versions of RubberEngine
 
 import numpy as np
 import openmdao.api as om
+import pytest
 from fastoad.constants import EngineSetting
+from fastoad.model_base import FlightPoint
 from fastoad.testing import run_system
+from openmdao.utils.assert_utils import assert_check_partials
 
-from ..openmdao import OMRubberEngineComponent
+from ..openmdao import OMRubberEngineComponent, OMRubberEngineDeckWrapper, OMRubberEngineWrapper
 
 
 def test_OMRubberEngineComponent():
@@ -118,3 +121,139 @@ def test_OMRubberEngineComponentWithSFCCorrections():
         problem["data:propulsion:thrust_rate"], [thrust_rates, thrust_rates], rtol=1e-2
     )
     np.testing.assert_allclose(problem["data:propulsion:thrust"], [thrusts, thrusts], rtol=1e-2)
+
+
+def test_OMRubberEngineComponent_partials(monkeypatch):
+    """Tests analytic partials of OMRubberEngineComponent"""
+    machs = [0.0, 0.3, 0.5, 0.78, 0.82, 0.8]
+    altitudes = [0.0, 500.0, 4000.0, 10000.0, 12500.0, 11500.0]
+    thrust_rates = [0.8, 0.5, 0.7, 0.4, 0.7, 0.9]
+    thrusts = [1.0e5, 6.0e4, 5.0e4, 2.0e4, 2.5e4, 3.0e4]
+    phases = [
+        EngineSetting.TAKEOFF,
+        EngineSetting.TAKEOFF,
+        EngineSetting.CLIMB,
+        EngineSetting.IDLE,
+        EngineSetting.CRUISE,
+        EngineSetting.CLIMB,
+    ]
+
+    ivc = om.IndepVarComp()
+    ivc.add_output("data:propulsion:rubber_engine:bypass_ratio", 5.0, units="unitless")
+    ivc.add_output("data:propulsion:rubber_engine:overall_pressure_ratio", 30.0, units="unitless")
+    ivc.add_output("data:propulsion:rubber_engine:turbine_inlet_temperature", 1500.0, units="K")
+    ivc.add_output("data:propulsion:MTO_thrust", 1.2e5, units="N")
+    ivc.add_output("data:propulsion:rubber_engine:maximum_mach", 0.85, units="unitless")
+    ivc.add_output("data:propulsion:rubber_engine:design_altitude", 10000.0, units="m")
+    ivc.add_output("data:propulsion:rubber_engine:delta_t4_climb", -40.0, units="unitless")
+    ivc.add_output("data:propulsion:rubber_engine:delta_t4_cruise", -70.0, units="unitless")
+    ivc.add_output("data:geometry:propulsion:engine:count", 2.0, units="unitless")
+    ivc.add_output("tuning:propulsion:rubber_engine:SFC:k_cr", 0.9, units="unitless")
+    ivc.add_output("tuning:propulsion:rubber_engine:SFC:k_sl", 0.8, units="unitless")
+
+    ivc.add_output("data:propulsion:mach", [machs, machs], units="unitless")
+    ivc.add_output("data:propulsion:altitude", [altitudes, altitudes], units="m")
+    ivc.add_output("data:propulsion:engine_setting", [phases, phases], units="unitless")
+    ivc.add_output("data:propulsion:use_thrust_rate", [[True] * 6, [False] * 6], units="unitless")
+    ivc.add_output(
+        "data:propulsion:required_thrust_rate", [thrust_rates, [0.0] * 6], units="unitless"
+    )
+    ivc.add_output("data:propulsion:required_thrust", [[0.0] * 6, thrusts], units="N")
+
+    problem = run_system(OMRubberEngineComponent(), ivc)
+
+    data = problem.check_partials(out_stream=None, method="fd", step=1.0e-7, form="central")
+    # Engine setting and thrust mode are flags: finite differences make no sense for them.
+    for component_data in data.values():
+        for output_name, input_name in list(component_data):
+            if input_name in ["data:propulsion:engine_setting", "data:propulsion:use_thrust_rate"]:
+                del component_data[output_name, input_name]
+    assert_check_partials(data, atol=1.0e-8, rtol=1.0e-4)
+
+    # Engine model of partials is provided by the wrapper, as in compute()
+    models = []
+
+    class RecordingWrapper(OMRubberEngineWrapper):
+        @staticmethod
+        def get_model(inputs):
+            models.append(OMRubberEngineWrapper.get_model(inputs))
+            return models[-1]
+
+    monkeypatch.setattr(OMRubberEngineComponent, "get_wrapper", RecordingWrapper)
+    problem.model.run_linearize()
+    assert len(models) == 1
+
+
+def test_OMRubberEngineComponent_validity_check():
+    """Tests counting of out-of-domain values during computations"""
+    ivc = om.IndepVarComp()
+    ivc.add_output("data:propulsion:rubber_engine:bypass_ratio", 5.0, units="unitless")
+    ivc.add_output("data:propulsion:rubber_engine:overall_pressure_ratio", 30.0, units="unitless")
+    ivc.add_output("data:propulsion:rubber_engine:turbine_inlet_temperature", 1500.0, units="K")
+    ivc.add_output("data:propulsion:MTO_thrust", 1.2e5, units="N")
+    ivc.add_output("data:propulsion:rubber_engine:maximum_mach", 0.85, units="unitless")
+    ivc.add_output("data:propulsion:rubber_engine:design_altitude", 10000.0, units="m")
+    ivc.add_output("data:geometry:propulsion:engine:count", 2.0, units="unitless")
+
+    ivc.add_output("data:propulsion:mach", [0.5, 0.78, 0.8, 0.9], units="unitless")
+    ivc.add_output("data:propulsion:altitude", [0.0, 10000.0, 10000.0, 21000.0], units="m")
+    ivc.add_output("data:propulsion:engine_setting", [3, 3, 3, 3], units="unitless")
+    ivc.add_output("data:propulsion:use_thrust_rate", [True] * 4, units="unitless")
+    ivc.add_output("data:propulsion:required_thrust_rate", [0.8, 0.7, 0.4, 0.9])
+    ivc.add_output("data:propulsion:required_thrust", [0.0] * 4, units="N")
+
+    engine = OMRubberEngineComponent(validity_check_period=2)
+    problem = run_system(engine, ivc)
+    summary = engine.validity_checker.summary
+    assert summary["data:propulsion:mach"].too_low == 1
+    assert summary["data:propulsion:mach"].too_high == 1
+    assert summary["data:propulsion:altitude"].too_high == 1
+    assert summary["data:propulsion:thrust_rate"].too_low == 1
+    assert summary["data:propulsion:rubber_engine:bypass_ratio"].is_ok
+
+    # Only one computation out of 2 is checked
+    received = []
+    engine.validity_checker.add_hook(received.append)
+    problem.run_model()
+    problem.run_model()
+    assert len(received) == 1
+    assert engine.validity_checker.check_count == 2
+    assert engine.validity_checker.summary["data:propulsion:mach"].too_low == 2
+
+    # No check by default
+    engine = OMRubberEngineComponent()
+    run_system(engine, ivc)
+    assert engine.validity_checker.summary == {}
+
+
+def test_OMRubberEngineDeckWrapper():
+    """Tests that tabulated engine model is consistent with analytical one"""
+    inputs = {
+        "data:propulsion:rubber_engine:bypass_ratio": np.array([5.0]),
+        "data:propulsion:rubber_engine:overall_pressure_ratio": np.array([30.0]),
+        "data:propulsion:rubber_engine:turbine_inlet_temperature": np.array([1500.0]),
+        "data:propulsion:MTO_thrust": np.array([100000.0]),
+        "data:propulsion:rubber_engine:maximum_mach": np.array([0.95]),
+        "data:propulsion:rubber_engine:design_altitude": np.array([10000.0]),
+        "data:propulsion:rubber_engine:delta_t4_climb": np.array([-50.0]),
+        "data:propulsion:rubber_engine:delta_t4_cruise": np.array([-100.0]),
+        "tuning:propulsion:rubber_engine:SFC:k_sl": np.array([1.0]),
+        "tuning:propulsion:rubber_engine:SFC:k_cr": np.array([1.0]),
+        "data:geometry:propulsion:engine:count": np.array([2.0]),
+    }
+
+    flight_points = []
+    for wrapper in [OMRubberEngineDeckWrapper(), OMRubberEngineWrapper()]:
+        flight_point = FlightPoint(
+            mach=0.78,
+            altitude=10500.0,
+            engine_setting=EngineSetting.CRUISE,
+            thrust_is_regulated=False,
+            thrust_rate=0.7,
+            isa_offset=10.0,
+        )
+        wrapper.get_model(inputs).compute_flight_points(flight_point)
+        flight_points.append(flight_point)
+
+    assert flight_points[0].thrust == pytest.approx(flight_points[1].thrust, rel=1e-2)
+    assert flight_points[0].sfc == pytest.approx(flight_points[1].sfc, rel=1e-2)
@@ -19,9 +19,11 @@ import numpy as np
 import pandas as pd
 import pytest
 from fastoad.constants import EngineSetting
+from fastoad.exceptions import FastUnknownEngineSettingError
 from fastoad.model_base import FlightPoint
 from stdatm import Atmosphere
 
+from ..exceptions import FastRubberEngineInconsistentInputParametersError
 from ..rubber_engine import RubberEngine
 
 
@@ -87,6 +89,288 @@ def test_compute_flight_points():
     np.testing.assert_allclose(flight_points.thrust, thrusts + thrusts, rtol=1e-4)
 
 
+def test_compute_flight_points_batched_designs():
+    bypass_ratios = [4.0, 5.0, 6.0]
+    opr = [25.0, 30.0, 38.0]
+    t4 = [1450.0, 1500.0, 1600.0]
+    f0 = [1.0e5, 1.2e5, 1.5e5]
+    delta_t4_climb = [-30.0, -50.0, -60.0]
+    k_sfc_cr = [0.9, 1.0, 0.95]
+
+    machs = [0.0, 0.3, 0.5, 0.8, 0.8]
+    altitudes = [0.0, 0.0, 5000.0, 10000.0, 13000.0]
+    engine_settings = [
+        EngineSetting.TAKEOFF,
+        EngineSetting.CLIMB,
+        EngineSetting.CLIMB,
+        EngineSetting.IDLE,
+        EngineSetting.CRUISE,
+    ]
+    thrust_is_regulated = [False, False, True, False, True]
+    thrust_rates = [0.8, 0.9, 0.0, 0.4, 0.0]
+    thrusts = [0.0, 0.0, 4.0e4, 0.0, 2.0e4]
+
+    def column(values):
+        return np.reshape(values, (-1, 1))
+
+    engines = RubberEngine(
+        column(bypass_ratios),
+        column(opr),
+        column(t4),
+        column(f0),
+        0.95,
+        10000.0,
+        delta_t4_climb=column(delta_t4_climb),
+        k_sfc_cr=column(k_sfc_cr),
+    )
+    sfc, thrust_rate, thrust = engines.compute_flight_points_from_dt4(
+        machs,
+        altitudes,
+        engines._get_delta_t4(engine_settings),
+        0.0,
+        thrust_is_regulated,
+        thrust_rates,
+        thrusts,
+    )
+    assert np.shape(sfc) == np.shape(thrust_rate) == np.shape(thrust) == (3, 5)
+
+    for i in range(3):
+        engine = RubberEngine(
+            bypass_ratios[i],
+            opr[i],
+            t4[i],
+            f0[i],
+            0.95,
+            10000.0,
+            delta_t4_climb=delta_t4_climb[i],
+            k_sfc_cr=k_sfc_cr[i],
+        )
+        flight_points = pd.DataFrame(
+            {
+                "mach": machs,
+                "altitude": altitudes,
+                "engine_setting": engine_settings,
+                "isa_offset": 0.0,
+                "thrust_is_regulated": thrust_is_regulated,
+                "thrust_rate": thrust_rates,
+                "thrust": thrusts,
+            }
+        )
+        engine.compute_flight_points(flight_points)
+        np.testing.assert_allclose(thrust[i], flight_points.thrust, rtol=1e-12)
+        np.testing.assert_allclose(thrust_rate[i], flight_points.thrust_rate, rtol=1e-12)
+        np.testing.assert_allclose(
+            sfc[i] * engines.sfc_correction(altitudes)[i], flight_points.sfc, rtol=1e-12
+        )
+
+
+def test_compute_flight_point_columns():
+    engine = RubberEngine(5, 30, 1500, 1.2e5, 0.95, 10000, k_sfc_sl=0.98, k_sfc_cr=0.95)
+
+    rng = np.random.default_rng(0)
+    columns = {
+        "mach": rng.uniform(0.0, 0.9, 100),
+        "altitude": rng.uniform(-500.0, 15000.0, 100),
+        "engine_setting": rng.choice([setting.value for setting in EngineSetting], 100),
+        "isa_offset": rng.uniform(-20.0, 30.0, 100),
+        "thrust_is_regulated": rng.choice([True, False], 100),
+        "thrust_rate": rng.uniform(0.3, 1.0, 100),
+        "thrust": rng.uniform(1.0e4, 5.0e4, 100),
+    }
+    flight_points = pd.DataFrame(columns)
+    engine.compute_flight_points(flight_points)
+
+    # Struct of arrays, with output buffers
+    out = {name: np.zeros(100) for name in ["sfc", "thrust_rate", "thrust"]}
+    sfc_buffer = out["sfc"]
+    assert engine.compute_flight_point_columns(columns, out) is out
+    assert out["sfc"] is sfc_buffer
+    for name in ["sfc", "thrust_rate", "thrust"]:
+        np.testing.assert_allclose(out[name], flight_points[name], rtol=1e-12)
+
+    # Structured array, without isa_offset, with results written in place
+    fields = ["mach", "altitude", "thrust_rate", "thrust", "sfc"]
+    structured_array = np.zeros(
+        100,
+        dtype=[(name, float) for name in fields]
+        + [("engine_setting", int), ("thrust_is_regulated", bool)],
+    )
+    for name, values in columns.items():
+        if name != "isa_offset":
+            structured_array[name] = values
+    engine.compute_flight_point_columns(structured_array)
+    flight_points["isa_offset"] = 0.0
+    engine.compute_flight_points(flight_points)
+    for name in ["sfc", "thrust_rate", "thrust"]:
+        np.testing.assert_allclose(structured_array[name], flight_points[name], rtol=1e-12)
+
+    with pytest.raises(ValueError):
+        engine.compute_flight_point_columns(columns, structured_array[["mach", "thrust"]])
+
+
+@pytest.mark.parametrize("array_parameters", [False, True])
+def test_compute_flight_points_scalar_path(array_parameters):
+    engine_params = [5.0, 30.0, 1500.0, 1.2e5, 0.95, 10000.0]
+    if array_parameters:
+        # As provided by OpenMDAO
+        engine_params = [np.array([value]) for value in engine_params]
+    engine = RubberEngine(*engine_params, k_sfc_sl=0.98, k_sfc_cr=0.95)
+
+    rng = np.random.default_rng(0)
+    flight_points = pd.DataFrame(
+        {
+            "mach": rng.uniform(0.0, 0.9, 50),
+            "altitude": rng.uniform(-500.0, 15000.0, 50),
+            "engine_setting": rng.choice(list(EngineSetting), 50),
+            "isa_offset": rng.uniform(-20.0, 30.0, 50),
+            "thrust_is_regulated": rng.choice([True, False], 50),
+            "thrust_rate": rng.uniform(0.3, 1.0, 50),
+            "thrust": rng.uniform(1.0e4, 5.0e4, 50),
+        }
+    )
+
+    scalar_results = []
+    for row in flight_points.itertuples(index=False):
+        flight_point = FlightPoint(**row._asdict())
+        engine.compute_flight_points(flight_point)
+        assert np.shape(flight_point.sfc) == ()
+        scalar_results.append([flight_point.sfc, flight_point.thrust_rate, flight_point.thrust])
+
+    # Array computation uses tabulated atmosphere pressure, hence the tolerance
+    engine.compute_flight_points(flight_points)
+    np.testing.assert_allclose(
+        scalar_results, flight_points[["sfc", "thrust_rate", "thrust"]], rtol=1e-8
+    )
+
+    # Values may be provided as arrays of size 1
+    flight_point = FlightPoint(
+        mach=np.array([0.8]),
+        altitude=np.array([10000.0]),
+        engine_setting=np.array([EngineSetting.CRUISE.value]),
+        thrust_is_regulated=np.array([1.0]),
+        thrust=np.array([3.0e4]),
+    )
+    engine.compute_flight_points(flight_point)
+    assert flight_point.thrust == pytest.approx(3.0e4)
+
+    # When thrust_is_regulated is not provided, the provided value is used.
+    flight_point = FlightPoint(
+        mach=0.8, altitude=10000.0, engine_setting=EngineSetting.CRUISE, thrust=3.0e4
+    )
+    engine.compute_flight_points(flight_point)
+    assert flight_point.thrust == pytest.approx(3.0e4)
+
+    with pytest.raises(FastRubberEngineInconsistentInputParametersError):
+        engine.compute_flight_points(
+            FlightPoint(mach=0.8, altitude=10000.0, engine_setting=EngineSetting.CRUISE)
+        )
+    with pytest.raises(FastRubberEngineInconsistentInputParametersError):
+        engine.compute_flight_points(
+            FlightPoint(
+                mach=0.8,
+                altitude=10000.0,
+                engine_setting=EngineSetting.CRUISE,
+                thrust_is_regulated=True,
+                thrust_rate=0.5,
+            )
+        )
+
+
+def test_get_flight_condition():
+    engine = RubberEngine(5, 30, 1500, 1, 0.95, 10000)
+    machs = np.array([0.0, 0.3, 0.8, 0.8, 0.78])
+    altitudes = np.array([0.0, 0.0, 10000.0, 13000.0, 11000.0])
+    isa_offsets = np.array([0.0, 15.0, 0.0, 20.0, -10.0])
+    engine_settings = [
+        EngineSetting.TAKEOFF,
+        EngineSetting.CLIMB,
+        EngineSetting.IDLE,
+        EngineSetting.CRUISE,
+        EngineSetting.CLIMB,
+    ]
+    thrust_rates = np.array([0.8, 0.5, 0.4, 0.7, 0.9])
+
+    flight_points = pd.DataFrame(
+        dict(
+            mach=machs,
+            altitude=altitudes,
+            engine_setting=engine_settings,
+            isa_offset=isa_offsets,
+            thrust_is_regulated=False,
+            thrust_rate=thrust_rates,
+            thrust=0.0,
+        )
+    )
+    engine.compute_flight_points(flight_points)
+
+    condition = engine.get_flight_condition(machs, altitudes, engine_settings, isa_offsets)
+    sfc, thrust = condition.compute_from_thrust_rate(thrust_rates)
+    np.testing.assert_allclose(sfc, flight_points.sfc, rtol=1e-12)
+    np.testing.assert_allclose(thrust, flight_points.thrust, rtol=1e-12)
+
+    # Thrust can be changed without computing again the flight condition
+    sfc, thrust_rate = condition.compute_from_thrust(flight_points.thrust.values)
+    np.testing.assert_allclose(sfc, flight_points.sfc, rtol=1e-12)
+    np.testing.assert_allclose(thrust_rate, thrust_rates, rtol=1e-12)
+
+    sfc, thrust_rate = condition.compute_from_thrust(0.5 * flight_points.thrust.values)
+    ref_sfc, ref_thrust_rate, _ = engine.compute_flight_points_from_dt4(
+        machs,
+        altitudes,
+        engine._get_delta_t4(engine_settings),
+        isa_offsets,
+        True,
+        0.0,
+        0.5 * flight_points.thrust.values,
+    )
+    ref_sfc = ref_sfc * engine.sfc_correction(altitudes)
+    np.testing.assert_allclose(sfc, ref_sfc, rtol=1e-12)
+    np.testing.assert_allclose(thrust_rate, 0.5 * thrust_rates, rtol=1e-12)
+
+    # Scalar flight condition
+    condition = engine.get_flight_condition(0.8, 10000.0, EngineSetting.CRUISE)
+    flight_point = FlightPoint(
+        mach=0.8,
+        altitude=10000.0,
+        engine_setting=EngineSetting.CRUISE,
+        thrust_is_regulated=True,
+        thrust=30000.0,
+    )
+    engine.compute_flight_points(flight_point)
+    sfc, thrust_rate = condition.compute_from_thrust(30000.0)
+    assert np.shape(sfc) == ()
+    assert sfc == pytest.approx(flight_point.sfc, rel=1e-8)
+    assert thrust_rate == pytest.approx(flight_point.thrust_rate, rel=1e-8)
+
+
+def test_get_delta_t4():
+    engine = RubberEngine(5, 30, 1500, 1, 0.95, 10000, delta_t4_climb=-40, delta_t4_cruise=-70)
+
+    assert engine._get_delta_t4(EngineSetting.CLIMB) == -40
+    assert engine._get_delta_t4(3) == -70
+
+    expected = [[0.0, -40.0, -70.0, -70.0]]
+    settings = [
+        [EngineSetting.TAKEOFF, EngineSetting.CLIMB, EngineSetting.CRUISE, EngineSetting.IDLE]
+    ]
+    np.testing.assert_equal(engine._get_delta_t4(settings), expected)
+    np.testing.assert_equal(engine._get_delta_t4(np.array([[1, 2, 3, 4]])), expected)
+    np.testing.assert_equal(engine._get_delta_t4(np.array([[1.0, 2.0, 2.9999999, 4.0]])), expected)
+    np.testing.assert_equal(
+        engine._get_delta_t4([["takeoff", "climb", EngineSetting.CRUISE, "IDLE"]]), expected
+    )
+
+    for settings in [[1, 2, 5], [0, 1], [1, -1], ["climb", "descent"]]:
+        with pytest.raises(FastUnknownEngineSettingError):
+            engine._get_delta_t4(settings)
+
+    # Batched designs with different dT4 values
+    engines = RubberEngine(5, 30, 1500, 1, 0.95, 10000, delta_t4_climb=[[-40.0], [-50.0]])
+    np.testing.assert_equal(
+        engines._get_delta_t4([1, 2, 3]), [[0.0, -40.0, -100.0], [0.0, -50.0, -100.0]]
+    )
+
+
 def test_installed_weight():
     fj44 = RubberEngine(0, 0, 0, 8452, 0, 0)
     np.testing.assert_allclose(fj44.installed_weight(), 225, atol=1)
@@ -97,6 +381,10 @@ def test_installed_weight():
     trent900 = RubberEngine(0, 0, 0, 340289, 0, 0)
     np.testing.assert_allclose(trent900.installed_weight(), 6535, atol=1)
 
+    # Batched designs
+    engines = RubberEngine(0, 0, 0, [8452, 66034, 104533, 340289], 0, 0)
+    np.testing.assert_allclose(engines.installed_weight(), [225, 1759, 2546, 6535], atol=1)
+
 
 def test_length():
     engine = RubberEngine(0, 0, 0, 75000, 0.95, 0)
@@ -105,6 +393,9 @@ def test_length():
     engine = RubberEngine(0, 0, 0, 250000, 0.92, 0)
     np.testing.assert_allclose(engine.length(), 4.39, atol=1e-2)
 
+    engines = RubberEngine(0, 0, 0, [75000, 250000], [0.95, 0.92], 0)
+    np.testing.assert_allclose(engines.length(), [2.73, 4.39], atol=1e-2)
+
 
 def test_nacelle_diameter():
     engine = RubberEngine(3, 0, 0, 75000, 0, 0)
@@ -113,6 +404,9 @@ def test_nacelle_diameter():
     engine = RubberEngine(5.5, 0, 0, 250000, 0, 0)
     np.testing.assert_allclose(engine.nacelle_diameter(), 3.25, atol=1e-2)
 
+    engines = RubberEngine([3, 5.5], 0, 0, [75000, 250000], 0, 0)
+    np.testing.assert_allclose(engines.nacelle_diameter(), [1.61, 3.25], atol=1e-2)
+
 
 def test_max_thrust():
     """
@@ -0,0 +1,79 @@
+"""
+Test module for validity_domain.py
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+
+import numpy as np
+import pytest
+
+from ..validity_domain import BatchedValidityChecker, OutOfDomainCount
+
+
+def test_check():
+    checker = BatchedValidityChecker({"a": (0.0, 1.0), "b": (None, 10.0), "c": (0.0, None)})
+
+    counts = checker.check({"a": np.linspace(-1.0, 2.0, 7), "b": [5.0, 11.0], "d": 100.0})
+    assert counts == [
+        OutOfDomainCount("a", 0.0, 1.0, 7, 2, 2),
+        OutOfDomainCount("b", -np.inf, 10.0, 2, 0, 1),
+    ]
+    assert not counts[0].is_ok
+
+    checker.check({"a": [0.5, 3.0], "c": 1.0})
+    summary = checker.summary
+    assert summary["a"] == OutOfDomainCount("a", 0.0, 1.0, 9, 2, 3)
+    assert summary["b"].too_high == 1
+    assert summary["c"].is_ok
+    assert checker.check_count == 2
+
+    checker.reset()
+    assert checker.summary == {}
+    assert checker.call_count == 0
+
+
+def test_check_period():
+    checker = BatchedValidityChecker({"a": (0.0, 1.0)}, check_period=3)
+    results = [checker.check({"a": [2.0]}) for _ in range(7)]
+    assert [result is not None for result in results] == [True, False, False] * 2 + [True]
+    assert checker.call_count == 7
+    assert checker.check_count == 3
+    assert checker.summary["a"].too_high == 3
+
+    checker = BatchedValidityChecker({"a": (0.0, 1.0)}, check_period=0)
+    assert checker.check({"a": [2.0]}) is None
+    assert checker.summary == {}
+
+    with pytest.raises(ValueError):
+        BatchedValidityChecker({"a": (0.0, 1.0)}, check_period=-1)
+
+
+def test_hooks_and_log(caplog):
+    checker = BatchedValidityChecker({"a": (0.0, 1.0), "b": (0.0, 1.0)})
+    received = []
+    checker.add_hook(received.append)
+    checker.check({"a": [2.0, 0.5], "b": 0.5})
+    assert received == [
+        [OutOfDomainCount("a", 0.0, 1.0, 2, 0, 1), OutOfDomainCount("b", 0.0, 1.0, 1, 0, 0)]
+    ]
+
+    checker.remove_hook(received.append)
+    checker.check({"a": [-2.0]})
+    assert len(received) == 1
+
+    with caplog.at_level(logging.WARNING):
+        checker.log_summary()
+    assert len(caplog.records) == 1
+    assert '"a" out of bounds in 2 checks: 1/3 values under lower limit' in caplog.text
@@ -0,0 +1,203 @@
+"""
+Vectorised check of validity domain for flight point variables.
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OutOfDomainCount(NamedTuple):
+    """Count of out-of-domain elements for one variable."""
+
+    variable_name: str
+    lower: float
+    upper: float
+
+    #: number of checked elements
+    size: int
+
+    #: number of elements under lower bound
+    too_low: int
+
+    #: number of elements over upper bound
+    too_high: int
+
+    @property
+    def is_ok(self) -> bool:
+        """True if all elements are in validity domain."""
+        return self.too_low == 0 and self.too_high == 0
+
+    def __add__(self, other: "OutOfDomainCount") -> "OutOfDomainCount":
+        return self._replace(
+            size=self.size + other.size,
+            too_low=self.too_low + other.too_low,
+            too_high=self.too_high + other.too_high,
+        )
+
+
+ValidityHook = Callable[[List[OutOfDomainCount]], None]
+
+
+class BatchedValidityChecker:
+    """
+    Checks values of vector variables against validity domains.
+
+    Unlike :class:`~fastoad.openmdao.validity_checker.ValidityDomainChecker`, that reports
+    values of out-of-domain variables once problem has run, this class is made to be called
+    at each computation, with a low cost for large vectors: for each variable, it only
+    counts elements that are under lower bound or over upper bound.
+
+    Checks can be sampled (only one call every `check_period` calls is checked) or
+    disabled (with `check_period=0`).
+
+    Results of checks are accumulated in :attr:`summary`, and are given to hooks that have
+    been registered with :meth:`add_hook`.
+
+    :param limits: a dictionary where keys are variable names and values are two-values
+                   tuples that give lower and upper bound. One bound can be set to None.
+    :param check_period: values are checked once every `check_period` calls of
+                         :meth:`check`. If 0, values are never checked.
+    """
+
+    def __init__(
+        self, limits: Mapping[str, Tuple[Optional[float], Optional[float]]], check_period: int = 1
+    ):
+        if check_period < 0:
+            raise ValueError("check_period should be a non-negative integer.")
+        self.limits = {
+            name: (
+                -np.inf if lower is None else lower,
+                np.inf if upper is None else upper,
+            )
+            for name, (lower, upper) in limits.items()
+        }
+        self.check_period = check_period
+
+        #: Number of calls to :meth:`check`
+        self.call_count = 0
+
+        #: Number of calls to :meth:`check` where values have actually been checked
+        self.check_count = 0
+
+        self._summary: Dict[str, OutOfDomainCount] = {}
+        self._hooks: List[ValidityHook] = []
+
+    @property
+    def summary(self) -> Dict[str, OutOfDomainCount]:
+        """Counts accumulated over all checks, for each variable."""
+        return dict(self._summary)
+
+    def check(self, values: Mapping[str, np.ndarray]) -> Optional[List[OutOfDomainCount]]:
+        """
+        Checks provided values, if this call is sampled.
+
+        Variables that have no defined limits are ignored.
+
+        :param values: a dictionary where keys are variable names, and values are their values
+        :return: counts for each checked variable, or None if values have not been checked
+        """
+        self.call_count += 1
+        if self.check_period == 0 or (self.call_count - 1) % self.check_period != 0:
+            return None
+
+        self.check_count += 1
+        counts = []
+        for name, (lower, upper) in self.limits.items():
+            if name not in values:
+                continue
+            value = np.asarray(values[name])
+            counts.append(
+                OutOfDomainCount(
+                    name,
+                    lower,
+                    upper,
+                    value.size,
+                    int(np.count_nonzero(value < lower)),
+                    int(np.count_nonzero(value > upper)),
+                )
+            )
+
+        for count in counts:
+            if count.variable_name in self._summary:
+                self._summary[count.variable_name] += count
+            else:
+                self._summary[count.variable_name] = count
+            if not count.is_ok:
+                _LOGGER.debug(
+                    'Variable "%s": %i/%i values under lower limit (%s), %i/%i values over '
+                    "upper limit (%s)",
+                    count.variable_name,
+                    count.too_low,
+                    count.size,
+                    count.lower,
+                    count.too_high,
+                    count.size,
+                    count.upper,
+                )
+
+        for hook in self._hooks:
+            hook(counts)
+
+        return counts
+
+    def add_hook(self, hook: ValidityHook):
+        """
+        Registers a function that will be called with results of each actual check.
+
+        :param hook: a callable that accepts the list of
+                     :class:`OutOfDomainCount` instances returned by :meth:`check`
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: ValidityHook):
+        """
+        Unregisters a function that has been registered with :meth:`add_hook`.
+
+        :param hook:
+        """
+        self._hooks.remove(hook)
+
+    def reset(self):
+        """Resets call counters and accumulated counts. Hooks are kept."""
+        self.call_count = 0
+        self.check_count = 0
+        self._summary.clear()
+
+    def log_summary(self, logger: Optional[logging.Logger] = None):
+        """
+        Logs a warning for each variable that had out-of-domain values in accumulated counts.
+
+        :param logger: the logger to use. If not provided, logger of this module is used.
+        """
+        if logger is None:
+            logger = _LOGGER
+        for count in self._summary.values():
+            if not count.is_ok:
+                logger.warning(
+                    'Variable "%s" out of bounds in %i checks: %i/%i values under lower limit '
+                    "(%s), %i/%i values over upper limit (%s)",
+                    count.variable_name,
+                    self.check_count,
+                    count.too_low,
+                    count.size,
+                    count.lower,
+                    count.too_high,
+                    count.size,
+                    count.upper,
+                )
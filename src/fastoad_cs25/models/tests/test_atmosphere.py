@@ -0,0 +1,92 @@
+"""
+Test module for atmosphere.py
+"""
+#  This file is part of FAST-OAD_CS25
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from stdatm import Atmosphere
+
+from ..atmosphere import AtmosphereService, TabulatedAtmosphere, get_atmosphere
+
+
+def test_scalar_cache():
+    service = AtmosphereService(cache_size=2)
+
+    atm = service.get(5000.0, 10.0)
+    assert service.cache_info() == (0, 1, 1)
+    assert atm.density == pytest.approx(Atmosphere(5000.0, 10.0).density, rel=1e-15)
+
+    # Size-1 arrays share the cache with floats
+    atm_2 = service.get(np.array([5000.0]), 10.0)
+    assert service.cache_info() == (1, 1, 1)
+
+    # Returned instances are independent
+    atm_2.true_airspeed = 100.0
+    assert atm_2.mach == pytest.approx(100.0 / atm_2.speed_of_sound)
+    assert atm.mach is None
+    assert service.get(5000.0, 10.0).mach is None
+
+    # Unit of altitude is part of the key
+    atm_3 = service.get(5000.0, 10.0, altitude_in_feet=False)
+    assert atm_3.density == pytest.approx(
+        Atmosphere(5000.0, 10.0, altitude_in_feet=False).density, rel=1e-15
+    )
+    assert service.cache_info() == (2, 2, 2)
+
+    # Least recently used entry is dropped
+    service.get(0.0)
+    assert service.cache_info().size == 2
+    service.get(5000.0, 10.0)
+    assert service.cache_info() == (2, 4, 2)
+
+    service.cache_clear()
+    assert service.cache_info() == (0, 0, 0)
+
+
+def test_tabulated_atmosphere():
+    rng = np.random.default_rng(0)
+    altitude = rng.uniform(-2000.0, 20000.0, 10000)
+    altitude[:3] = [-2000.0, 11000.0, 20000.0]
+    delta_t = rng.uniform(-20.0, 30.0, 10000)
+
+    atm = get_atmosphere(altitude, delta_t, altitude_in_feet=False)
+    assert isinstance(atm, TabulatedAtmosphere)
+    ref_atm = Atmosphere(altitude, delta_t, altitude_in_feet=False)
+    np.testing.assert_allclose(atm.pressure, ref_atm.pressure, rtol=1e-8)
+    np.testing.assert_allclose(atm.density, ref_atm.density, rtol=1e-8)
+    np.testing.assert_allclose(atm.temperature, ref_atm.temperature, rtol=1e-15)
+    np.testing.assert_allclose(atm.get_altitude(), ref_atm.get_altitude(), rtol=1e-15)
+
+    # Out of the table, computation is exact.
+    atm = get_atmosphere([0.0, 25000.0], altitude_in_feet=False)
+    assert not isinstance(atm, TabulatedAtmosphere)
+    atm = get_atmosphere([0.0, np.nan], altitude_in_feet=False)
+    assert not isinstance(atm, TabulatedAtmosphere)
+
+
+def test_thread_safety():
+    service = AtmosphereService()
+    altitudes = np.arange(100.0) * 100.0
+
+    def _get_densities(_):
+        return [service.get(altitude).density for altitude in altitudes]
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(_get_densities, range(8)))
+
+    np.testing.assert_allclose(results, [Atmosphere(altitudes).density] * 8, rtol=1e-15)
+    assert service.cache_info() == (700, 100, 100)
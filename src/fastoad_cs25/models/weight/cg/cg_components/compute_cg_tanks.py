@@ -79,15 +79,15 @@ class ComputeTanksCG(om.ExplicitComponent):
         fa_length = inputs["data:geometry:wing:MAC:at25percent:x"]
         width_max = inputs["data:geometry:fuselage:maximum_width"]
 
-        profile = get_profile("airfoil_f_15_15.txt", chord_length=1.0)
+        profile = get_profile("airfoil_f_15_15.txt", chord_length=1.0, array_backed=True)
         height_root_front, height_root_rear = self._get_thickness(
             profile, l2_wing, [front_spar_ratio_root, rear_spar_ratio_root]
         )
-        profile = get_profile("airfoil_f_15_12.txt", chord_length=1.0)
+        profile = get_profile("airfoil_f_15_12.txt", chord_length=1.0, array_backed=True)
         height_kink_front, height_kink_rear = self._get_thickness(
             profile, l3_wing, [front_spar_ratio_root, rear_spar_ratio_root]
         )
-        profile = get_profile("airfoil_f_15_11.txt", chord_length=1.0)
+        profile = get_profile("airfoil_f_15_11.txt", chord_length=1.0, array_backed=True)
         height_tip_front, height_tip_rear = self._get_thickness(
             profile, l4_wing, [front_spar_ratio_root, rear_spar_ratio_root]
         )